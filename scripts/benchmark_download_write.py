@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark the download write path.
+
+This script serves a generated file from the local HTTP stand-in server used
+by benchmark_http_session.py and downloads it repeatedly three ways:
+the previous write loop (8 KB chunks, flush and fsync after every chunk),
+the durable-at-end path (large chunks, one fsync, atomic rename) and the
+durable-at-end path with visible progress reporting.
+"""
+
+import os
+import sys
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+
+# Add parent directory to python path so the src package is importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.download_utils import download_file, get_http_session, close_http_session
+from scripts.benchmark_http_session import start_server
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.benchmark")
+
+
+def download_fsync_per_chunk(url, save_path):
+    """Download with the previous write loop: fsync after every 8 KB chunk."""
+    with get_http_session().get(url, stream=True, timeout=(10, 60)) as response:
+        response.raise_for_status()
+        with open(save_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                if chunk:
+                    f.write(chunk)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+
+def main():
+    """Main function to parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the download write path")
+    parser.add_argument("--size-mb", type=float, default=50, help="Size of the served file in MB")
+    parser.add_argument("--count", type=int, default=5, help="Downloads per mode")
+    parser.add_argument("--output-dir", default=None,
+                        help="Directory to write to (default: a temporary directory; "
+                             "point this at network storage to measure it)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    # Keep the benchmark output readable
+    logging.getLogger("jfk_scraper.download").setLevel(logging.WARNING)
+
+    payload = os.urandom(int(args.size_mb * 1024 * 1024))
+    server, base_url, _ = start_server(payload)
+
+    modes = [
+        ("fsync-per-chunk", lambda url, path: download_fsync_per_chunk(url, path)),
+        ("durable-at-end", lambda url, path: download_file(url, path, visible_progress=False)),
+        ("visible-progress", lambda url, path: download_file(url, path, visible_progress=True)),
+    ]
+
+    try:
+        for label, download in modes:
+            output_dir = tempfile.mkdtemp(dir=args.output_dir)
+            try:
+                start_time = time.time()
+                for i in range(args.count):
+                    download(f"{base_url}/file-{i}.pdf", os.path.join(output_dir, f"file-{i}.pdf"))
+                elapsed = time.time() - start_time
+            finally:
+                shutil.rmtree(output_dir)
+            throughput = args.size_mb * args.count / elapsed
+            logger.info(f"{label:>16}: {args.count} x {args.size_mb:g} MB in {elapsed:.2f}s ({throughput:.1f} MB/s)")
+    finally:
+        close_http_session()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
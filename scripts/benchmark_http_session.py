@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark pooled HTTP downloads against per-request connections.
+
+This script serves a test PDF from a local HTTP/1.1 stand-in server and
+downloads it repeatedly with download_file, first opening a new connection
+for every file (the behaviour of a bare requests.get) and then through the
+shared pooled session. The server can add a delay to every new connection
+to stand in for the TCP+TLS handshake to a remote archive.
+"""
+
+import os
+import sys
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import threading
+import concurrent.futures
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+# Add parent directory to python path so the src package is importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.download_utils import download_file, get_http_session, close_http_session
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.benchmark")
+
+DEFAULT_PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "test_data", "test_document.pdf")
+
+
+def start_server(payload, handshake_delay=0.0):
+    """
+    Start a keep-alive HTTP server that serves the payload at every path.
+
+    Args:
+        payload (bytes): Response body
+        handshake_delay (float): Seconds to stall each new connection
+
+    Returns:
+        tuple: (server, base_url, stats) where stats counts connections and requests
+    """
+    stats = {"connections": 0, "requests": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with lock:
+                stats["connections"] += 1
+            if handshake_delay:
+                time.sleep(handshake_delay)
+
+        def do_GET(self):
+            with lock:
+                stats["requests"] += 1
+            self.send_response(200)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}", stats
+
+
+def run_downloads(base_url, count, workers, output_dir, pooled):
+    """
+    Download the served file count times.
+
+    Args:
+        base_url (str): Server URL
+        count (int): Number of downloads
+        workers (int): Concurrent download threads
+        output_dir (str): Directory to write the files to
+        pooled (bool): Use the shared session instead of a new connection per file
+
+    Returns:
+        float: Elapsed seconds
+    """
+    def fetch(i):
+        url = f"{base_url}/docid-{i:06d}.pdf"
+        save_path = os.path.join(output_dir, f"docid-{i:06d}.pdf")
+        if pooled:
+            return download_file(url, save_path)
+        # A throwaway session per file is what requests.get does internally
+        with requests.Session() as session:
+            return download_file(url, save_path, session=session)
+
+    if pooled:
+        get_http_session(pool_size=workers)
+
+    start_time = time.time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(fetch, range(count)))
+    return time.time() - start_time
+
+
+def main():
+    """Main function to parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark pooled HTTP downloads")
+    parser.add_argument("--pdf", default=DEFAULT_PDF, help="PDF file to serve")
+    parser.add_argument("--count", type=int, default=200, help="Number of downloads per run")
+    parser.add_argument("--workers", type=int, default=10, help="Concurrent download threads")
+    parser.add_argument("--handshake-ms", type=float, default=50.0,
+                        help="Delay added to every new connection, in milliseconds")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    with open(args.pdf, "rb") as f:
+        payload = f.read()
+
+    server, base_url, stats = start_server(payload, args.handshake_ms / 1000.0)
+    # Keep the benchmark output readable
+    logging.getLogger("jfk_scraper.download").setLevel(logging.WARNING)
+
+    results = {}
+    try:
+        for label, pooled in (("per-request", False), ("pooled", True)):
+            output_dir = tempfile.mkdtemp()
+            stats["connections"] = stats["requests"] = 0
+            try:
+                elapsed = run_downloads(base_url, args.count, args.workers, output_dir, pooled)
+            finally:
+                shutil.rmtree(output_dir)
+            results[label] = elapsed
+            logger.info(f"{label:>11}: {args.count} downloads in {elapsed:.2f}s "
+                        f"({args.count / elapsed:.1f} files/s), {stats['connections']} connections")
+    finally:
+        close_http_session()
+        server.shutdown()
+
+    logger.info(f"Speedup: {results['per-request'] / results['pooled']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark the single-pass Markdown to JSON parser against the previous one.
+
+The previous _convert_markdown_to_json matched every line against
+uncompiled regexes, copied section line lists and ran each metadata pattern
+over the opening text separately. This script converts the Markdown files
+in data/markdown with both implementations, checks that they produce the
+same JSON, and times them. Large OCR outputs are simulated by concatenating
+the documents into one file of `--pages` page sections.
+"""
+
+import os
+import re
+import sys
+import glob
+import time
+import shutil
+import logging
+import argparse
+import datetime
+import tempfile
+import traceback
+
+# Add parent directory to python path so the src package is importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.conversion_utils import _convert_markdown_to_json
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.benchmark")
+# The reference implementation logs like the one in conversion_utils
+conversion_logger = logging.getLogger("jfk_scraper.conversion")
+
+DEFAULT_MARKDOWN_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                    "data", "markdown")
+
+
+def legacy_convert_markdown_to_json(markdown_path, title=None):
+    """
+    The line-by-line Markdown to JSON conversion _convert_markdown_to_json
+    used before the single-pass parser, kept verbatim as the reference.
+    
+    Args:
+        markdown_path (str): Path to the Markdown file
+        title (str, optional): Document title to use. If None, uses the filename.
+        
+    Returns:
+        dict: JSON content
+    """
+    try:
+        with open(markdown_path, 'r', encoding='utf-8') as f:
+            markdown_content = f.read()
+
+        if title is None:
+            title = os.path.splitext(os.path.basename(markdown_path))[0]
+            
+        # Try to extract document ID from title for JFK files
+        doc_id = title
+        
+        # Extract standard JFK document ID patterns
+        doc_id_match = re.match(r'^(\d+-\d+-\d+)', title)
+        if doc_id_match:
+            doc_id = doc_id_match.group(1)
+        elif "docid" in title.lower():
+            doc_id_match = re.search(r'docid[-\s]?(\d+)', title.lower())
+            if doc_id_match:
+                doc_id = f"docid-{doc_id_match.group(1)}"
+        
+        # Handle empty or invalid content
+        if not markdown_content or len(markdown_content.strip()) == 0:
+            conversion_logger.warning(f"Empty markdown file: {markdown_path}")
+            return {
+                "docId": doc_id,
+                "title": title,
+                "metadata": {
+                    "source": "National Archives",
+                    "collection": "JFK Files",
+                    "format": "PDF to Markdown to JSON",
+                    "warning": "Empty source file",
+                    "conversion_timestamp": datetime.datetime.now().isoformat()
+                },
+                "sections": [],
+                "fullText": ""
+            }
+        
+        # Check for our pdf2md_wrapper
+        have_pdf2md = False
+        try:
+            from src.utils.pdf2md_wrapper import PDF2MarkdownWrapper
+            have_pdf2md = True
+            conversion_logger.info("Using PDF2MarkdownWrapper for enhanced section detection")
+        except ImportError:
+            conversion_logger.info("PDF2MarkdownWrapper not available, using basic section extraction")
+        
+        # Process markdown into sections with enhanced detection
+        sections = []
+        current_section = {"title": "", "content": []}
+        lines = markdown_content.split('\n')
+        
+        # First-pass extraction with improved section detection
+        page_pattern = re.compile(r'^#+\s+Page\s+(\d+)', re.IGNORECASE)
+        in_content_block = False
+        code_block_markers = 0
+        
+        for line in lines:
+            # Handle code blocks specially
+            if line.strip().startswith('```'):
+                code_block_markers += 1
+                in_content_block = (code_block_markers % 2 == 1)  # Toggle state for each marker
+                if current_section["title"]:  # Only add to current section if we have one
+                    current_section["content"].append(line)
+                continue
+                
+            # Skip header detection inside code blocks
+            if in_content_block:
+                if current_section["title"]:
+                    current_section["content"].append(line)
+                continue
+            
+            # Try to detect headers
+            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
+            if header_match:
+                # Save previous section if it exists
+                if current_section["title"] and current_section["content"]:
+                    # Join content, ensuring proper handling of lists and paragraphs
+                    sections.append(current_section.copy())
+                
+                level = len(header_match.group(1))
+                section_title = header_match.group(2).strip()
+                
+                # Special handling for page markers
+                page_match = page_pattern.match(line)
+                if page_match:
+                    page_num = page_match.group(1)
+                    section_title = f"Page {page_num}"
+                
+                current_section = {
+                    "title": section_title,
+                    "level": level,
+                    "content": []
+                }
+            elif line.strip():  # Non-empty line
+                if current_section["title"]:  # If we're in a section
+                    current_section["content"].append(line)
+                elif not sections:  # If no sections yet and this is text, create an implicit section
+                    current_section = {
+                        "title": "Document Content",
+                        "level": 1,
+                        "content": [line]
+                    }
+            else:  # Empty line
+                if current_section["title"] and current_section["content"]:  # Only add if we have content
+                    current_section["content"].append(line)  # Preserve paragraph breaks
+        
+        # Don't forget the last section
+        if current_section["title"] and current_section["content"]:
+            sections.append(current_section)
+            
+        # Handle case where no proper sections were found
+        if not sections:
+            conversion_logger.warning(f"No proper sections found in {markdown_path}, using fallback extraction")
+            # Create a fallback section with all content
+            sections = [{
+                "title": "Document Content",
+                "level": 1,
+                "content": markdown_content.split('\n')
+            }]
+        
+        # Try to extract date and classification information
+        creation_date = None
+        classification = None
+        agency = None
+        
+        # Look for date patterns in the first few sections
+        date_patterns = [
+            r'(?:Date|Dated):\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+            r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
+            r'(\d{1,2}/\d{1,2}/\d{2,4})'
+        ]
+        
+        # Look for classification patterns
+        classification_patterns = [
+            r'(?:Classification|Classified):\s*(\w+\s+\w+|\w+)',
+            r'(CONFIDENTIAL|SECRET|TOP SECRET|UNCLASSIFIED)'
+        ]
+        
+        # Look for agency patterns
+        agency_patterns = [
+            r'(?:Agency|From|Originator):\s*([\w\s]+)',
+            r'(CIA|FBI|HSCA|NSA|DOS|DOD)'
+        ]
+        
+        # Check the first few sections for metadata
+        search_text = "\n".join([section["title"] + "\n" + "\n".join(section["content"]) 
+                                for section in sections[:min(3, len(sections))]])
+        
+        # Extract date
+        for pattern in date_patterns:
+            date_match = re.search(pattern, search_text, re.IGNORECASE)
+            if date_match:
+                creation_date = date_match.group(1)
+                break
+                
+        # Extract classification
+        for pattern in classification_patterns:
+            class_match = re.search(pattern, search_text, re.IGNORECASE)
+            if class_match:
+                classification = class_match.group(1).upper()
+                break
+                
+        # Extract agency
+        for pattern in agency_patterns:
+            agency_match = re.search(pattern, search_text, re.IGNORECASE)
+            if agency_match:
+                agency = agency_match.group(1).strip()
+                break
+        
+        # Create JSON structure with enhanced metadata
+        json_content = {
+            "docId": doc_id,
+            "title": title,
+            "metadata": {
+                "source": "National Archives",
+                "collection": "JFK Files",
+                "format": "PDF to Markdown to JSON",
+                "conversion_timestamp": datetime.datetime.now().isoformat(),
+                "pages": len([s for s in sections if "Page" in s["title"]])
+            },
+            "sections": [],
+            "fullText": markdown_content
+        }
+        
+        # Add extracted metadata if available
+        if creation_date:
+            json_content["metadata"]["date"] = creation_date
+        if classification:
+            json_content["metadata"]["classification"] = classification
+        if agency:
+            json_content["metadata"]["agency"] = agency
+            
+        # Add sections to JSON with improved content formatting
+        for section in sections:
+            # Process content to fix formatting
+            content_text = "\n".join(section["content"])
+            
+            # Fix common formatting issues
+            content_text = re.sub(r'\n{3,}', '\n\n', content_text)  # Normalize excessive newlines
+            
+            json_section = {
+                "title": section["title"],
+                "level": section.get("level", 1),
+                "content": content_text
+            }
+            json_content["sections"].append(json_section)
+        
+        return json_content
+        
+    except Exception as e:
+        conversion_logger.error(f"Error converting markdown to JSON: {e}")
+        conversion_logger.error(traceback.format_exc())
+        
+        # Return a minimal valid JSON with error information
+        return {
+            "docId": title if title else os.path.splitext(os.path.basename(markdown_path))[0],
+            "title": title if title else os.path.splitext(os.path.basename(markdown_path))[0],
+            "metadata": {
+                "source": "National Archives",
+                "collection": "JFK Files",
+                "format": "PDF to Markdown to JSON",
+                "error": f"Conversion error: {str(e)}",
+                "conversion_timestamp": datetime.datetime.now().isoformat()
+            },
+            "sections": [],
+            "fullText": ""
+        }
+
+
+def comparable(json_content):
+    """
+    Drop the conversion timestamp, which differs between any two runs.
+
+    Args:
+        json_content (dict): Converted document
+
+    Returns:
+        dict: The document without metadata.conversion_timestamp
+    """
+    metadata = {key: value for key, value in json_content["metadata"].items() if key != "conversion_timestamp"}
+    return dict(json_content, metadata=metadata)
+
+
+def build_large_document(paths, pages, output_dir):
+    """
+    Write a long OCR-style document made of the sample files as page sections.
+
+    Args:
+        paths (list): Markdown files to draw pages from
+        pages (int): Number of page sections
+        output_dir (str): Directory to write the file to
+
+    Returns:
+        str: Path of the generated file
+    """
+    texts = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            texts.append(f.read())
+    parts = []
+    for page in range(1, pages + 1):
+        parts.append(f"## Page {page}\n\n{texts[page % len(texts)]}\n")
+    path = os.path.join(output_dir, f"large-ocr-{pages}-pages.md")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts))
+    return path
+
+
+def time_conversion(convert, path, iterations):
+    """
+    Time repeated conversions of one file.
+
+    Args:
+        convert (callable): Conversion function taking (markdown_path, title)
+        path (str): Markdown file
+        iterations (int): Number of conversions
+
+    Returns:
+        float: Best time of a single conversion in seconds
+    """
+    title = os.path.splitext(os.path.basename(path))[0]
+    best = float("inf")
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        convert(path, title)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def main():
+    """Main function to parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the Markdown to JSON parser")
+    parser.add_argument("--markdown-dir", default=DEFAULT_MARKDOWN_DIR, help="Directory of Markdown files")
+    parser.add_argument("--pages", type=int, default=500, help="Page sections in the simulated large OCR output")
+    parser.add_argument("--iterations", type=int, default=20, help="Conversions per file (best time is kept)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    # Keep the benchmark output readable
+    conversion_logger.setLevel(logging.WARNING)
+
+    paths = sorted(glob.glob(os.path.join(args.markdown_dir, "*.md")))
+    if not paths:
+        logger.error(f"No Markdown files found in {args.markdown_dir}")
+        sys.exit(1)
+
+    output_dir = tempfile.mkdtemp()
+    try:
+        large_path = build_large_document(paths, args.pages, output_dir)
+        totals = {"previous": 0.0, "single-pass": 0.0}
+        mismatches = 0
+        for path in paths + [large_path]:
+            title = os.path.splitext(os.path.basename(path))[0]
+            if comparable(legacy_convert_markdown_to_json(path, title)) != comparable(_convert_markdown_to_json(path, title)):
+                logger.error(f"Output differs for {path}")
+                mismatches += 1
+
+            previous = time_conversion(legacy_convert_markdown_to_json, path, args.iterations)
+            single_pass = time_conversion(_convert_markdown_to_json, path, args.iterations)
+            if path != large_path:
+                totals["previous"] += previous
+                totals["single-pass"] += single_pass
+            logger.info(f"{os.path.basename(path):>36} ({os.path.getsize(path) / 1024:7.1f} KB): "
+                        f"{previous * 1000:8.2f} ms -> {single_pass * 1000:8.2f} ms "
+                        f"({previous / single_pass:.2f}x)")
+    finally:
+        shutil.rmtree(output_dir)
+
+    logger.info(f"Sample files: {totals['previous'] * 1000:.2f} ms -> {totals['single-pass'] * 1000:.2f} ms "
+                f"({totals['previous'] / totals['single-pass']:.2f}x)")
+    if mismatches:
+        logger.error(f"{mismatches} files converted differently")
+        sys.exit(1)
+    logger.info("Both parsers produced identical JSON for every file")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,16 +33,24 @@ from src.utils.logging_utils import (
 from src.utils.checkpoint_utils import (
     save_checkpoint, load_checkpoint, create_directories
 )
-from src.utils.scrape_utils import scrape_jfk_files
-from src.utils.download_utils import download_pdf
+from src.utils.scrape_utils import (
+    scrape_jfk_files, stream_jfk_file_urls, scrape_jfk_file_changes, ScrapeConfig
+)
+from src.utils.url_manifest import get_url_manifest
+from src.utils.download_utils import download_pdf, DownloadConfig
 from src.utils.conversion_utils import (
     pdf_to_markdown, markdown_to_json, 
     transform_pandoc_json_to_standard_format, parse_markdown_with_python
 )
 from src.utils.batch_utils import (
-    process_file, process_batch, process_all_files, _process_all_files_optimized
+    process_file, process_batch, process_all_files, process_url_stream, _process_all_files_optimized
 )
 from src.utils.storage import store_json_data, get_document_path
+from src.utils.pdf2md_wrapper import OCRConfig
+from src.utils.ocr_cache import OCRCacheConfig
+from src.utils.async_download import AsyncDownloadConfig
+from src.utils.scheduling import SchedulingConfig, SCHEDULING_POLICIES
+from src.utils.rate_limit import RateLimitConfig
 
 # Initialize the logger with a default configuration for imports
 from src.utils.logging_utils import configure_logging
@@ -65,6 +73,44 @@ def main():
     parser.add_argument("--resume", action="store_true", help="Resume from the last checkpoint.")
     parser.add_argument("--no-resume", action="store_false", dest="resume", help="Do not resume from checkpoint.")
     parser.add_argument("--max-workers", type=int, help="Maximum number of concurrent downloads. Default is based on CPU count.")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Overlap downloads and conversion with a staged pipeline (download → detect → markdown → json → store).")
+    parser.add_argument("--process-pool", action="store_true",
+                        help="Run PDF to Markdown conversion in a pool of worker processes.")
+    parser.add_argument("--process-workers", type=int,
+                        help="Number of conversion worker processes for --process-pool. Default is the CPU count.")
+    parser.add_argument("--ocr-workers", type=int,
+                        help="Worker processes for page-level OCR within a single document. Default is 1 (no fan-out).")
+    parser.add_argument("--ocr-chunk-size", type=int,
+                        help="Pages per OCR worker task when --ocr-workers is greater than 1. Default is 4.")
+    parser.add_argument("--no-ocr-cache", action="store_false", dest="ocr_cache",
+                        help="Do not reuse or store per-page OCR results in the OCR cache.")
+    parser.add_argument("--async-downloads", action="store_true",
+                        help="Download on a single asyncio event loop instead of one thread per download.")
+    parser.add_argument("--per-host-limit", type=int,
+                        help="Concurrent downloads per host with --async-downloads. Default is 16.")
+    parser.add_argument("--http-rate", type=float,
+                        help="Requests per second to the archive for scraping and downloads. Default is 2; "
+                             "adaptive throttling may go up to 5 or this rate, whichever is higher.")
+    parser.add_argument("--verify-downloads", action="store_true",
+                        help="Hash every previously downloaded PDF against the download manifest, not only files "
+                             "whose size or modification time changed.")
+    parser.add_argument("--scrape-concurrency", type=int,
+                        help="Listing pages crawled at once during URL discovery. Default is 4.")
+    parser.add_argument("--no-stream", action="store_false", dest="stream",
+                        help="With --scrape-all, finish URL discovery before processing starts instead of "
+                             "processing each file as soon as its listing page is scraped.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Diff the listing against the URL manifest of previous scrapes: stop once pages are "
+                             "unchanged and only process new URLs and those an earlier run left unprocessed.")
+    parser.add_argument("--browser-scrape", action="store_true",
+                        help="Render every listing page in the headless browser instead of fetching it over plain HTTP.")
+    parser.add_argument("--schedule", choices=SCHEDULING_POLICIES, default=SchedulingConfig.POLICY,
+                        help="Order of full-scale processing by file size: largest_first shortens the total run, "
+                             "smallest_first finishes more files early. Default is 'largest_first'.")
+    parser.add_argument("--probe-sizes", action="store_true",
+                        help="Size files not downloaded yet with HEAD requests before scheduling. Costs one "
+                             "rate-limited request per file; by default they rank as the median local size.")
     parser.add_argument("--scrape-all", action="store_true", help="Scrape all 113 pages and process all 1,123 files.")
     parser.add_argument("--organize", action="store_true", default=True, help="Organize PDFs into subdirectories by collection.")
     parser.add_argument("--flat", action="store_false", dest="organize", help="Save PDFs in a flat directory structure.")
@@ -84,6 +130,34 @@ def main():
     # Process OCR options - use force_ocr if specified, otherwise fall back to ocr
     use_ocr = args.force_ocr or args.ocr
     
+    # Page-level OCR settings apply to every conversion in this run
+    if args.ocr_workers:
+        OCRConfig.PAGE_WORKERS = args.ocr_workers
+    if args.ocr_chunk_size:
+        OCRConfig.PAGE_CHUNK_SIZE = args.ocr_chunk_size
+    OCRCacheConfig.ENABLED = args.ocr_cache
+    
+    # Download engine settings apply to batch and pipelined processing
+    AsyncDownloadConfig.ENABLED = args.async_downloads
+    if args.per_host_limit:
+        AsyncDownloadConfig.PER_HOST_LIMIT = args.per_host_limit
+    DownloadConfig.VERIFY_HASHES = args.verify_downloads
+    if args.http_rate:
+        # Opt in to a faster request rate than the polite default
+        RateLimitConfig.HTTP_RATE = args.http_rate
+        try:
+            from src.optimization import OptimizationConfig
+            OptimizationConfig.BASE_HTTP_RATE = args.http_rate
+            OptimizationConfig.MAX_HTTP_RATE = max(OptimizationConfig.MAX_HTTP_RATE, args.http_rate)
+        except ImportError:
+            pass
+    SchedulingConfig.POLICY = args.schedule
+    SchedulingConfig.PROBE_REMOTE = args.probe_sizes
+    if args.scrape_concurrency:
+        ScrapeConfig.CONCURRENT_PAGES = args.scrape_concurrency
+    if args.browser_scrape:
+        ScrapeConfig.MODE = "browser"
+    
     # Handle test mode
     if args.test:
         logger.info(f"Running in test mode (OCR: {use_ocr}, Quality: {args.ocr_quality}).")
@@ -119,7 +193,10 @@ def main():
             "resume": args.resume,
             "with_ocr": use_ocr,
             "ocr_quality": args.ocr_quality,
-            "organize_directories": args.organize
+            "organize_directories": args.organize,
+            "pipelined": args.pipeline,
+            "use_process_pool": args.process_pool,
+            "process_workers": args.process_workers
         }
         
         # Add max_workers if specified
@@ -137,31 +214,86 @@ def main():
         end_page = 113
         logger.info(f"Scraping pages 1-{end_page} from {args.url}")
         
-        # Scrape all URLs
-        urls = scrape_jfk_files(args.url, args.start_page, end_page)
-        if urls:
-            logger.info(f"Successfully scraped {len(urls)} URLs from {end_page} pages")
-            # Save the scraped URLs to a checkpoint
-            save_checkpoint({"pdf_urls": urls}, "urls")
-            
-            # Process all scraped files with enhanced options
-            logger.info("Starting full-scale processing of all scraped files")
-            
-            # Create processing options dictionary
+        if args.stream:
+            # Downloads start as soon as the first listing page is scraped
+            logger.info("Processing files while their listing pages are scraped")
             processing_options = {
                 "resume": args.resume,
                 "with_ocr": use_ocr,
                 "ocr_quality": args.ocr_quality,
-                "organize_directories": args.organize
+                "organize_directories": args.organize,
+                "use_process_pool": args.process_pool,
+                "process_workers": args.process_workers
             }
-            
-            # Add max_workers if specified
             if args.max_workers:
                 processing_options["max_workers"] = args.max_workers
+            
+            manifest = None
+            if args.incremental:
+                manifest = get_url_manifest()
+                # Only successful URLs are marked; failures stay pending for the next run
+                processing_options["on_processed"] = manifest.mark_processed
+            _, _, total = process_url_stream(
+                stream_jfk_file_urls(args.url, args.start_page, end_page, manifest=manifest), **processing_options
+            )
+            if not total:
+                if args.incremental:
+                    logger.info("No new URLs since the last scrape")
+                else:
+                    logger.error("Failed to scrape URLs. Please check the logs for details.")
+        else:
+            # Scrape all URLs, or only the new ones (the URL checkpoint is then written by the scrape)
+            if args.incremental:
+                manifest = get_url_manifest()
+                changes = scrape_jfk_file_changes(args.url, args.start_page, end_page, manifest=manifest)
+                urls = changes["new"] + changes["pending"] if changes else None
+            else:
+                urls = scrape_jfk_files(args.url, args.start_page, end_page)
+            if urls:
+                logger.info(f"Successfully scraped {len(urls)} URLs from {end_page} pages")
+                # Save the scraped URLs to a checkpoint
+                if not args.incremental:
+                    save_checkpoint({"pdf_urls": urls}, "urls")
+                
+                # Process all scraped files with enhanced options
+                logger.info("Starting full-scale processing of all scraped files")
                 
-            process_all_files(urls, **processing_options)
+                # Create processing options dictionary
+                processing_options = {
+                    "resume": args.resume,
+                    "with_ocr": use_ocr,
+                    "ocr_quality": args.ocr_quality,
+                    "organize_directories": args.organize,
+                    "pipelined": args.pipeline,
+                    "use_process_pool": args.process_pool,
+                    "process_workers": args.process_workers
+                }
+                
+                # Add max_workers if specified
+                if args.max_workers:
+                    processing_options["max_workers"] = args.max_workers
+                
+                if args.incremental:
+                    # Results mark each URL processed in the manifest, so an interrupted
+                    # run leaves the rest pending for the next one
+                    del processing_options["pipelined"]
+                    process_url_stream(urls, on_processed=manifest.mark_processed, **processing_options)
+                else:
+                    process_all_files(urls, **processing_options)
+            elif args.incremental and urls is not None:
+                logger.info("No new URLs since the last scrape")
+            else:
+                logger.error("Failed to scrape URLs. Please check the logs for details.")
+    
+    # Report what changed on the listing since the last scrape
+    elif args.incremental:
+        changes = scrape_jfk_file_changes(args.url, args.start_page, args.end_page)
+        if changes:
+            logger.info(f"{len(changes['new'])} new, {len(changes['pending'])} unprocessed and "
+                        f"{len(changes['removed'])} removed URLs since the last scrape "
+                        f"({changes['pages_scraped']} pages checked). Use --scrape-all --incremental to process them.")
         else:
-            logger.error("Failed to scrape URLs. Please check the logs for details.")
+            logger.warning("No URLs scraped.")
     
     # If no specific mode is selected, scrape URLs based on provided arguments
     else:
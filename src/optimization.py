@@ -16,23 +16,33 @@ import time
 import signal
 import psutil
 import threading
-import queue
 import json
 import logging
 import pickle
 import hashlib
 import concurrent.futures
 from datetime import datetime, timedelta
+from collections import deque, Counter
 from pathlib import Path
 
-# Add parent directory to python path to import from jfk_scraper.py
+# Add parent directory to python path so the src package is importable
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Import required functions from jfk_scraper
-from jfk_scraper import (
-    logger, process_file, create_directories, track_error, 
-    performance_metrics, error_counts, save_checkpoint, load_checkpoint
+# Import required functions from the utility modules
+from src.utils.logging_utils import (
+    track_error, _performance_metrics as performance_metrics, _error_counts as error_counts
 )
+from src.utils.checkpoint_utils import save_checkpoint, load_checkpoint, create_directories
+from src.utils.batch_utils import process_file
+from src.utils.storage import export_lite_llm_data
+from src.utils.download_utils import get_http_session, close_http_session
+from src.utils.rate_limit import get_http_rate_limiter, get_http_rate_statistics
+from src.utils.worker_pool import ElasticThreadPool
+from src.utils.scheduling import SchedulingConfig, SizeAwareQueue, estimate_job_sizes
+from src.utils.progress_journal import ProgressJournal
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.optimization")
 
 # Configure constants for optimization
 class OptimizationConfig:
@@ -42,10 +52,10 @@ class OptimizationConfig:
     MIN_WORKERS = 2   # Minimum number of worker threads
     INITIAL_WORKERS = 5  # Initial number of worker threads
     
-    # Rate limiting and throttling
-    BASE_RATE_LIMIT = 0.5  # Base delay between operations (seconds)
-    MIN_RATE_LIMIT = 0.2   # Minimum delay (seconds)
-    MAX_RATE_LIMIT = 2.0   # Maximum delay (seconds)
+    # Rate limiting and throttling of outbound HTTP (scrape and download) requests
+    BASE_HTTP_RATE = 2.0  # Base request rate (requests/second)
+    MIN_HTTP_RATE = 0.5   # Minimum request rate (requests/second)
+    MAX_HTTP_RATE = 5.0   # Maximum request rate (requests/second)
     
     # Resource thresholds
     CPU_THRESHOLD_HIGH = 80  # CPU percentage to trigger throttling
@@ -53,6 +63,11 @@ class OptimizationConfig:
     MEM_THRESHOLD_HIGH = 75  # Memory percentage to trigger throttling
     MEM_THRESHOLD_LOW = 50   # Memory percentage to trigger acceleration
     
+    # Scaling hysteresis
+    SCALE_CONFIRMATIONS = 3  # Consecutive readings outside the band before scaling
+    SCALE_COOLDOWN = 30      # Minimum seconds between scaling decisions
+    SCALING_LOG_LENGTH = 100 # Scaling decisions kept in AdaptiveThreadPool.scaling_log
+    
     # Checkpointing
     CHECKPOINT_INTERVAL = 10  # Files processed between checkpoints
     CHECKPOINT_TIME = 300     # Time between checkpoints (seconds)
@@ -70,6 +85,12 @@ class OptimizationConfig:
     # Emergency handling
     MAX_ERRORS_BEFORE_PAUSE = 5  # Maximum consecutive errors before pausing
     PAUSE_DURATION = 60  # Duration to pause after too many errors (seconds)
+    
+    # Process-pool conversion
+    USE_PROCESS_POOL = False  # Run PDF to Markdown conversion in worker processes
+    PROCESS_POOL_WORKERS = None  # Worker processes (None = CPU count)
+    PROCESS_MEMORY_LIMIT_MB = 2048  # Memory cap per conversion worker
+    PROCESS_MAX_TASKS_PER_WORKER = 25  # Recycle workers after this many documents
 
 # Class for adaptive thread pool management
 class AdaptiveThreadPool:
@@ -78,11 +99,13 @@ class AdaptiveThreadPool:
     def __init__(self, config=None):
         """Initialize thread pool with configuration settings."""
         self.config = config or OptimizationConfig()
-        self.executor = concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.config.INITIAL_WORKERS
-        )
+        self.executor = ElasticThreadPool(self.config.INITIAL_WORKERS)
         self.active_workers = self.config.INITIAL_WORKERS
-        self.rate_limit = self.config.BASE_RATE_LIMIT
+        self.scaling_log = deque(maxlen=self.config.SCALING_LOG_LENGTH)
+        self.last_scaling_time = 0
+        self.http_rate = self.config.BASE_HTTP_RATE
+        self.rate_limiter = get_http_rate_limiter()
+        self.rate_limiter.set_rate(self.http_rate)
         self.shutdown_requested = False
         self.lock = threading.Lock()
         self.pause_event = threading.Event()
@@ -94,10 +117,16 @@ class AdaptiveThreadPool:
         self.monitor_thread.start()
         
         logger.info(f"AdaptiveThreadPool initialized with {self.active_workers} workers")
-        logger.info(f"Rate limit set to {self.rate_limit} seconds")
+        logger.info(f"HTTP rate limit set to {self.http_rate} requests/second")
     
     def _monitor_resources(self):
-        """Continuously monitor system resources and adjust thread pool accordingly."""
+        """
+        Continuously monitor system resources and resize the thread pool accordingly.
+        
+        Scaling uses hysteresis: load must stay outside the CPU/memory band for
+        SCALE_CONFIRMATIONS consecutive readings, and at least SCALE_COOLDOWN
+        seconds must pass between decisions, so the pool does not oscillate.
+        """
         consecutive_high_load = 0
         consecutive_low_load = 0
         
@@ -110,29 +139,27 @@ class AdaptiveThreadPool:
                 # Log current resource usage
                 logger.debug(f"System resources: CPU: {cpu_percent}%, Memory: {mem_percent}%")
                 
-                # Adapt based on CPU usage
-                if cpu_percent > self.config.CPU_THRESHOLD_HIGH:
+                # High if either resource is over its upper threshold, low only if both are under their lower one
+                if cpu_percent > self.config.CPU_THRESHOLD_HIGH or mem_percent > self.config.MEM_THRESHOLD_HIGH:
                     consecutive_high_load += 1
                     consecutive_low_load = 0
-                elif cpu_percent < self.config.CPU_THRESHOLD_LOW:
+                elif cpu_percent < self.config.CPU_THRESHOLD_LOW and mem_percent < self.config.MEM_THRESHOLD_LOW:
                     consecutive_low_load += 1
                     consecutive_high_load = 0
                 else:
                     consecutive_high_load = 0
                     consecutive_low_load = 0
                 
-                # Take action if consistently high or low load
-                if consecutive_high_load >= 3:
-                    self._throttle_processing()
+                # Take action if consistently high or low load and not scaled recently
+                cooled_down = time.time() - self.last_scaling_time >= self.config.SCALE_COOLDOWN
+                reason = f"CPU {cpu_percent}%, memory {mem_percent}%"
+                if consecutive_high_load >= self.config.SCALE_CONFIRMATIONS and cooled_down:
+                    self._throttle_processing(reason)
                     consecutive_high_load = 0
-                elif consecutive_low_load >= 3:
-                    self._accelerate_processing()
+                elif consecutive_low_load >= self.config.SCALE_CONFIRMATIONS and cooled_down:
+                    self._accelerate_processing(reason)
                     consecutive_low_load = 0
                 
-                # Additional throttling based on memory usage
-                if mem_percent > self.config.MEM_THRESHOLD_HIGH:
-                    self._throttle_processing()
-                
                 # Sleep before next check
                 time.sleep(self.config.MONITOR_INTERVAL)
             
@@ -140,60 +167,78 @@ class AdaptiveThreadPool:
                 logger.error(f"Error in resource monitoring: {e}")
                 time.sleep(self.config.MONITOR_INTERVAL)
     
-    def _throttle_processing(self):
-        """Reduce resource usage by throttling processing."""
+    def _record_scaling(self, action, old_workers, new_workers, old_rate, new_rate, reason):
+        """Log a scaling decision and keep it in scaling_log. Must be called with the lock held."""
+        self.last_scaling_time = time.time()
+        self.scaling_log.append({
+            "time": datetime.now().isoformat(),
+            "action": action,
+            "workers": [old_workers, new_workers],
+            "http_rate": [round(old_rate, 2), round(new_rate, 2)],
+            "reason": reason
+        })
+        logger.info(f"{action.capitalize()}: workers {old_workers} -> {new_workers}, "
+                    f"HTTP rate {old_rate:.2f} -> {new_rate:.2f} requests/s ({reason})")
+    
+    def _throttle_processing(self, reason="high load"):
+        """
+        Reduce resource usage by retiring a worker and lowering the HTTP rate.
+        
+        Args:
+            reason (str): Why the pool is being throttled, for the scaling log
+        """
         with self.lock:
             # Only throttle if we're not already at minimum
             if (self.active_workers > self.config.MIN_WORKERS or 
-                    self.rate_limit < self.config.MAX_RATE_LIMIT):
+                    self.http_rate > self.config.MIN_HTTP_RATE):
+                old_workers, old_rate = self.active_workers, self.http_rate
                 
-                # Reduce workers if possible
-                if self.active_workers > self.config.MIN_WORKERS:
-                    new_workers = max(self.config.MIN_WORKERS, self.active_workers - 1)
-                    logger.info(f"Throttling: Reducing workers from {self.active_workers} to {new_workers}")
-                    self.active_workers = new_workers
-                    
-                    # We can't directly resize ThreadPoolExecutor
-                    # We'll let natural worker completion handle the reduction
+                # Retire a worker if possible; it exits after its current task
+                self.active_workers = max(self.config.MIN_WORKERS, self.active_workers - 1)
+                self.executor.resize(self.active_workers)
                 
-                # Increase rate limit
-                new_rate = min(self.config.MAX_RATE_LIMIT, self.rate_limit * 1.5)
-                logger.info(f"Throttling: Increasing rate limit from {self.rate_limit} to {new_rate}")
-                self.rate_limit = new_rate
+                # Lower the HTTP request rate
+                self.http_rate = max(self.config.MIN_HTTP_RATE, self.http_rate / 1.5)
+                self.rate_limiter.set_rate(self.http_rate)
+                
+                self._record_scaling("throttling", old_workers, self.active_workers,
+                                     old_rate, self.http_rate, reason)
     
-    def _accelerate_processing(self):
-        """Increase resource usage to accelerate processing."""
+    def _accelerate_processing(self, reason="low load"):
+        """
+        Increase resource usage by adding a worker and raising the HTTP rate.
+        
+        Args:
+            reason (str): Why the pool is being accelerated, for the scaling log
+        """
         with self.lock:
             # Only accelerate if we're not already at maximum
             if (self.active_workers < self.config.MAX_WORKERS or 
-                    self.rate_limit > self.config.MIN_RATE_LIMIT):
+                    self.http_rate < self.config.MAX_HTTP_RATE):
+                old_workers, old_rate = self.active_workers, self.http_rate
                 
-                # Increase workers if possible
-                if self.active_workers < self.config.MAX_WORKERS:
-                    new_workers = min(self.config.MAX_WORKERS, self.active_workers + 1)
-                    logger.info(f"Accelerating: Increasing workers from {self.active_workers} to {new_workers}")
-                    self.active_workers = new_workers
-                    
-                    # We can't directly resize ThreadPoolExecutor
-                    # We'll utilize the new worker count in submit operations
+                # Start another worker if possible
+                self.active_workers = min(self.config.MAX_WORKERS, self.active_workers + 1)
+                self.executor.resize(self.active_workers)
                 
-                # Decrease rate limit
-                new_rate = max(self.config.MIN_RATE_LIMIT, self.rate_limit / 1.5)
-                logger.info(f"Accelerating: Decreasing rate limit from {self.rate_limit} to {new_rate}")
-                self.rate_limit = new_rate
+                # Raise the HTTP request rate
+                self.http_rate = min(self.config.MAX_HTTP_RATE, self.http_rate * 1.5)
+                self.rate_limiter.set_rate(self.http_rate)
+                
+                self._record_scaling("accelerating", old_workers, self.active_workers,
+                                     old_rate, self.http_rate, reason)
     
     def submit(self, fn, *args, **kwargs):
-        """Submit a task to the thread pool with adaptive rate limiting."""
+        """
+        Submit a task to the thread pool.
+        
+        Tasks are not delayed here; outbound HTTP requests made by the task are
+        paced by the shared rate limiter, so CPU-bound work is never throttled.
+        """
         # Wait for any active pause to end
         self.pause_event.wait()
         
-        # Apply rate limiting
-        time.sleep(self.rate_limit)
-        
-        # Submit task only if we haven't reached maximum active workers
-        with self.lock:
-            future = self.executor.submit(fn, *args, **kwargs)
-            return future
+        return self.executor.submit(fn, *args, **kwargs)
     
     def pause_processing(self, duration=None):
         """Pause processing for a specified duration or until resumed."""
@@ -386,11 +431,29 @@ class EnhancedCheckpointManager:
 class LargeScaleProcessor:
     """Handles processing of large file sets with memory optimization."""
     
-    def __init__(self, config=None):
+    def __init__(self, config=None, processing_options=None):
         """Initialize large-scale processor with configuration settings."""
         self.config = config or OptimizationConfig()
+        self.processing_options = dict(processing_options or {})
+        # Entries are exported once at the end of process_urls instead of per file
+        self.processing_options.setdefault("export_lite_llm", False)
         self.thread_pool = AdaptiveThreadPool(self.config)
         self.checkpoint_manager = EnhancedCheckpointManager(self.config)
+        # Per-URL outcomes are journaled as they happen instead of pickled with each checkpoint
+        self.journal = ProgressJournal(os.path.join(self.checkpoint_manager.base_dir, "large_scale_processing"))
+        
+        # Size the shared HTTP connection pool for the largest worker count
+        get_http_session(pool_size=self.config.MAX_WORKERS)
+        
+        # Optional process pool for the CPU-bound conversion step
+        self.conversion_pool = None
+        if self.config.USE_PROCESS_POOL:
+            from src.utils.conversion_pool import ConversionProcessPool
+            self.conversion_pool = ConversionProcessPool(
+                max_workers=self.config.PROCESS_POOL_WORKERS,
+                memory_limit_mb=self.config.PROCESS_MEMORY_LIMIT_MB,
+                max_tasks_per_worker=self.config.PROCESS_MAX_TASKS_PER_WORKER
+            )
         self.processing_stats = {
             "start_time": time.time(),
             "total_files": 0,
@@ -398,10 +461,13 @@ class LargeScaleProcessor:
             "successful_files": 0,
             "failed_files": 0,
             "skipped_files": 0,
-            "in_progress_files": 0
+            "in_progress_files": 0,
+            "makespan": None  # Seconds from the first task starting to the last finishing
         }
         self.futures = {}  # Track futures by URL
         self.url_status = {}  # Track status of each URL
+        self.status_counts = Counter()  # Number of URLs in each status, updated on every transition
+        self.progress_path = os.path.join(self.checkpoint_manager.base_dir, "large_scale_processing.progress.json")
         self.lock = threading.Lock()
         self.error_tracking = {"consecutive_errors": 0, "last_error_time": None}
         
@@ -430,12 +496,12 @@ class LargeScaleProcessor:
         try:
             # Mark as in-progress
             with self.lock:
-                self.url_status[url] = "in_progress"
+                self._set_status(url, "in_progress")
                 self.processing_stats["in_progress_files"] += 1
             
             # Process the file
             logger.info(f"Processing {url}")
-            success = process_file(url)
+            success = process_file(url, conversion_pool=self.conversion_pool, **self.processing_options)
             
             # Update tracking based on result
             with self.lock:
@@ -443,14 +509,15 @@ class LargeScaleProcessor:
                 self.processing_stats["in_progress_files"] -= 1
                 
                 if success:
-                    self.url_status[url] = "completed"
+                    self._set_status(url, "completed")
                     self.processing_stats["successful_files"] += 1
                     self.error_tracking["consecutive_errors"] = 0
                 else:
-                    self.url_status[url] = "failed"
+                    self._set_status(url, "failed")
                     self.processing_stats["failed_files"] += 1
                     self.error_tracking["consecutive_errors"] += 1
                     self.error_tracking["last_error_time"] = time.time()
+                self.journal.record(url, self.url_status[url])
                 
                 # Check if we should checkpoint
                 self.checkpoint_manager.record_processed()
@@ -469,7 +536,8 @@ class LargeScaleProcessor:
             logger.error(f"Error in process_file_wrapper for {url}: {e}")
             
             with self.lock:
-                self.url_status[url] = "error"
+                self._set_status(url, "error")
+                self.journal.record(url, "error")
                 self.processing_stats["failed_files"] += 1
                 self.processing_stats["in_progress_files"] -= 1
                 self.error_tracking["consecutive_errors"] += 1
@@ -483,14 +551,80 @@ class LargeScaleProcessor:
             
             return False
     
+    def _set_status(self, url, status):
+        """Move a URL to a new status, keeping status_counts current. Must be called with the lock held."""
+        previous = self.url_status.get(url)
+        if previous is not None:
+            self.status_counts[previous] -= 1
+        self.status_counts[status] += 1
+        self.url_status[url] = status
+    
+    def _load_statuses(self, url_status):
+        """Replace all URL statuses at once and recount them."""
+        with self.lock:
+            self.url_status = url_status
+            self.status_counts = Counter(url_status.values())
+    
+    def get_progress(self):
+        """
+        Get a snapshot of processing progress in constant time.
+        
+        Returns:
+            dict: Per-status counts, percentage complete, rate (files/s) and ETA (seconds)
+        """
+        with self.lock:
+            completed = self.status_counts["completed"]
+            failed = self.status_counts["failed"] + self.status_counts["error"]
+            pending = self.status_counts["pending"]
+            in_progress = self.status_counts["in_progress"]
+        
+        total = self.processing_stats["total_files"] or (completed + failed + pending + in_progress)
+        processed = completed + failed
+        time_elapsed = time.time() - self.processing_stats["start_time"]
+        rate = processed / time_elapsed if time_elapsed > 0 else 0.0
+        
+        return {
+            "total": total,
+            "completed": completed,
+            "failed": failed,
+            "pending": pending,
+            "in_progress": in_progress,
+            "processed": processed,
+            "percent": (processed / total) * 100 if total else 0.0,
+            "rate": rate,
+            "eta_seconds": (pending + in_progress) / rate if rate > 0 else None,
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+    
+    def _write_progress_file(self, progress=None):
+        """Publish progress for monitor_progress and other processes."""
+        progress = progress or self.get_progress()
+        temp_path = f"{self.progress_path}.temp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(progress, f)
+            os.replace(temp_path, self.progress_path)
+        except OSError as e:
+            logger.debug(f"Could not write progress file: {e}")
+    
     def _create_processing_checkpoint(self):
-        """Create a checkpoint of the current processing state."""
+        """
+        Create a checkpoint of the current processing state.
+        
+        URL statuses are already in the progress journal, so this only makes the
+        journal durable and saves the run's counters and metrics.
+        """
+        self.journal.flush()
+        
+        progress = self.get_progress()
+        self._write_progress_file(progress)
+        
         checkpoint_data = {
-            "url_status": self.url_status.copy(),
+            "progress": progress,
             "processing_stats": self.processing_stats.copy(),
             "params": {
                 "max_workers": self.config.MAX_WORKERS,
-                "rate_limit": self.config.BASE_RATE_LIMIT
+                "http_rate": self.config.BASE_HTTP_RATE
             }
         }
         
@@ -505,13 +639,20 @@ class LargeScaleProcessor:
         """Resume processing from the latest checkpoint."""
         checkpoint_data = self.checkpoint_manager.load_latest_checkpoint("large_scale_processing")
         
-        if checkpoint_data:
+        # Checkpoints from older versions carry the full URL status map; move it into the journal
+        if checkpoint_data and "url_status" in checkpoint_data and not self.journal.get_statuses():
+            self.journal.record_many({
+                url: status for url, status in checkpoint_data["url_status"].items()
+                if status in ("completed", "failed", "error")
+            })
+        
+        if checkpoint_data or self.journal.get_statuses():
             logger.info("Resuming from checkpoint")
+            checkpoint_data = checkpoint_data or {}
             
-            # Restore URL status
-            if "url_status" in checkpoint_data:
-                self.url_status = checkpoint_data["url_status"]
-                logger.info(f"Restored status for {len(self.url_status)} URLs")
+            # Restore URL status from the journal
+            self._load_statuses(self.journal.get_statuses())
+            logger.info(f"Restored status for {len(self.url_status)} URLs")
             
             # Restore processing stats
             if "processing_stats" in checkpoint_data:
@@ -523,6 +664,15 @@ class LargeScaleProcessor:
                 self.processing_stats["skipped_files"] = checkpoint_stats.get("skipped_files", 0)
                 self.processing_stats["total_files"] = checkpoint_stats.get("total_files", 0)
                 
+                # The journal may be ahead of the last checkpoint
+                counts = self.status_counts
+                self.processing_stats["successful_files"] = max(
+                    self.processing_stats["successful_files"], counts["completed"])
+                self.processing_stats["failed_files"] = max(
+                    self.processing_stats["failed_files"], counts["failed"] + counts["error"])
+                self.processing_stats["processed_files"] = max(
+                    self.processing_stats["processed_files"], len(self.url_status))
+                
                 logger.info(f"Restored processing stats: {self.processing_stats['processed_files']} processed, "
                            f"{self.processing_stats['successful_files']} successful")
             
@@ -552,21 +702,39 @@ class LargeScaleProcessor:
             
             # Initialize URL status if not resuming
             if not resume or not self.resume_from_checkpoint():
-                self.url_status = {url: "pending" for url in urls}
+                if not resume:
+                    self.journal.reset()
+                self._load_statuses({url: "pending" for url in urls})
+            else:
+                # The journal only holds finished URLs; everything else is pending
+                with self.lock:
+                    for url in urls:
+                        if url not in self.url_status:
+                            self._set_status(url, "pending")
             
             # Log initial state
-            completed = sum(1 for status in self.url_status.values() if status == "completed")
-            pending = sum(1 for status in self.url_status.values() if status == "pending")
-            failed = sum(1 for status in self.url_status.values() if status == "failed")
+            progress = self.get_progress()
             
             logger.info(f"Starting large-scale processing with {self.processing_stats['total_files']} total files")
-            logger.info(f"Initial state: {completed} completed, {pending} pending, {failed} failed")
+            logger.info(f"Initial state: {progress['completed']} completed, {progress['pending']} pending, "
+                       f"{progress['failed']} failed")
+            
+            # Sizing counts towards the makespan: probing can delay the first submit
+            makespan_start = time.time()
             
-            # Create a processing queue for pending URLs
-            url_queue = queue.Queue()
-            for url, status in self.url_status.items():
-                if status == "pending":
+            # Create a processing queue for pending URLs, ordered by the scheduling policy
+            pending_urls = [url for url, status in self.url_status.items() if status == "pending"]
+            url_queue = SizeAwareQueue(SchedulingConfig.POLICY)
+            if SchedulingConfig.POLICY == "fifo":
+                for url in pending_urls:
                     url_queue.put(url)
+            else:
+                sizes = estimate_job_sizes(
+                    pending_urls,
+                    organize_by_collection=self.processing_options.get("organize_directories", True)
+                )
+                url_queue.put_many(pending_urls, sizes)
+            logger.info(f"Scheduling {len(pending_urls)} files with the '{SchedulingConfig.POLICY}' policy")
             
             # Process URLs until queue is empty
             active_futures = set()
@@ -592,32 +760,25 @@ class LargeScaleProcessor:
                 
                 # Log progress periodically
                 if not url_queue.empty() and len(active_futures) > 0:
-                    completed = sum(1 for status in self.url_status.values() if status == "completed")
-                    pending = sum(1 for status in self.url_status.values() if status == "pending") + url_queue.qsize()
-                    failed = sum(1 for status in self.url_status.values() if status == "failed")
-                    in_progress = sum(1 for status in self.url_status.values() if status == "in_progress")
-                    
-                    time_elapsed = time.time() - self.processing_stats["start_time"]
-                    files_processed = completed + failed
+                    progress = self.get_progress()
                     
-                    # Calculate processing rate and ETA
-                    if files_processed > 0 and time_elapsed > 0:
-                        rate = files_processed / time_elapsed
-                        remaining_files = pending + in_progress
-                        eta_seconds = remaining_files / rate if rate > 0 else 0
-                        eta = str(timedelta(seconds=int(eta_seconds)))
+                    if progress["processed"] > 0 and progress["rate"] > 0:
+                        self._write_progress_file(progress)
+                        eta = str(timedelta(seconds=int(progress["eta_seconds"])))
+                        http_stats = self.thread_pool.rate_limiter.get_statistics()
                         
-                        # Calculate progress percentage
-                        progress = (files_processed / self.processing_stats["total_files"]) * 100
-                        
-                        logger.info(f"Progress: {progress:.1f}% - {completed} completed, {pending} pending, "
-                                   f"{failed} failed, {in_progress} in progress | "
-                                   f"Rate: {rate:.2f} files/s | ETA: {eta}")
+                        logger.info(f"Progress: {progress['percent']:.1f}% - {progress['completed']} completed, "
+                                   f"{progress['pending']} pending, {progress['failed']} failed, "
+                                   f"{progress['in_progress']} in progress | "
+                                   f"Rate: {progress['rate']:.2f} files/s | "
+                                   f"HTTP: {http_stats['tokens_per_sec']:.2f}/{http_stats['rate']:.2f} req/s | ETA: {eta}")
+            
+            self.processing_stats["makespan"] = time.time() - makespan_start
             
             # Final report
-            completed = sum(1 for status in self.url_status.values() if status == "completed")
-            failed = sum(1 for status in self.url_status.values() if status == "failed")
-            total_processed = completed + failed
+            progress = self.get_progress()
+            completed, failed = progress["completed"], progress["failed"]
+            total_processed = progress["processed"]
             
             if total_processed > 0:
                 success_rate = (completed / total_processed) * 100
@@ -625,6 +786,9 @@ class LargeScaleProcessor:
             else:
                 logger.info("Processing complete: No files were processed")
             
+            # Write the Lite LLM array file once for the whole run
+            export_lite_llm_data("lite_llm/jfk_files.json")
+            
             # Create final checkpoint
             self._create_processing_checkpoint()
             
@@ -648,6 +812,19 @@ class LargeScaleProcessor:
         except Exception as e:
             logger.error(f"Error shutting down thread pool: {e}")
         
+        # Shutdown conversion worker processes
+        if self.conversion_pool:
+            try:
+                self.conversion_pool.shutdown()
+            except Exception as e:
+                logger.error(f"Error shutting down conversion pool: {e}")
+        
+        # Every worker has finished, so no more outcomes will be journaled
+        self.journal.close()
+        
+        # Release pooled HTTP connections
+        close_http_session()
+        
         # Report final metrics
         self._report_final_metrics()
     
@@ -683,6 +860,22 @@ class LargeScaleProcessor:
             rate = self.processing_stats['processed_files'] / time_elapsed
             logger.info(f"Processing rate: {rate:.2f} files/second")
         
+        # Log the makespan achieved by the scheduling policy
+        if self.processing_stats["makespan"] is not None:
+            logger.info(f"Makespan: {timedelta(seconds=int(self.processing_stats['makespan']))} "
+                       f"({SchedulingConfig.POLICY} scheduling)")
+        
+        # Log worker pool scaling
+        scaling_log = self.thread_pool.scaling_log
+        logger.info(f"Worker pool: {self.thread_pool.active_workers} workers, "
+                   f"{len(scaling_log)} scaling decisions")
+        
+        # Log outbound HTTP rate limiting
+        http_stats = get_http_rate_statistics()
+        if http_stats:
+            logger.info(f"HTTP requests: {http_stats['tokens_per_sec']:.2f} tokens/second "
+                       f"(limit {http_stats['rate']:.2f}, {http_stats['wait_time']:.1f}s spent waiting)")
+        
         # Log error information
         for category, count in error_counts.items():
             if count > 0:
@@ -691,7 +884,8 @@ class LargeScaleProcessor:
         logger.info("=" * 80)
 
 # Main function to optimize for full-scale processing
-def optimize_full_scale_processing(url_list=None, resume=True, config=None):
+def optimize_full_scale_processing(url_list=None, resume=True, config=None, use_process_pool=None,
+                                   processing_options=None):
     """
     Optimize and process a full-scale list of URLs (all 1,123 files).
     
@@ -699,15 +893,21 @@ def optimize_full_scale_processing(url_list=None, resume=True, config=None):
         url_list (list): List of URLs to process. If None, will try to load from checkpoint.
         resume (bool): Whether to resume from a checkpoint if available.
         config (OptimizationConfig): Custom configuration settings for optimization.
+        use_process_pool (bool): Run PDF to Markdown conversion in worker processes.
+                                 If None, uses config.USE_PROCESS_POOL.
+        processing_options (dict): Extra keyword arguments for process_file
+                                   (e.g. with_ocr, ocr_quality).
         
     Returns:
         tuple: (successful_files, failed_files) counts
     """
     # Use default config if none provided
     config = config or OptimizationConfig()
+    if use_process_pool is not None:
+        config.USE_PROCESS_POOL = use_process_pool
     
     # Initialize processor
-    processor = LargeScaleProcessor(config)
+    processor = LargeScaleProcessor(config, processing_options=processing_options)
     
     try:
         # If no URL list provided, try to load from checkpoint
@@ -726,7 +926,7 @@ def optimize_full_scale_processing(url_list=None, resume=True, config=None):
         # Log start of large-scale processing
         logger.info(f"Starting optimized full-scale processing of {len(url_list)} files")
         logger.info(f"Maximum workers: {config.MAX_WORKERS}")
-        logger.info(f"Base rate limit: {config.BASE_RATE_LIMIT} seconds")
+        logger.info(f"Base HTTP rate: {config.BASE_HTTP_RATE} requests/second")
         
         # Process all URLs with optimized settings
         successful, failed = processor.process_urls(url_list, resume=resume)
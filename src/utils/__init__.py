@@ -17,9 +17,10 @@ from src.utils.checkpoint_utils import (
 
 from src.utils.download_utils import download_pdf, download_file
 from src.utils.conversion_utils import pdf_to_markdown, markdown_to_json
-from src.utils.pdf_utils import is_scanned_pdf, repair_document, detect_document_format
+from src.utils.pdf_utils import is_scanned_pdf, repair_document, detect_document_format, analyze_pdf, PDFAnalysis
 from src.utils.scrape_utils import scrape_jfk_files
 from src.utils.batch_utils import process_file, process_batch, process_all_files
+from src.utils.pipeline_utils import ProcessingPipeline, PipelineConfig, run_pipeline
 
 __all__ = [
     'configure_logging', 'log_metrics', 'update_performance_metrics',
@@ -28,7 +29,8 @@ __all__ = [
     'save_checkpoint', 'load_checkpoint', 'create_directories',
     'download_pdf', 'download_file',
     'pdf_to_markdown', 'markdown_to_json',
-    'is_scanned_pdf', 'repair_document', 'detect_document_format',
+    'is_scanned_pdf', 'repair_document', 'detect_document_format', 'analyze_pdf', 'PDFAnalysis',
     'scrape_jfk_files',
-    'process_file', 'process_batch', 'process_all_files'
+    'process_file', 'process_batch', 'process_all_files',
+    'ProcessingPipeline', 'PipelineConfig', 'run_pipeline'
 ]
\ No newline at end of file
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Memory admission control for JFK Files Scraper.
+
+Rasterizing a long scanned PDF at 300 DPI can take far more memory than
+converting a short digital one. Instead of reacting once system memory is
+already high, conversions estimate their memory cost up front from the file
+size, page count and OCR resolution, and wait for admission while the total
+estimated cost of running jobs would exceed a budget. Many small documents
+fit side by side; giant ones end up running alone.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+import psutil
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.admission")
+
+
+class AdmissionConfig:
+    """Configuration settings for memory admission control."""
+    ENABLED = True
+    MEMORY_BUDGET_MB = None  # Estimated memory all running conversions may use (None = fraction of RAM)
+    MEMORY_BUDGET_FRACTION = 0.5  # Share of total RAM used when MEMORY_BUDGET_MB is None
+
+    # Cost model
+    BASE_JOB_MB = 50  # Fixed overhead of a conversion
+    FILE_SIZE_FACTOR = 4  # Working memory per MB of PDF while it is parsed
+    TEXT_PAGE_MB = 0.2  # Extracted text and layout per page
+    PAGE_AREA_SQIN = 8.5 * 11  # Page size assumed when rasterizing (US letter)
+    RASTER_BYTES_PER_PIXEL = 3  # RGB
+    RASTER_OVERHEAD = 2.0  # Copies made while the page image is preprocessed and OCR'd
+
+
+def estimate_job_memory(file_size_mb, page_count, dpi=None, raster_pages=0, pages_in_memory=1,
+                        config=AdmissionConfig):
+    """
+    Estimate the peak memory of converting one document.
+
+    Args:
+        file_size_mb (float): Size of the PDF in MB
+        page_count (int): Number of pages
+        dpi (int, optional): OCR rendering resolution
+        raster_pages (int): Pages that will be rasterized for OCR
+        pages_in_memory (int): Rasterized pages held at once (the whole set when not streaming)
+        config: Cost model settings
+
+    Returns:
+        float: Estimated memory in MB
+    """
+    cost = config.BASE_JOB_MB + file_size_mb * config.FILE_SIZE_FACTOR + page_count * config.TEXT_PAGE_MB
+    if dpi and raster_pages:
+        page_mb = config.PAGE_AREA_SQIN * dpi * dpi * config.RASTER_BYTES_PER_PIXEL / (1024 * 1024)
+        cost += page_mb * config.RASTER_OVERHEAD * min(raster_pages, max(1, pages_in_memory))
+    return cost
+
+
+class MemoryAdmissionController:
+    """
+    Admits jobs while their combined estimated memory stays under a budget.
+
+    Jobs are admitted in arrival order, so a large job waiting for room is not
+    starved by a stream of small ones. A job estimated above the whole budget
+    is admitted once nothing else is running.
+    """
+
+    def __init__(self, budget_mb):
+        """
+        Initialize the controller.
+
+        Args:
+            budget_mb (float): Memory budget in MB
+        """
+        if budget_mb <= 0:
+            raise ValueError("budget_mb must be positive")
+        self.budget_mb = float(budget_mb)
+        self.in_use_mb = 0.0
+        self.running = 0
+        self.condition = threading.Condition()
+        self.waiting = deque()
+
+        # Statistics
+        self.admitted = 0
+        self.delayed = 0
+        self.wait_time = 0.0
+        self.peak_mb = 0.0
+
+    def _fits(self, cost_mb):
+        """Whether a job can start now. Must be called with the condition held."""
+        return self.running == 0 or self.in_use_mb + cost_mb <= self.budget_mb
+
+    def acquire(self, cost_mb, timeout=None):
+        """
+        Wait until a job of the given cost can run, then reserve its memory.
+
+        Args:
+            cost_mb (float): Estimated memory of the job
+            timeout (float, optional): Maximum seconds to wait
+
+        Returns:
+            bool: True if admitted, False if the timeout expired
+        """
+        ticket = object()
+        started = time.monotonic()
+        with self.condition:
+            self.waiting.append(ticket)
+            admitted = self.condition.wait_for(
+                lambda: self.waiting[0] is ticket and self._fits(cost_mb), timeout
+            )
+            self.waiting.remove(ticket)
+            if admitted:
+                self.in_use_mb += cost_mb
+                self.running += 1
+                self.admitted += 1
+                self.peak_mb = max(self.peak_mb, self.in_use_mb)
+                waited = time.monotonic() - started
+                if waited > 0.01:
+                    self.delayed += 1
+                    self.wait_time += waited
+            # The next ticket may be at the head now
+            self.condition.notify_all()
+        return admitted
+
+    def release(self, cost_mb):
+        """
+        Return a finished job's memory to the budget.
+
+        Args:
+            cost_mb (float): Cost passed to acquire()
+        """
+        with self.condition:
+            self.in_use_mb = max(0.0, self.in_use_mb - cost_mb)
+            self.running -= 1
+            self.condition.notify_all()
+
+    @contextmanager
+    def admit(self, cost_mb, label=None):
+        """
+        Context manager that holds a job's memory reservation while it runs.
+
+        Args:
+            cost_mb (float): Estimated memory of the job
+            label (str, optional): Job name for logging
+        """
+        with self.condition:
+            must_wait = bool(self.waiting) or not self._fits(cost_mb)
+        if must_wait:
+            logger.info(f"Waiting for memory to admit {label or 'job'} "
+                        f"(estimated {cost_mb:.0f} MB, {self.in_use_mb:.0f}/{self.budget_mb:.0f} MB in use)")
+        self.acquire(cost_mb)
+        try:
+            yield
+        finally:
+            self.release(cost_mb)
+
+    def get_statistics(self):
+        """
+        Get admission statistics.
+
+        Returns:
+            dict: Budget, current and peak reserved memory, running jobs and waits
+        """
+        with self.condition:
+            return {
+                "budget_mb": self.budget_mb,
+                "in_use_mb": self.in_use_mb,
+                "peak_mb": self.peak_mb,
+                "running": self.running,
+                "waiting": len(self.waiting),
+                "admitted": self.admitted,
+                "delayed": self.delayed,
+                "wait_time": self.wait_time
+            }
+
+
+# Process-wide controller, created on first use
+_admission_controller = None
+_admission_controller_lock = threading.Lock()
+
+
+def get_admission_controller():
+    """
+    Get the admission controller shared by all conversions in this process.
+
+    Returns:
+        MemoryAdmissionController: The shared controller
+    """
+    global _admission_controller
+    if _admission_controller is None:
+        with _admission_controller_lock:
+            if _admission_controller is None:
+                budget_mb = AdmissionConfig.MEMORY_BUDGET_MB
+                if not budget_mb:
+                    total_mb = psutil.virtual_memory().total / (1024 * 1024)
+                    budget_mb = total_mb * AdmissionConfig.MEMORY_BUDGET_FRACTION
+                _admission_controller = MemoryAdmissionController(budget_mb)
+                logger.info(f"Conversion memory budget set to {budget_mb:.0f} MB")
+    return _admission_controller
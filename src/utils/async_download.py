@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Asynchronous download engine for JFK Files Scraper.
+
+This module downloads PDFs on a single asyncio event loop with aiohttp, so
+hundreds of transfers can be in flight without an OS thread each. Concurrency
+is bounded per host by a semaphore, request starts are paced by a token
+bucket, and each body is streamed to disk using the same .part file, Range
+resume and download manifest conventions as download_utils.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import functools
+import concurrent.futures
+from urllib.parse import urlparse
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+# Import custom exceptions and utilities
+from src.utils.logging_utils import DownloadError, track_error, update_performance_metrics
+from src.utils.rate_limit import TokenBucket, get_http_rate_limiter
+from src.utils.download_utils import (
+    DownloadConfig, get_pdf_save_path, use_existing_download, get_manifest_for,
+    _load_resume_state, _save_resume_state, _discard_partial, _content_range
+)
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.async_download")
+
+# HTTP statuses that are not worth retrying
+PERMANENT_HTTP_ERRORS = (401, 403, 404)
+
+# Marker for an exhausted item iterator
+_END = object()
+
+
+class AsyncDownloadConfig:
+    """Configuration settings for the asyncio download engine."""
+    ENABLED = False  # Use the engine in process_batch and the pipeline
+    MAX_IN_FLIGHT = 200  # Concurrent downloads across all hosts
+    PER_HOST_LIMIT = 16  # Concurrent downloads per host
+    SHARED_RATE_LIMIT = True  # Pace requests with the process-wide HTTP limiter
+    RATE_LIMIT = None  # Private requests/sec for this engine instead of the shared limiter
+    BURST = 20  # Requests that may start at once after an idle period (private limiter only)
+    CONNECT_TIMEOUT = 10  # Seconds
+    READ_TIMEOUT = 60  # Seconds without data before a transfer is abandoned
+    MAX_RETRIES = 3
+    RETRY_DELAY = 1  # Initial delay between retries (seconds), doubled per retry
+
+
+def run_coroutine(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # Already inside an event loop: run on a separate thread with its own loop
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class AsyncDownloadEngine:
+    """Downloads many PDFs concurrently on one event loop."""
+
+    def __init__(self, config=None, rate_limiter=None):
+        """
+        Initialize the engine.
+
+        Args:
+            config (AsyncDownloadConfig): Concurrency, rate and retry settings
+            rate_limiter (TokenBucket, optional): Limiter shared with other callers
+        """
+        if not HAS_AIOHTTP:
+            raise ImportError("aiohttp is required for the async download engine (pip install aiohttp)")
+
+        self.config = config or AsyncDownloadConfig()
+        if rate_limiter is None and self.config.RATE_LIMIT:
+            rate_limiter = TokenBucket(self.config.RATE_LIMIT, self.config.BURST)
+        elif rate_limiter is None and self.config.SHARED_RATE_LIMIT:
+            rate_limiter = get_http_rate_limiter()
+        self.rate_limiter = rate_limiter
+        self._host_semaphores = {}
+
+    def _host_semaphore(self, url):
+        """Get the semaphore bounding concurrent downloads from the URL's host."""
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.config.PER_HOST_LIMIT)
+        return self._host_semaphores[host]
+
+    def _create_session(self):
+        """Create the aiohttp session for one run."""
+        connector = aiohttp.TCPConnector(limit=self.config.MAX_IN_FLIGHT,
+                                         limit_per_host=self.config.PER_HOST_LIMIT)
+        timeout = aiohttp.ClientTimeout(sock_connect=self.config.CONNECT_TIMEOUT,
+                                        sock_read=self.config.READ_TIMEOUT)
+        headers = {
+            'User-Agent': 'JFK-Files-Scraper/1.0 (Research Project)',
+            'Accept': 'application/pdf',
+            # Byte offsets must refer to the file as stored, not a decoded transfer
+            'Accept-Encoding': 'identity'
+        }
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers,
+                                     auto_decompress=False)
+
+    async def _write_body(self, response, part_path, mode):
+        """
+        Stream a response body into the .part file without blocking the event loop.
+
+        Chunks are collected into blocks of WRITE_BUFFER_SIZE and each block is
+        written by the default executor, as are opening, fsync and closing the file.
+
+        Args:
+            response (aiohttp.ClientResponse): Response to read
+            part_path (str): Partial file to write to
+            mode (str): 'wb' to start over or 'ab' to append to a resumed download
+
+        Returns:
+            int: Number of bytes written
+        """
+        loop = asyncio.get_running_loop()
+        written = 0
+        f = await loop.run_in_executor(None, functools.partial(
+            open, part_path, mode, buffering=DownloadConfig.WRITE_BUFFER_SIZE))
+        try:
+            block = []
+            block_size = 0
+            try:
+                async for chunk in response.content.iter_chunked(DownloadConfig.CHUNK_SIZE):
+                    block.append(chunk)
+                    block_size += len(chunk)
+                    written += len(chunk)
+                    if block_size >= DownloadConfig.WRITE_BUFFER_SIZE:
+                        await loop.run_in_executor(None, f.write, b"".join(block))
+                        block = []
+                        block_size = 0
+            finally:
+                # Keep what arrived before an interruption so the download can resume
+                if block:
+                    await loop.run_in_executor(None, f.write, b"".join(block))
+
+            # Make the file durable once
+            await loop.run_in_executor(None, f.flush)
+            await loop.run_in_executor(None, os.fsync, f.fileno())
+        finally:
+            await loop.run_in_executor(None, f.close)
+        return written
+
+    async def _fetch(self, session, url, save_path, manifest):
+        """
+        Stream one URL to disk, resuming or revalidating like download_file.
+
+        Args:
+            session (aiohttp.ClientSession): Session for this run
+            url (str): The URL to download from
+            save_path (str): The path to save the file to
+            manifest (DownloadManifest): Manifest to revalidate against and record into
+
+        Returns:
+            int: Size of the saved file
+        """
+        loop = asyncio.get_running_loop()
+        part_path = save_path + DownloadConfig.PART_SUFFIX
+        resume_path = part_path + DownloadConfig.RESUME_SUFFIX
+
+        request_headers = {}
+        offset, validator, state = _load_resume_state(url, part_path, resume_path)
+        entry = manifest.get(url) if manifest is not None else None
+        if offset:
+            request_headers['Range'] = f"bytes={offset}-"
+            request_headers['If-Range'] = validator
+            logger.info(f"Resuming {url} at byte {offset}")
+        elif entry and entry["path"] == save_path and os.path.exists(save_path):
+            if entry["etag"]:
+                request_headers['If-None-Match'] = entry["etag"]
+            if entry["last_modified"]:
+                request_headers['If-Modified-Since'] = entry["last_modified"]
+            logger.info(f"Revalidating {url}")
+        else:
+            logger.info(f"Downloading {url} to {save_path}")
+
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async()
+
+        try:
+            async with session.get(url, headers=request_headers) as response:
+                if response.status == 304 and entry:
+                    await loop.run_in_executor(None, manifest.touch, url)
+                    logger.info(f"Not modified, keeping {save_path}")
+                    return entry["size"]
+
+                if offset and response.status == 416:
+                    # Nothing left to fetch if the partial file is already complete
+                    _, total = _content_range(response)
+                    if total != offset:
+                        _discard_partial(part_path, resume_path)
+                        raise DownloadError(f"Cannot resume {url} at byte {offset}, restarting")
+                    expected_size = total
+                    actual_size = offset
+                else:
+                    response.raise_for_status()
+
+                    if offset and response.status == 206:
+                        start, total = _content_range(response)
+                        if start != offset:
+                            _discard_partial(part_path, resume_path)
+                            raise DownloadError(f"Server resumed {url} at byte {start}, expected {offset}")
+                        expected_size = total or offset + int(response.headers.get('Content-Length', 0))
+                        mode = 'ab'
+                    else:
+                        if offset:
+                            logger.info(f"{url} changed on the server, restarting download")
+                        offset = 0
+                        expected_size = int(response.headers.get('Content-Length', 0))
+                        state = _save_resume_state(url, response, resume_path)
+                        mode = 'wb'
+
+                    actual_size = offset + await self._write_body(response, part_path, mode)
+
+            # Verify file size if expected size was provided
+            if expected_size > 0 and actual_size != expected_size:
+                if actual_size > expected_size:
+                    _discard_partial(part_path, resume_path)
+                raise DownloadError(f"File size mismatch: expected {expected_size}, got {actual_size}")
+
+            # Publish the complete file atomically
+            os.replace(part_path, save_path)
+            if os.path.exists(resume_path):
+                os.remove(resume_path)
+
+            if manifest is not None:
+                await loop.run_in_executor(None, functools.partial(
+                    manifest.record, url, save_path,
+                    etag=state.get("etag"), last_modified=state.get("last_modified")))
+        except BaseException:
+            # Keep partial data only when a later attempt can safely resume it
+            if not os.path.exists(resume_path) and os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
+        return actual_size
+
+    async def download_pdf(self, session, pdf_url, save_dir="pdfs", organize_by_collection=True):
+        """
+        Download one PDF with retries, like download_utils.download_pdf.
+
+        Args:
+            session (aiohttp.ClientSession): Session for this run
+            pdf_url (str): The URL of the PDF file
+            save_dir (str): The base directory to save the PDF to
+            organize_by_collection (bool): Whether to organize files into subdirectories
+
+        Returns:
+            str: The path to the saved PDF file or None if download failed
+        """
+        loop = asyncio.get_running_loop()
+        start_time = time.time()
+
+        try:
+            save_path = get_pdf_save_path(pdf_url, save_dir, organize_by_collection)
+            manifest = get_manifest_for(save_dir)
+
+            # Hashing an existing file is blocking work
+            if await loop.run_in_executor(None, use_existing_download, pdf_url, save_path, manifest):
+                update_performance_metrics(
+                    total_download_size=os.path.getsize(save_path),
+                    download_times=time.time() - start_time
+                )
+                return save_path
+
+            delay = self.config.RETRY_DELAY
+            for attempt in range(1, self.config.MAX_RETRIES + 1):
+                try:
+                    async with self._host_semaphore(pdf_url):
+                        file_size = await self._fetch(session, pdf_url, save_path, manifest)
+                    break
+                except aiohttp.ClientResponseError as e:
+                    if e.status in PERMANENT_HTTP_ERRORS or attempt == self.config.MAX_RETRIES:
+                        raise
+                    error = e
+                except (aiohttp.ClientError, asyncio.TimeoutError, DownloadError, OSError) as e:
+                    if attempt == self.config.MAX_RETRIES:
+                        raise
+                    error = e
+                logger.warning(f"Retry {attempt}/{self.config.MAX_RETRIES} for {pdf_url} after error: {error!r}")
+                await asyncio.sleep(delay)
+                delay *= 2
+
+            update_performance_metrics(
+                total_download_size=file_size,
+                download_times=time.time() - start_time
+            )
+            return save_path
+
+        except Exception as e:
+            error_msg = f"Error downloading {pdf_url}: {e!r}"
+            logger.error(error_msg)
+            track_error("download", DownloadError(error_msg), pdf_url)
+            update_performance_metrics(failed_files=1)
+            return None
+
+    async def _download_item(self, session, item, url_of, save_dir, organize_by_collection, on_result):
+        """Download one work item and hand the result to the callback off the event loop."""
+        pdf_path = await self.download_pdf(session, url_of(item), save_dir, organize_by_collection)
+        if on_result:
+            try:
+                # The callback may block, e.g. on a full downstream queue
+                await asyncio.get_running_loop().run_in_executor(None, on_result, item, pdf_path)
+            except Exception as e:
+                logger.error(f"Error handling download result for {url_of(item)}: {e}")
+        return pdf_path
+
+    async def download_iter(self, items, save_dir="pdfs", organize_by_collection=True,
+                            on_result=None, url_of=None):
+        """
+        Download work items as they are produced, keeping up to MAX_IN_FLIGHT in flight.
+
+        Args:
+            items (iterable): URLs or work items; may block while waiting for more
+            save_dir (str): The base directory to save PDFs to
+            organize_by_collection (bool): Whether to organize files into subdirectories
+            on_result (callable, optional): Called with (item, pdf_path or None) per item
+            url_of (callable, optional): Get the URL from a work item (default: the item itself)
+
+        Returns:
+            tuple: (successful_count, failed_count)
+        """
+        loop = asyncio.get_running_loop()
+        url_of = url_of or (lambda item: item)
+        iterator = iter(items)
+        self._host_semaphores = {}
+        in_flight = set()
+        exhausted = False
+        successful = 0
+        failed = 0
+
+        async with self._create_session() as session:
+            while True:
+                while not exhausted and len(in_flight) < self.config.MAX_IN_FLIGHT:
+                    item = await loop.run_in_executor(None, next, iterator, _END)
+                    if item is _END:
+                        exhausted = True
+                        break
+                    in_flight.add(asyncio.ensure_future(self._download_item(
+                        session, item, url_of, save_dir, organize_by_collection, on_result)))
+
+                if not in_flight:
+                    break
+
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.result():
+                        successful += 1
+                    else:
+                        failed += 1
+
+        return successful, failed
+
+    def run(self, items, save_dir="pdfs", organize_by_collection=True, on_result=None, url_of=None):
+        """
+        Synchronous wrapper around download_iter.
+
+        Args:
+            items (iterable): URLs or work items; may block while waiting for more
+            save_dir (str): The base directory to save PDFs to
+            organize_by_collection (bool): Whether to organize files into subdirectories
+            on_result (callable, optional): Called with (item, pdf_path or None) per item
+            url_of (callable, optional): Get the URL from a work item (default: the item itself)
+
+        Returns:
+            tuple: (successful_count, failed_count)
+        """
+        return run_coroutine(self.download_iter(items, save_dir, organize_by_collection, on_result, url_of))
+
+    def download_urls(self, urls, save_dir="pdfs", organize_by_collection=True):
+        """
+        Download a list of URLs and wait for all of them.
+
+        Args:
+            urls (list): PDF URLs
+            save_dir (str): The base directory to save PDFs to
+            organize_by_collection (bool): Whether to organize files into subdirectories
+
+        Returns:
+            dict: URL mapped to the saved path, or None if its download failed
+        """
+        results = {}
+
+        def record(url, pdf_path):
+            results[url] = pdf_path
+
+        successful, failed = self.run(urls, save_dir, organize_by_collection, on_result=record)
+        logger.info(f"Async downloads complete: {successful} successful, {failed} failed")
+        return results
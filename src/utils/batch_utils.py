@@ -10,6 +10,7 @@ with performance tracking and error handling.
 import os
 import time
 import logging
+import traceback
 import concurrent.futures
 from pathlib import Path
 
@@ -17,15 +18,22 @@ from pathlib import Path
 from src.utils.logging_utils import (
     track_error, update_performance_metrics
 )
-from src.utils.checkpoint_utils import save_checkpoint, load_checkpoint
-from src.utils.download_utils import download_pdf
-from src.utils.conversion_utils import pdf_to_markdown, markdown_to_json
+from src.utils.checkpoint_utils import load_checkpoint
+from src.utils.download_utils import download_pdf, get_http_session
+from src.utils.async_download import AsyncDownloadConfig, AsyncDownloadEngine, HAS_AIOHTTP
+from src.utils.conversion_utils import (
+    pdf_to_markdown, markdown_to_json, admit_conversion, estimate_conversion_memory
+)
+from src.utils.pdf_utils import detect_document_format
+from src.utils.admission import AdmissionConfig, get_admission_controller
+from src.utils.progress_journal import ProgressJournal
 
 # Initialize logger
 logger = logging.getLogger("jfk_scraper.batch")
 
 
-def process_file(url, with_ocr=False, ocr_quality="high", organize_directories=True, with_performance_monitoring=True):
+def process_file(url, with_ocr=False, ocr_quality="high", organize_directories=True, with_performance_monitoring=True,
+                 conversion_pool=None, export_lite_llm=True):
     """
     Process a single file through the complete pipeline (download → PDF → Markdown → JSON).
     
@@ -35,6 +43,9 @@ def process_file(url, with_ocr=False, ocr_quality="high", organize_directories=T
         ocr_quality (str): OCR quality setting ("low", "medium", "high")
         organize_directories (bool): Whether to organize PDFs into subdirectories by collection
         with_performance_monitoring (bool): Whether to monitor and report performance
+        conversion_pool (ConversionProcessPool, optional): Process pool for the PDF to Markdown step
+        export_lite_llm (bool): Whether to refresh the Lite LLM array file after storing.
+                                Batch callers disable this and export once at the end.
         
     Returns:
         bool: True if processing was successful, False otherwise
@@ -64,7 +75,14 @@ def process_file(url, with_ocr=False, ocr_quality="high", organize_directories=T
             return False
         
         # Step 2: Convert PDF to Markdown with enhanced OCR options
-        markdown_path, _ = pdf_to_markdown(pdf_path, force_ocr=with_ocr, ocr_quality=ocr_quality)
+        if conversion_pool:
+            # Admit here: the workers cannot see each other's memory reservations
+            doc_format = detect_document_format(pdf_path, include_details=True)
+            with admit_conversion(pdf_path, doc_format, with_ocr, ocr_quality):
+                markdown_path = conversion_pool.convert(pdf_path, force_ocr=with_ocr, ocr_quality=ocr_quality,
+                                                        doc_format=doc_format)
+        else:
+            markdown_path, _ = pdf_to_markdown(pdf_path, force_ocr=with_ocr, ocr_quality=ocr_quality)
         if not markdown_path:
             logger.error(f"Failed to convert PDF to Markdown: {pdf_path}")
             update_performance_metrics(failed_files=1)
@@ -78,12 +96,14 @@ def process_file(url, with_ocr=False, ocr_quality="high", organize_directories=T
             return False
             
         # Step 4: Store in Lite LLM format
-        from src.utils.storage import store_json_data
+        from src.utils.storage import store_json_data, export_lite_llm_data
         lite_llm_path = "lite_llm/jfk_files.json"
         stored = store_json_data(json_path, lite_llm_path)
         if not stored:
             logger.warning(f"Failed to store JSON data in Lite LLM format: {json_path}")
             # Continue anyway, don't consider this a fatal error
+        elif export_lite_llm:
+            export_lite_llm_data(lite_llm_path)
 
         # Update performance metrics
         update_performance_metrics(successful_files=1)
@@ -106,7 +126,40 @@ def process_file(url, with_ocr=False, ocr_quality="high", organize_directories=T
         return False
 
 
-def process_batch(urls, batch_number, batch_metrics=None, with_ocr=False, ocr_quality="high", max_workers=None):
+def _submit_admitted(conversion_pool, pdf_path, doc_format, with_ocr, ocr_quality):
+    """
+    Submit a conversion to the process pool once its estimated memory is admitted.
+    
+    The reservation is released when the worker finishes, not when the result
+    is collected, so later submissions are not held up by the collection order.
+    
+    Args:
+        conversion_pool (ConversionProcessPool): Process pool to submit to
+        pdf_path (str): Path to the PDF file
+        doc_format (dict): Result of detect_document_format(include_details=True)
+        with_ocr (bool): Whether to force OCR processing
+        ocr_quality (str): OCR quality setting ("low", "medium", "high")
+    
+    Returns:
+        Future: Future returned by ConversionProcessPool.submit()
+    """
+    if not AdmissionConfig.ENABLED:
+        return conversion_pool.submit(pdf_path, force_ocr=with_ocr, ocr_quality=ocr_quality, doc_format=doc_format)
+    
+    controller = get_admission_controller()
+    memory_mb = estimate_conversion_memory(pdf_path, doc_format, with_ocr, ocr_quality)
+    controller.acquire(memory_mb)
+    try:
+        future = conversion_pool.submit(pdf_path, force_ocr=with_ocr, ocr_quality=ocr_quality, doc_format=doc_format)
+    except Exception:
+        controller.release(memory_mb)
+        raise
+    future.add_done_callback(lambda _: controller.release(memory_mb))
+    return future
+
+
+def process_batch(urls, batch_number, batch_metrics=None, with_ocr=False, ocr_quality="high", max_workers=None,
+                  pipelined=False, pipeline_config=None, conversion_pool=None, async_downloads=None):
     """
     Process a batch of files concurrently with batch metrics tracking.
     
@@ -116,6 +169,11 @@ def process_batch(urls, batch_number, batch_metrics=None, with_ocr=False, ocr_qu
         batch_metrics (object): BatchMetrics object for tracking (optional)
         with_ocr (bool): Whether to force OCR for PDF conversion
         max_workers (int, optional): Maximum number of concurrent workers
+        pipelined (bool): Whether to overlap download and conversion with a staged pipeline
+        pipeline_config (PipelineConfig, optional): Stage worker counts for pipelined mode
+        conversion_pool (ConversionProcessPool, optional): Process pool for PDF to Markdown conversion
+        async_downloads (bool, optional): Download with the asyncio engine instead of threads
+                                          (default: AsyncDownloadConfig.ENABLED)
         
     Returns:
         tuple: (successful_count, failed_count)
@@ -133,6 +191,34 @@ def process_batch(urls, batch_number, batch_metrics=None, with_ocr=False, ocr_qu
     if max_workers is None:
         max_workers = min(10, max(1, os.cpu_count() or 4))
     
+    # Pipelined mode: download, detection, conversion and storage run as
+    # concurrent stages so conversion starts as soon as the first PDF lands
+    if pipelined:
+        from src.utils.pipeline_utils import ProcessingPipeline, PipelineConfig
+        
+        config = pipeline_config or PipelineConfig()
+        if pipeline_config is None:
+            config.DOWNLOAD_WORKERS = max_workers
+            if conversion_pool:
+                # One feeding thread per worker process keeps the pool saturated
+                config.MARKDOWN_WORKERS = conversion_pool.max_workers
+        
+        pipeline = ProcessingPipeline(
+            config=config,
+            with_ocr=with_ocr,
+            ocr_quality=ocr_quality,
+            batch_metrics=batch_metrics,
+            conversion_pool=conversion_pool,
+            async_downloads=async_downloads
+        )
+        successful, failed = pipeline.run(urls)
+        
+        if batch_metrics:
+            batch_metrics.end_batch()
+        
+        logger.info(f"Batch {batch_number} complete: {successful} successful, {failed} failed")
+        return successful, failed
+    
     # Split processing into two phases: 
     # 1. Download PDFs concurrently (IO-bound)
     # 2. Process PDFs (CPU-bound with OCR)
@@ -140,42 +226,72 @@ def process_batch(urls, batch_number, batch_metrics=None, with_ocr=False, ocr_qu
     downloaded_paths = []
     download_results = {}
     
+    if async_downloads is None:
+        async_downloads = AsyncDownloadConfig.ENABLED
+    if async_downloads and not HAS_AIOHTTP:
+        logger.warning("aiohttp not available - using threaded downloads")
+        async_downloads = False
+    
     # Phase 1: Download PDFs concurrently
-    logger.info(f"Starting concurrent downloads with {max_workers} workers")
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Prepare download futures
-        future_to_url = {
-            executor.submit(
-                download_pdf, 
-                url, 
-                "pdfs", 
-                retry_count=3, 
-                organize_by_collection=True
-            ): url for url in urls
-        }
-        
-        # Process download results as they complete
-        for future in concurrent.futures.as_completed(future_to_url):
-            url = future_to_url[future]
-            try:
-                pdf_path = future.result()
-                if pdf_path:
-                    download_results[url] = (True, pdf_path)
-                    downloaded_paths.append(pdf_path)
-                    logger.info(f"Successfully downloaded {url} -> {pdf_path}")
-                else:
+    if async_downloads:
+        # Many transfers in flight on one event loop thread
+        logger.info(f"Starting async downloads ({AsyncDownloadConfig.PER_HOST_LIMIT} per host)")
+        for url, pdf_path in AsyncDownloadEngine().download_urls(urls, "pdfs", organize_by_collection=True).items():
+            download_results[url] = (bool(pdf_path), pdf_path)
+            if pdf_path:
+                downloaded_paths.append(pdf_path)
+            else:
+                logger.error(f"Failed to download {url}")
+    else:
+        # One kept-alive connection per worker thread
+        get_http_session(pool_size=max_workers)
+        logger.info(f"Starting concurrent downloads with {max_workers} workers")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Prepare download futures
+            future_to_url = {
+                executor.submit(
+                    download_pdf, 
+                    url, 
+                    "pdfs", 
+                    retry_count=3, 
+                    organize_by_collection=True
+                ): url for url in urls
+            }
+        
+            # Process download results as they complete
+            for future in concurrent.futures.as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    pdf_path = future.result()
+                    if pdf_path:
+                        download_results[url] = (True, pdf_path)
+                        downloaded_paths.append(pdf_path)
+                        logger.info(f"Successfully downloaded {url} -> {pdf_path}")
+                    else:
+                        download_results[url] = (False, None)
+                        logger.error(f"Failed to download {url}")
+                except Exception as e:
                     download_results[url] = (False, None)
-                    logger.error(f"Failed to download {url}")
-            except Exception as e:
-                download_results[url] = (False, None)
-                logger.error(f"Download error for {url}: {e}")
+                    logger.error(f"Download error for {url}: {e}")
     
     # Log download phase results
     successful_downloads = sum(1 for result in download_results.values() if result[0])
     logger.info(f"Download phase complete: {successful_downloads}/{len(urls)} successful")
     
     # Phase 2: Process downloaded PDFs
-    # Note: We process one at a time since OCR is CPU and memory intensive
+    # Without a process pool we convert one at a time since OCR is CPU and memory
+    # intensive; with a pool conversions are submitted as soon as the parent's
+    # admission controller has room for them and run in separate worker processes
+    conversion_futures = {}
+    if conversion_pool:
+        for url in urls:
+            download_success, pdf_path = download_results.get(url, (False, None))
+            if download_success and pdf_path:
+                doc_format = detect_document_format(pdf_path, include_details=True)
+                future = _submit_admitted(conversion_pool, pdf_path, doc_format, with_ocr, ocr_quality)
+                conversion_futures[url] = (time.time(), future)
+        logger.info(f"Submitted {len(conversion_futures)} conversions to the process pool")
+    
     for url in urls:
         start_time = time.time()
         success = False
@@ -185,7 +301,11 @@ def process_batch(urls, batch_number, batch_metrics=None, with_ocr=False, ocr_qu
         if download_success and pdf_path:
             try:
                 # Convert the PDF to markdown with quality settings
-                markdown_path, _ = pdf_to_markdown(pdf_path, force_ocr=with_ocr, ocr_quality=ocr_quality)
+                if url in conversion_futures:
+                    start_time, future = conversion_futures[url]
+                    markdown_path = conversion_pool.result(future, pdf_path)
+                else:
+                    markdown_path, _ = pdf_to_markdown(pdf_path, force_ocr=with_ocr, ocr_quality=ocr_quality)
                 
                 if markdown_path:
                     # Convert the markdown to JSON
@@ -225,7 +345,8 @@ def process_batch(urls, batch_number, batch_metrics=None, with_ocr=False, ocr_qu
 
 
 def process_all_files(urls=None, resume=True, batch_size=50, with_ocr=False, ocr_quality="high", 
-                    max_workers=None, organize_directories=True):
+                    max_workers=None, organize_directories=True, pipelined=False,
+                    use_process_pool=False, process_workers=None, use_optimization=True):
     """
     Process all JFK files with batch processing.
     
@@ -237,6 +358,10 @@ def process_all_files(urls=None, resume=True, batch_size=50, with_ocr=False, ocr
         ocr_quality (str): OCR quality setting ("low", "medium", "high").
         max_workers (int): Maximum number of concurrent downloads.
         organize_directories (bool): Whether to organize PDFs into subdirectories.
+        pipelined (bool): Whether to process each batch with the staged pipeline.
+        use_process_pool (bool): Whether to run PDF to Markdown conversion in worker processes.
+        process_workers (int): Number of conversion worker processes (default: CPU count).
+        use_optimization (bool): Whether to use the LargeScaleProcessor when it is available.
         
     Returns:
         tuple: (successful_count, failed_count, total_count)
@@ -258,9 +383,16 @@ def process_all_files(urls=None, resume=True, batch_size=50, with_ocr=False, ocr
         has_batch_metrics = False
         logger.warning("BatchMetrics not available - will process without detailed metrics")
     
-    # If optimization is available, use it
-    if has_optimization:
-        return _process_all_files_optimized(urls, resume)
+    # If optimization is available, use it (the staged pipeline replaces it when requested)
+    if has_optimization and use_optimization and not pipelined:
+        return _process_all_files_optimized(
+            urls, resume,
+            with_ocr=with_ocr,
+            ocr_quality=ocr_quality,
+            organize_directories=organize_directories,
+            use_process_pool=use_process_pool,
+            process_workers=process_workers
+        )
     
     # Otherwise, use basic batch processing
     logger.info("Starting full-scale processing with basic batch processing")
@@ -284,37 +416,42 @@ def process_all_files(urls=None, resume=True, batch_size=50, with_ocr=False, ocr
     # Create directories
     _create_directories()
     
+    # Start conversion worker processes if requested
+    conversion_pool = None
+    if use_process_pool:
+        from src.utils.conversion_pool import ConversionProcessPool
+        conversion_pool = ConversionProcessPool(max_workers=process_workers)
+    
     # Split URLs into batches
     total_urls = len(urls)
     total_batches = (total_urls + batch_size - 1) // batch_size  # Ceiling division
     
     logger.info(f"Processing {total_urls} URLs in {total_batches} batches")
     
-    # Load progress from checkpoint if resuming
+    # Progress is journaled per batch; recording a batch costs O(batch), not O(processed)
+    journal = ProgressJournal(os.path.join(".checkpoints", "progress"))
     start_batch = 0
     processed_urls = set()
     
     if resume:
-        progress_data = load_checkpoint("progress")
-        if progress_data:
-            if "processed_urls" in progress_data:
-                processed_urls = set(progress_data["processed_urls"])
-                logger.info(f"Resuming: {len(processed_urls)} URLs already processed")
-            if "current_batch" in progress_data:
-                start_batch = progress_data["current_batch"]
-                logger.info(f"Resuming from batch {start_batch}")
+        if not journal.get_statuses():
+            # Carry over progress from a pickled checkpoint written by older versions
+            progress_data = load_checkpoint("progress")
+            if progress_data and progress_data.get("processed_urls"):
+                journal.record_many(
+                    {url: "processed" for url in progress_data["processed_urls"]},
+                    current_batch=progress_data.get("current_batch", 0)
+                )
+        # URLs the streaming path journaled as failed are retried
+        processed_urls = {url for url, status in journal.get_statuses().items() if status == "processed"}
+        start_batch = journal.get_meta().get("current_batch", 0)
+        if processed_urls:
+            logger.info(f"Resuming: {len(processed_urls)} URLs already processed")
+            logger.info(f"Resuming from batch {start_batch}")
         else:
-            # Initialize an empty progress checkpoint if it doesn't exist
-            logger.info("No progress checkpoint found, initializing new one")
-            progress_data = {
-                "current_batch": 0,
-                "processed_urls": [],
-                "successful": 0,
-                "failed": 0,
-                "total": len(urls),
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-            }
-            save_checkpoint(progress_data, "progress")
+            logger.info("No progress journal found, starting a new one")
+    else:
+        journal.reset()
     
     # Filter out already processed URLs
     if processed_urls:
@@ -340,23 +477,25 @@ def process_all_files(urls=None, resume=True, batch_size=50, with_ocr=False, ocr
             batch_metrics=batch_metrics,
             with_ocr=with_ocr,
             ocr_quality=ocr_quality,
-            max_workers=max_workers
+            max_workers=max_workers,
+            pipelined=pipelined,
+            conversion_pool=conversion_pool
         )
         
         successful_total += successful
         failed_total += failed
         
-        # Update progress checkpoint
+        # Journal the batch and make it durable before moving on
         processed_urls.update(batch_urls)
-        progress_data = {
-            "current_batch": current_batch + 1,
-            "processed_urls": list(processed_urls),
-            "successful": successful_total,
-            "failed": failed_total,
-            "total": total_urls,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
-        save_checkpoint(progress_data, "progress")
+        journal.record_many(
+            {url: "processed" for url in batch_urls},
+            current_batch=current_batch + 1,
+            successful=successful_total,
+            failed=failed_total,
+            total=total_urls,
+            timestamp=time.strftime("%Y-%m-%d %H:%M:%S")
+        )
+        journal.flush()
         
         current_batch += 1
         
@@ -365,6 +504,20 @@ def process_all_files(urls=None, resume=True, batch_size=50, with_ocr=False, ocr
         progress_percent = (completed / total_urls) * 100
         logger.info(f"Progress: {progress_percent:.1f}% - {completed}/{total_urls} files processed")
     
+    journal.close()
+    
+    # Stop conversion worker processes
+    if conversion_pool:
+        conversion_pool.shutdown()
+    
+    # Write the Lite LLM array file once for the whole run
+    from src.utils.storage import export_lite_llm_data
+    export_lite_llm_data("lite_llm/jfk_files.json")
+    
+    # Report how much OCR work the page cache saved
+    from src.utils.ocr_cache import log_ocr_cache_statistics
+    log_ocr_cache_statistics()
+    
     # Generate overall report if batch metrics available
     if batch_metrics:
         batch_metrics.generate_overall_report()
@@ -374,13 +527,124 @@ def process_all_files(urls=None, resume=True, batch_size=50, with_ocr=False, ocr
     return successful_total, failed_total, total_urls
 
 
-def _process_all_files_optimized(urls=None, resume=True):
+def process_url_stream(urls, resume=True, with_ocr=False, ocr_quality="high", max_workers=None,
+                       organize_directories=True, use_process_pool=False, process_workers=None,
+                       on_processed=None):
+    """
+    Process URLs with the staged pipeline while they are still being discovered.
+    
+    Unlike process_all_files, the URLs do not have to be known up front: each
+    one enters the download stage as soon as the iterable yields it. Progress
+    is journaled per URL in the same journal process_all_files uses; URLs that
+    failed are journaled as "failed" and retried by the next run.
+    
+    Args:
+        urls (iterable): PDF URLs, e.g. from stream_jfk_file_urls. Duplicates are skipped.
+        resume (bool): Whether to skip URLs already recorded as processed.
+        with_ocr (bool): Whether to force OCR for all PDF conversions.
+        ocr_quality (str): OCR quality setting ("low", "medium", "high").
+        max_workers (int): Number of download workers (default: PipelineConfig.DOWNLOAD_WORKERS).
+        organize_directories (bool): Whether to organize PDFs into subdirectories.
+        use_process_pool (bool): Whether to run PDF to Markdown conversion in worker processes.
+        process_workers (int): Number of conversion worker processes (default: CPU count).
+        on_processed (callable, optional): Called with each URL that was processed successfully,
+                                           including URLs skipped because an earlier run processed them.
+        
+    Returns:
+        tuple: (successful_count, failed_count, total_count)
+    """
+    from src.utils.pipeline_utils import ProcessingPipeline, PipelineConfig
+    
+    logger.info("Starting streaming processing of discovered URLs")
+    _create_directories()
+    
+    journal = ProgressJournal(os.path.join(".checkpoints", "progress"))
+    if resume:
+        statuses = journal.get_statuses()
+        processed_urls = {url for url, status in statuses.items() if status == "processed"}
+        if processed_urls:
+            logger.info(f"Resuming: {len(processed_urls)} URLs already processed")
+        failed_before = len(statuses) - len(processed_urls)
+        if failed_before:
+            logger.info(f"Retrying {failed_before} URLs that failed in an earlier run if they are listed again")
+    else:
+        journal.reset()
+        processed_urls = set()
+    
+    conversion_pool = None
+    if use_process_pool:
+        from src.utils.conversion_pool import ConversionProcessPool
+        conversion_pool = ConversionProcessPool(max_workers=process_workers)
+    
+    config = PipelineConfig()
+    if max_workers:
+        config.DOWNLOAD_WORKERS = max_workers
+    if conversion_pool:
+        # One feeding thread per worker process keeps the pool saturated
+        config.MARKDOWN_WORKERS = conversion_pool.max_workers
+    
+    seen = set()
+    state = {"skipped": 0}
+    
+    def pending_urls():
+        for url in urls:
+            if url in seen:
+                continue
+            seen.add(url)
+            if url in processed_urls:
+                state["skipped"] += 1
+                if on_processed:
+                    on_processed(url)
+                continue
+            yield url
+    
+    def record_result(url, success):
+        journal.record(url, "processed" if success else "failed")
+        if success and on_processed:
+            on_processed(url)
+    
+    pipeline = ProcessingPipeline(
+        config=config,
+        with_ocr=with_ocr,
+        ocr_quality=ocr_quality,
+        organize_directories=organize_directories,
+        conversion_pool=conversion_pool,
+        on_result=record_result
+    )
+    try:
+        successful, failed = pipeline.run(pending_urls())
+    finally:
+        journal.close()
+        if conversion_pool:
+            conversion_pool.shutdown()
+    
+    # Write the Lite LLM array file once for the whole run
+    from src.utils.storage import export_lite_llm_data
+    export_lite_llm_data(config.LITE_LLM_PATH)
+    
+    # Report how much OCR work the page cache saved
+    from src.utils.ocr_cache import log_ocr_cache_statistics
+    log_ocr_cache_statistics()
+    
+    total_urls = len(seen)
+    logger.info(f"Streaming processing complete: {successful} successful, {failed} failed, "
+                f"{state['skipped']} already processed, {total_urls} total")
+    return successful, failed, total_urls
+
+
+def _process_all_files_optimized(urls=None, resume=True, with_ocr=False, ocr_quality="high",
+                                 organize_directories=True, use_process_pool=False, process_workers=None):
     """
     Process all files using the optimized LargeScaleProcessor.
     
     Args:
         urls (list): List of URLs to process. If None, will try to load from checkpoint.
         resume (bool): Whether to resume from checkpoint if available.
+        with_ocr (bool): Whether to force OCR for all PDF conversions.
+        ocr_quality (str): OCR quality setting ("low", "medium", "high").
+        organize_directories (bool): Whether to organize PDFs into subdirectories.
+        use_process_pool (bool): Whether to run PDF to Markdown conversion in worker processes.
+        process_workers (int): Number of conversion worker processes (default: CPU count).
         
     Returns:
         tuple: (successful_count, failed_count, total_count)
@@ -408,16 +672,26 @@ def _process_all_files_optimized(urls=None, resume=True):
         config = OptimizationConfig()
         config.MAX_WORKERS = min(20, os.cpu_count() * 2 if os.cpu_count() else 8)  # Adaptive based on CPU cores
         config.BATCH_SIZE = 50  # Default batch size
+        config.USE_PROCESS_POOL = use_process_pool
+        config.PROCESS_POOL_WORKERS = process_workers
         
         # Initialize processor
-        processor = LargeScaleProcessor(config)
+        processor = LargeScaleProcessor(config, processing_options={
+            "with_ocr": with_ocr,
+            "ocr_quality": ocr_quality,
+            "organize_directories": organize_directories
+        })
         
         # Process all URLs
         total_urls = len(urls)
         logger.info(f"Processing {total_urls} URLs with optimized processor")
         
         # Process with optimized settings
-        successful, failed = processor.process_urls(urls, resume=resume)
+        try:
+            successful, failed = processor.process_urls(urls, resume=resume)
+        finally:
+            if processor.conversion_pool:
+                processor.conversion_pool.shutdown()
         
         logger.info(f"Optimized full-scale processing complete: {successful} successful, {failed} failed, {total_urls} total")
         
@@ -426,12 +700,18 @@ def _process_all_files_optimized(urls=None, resume=True):
     except ImportError as e:
         logger.error(f"Failed to import optimization modules: {e}")
         logger.info("Falling back to basic batch processing")
-        return process_all_files(urls, resume)
+        return process_all_files(urls, resume, with_ocr=with_ocr, ocr_quality=ocr_quality,
+                                 organize_directories=organize_directories,
+                                 use_process_pool=use_process_pool, process_workers=process_workers,
+                                 use_optimization=False)
     
     except Exception as e:
         logger.error(f"Error during optimized processing: {e}")
         logger.info("Falling back to basic batch processing")
-        return process_all_files(urls, resume)
+        return process_all_files(urls, resume, with_ocr=with_ocr, ocr_quality=ocr_quality,
+                                 organize_directories=organize_directories,
+                                 use_process_pool=use_process_pool, process_workers=process_workers,
+                                 use_optimization=False)
 
 
 def _create_directories():
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Process-pool conversion engine for JFK Files Scraper.
+
+This module runs the PDF to Markdown conversion (PyMuPDF + pytesseract) in
+separate worker processes, so OCR-heavy batches use every core instead of
+being serialized by the GIL, and a crash in one conversion does not take
+down the whole run.
+"""
+
+import os
+import sys
+import logging
+import threading
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+
+# Import custom exceptions and utilities
+from src.utils.logging_utils import ConversionError, track_error
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.conversion_pool")
+
+# resource is only available on Unix-like systems
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
+
+# ProcessPoolExecutor gained native worker recycling in Python 3.11
+HAS_MAX_TASKS_PER_CHILD = sys.version_info >= (3, 11)
+
+# Set in every worker process (and inherited by anything it starts)
+WORKER_ENV = "JFK_SCRAPER_CONVERSION_WORKER"
+
+
+def is_conversion_worker():
+    """Whether this process is a ConversionProcessPool worker."""
+    return os.environ.get(WORKER_ENV) == "1"
+
+
+def _init_worker(memory_limit_mb):
+    """
+    Initialize a conversion worker process.
+
+    Args:
+        memory_limit_mb (int): Address-space limit for the worker in MB, or None
+    """
+    # The pool already uses every core, so conversions must not fan their
+    # pages out to a second process pool. ProcessPoolExecutor workers are not
+    # daemonic, so the wrapper cannot tell on its own.
+    os.environ[WORKER_ENV] = "1"
+
+    if memory_limit_mb and HAS_RESOURCE:
+        limit_bytes = int(memory_limit_mb) * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+        except (ValueError, OSError) as e:
+            logging.getLogger("jfk_scraper.conversion_pool").warning(
+                f"Could not apply memory limit of {memory_limit_mb} MB: {e}")
+
+
+def _convert_pdf_task(pdf_path, output_dir, force_ocr, ocr_quality, doc_format):
+    """
+    Convert a single PDF to Markdown inside a worker process.
+
+    Only the output path is returned to keep inter-process traffic small;
+    the Markdown content is on disk.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        output_dir (str): Directory to save the Markdown to
+        force_ocr (bool): Whether to force OCR processing
+        ocr_quality (str): OCR quality setting ("low", "medium", "high")
+        doc_format (dict): Pre-computed document format details, or None
+
+    Returns:
+        str: Path to the Markdown file, or None if conversion failed
+    """
+    from src.utils.conversion_utils import pdf_to_markdown
+
+    try:
+        markdown_path, _ = pdf_to_markdown(
+            pdf_path,
+            output_dir=output_dir,
+            force_ocr=force_ocr,
+            ocr_quality=ocr_quality,
+            doc_format=doc_format
+        )
+        return markdown_path
+    except MemoryError:
+        logging.getLogger("jfk_scraper.conversion_pool").error(
+            f"Conversion of {pdf_path} exceeded the worker memory limit")
+        return None
+
+
+class ConversionProcessPool:
+    """
+    ProcessPoolExecutor-backed engine for PDF to Markdown conversion with
+    a memory cap per worker and worker recycling after N documents.
+    """
+
+    def __init__(self, max_workers=None, memory_limit_mb=None, max_tasks_per_worker=None):
+        """
+        Initialize the conversion pool.
+
+        Args:
+            max_workers (int): Number of worker processes. Defaults to the CPU count.
+            memory_limit_mb (int): Memory cap per worker process in MB (Unix only)
+            max_tasks_per_worker (int): Recycle workers after this many documents
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks_per_worker = max_tasks_per_worker
+
+        self.lock = threading.Lock()
+        self.executor = None
+        self.generation = 0
+        self.submitted_in_generation = 0
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "crashed": 0, "retried": 0, "recycled": 0}
+
+        if memory_limit_mb and not HAS_RESOURCE:
+            logger.warning("Memory limits are not supported on this platform; running without a cap")
+
+        self._start_executor()
+
+        logger.info(f"ConversionProcessPool initialized with {self.max_workers} workers "
+                    f"(memory limit: {memory_limit_mb or 'none'} MB, "
+                    f"recycle after: {max_tasks_per_worker or 'never'} documents)")
+
+    def _start_executor(self):
+        """Create a fresh ProcessPoolExecutor. Must be called with the lock held or during init."""
+        kwargs = {
+            "max_workers": self.max_workers,
+            "initializer": _init_worker,
+            "initargs": (self.memory_limit_mb,)
+        }
+        if self.max_tasks_per_worker and HAS_MAX_TASKS_PER_CHILD:
+            kwargs["max_tasks_per_child"] = self.max_tasks_per_worker
+
+        self.executor = concurrent.futures.ProcessPoolExecutor(**kwargs)
+        self.generation += 1
+        self.submitted_in_generation = 0
+
+    def _rotate_executor(self, reason):
+        """Replace the current executor; running tasks on the old one are allowed to finish."""
+        old_executor = self.executor
+        logger.info(f"Recycling conversion workers ({reason})")
+        self._start_executor()
+        self.stats["recycled"] += 1
+        old_executor.shutdown(wait=False)
+
+    def submit(self, pdf_path, output_dir="markdown", force_ocr=False, ocr_quality="high", doc_format=None):
+        """
+        Submit a PDF for conversion.
+
+        Args:
+            pdf_path (str): Path to the PDF file
+            output_dir (str): Directory to save the Markdown to
+            force_ocr (bool): Whether to force OCR processing
+            ocr_quality (str): OCR quality setting ("low", "medium", "high")
+            doc_format (dict): Pre-computed document format details (optional). Its
+                               PDFAnalysis is not sent; the worker re-opens the PDF.
+
+        Returns:
+            Future: Resolves to the Markdown path, or None on failure
+        """
+        if doc_format and "analysis" in doc_format:
+            # Keep per-page data out of the pickled task
+            doc_format = {key: value for key, value in doc_format.items() if key != "analysis"}
+
+        with self.lock:
+            # Before Python 3.11 recycle the whole pool once every worker
+            # has had its share of documents
+            if (self.max_tasks_per_worker and not HAS_MAX_TASKS_PER_CHILD and
+                    self.submitted_in_generation >= self.max_tasks_per_worker * self.max_workers):
+                self._rotate_executor(f"{self.submitted_in_generation} documents converted")
+
+            future = self._submit_task((pdf_path, output_dir, force_ocr, ocr_quality, doc_format))
+            self.stats["submitted"] += 1
+            return future
+
+    def _submit_task(self, task):
+        """
+        Submit conversion arguments to the current executor. Must be called with the lock held.
+
+        The arguments are kept on the future so the task can be resubmitted
+        if the pool breaks before it finishes.
+
+        Args:
+            task (tuple): Arguments for _convert_pdf_task
+
+        Returns:
+            Future: Future for the conversion
+        """
+        try:
+            future = self.executor.submit(_convert_pdf_task, *task)
+        except BrokenProcessPool:
+            self._rotate_executor("worker pool was broken")
+            future = self.executor.submit(_convert_pdf_task, *task)
+
+        self.submitted_in_generation += 1
+        future.generation = self.generation
+        future.task = task
+        return future
+
+    def result(self, future, pdf_path=None):
+        """
+        Wait for a conversion future, isolating worker crashes.
+
+        When a worker dies, every task queued on or running in the pool fails
+        with BrokenProcessPool, not just the one that crashed. Such tasks are
+        resubmitted once to a fresh pool; a document only counts as crashed
+        if its retry breaks the pool as well.
+
+        Args:
+            future (Future): Future returned by submit()
+            pdf_path (str): PDF path for error reporting (optional)
+
+        Returns:
+            str: Path to the Markdown file, or None if conversion failed or the worker crashed
+        """
+        retried = False
+        while True:
+            try:
+                markdown_path = future.result()
+                break
+            except BrokenProcessPool as e:
+                with self.lock:
+                    # Only the first caller to notice replaces the broken executor
+                    if getattr(future, "generation", self.generation) == self.generation:
+                        self._rotate_executor("a worker process crashed")
+                    task = getattr(future, "task", None)
+                    if task is not None and not retried:
+                        future = self._submit_task(task)
+                        self.stats["retried"] += 1
+                        retried = True
+                        continue
+                    self.stats["crashed"] += 1
+                    self.stats["failed"] += 1
+                error_message = f"Conversion worker crashed while processing {pdf_path}: {e}"
+                logger.error(error_message)
+                track_error("pdf_to_markdown", ConversionError(error_message), pdf_path)
+                return None
+            except Exception as e:
+                with self.lock:
+                    self.stats["failed"] += 1
+                error_message = f"Conversion failed for {pdf_path}: {e}"
+                logger.error(error_message)
+                track_error("pdf_to_markdown", ConversionError(error_message), pdf_path)
+                return None
+
+        with self.lock:
+            if markdown_path:
+                self.stats["completed"] += 1
+            else:
+                self.stats["failed"] += 1
+        return markdown_path
+
+    def convert(self, pdf_path, output_dir="markdown", force_ocr=False, ocr_quality="high", doc_format=None):
+        """
+        Convert a PDF in a worker process and wait for the result.
+
+        Args:
+            pdf_path (str): Path to the PDF file
+            output_dir (str): Directory to save the Markdown to
+            force_ocr (bool): Whether to force OCR processing
+            ocr_quality (str): OCR quality setting ("low", "medium", "high")
+            doc_format (dict): Pre-computed document format details (optional)
+
+        Returns:
+            str: Path to the Markdown file, or None if conversion failed
+        """
+        future = self.submit(pdf_path, output_dir, force_ocr, ocr_quality, doc_format)
+        return self.result(future, pdf_path)
+
+    def get_statistics(self):
+        """
+        Get conversion pool statistics.
+
+        Returns:
+            dict: Submitted, completed, failed, crashed, retried and recycled counts
+        """
+        with self.lock:
+            return dict(self.stats, workers=self.max_workers, generation=self.generation)
+
+    def shutdown(self, wait=True):
+        """Shut down the worker processes."""
+        logger.info(f"Shutting down ConversionProcessPool: {self.get_statistics()}")
+        with self.lock:
+            if self.executor:
+                self.executor.shutdown(wait=wait)
@@ -13,16 +13,20 @@ import json
 import logging
 import time
 import datetime
+import traceback
 from pathlib import Path
+from contextlib import contextmanager
 
 # Import custom exceptions and utilities
 from src.utils.logging_utils import (
     ConversionError, track_error, update_performance_metrics
 )
 from src.utils.pdf_utils import (
-    is_scanned_pdf, repair_document, detect_document_format,
+    is_scanned_pdf, repair_document, detect_document_format, analyze_pdf,
     HAS_PYMUPDF, HAS_PDF2MD
 )
+from src.utils.admission import AdmissionConfig, estimate_job_memory, get_admission_controller
+from src.utils.conversion_pool import is_conversion_worker
 
 # Initialize logger
 logger = logging.getLogger("jfk_scraper.conversion")
@@ -161,7 +165,7 @@ def validate_markdown_quality(markdown_text):
     }
 
 
-def pdf_to_markdown(pdf_path, output_dir="markdown", force_ocr=False, ocr_quality="high"):
+def pdf_to_markdown(pdf_path, output_dir="markdown", force_ocr=False, ocr_quality="high", doc_format=None):
     """
     Converts a PDF document to Markdown format using pdf2md_wrapper with enhanced OCR support.
     
@@ -176,12 +180,15 @@ def pdf_to_markdown(pdf_path, output_dir="markdown", force_ocr=False, ocr_qualit
         output_dir (str): The directory to save the Markdown to.
         force_ocr (bool): Whether to force OCR processing even for digital PDFs.
         ocr_quality (str): OCR quality setting ("low", "medium", "high").
+        doc_format (dict, optional): Result of detect_document_format(include_details=True)
+                                     if it was already computed, to avoid a second pass.
 
     Returns:
         tuple: (markdown_path, markdown_content) or (None, None) if conversion failed.
     """
     # Keep the original return value for test compatibility
-    return convert_to_markdown_or_json(pdf_path, output_dir, "markdown", force_ocr, ocr_quality)
+    return convert_to_markdown_or_json(pdf_path, output_dir, "markdown", force_ocr, ocr_quality,
+                                       doc_format=doc_format)
 
 
 def markdown_to_json(markdown_path, output_dir="json"):
@@ -199,7 +206,8 @@ def markdown_to_json(markdown_path, output_dir="json"):
     return convert_to_markdown_or_json(markdown_path, output_dir, "json")
 
 
-def convert_to_markdown_or_json(input_path, output_dir, output_format, force_ocr=False, ocr_quality="high"):
+def convert_to_markdown_or_json(input_path, output_dir, output_format, force_ocr=False, ocr_quality="high",
+                                doc_format=None):
     """
     Helper function to convert a PDF to Markdown or Markdown to JSON.
 
@@ -209,6 +217,7 @@ def convert_to_markdown_or_json(input_path, output_dir, output_format, force_ocr
         output_format (str): Either "markdown" or "json".
         force_ocr (bool): Only relevant for PDF to Markdown; forces OCR.
         ocr_quality (str): OCR quality setting ("low", "medium", "high").
+        doc_format (dict, optional): Pre-computed document format details for PDF input.
 
     Returns:
         tuple: (output_path, output_content) or (None, None) if conversion failed.
@@ -239,7 +248,7 @@ def convert_to_markdown_or_json(input_path, output_dir, output_format, force_ocr
 
         # Handle PDF to Markdown conversion
         if output_format == "markdown":
-            output_content = _convert_pdf_to_markdown(input_path, force_ocr, ocr_quality)
+            output_content = _convert_pdf_to_markdown(input_path, force_ocr, ocr_quality, doc_format)
         # Handle Markdown to JSON conversion
         else:
             output_content = _convert_markdown_to_json(input_path, base_filename)
@@ -272,7 +281,99 @@ def convert_to_markdown_or_json(input_path, output_dir, output_format, force_ocr
         return None, None
 
 
-def _convert_pdf_to_markdown(pdf_path, force_ocr=False, ocr_quality="high"):
+def _estimate_conversion_memory(pdf_path, doc_format, needs_ocr, route_pages, ocr_quality):
+    """
+    Estimate the peak memory of converting a PDF, for admission control.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        doc_format (dict): Result of detect_document_format(include_details=True)
+        needs_ocr (bool): Whether every page will be OCR'd
+        route_pages (bool): Whether only the pages that need it will be OCR'd
+        ocr_quality (str): OCR quality setting ("low", "medium", "high")
+        
+    Returns:
+        float: Estimated memory in MB
+    """
+    from src.utils.pdf2md_wrapper import OCRConfig, OCR_DPI, get_page_count
+    
+    page_count = doc_format.get("page_count")
+    if page_count is None:
+        try:
+            page_count = get_page_count(pdf_path)
+        except Exception:
+            page_count = 1
+    
+    analysis = doc_format.get("analysis")
+    if needs_ocr:
+        raster_pages = page_count
+    elif route_pages and doc_format.get("ocr_page_count") is not None:
+        raster_pages = doc_format["ocr_page_count"]
+    elif route_pages and analysis is not None:
+        raster_pages = len(analysis.pages_needing_ocr())
+    else:
+        raster_pages = 0
+    
+    # Streaming OCR holds a window of pages (or one per OCR worker); otherwise all of them
+    if OCRConfig.STREAMING:
+        pages_in_memory = max(OCRConfig.PAGE_WINDOW, OCRConfig.PAGE_WORKERS)
+    else:
+        pages_in_memory = raster_pages
+    
+    file_size_mb = doc_format.get("file_size_mb")
+    if file_size_mb is None:
+        file_size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
+    
+    dpi = OCR_DPI.get(ocr_quality, OCR_DPI["low"])
+    return estimate_job_memory(file_size_mb, page_count, dpi, raster_pages, pages_in_memory)
+
+
+@contextmanager
+def admit_conversion(pdf_path, doc_format, force_ocr=False, ocr_quality="high"):
+    """
+    Hold a conversion's estimated memory in this process's admission controller.
+    
+    Conversions handed to a ConversionProcessPool are admitted by the parent
+    around submit/result: each worker process has a controller of its own, so
+    admitting inside the workers would never share the budget.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        doc_format (dict): Result of detect_document_format(include_details=True)
+        force_ocr (bool): Whether OCR is forced for every page
+        ocr_quality (str): OCR quality setting ("low", "medium", "high")
+    """
+    if not AdmissionConfig.ENABLED:
+        yield
+        return
+    with get_admission_controller().admit(estimate_conversion_memory(pdf_path, doc_format, force_ocr, ocr_quality),
+                                          label=os.path.splitext(os.path.basename(pdf_path))[0]):
+        yield
+
+
+def estimate_conversion_memory(pdf_path, doc_format, force_ocr=False, ocr_quality="high"):
+    """
+    Estimate the peak memory of a conversion before it starts.
+    
+    Uses only the fields that survive the trip to a pool worker (page_count,
+    ocr_page_count, file_size_mb). Rare formats are assumed to need full OCR,
+    as most of their processing strategies end up there.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        doc_format (dict): Result of detect_document_format(include_details=True)
+        force_ocr (bool): Whether OCR is forced for every page
+        ocr_quality (str): OCR quality setting ("low", "medium", "high")
+        
+    Returns:
+        float: Estimated memory in MB
+    """
+    needs_ocr = force_ocr or doc_format["needs_ocr"] or doc_format["is_rare_format"]
+    route_pages = not force_ocr and not doc_format["is_rare_format"]
+    return _estimate_conversion_memory(pdf_path, doc_format, needs_ocr, route_pages, ocr_quality)
+
+
+def _convert_pdf_to_markdown(pdf_path, force_ocr=False, ocr_quality="high", doc_format=None):
     """
     Internal function to convert PDF to Markdown with enhanced handling of rare formats.
     
@@ -280,12 +381,22 @@ def _convert_pdf_to_markdown(pdf_path, force_ocr=False, ocr_quality="high"):
         pdf_path (str): Path to the PDF file
         force_ocr (bool): Whether to force OCR processing
         ocr_quality (str): OCR quality setting ("low", "medium", "high")
+        doc_format (dict, optional): Pre-computed document format details
         
     Returns:
         str: Markdown content
     """
-    # Get detailed document format information
-    doc_format = detect_document_format(pdf_path, include_details=True)
+    # Get detailed document format information unless the caller already has it.
+    # Nothing crosses a queue here, so one full analysis serves detection and extraction.
+    if doc_format is None:
+        try:
+            analysis = analyze_pdf(pdf_path)
+        except Exception as e:
+            logger.debug(f"Could not analyze {pdf_path} up front: {e}")
+            analysis = None
+        doc_format = detect_document_format(pdf_path, include_details=True, analysis=analysis)
+    # The single-pass analysis behind doc_format, reused by the wrapper
+    analysis = doc_format.get("analysis")
     needs_ocr = force_ocr or doc_format["needs_ocr"]
     
     # Handle rare format documents
@@ -352,7 +463,20 @@ def _convert_pdf_to_markdown(pdf_path, force_ocr=False, ocr_quality="high"):
         logger.info(f"Converting {pdf_path} to markdown with pdf2md_wrapper (OCR: {needs_ocr}, Quality: {ocr_quality})")
         
         # Use the wrapper with all our enhanced options
-        markdown_content = convert_pdf_to_markdown(pdf_path, force_ocr=needs_ocr, ocr_quality=ocr_quality)
+        # Unless the user forced OCR or the format is unusual, let the wrapper
+        # OCR only the pages that need it
+        route_pages = not force_ocr and not doc_format["is_rare_format"]
+        
+        # Pool workers were already admitted by the parent (see admit_conversion)
+        if AdmissionConfig.ENABLED and not is_conversion_worker():
+            # Wait until the estimated memory of this conversion fits the budget
+            memory_mb = _estimate_conversion_memory(pdf_path, doc_format, needs_ocr, route_pages, ocr_quality)
+            with get_admission_controller().admit(memory_mb, label=doc_title):
+                markdown_content = convert_pdf_to_markdown(pdf_path, force_ocr=needs_ocr, ocr_quality=ocr_quality,
+                                                           analysis=analysis, route_pages=route_pages)
+        else:
+            markdown_content = convert_pdf_to_markdown(pdf_path, force_ocr=needs_ocr, ocr_quality=ocr_quality,
+                                                       analysis=analysis, route_pages=route_pages)
         
         # Validate the quality of the markdown output for monitoring
         markdown_quality = validate_markdown_quality(markdown_content)
@@ -548,6 +672,142 @@ def parse_markdown_with_python(markdown_text, doc_id):
     return result
 
 
+# Patterns used by _convert_markdown_to_json, compiled once
+_HEADER_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$')
+_PAGE_TITLE_PATTERN = re.compile(r'Page\s+(\d+)', re.IGNORECASE)
+_JFK_DOC_ID_PATTERN = re.compile(r'^(\d+-\d+-\d+)')
+_DOCID_PATTERN = re.compile(r'docid[-\s]?(\d+)')
+_EXCESS_NEWLINES_PATTERN = re.compile(r'\n{3,}')
+
+# Metadata fields and their patterns, most specific first. Each pattern has
+# exactly one capturing group, holding the value.
+_METADATA_PATTERNS = (
+    ("date", (
+        r'(?:Date|Dated):\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+        r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
+        r'(\d{1,2}/\d{1,2}/\d{2,4})'
+    )),
+    ("classification", (
+        r'(?:Classification|Classified):\s*(\w+\s+\w+|\w+)',
+        r'(CONFIDENTIAL|SECRET|TOP SECRET|UNCLASSIFIED)'
+    )),
+    ("agency", (
+        r'(?:Agency|From|Originator):\s*([\w\s]+)',
+        r'(CIA|FBI|HSCA|NSA|DOS|DOD)'
+    )),
+)
+
+# All metadata patterns as one alternation; the index of the group that took
+# part in a match identifies the field and the pattern's rank. No two of the
+# patterns can match at the same position, so stepping one character past
+# each match start finds the first match of every pattern. Every pattern
+# starts with a digit or one of the letters in the lookahead, which lets the
+# scan skip other positions without trying each alternative.
+_METADATA_PATTERN = re.compile(
+    r"(?=[\dACDFHNOSTU])(?:" +
+    "|".join(f"(?:{pattern})" for _, patterns in _METADATA_PATTERNS for pattern in patterns) + ")",
+    re.IGNORECASE
+)
+_METADATA_GROUPS = [
+    (field, rank) for field, patterns in _METADATA_PATTERNS for rank in range(len(patterns))
+]
+
+
+def _extract_markdown_metadata(text):
+    """
+    Find the date, classification and agency in a document's opening text.
+    
+    For each field the first pattern in _METADATA_PATTERNS that matches
+    anywhere wins, at its first match, all found in one scan of the text.
+    
+    Args:
+        text (str): Text to search
+        
+    Returns:
+        dict: Raw matched value for each field found
+    """
+    found = {}  # Field -> (rank, value)
+    position = 0
+    while True:
+        match = _METADATA_PATTERN.search(text, position)
+        if not match:
+            break
+        field, rank = _METADATA_GROUPS[match.lastindex - 1]
+        if field not in found or rank < found[field][0]:
+            found[field] = (rank, match.group(match.lastindex))
+            if len(found) == len(_METADATA_PATTERNS) and not any(rank for rank, _ in found.values()):
+                # Every field has its best pattern; nothing later can win
+                break
+        position = match.start() + 1
+    return {field: value for field, (_, value) in found.items()}
+
+
+def _split_markdown_sections(lines):
+    """
+    Split Markdown lines into sections in a single pass.
+    
+    A section starts at a header (or, before the first section, at the
+    first line of text) and its content runs from its first non-blank line
+    up to the next header outside a code block, so sections are returned as
+    line index ranges rather than copied line lists. Sections without a
+    title or content are dropped.
+    
+    Args:
+        lines (list): Lines of the document
+        
+    Returns:
+        list: (title, level, start, end) tuples; content is lines[start:end]
+    """
+    sections = []
+    title = ""
+    level = 1
+    start = None  # Index of the current section's first content line
+    in_code_block = False
+    
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        
+        # Code fences and code block lines are content, never headers
+        if stripped.startswith('```'):
+            in_code_block = not in_code_block
+            if title and start is None:
+                start = index
+            continue
+        if in_code_block:
+            continue
+        
+        if line.startswith('#'):
+            header_match = _HEADER_PATTERN.match(line)
+            if header_match:
+                if title and start is not None:
+                    sections.append((title, level, start, index))
+                
+                level = len(header_match.group(1))
+                title = header_match.group(2).strip()
+                
+                # Special handling for page markers
+                page_match = _PAGE_TITLE_PATTERN.match(header_match.group(2))
+                if page_match:
+                    title = f"Page {page_match.group(1)}"
+                start = None
+                continue
+        
+        if stripped and start is None:
+            if title:
+                start = index
+            elif not sections:
+                # Text before any header becomes an implicit section
+                title = "Document Content"
+                level = 1
+                start = index
+    
+    # Don't forget the last section
+    if title and start is not None:
+        sections.append((title, level, start, len(lines)))
+    
+    return sections
+
+
 def _convert_markdown_to_json(markdown_path, title=None):
     """
     Internal function to convert Markdown to JSON with enhanced error handling
@@ -571,11 +831,11 @@ def _convert_markdown_to_json(markdown_path, title=None):
         doc_id = title
         
         # Extract standard JFK document ID patterns
-        doc_id_match = re.match(r'^(\d+-\d+-\d+)', title)
+        doc_id_match = _JFK_DOC_ID_PATTERN.match(title)
         if doc_id_match:
             doc_id = doc_id_match.group(1)
         elif "docid" in title.lower():
-            doc_id_match = re.search(r'docid[-\s]?(\d+)', title.lower())
+            doc_id_match = _DOCID_PATTERN.search(title.lower())
             if doc_id_match:
                 doc_id = f"docid-{doc_id_match.group(1)}"
         
@@ -596,137 +856,22 @@ def _convert_markdown_to_json(markdown_path, title=None):
                 "fullText": ""
             }
         
-        # Check for our pdf2md_wrapper
-        have_pdf2md = False
-        try:
-            from src.utils.pdf2md_wrapper import PDF2MarkdownWrapper
-            have_pdf2md = True
-            logger.info("Using PDF2MarkdownWrapper for enhanced section detection")
-        except ImportError:
-            logger.info("PDF2MarkdownWrapper not available, using basic section extraction")
-        
         # Process markdown into sections with enhanced detection
-        sections = []
-        current_section = {"title": "", "content": []}
         lines = markdown_content.split('\n')
-        
-        # First-pass extraction with improved section detection
-        page_pattern = re.compile(r'^#+\s+Page\s+(\d+)', re.IGNORECASE)
-        in_content_block = False
-        code_block_markers = 0
-        
-        for line in lines:
-            # Handle code blocks specially
-            if line.strip().startswith('```'):
-                code_block_markers += 1
-                in_content_block = (code_block_markers % 2 == 1)  # Toggle state for each marker
-                if current_section["title"]:  # Only add to current section if we have one
-                    current_section["content"].append(line)
-                continue
-                
-            # Skip header detection inside code blocks
-            if in_content_block:
-                if current_section["title"]:
-                    current_section["content"].append(line)
-                continue
-            
-            # Try to detect headers
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if header_match:
-                # Save previous section if it exists
-                if current_section["title"] and current_section["content"]:
-                    # Join content, ensuring proper handling of lists and paragraphs
-                    sections.append(current_section.copy())
-                
-                level = len(header_match.group(1))
-                section_title = header_match.group(2).strip()
-                
-                # Special handling for page markers
-                page_match = page_pattern.match(line)
-                if page_match:
-                    page_num = page_match.group(1)
-                    section_title = f"Page {page_num}"
-                
-                current_section = {
-                    "title": section_title,
-                    "level": level,
-                    "content": []
-                }
-            elif line.strip():  # Non-empty line
-                if current_section["title"]:  # If we're in a section
-                    current_section["content"].append(line)
-                elif not sections:  # If no sections yet and this is text, create an implicit section
-                    current_section = {
-                        "title": "Document Content",
-                        "level": 1,
-                        "content": [line]
-                    }
-            else:  # Empty line
-                if current_section["title"] and current_section["content"]:  # Only add if we have content
-                    current_section["content"].append(line)  # Preserve paragraph breaks
-        
-        # Don't forget the last section
-        if current_section["title"] and current_section["content"]:
-            sections.append(current_section)
+        sections = _split_markdown_sections(lines)
             
         # Handle case where no proper sections were found
         if not sections:
             logger.warning(f"No proper sections found in {markdown_path}, using fallback extraction")
             # Create a fallback section with all content
-            sections = [{
-                "title": "Document Content",
-                "level": 1,
-                "content": markdown_content.split('\n')
-            }]
-        
-        # Try to extract date and classification information
-        creation_date = None
-        classification = None
-        agency = None
-        
-        # Look for date patterns in the first few sections
-        date_patterns = [
-            r'(?:Date|Dated):\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
-            r'(\d{1,2}/\d{1,2}/\d{2,4})'
-        ]
-        
-        # Look for classification patterns
-        classification_patterns = [
-            r'(?:Classification|Classified):\s*(\w+\s+\w+|\w+)',
-            r'(CONFIDENTIAL|SECRET|TOP SECRET|UNCLASSIFIED)'
-        ]
-        
-        # Look for agency patterns
-        agency_patterns = [
-            r'(?:Agency|From|Originator):\s*([\w\s]+)',
-            r'(CIA|FBI|HSCA|NSA|DOS|DOD)'
-        ]
+            sections = [("Document Content", 1, 0, len(lines))]
         
         # Check the first few sections for metadata
-        search_text = "\n".join([section["title"] + "\n" + "\n".join(section["content"]) 
-                                for section in sections[:min(3, len(sections))]])
-        
-        # Extract date
-        for pattern in date_patterns:
-            date_match = re.search(pattern, search_text, re.IGNORECASE)
-            if date_match:
-                creation_date = date_match.group(1)
-                break
-                
-        # Extract classification
-        for pattern in classification_patterns:
-            class_match = re.search(pattern, search_text, re.IGNORECASE)
-            if class_match:
-                classification = class_match.group(1).upper()
-                break
-                
-        # Extract agency
-        for pattern in agency_patterns:
-            agency_match = re.search(pattern, search_text, re.IGNORECASE)
-            if agency_match:
-                agency = agency_match.group(1).strip()
-                break
+        search_text = "\n".join(
+            section_title + "\n" + "\n".join(lines[start:end])
+            for section_title, _, start, end in sections[:3]
+        )
+        metadata = _extract_markdown_metadata(search_text)
         
         # Create JSON structure with enhanced metadata
         json_content = {
@@ -737,34 +882,33 @@ def _convert_markdown_to_json(markdown_path, title=None):
                 "collection": "JFK Files",
                 "format": "PDF to Markdown to JSON",
                 "conversion_timestamp": datetime.datetime.now().isoformat(),
-                "pages": len([s for s in sections if "Page" in s["title"]])
+                "pages": sum(1 for section_title, _, _, _ in sections if "Page" in section_title)
             },
             "sections": [],
             "fullText": markdown_content
         }
         
         # Add extracted metadata if available
-        if creation_date:
-            json_content["metadata"]["date"] = creation_date
-        if classification:
-            json_content["metadata"]["classification"] = classification
-        if agency:
-            json_content["metadata"]["agency"] = agency
+        if metadata.get("date"):
+            json_content["metadata"]["date"] = metadata["date"]
+        if metadata.get("classification"):
+            json_content["metadata"]["classification"] = metadata["classification"].upper()
+        if metadata.get("agency") and metadata["agency"].strip():
+            json_content["metadata"]["agency"] = metadata["agency"].strip()
             
         # Add sections to JSON with improved content formatting
-        for section in sections:
-            # Process content to fix formatting
-            content_text = "\n".join(section["content"])
+        for section_title, level, start, end in sections:
+            content_text = "\n".join(lines[start:end])
             
             # Fix common formatting issues
-            content_text = re.sub(r'\n{3,}', '\n\n', content_text)  # Normalize excessive newlines
+            if "\n\n\n" in content_text:
+                content_text = _EXCESS_NEWLINES_PATTERN.sub('\n\n', content_text)  # Normalize excessive newlines
             
-            json_section = {
-                "title": section["title"],
-                "level": section.get("level", 1),
+            json_content["sections"].append({
+                "title": section_title,
+                "level": level,
                 "content": content_text
-            }
-            json_content["sections"].append(json_section)
+            })
         
         return json_content
         
@@ -785,4 +929,4 @@ def _convert_markdown_to_json(markdown_path, title=None):
             },
             "sections": [],
             "fullText": ""
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Download manifest for JFK Files Scraper.
+
+This module records, for every downloaded URL, where the file was saved and
+the server validators (ETag, Last-Modified) together with the size and
+SHA-256 of the local copy. Re-runs use the validators to issue conditional
+requests and skip unchanged files on a 304, and use the size and hash to
+detect local files that were truncated or corrupted after download. The
+modification time is recorded too, so a file is only re-hashed when it
+has been touched since it was recorded.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.download_manifest")
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """
+    Compute the SHA-256 digest of a file.
+
+    Args:
+        path (str): Path to the file
+        chunk_size (int): Bytes read per iteration
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DownloadManifest:
+    """
+    SQLite-backed record of downloaded files and their HTTP validators.
+
+    The database runs in WAL mode and the connection is shared by download
+    threads under a lock.
+    """
+
+    def __init__(self, db_path):
+        """
+        Open (or create) the manifest.
+
+        Args:
+            db_path (str): Path to the SQLite database
+        """
+        self.db_path = db_path
+        self.lock = threading.Lock()
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS downloads (
+                url TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                downloaded_at REAL NOT NULL,
+                checked_at REAL NOT NULL,
+                mtime_ns INTEGER
+            )
+        """)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(downloads)")}
+        if "mtime_ns" not in columns:
+            # Manifests written before modification times were recorded
+            self.conn.execute("ALTER TABLE downloads ADD COLUMN mtime_ns INTEGER")
+        self.conn.commit()
+
+    def get(self, url):
+        """
+        Get the manifest entry for a URL.
+
+        Args:
+            url (str): Download URL
+
+        Returns:
+            dict: Entry with path, etag, last_modified, size, sha256 and mtime_ns, or None
+        """
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM downloads WHERE url = ?", (url,)).fetchone()
+        return dict(row) if row else None
+
+    def record(self, url, path, etag=None, last_modified=None, sha256=None):
+        """
+        Record a completed download.
+
+        Args:
+            url (str): Download URL
+            path (str): Where the file was saved
+            etag (str): ETag sent by the server
+            last_modified (str): Last-Modified sent by the server
+            sha256 (str, optional): Digest of the file; computed if not given
+        """
+        stat = os.stat(path)
+        sha256 = sha256 or file_sha256(path)
+        now = time.time()
+        with self.lock:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO downloads
+                    (url, path, etag, last_modified, size, sha256, downloaded_at, checked_at, mtime_ns)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (url, path, etag, last_modified, stat.st_size, sha256, now, now, stat.st_mtime_ns))
+            self.conn.commit()
+
+    def touch(self, url):
+        """
+        Mark an entry as revalidated against the server.
+
+        Args:
+            url (str): Download URL
+        """
+        with self.lock:
+            self.conn.execute("UPDATE downloads SET checked_at = ? WHERE url = ?", (time.time(), url))
+            self.conn.commit()
+
+    def remove(self, url):
+        """
+        Forget a URL.
+
+        Args:
+            url (str): Download URL
+        """
+        with self.lock:
+            self.conn.execute("DELETE FROM downloads WHERE url = ?", (url,))
+            self.conn.commit()
+
+    def find_mismatch(self, entry, path, always_hash=False):
+        """
+        Compare a local file with its manifest entry.
+
+        The file is only hashed when its modification time differs from the
+        recorded one; if the hash still matches, the new time is recorded so
+        the next run can skip the hash.
+
+        Args:
+            entry (dict): Entry from get()
+            path (str): Local file to check
+            always_hash (bool): Hash the file even if its modification time is unchanged
+
+        Returns:
+            str: Description of the expected and actual values that differ, or None if the file matches
+        """
+        if entry["path"] != path:
+            return f"path is {path}, expected {entry['path']}"
+        if not os.path.exists(path):
+            return "file is missing"
+        stat = os.stat(path)
+        if stat.st_size != entry["size"]:
+            return f"size is {stat.st_size} bytes, expected {entry['size']}"
+        if not always_hash and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return None
+
+        sha256 = file_sha256(path)
+        if sha256 != entry["sha256"]:
+            return f"sha256 is {sha256}, expected {entry['sha256']}"
+        with self.lock:
+            self.conn.execute("UPDATE downloads SET mtime_ns = ? WHERE url = ?", (stat.st_mtime_ns, entry["url"]))
+            self.conn.commit()
+        return None
+
+    def verify(self, entry, path, always_hash=False):
+        """
+        Check that a local file still matches its manifest entry.
+
+        Args:
+            entry (dict): Entry from get()
+            path (str): Local file to check
+            always_hash (bool): Hash the file even if its modification time is unchanged
+
+        Returns:
+            bool: True if the file exists with the recorded size and hash
+        """
+        return self.find_mismatch(entry, path, always_hash) is None
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
+
+
+# One manifest connection per process and database path
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+
+def get_download_manifest(db_path):
+    """
+    Get this process's manifest for a database path.
+
+    Args:
+        db_path (str): Path to the SQLite database
+
+    Returns:
+        DownloadManifest: The shared manifest instance, or None if it cannot be opened
+    """
+    key = (os.getpid(), os.path.abspath(db_path))
+    with _manifests_lock:
+        if key not in _manifests:
+            try:
+                _manifests[key] = DownloadManifest(db_path)
+            except sqlite3.Error as e:
+                logger.warning(f"Download manifest unavailable, continuing without it: {e}")
+                return None
+        return _manifests[key]
@@ -9,31 +9,264 @@ with error handling, retry logic, and performance tracking.
 
 import os
 import re
+import json
 import time
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
 # Import custom exceptions and utilities
 from src.utils.logging_utils import (
     DownloadError, track_error, update_performance_metrics, retry_with_backoff
 )
+from src.utils.download_manifest import get_download_manifest
+from src.utils.rate_limit import get_http_rate_limiter
 
 # Initialize logger
 logger = logging.getLogger("jfk_scraper.download")
 
 
+class HTTPSessionConfig:
+    """Configuration settings for the shared HTTP session."""
+    POOL_SIZE = 10  # Keep-alive connections per host; match the download worker count
+    MAX_RETRIES = 2  # Connection-level retries inside the adapter
+    BACKOFF_FACTOR = 0.5  # Delay factor between adapter retries (seconds)
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class DownloadConfig:
+    """Configuration settings for writing downloads to disk."""
+    CHUNK_SIZE = 64 * 1024  # Bytes read from the response per iteration; an interruption loses at most this much
+    WRITE_BUFFER_SIZE = 1024 * 1024  # Writes reach the OS in blocks of this size
+    PART_SUFFIX = ".part"  # Downloads stream into <path>.part and are renamed when complete
+    RESUME_SUFFIX = ".json"  # Validators for resuming a .part file are kept in <path>.part.json
+    USE_MANIFEST = True  # Record validators and hashes of downloaded files
+    MANIFEST_NAME = ".download_manifest.db"  # Manifest database inside the download directory
+    REVALIDATE = True  # Re-check existing files with conditional requests
+    VERIFY_HASHES = False  # Hash every existing file, not only those modified since they were recorded
+    VISIBLE_PROGRESS = False  # Publish bytes written while downloading
+    PROGRESS_INTERVAL = 4 * 1024 * 1024  # Bytes between progress updates
+
+
+# Shared session so downloads reuse TCP/TLS connections instead of
+# handshaking for every file
+_session = None
+_session_pool_size = 0
+_session_lock = threading.Lock()
+
+
+def _create_http_session(pool_size):
+    """
+    Build a requests session with a pooled, retrying adapter.
+    
+    Args:
+        pool_size (int): Maximum number of kept-alive connections per host
+        
+    Returns:
+        requests.Session: Configured session
+    """
+    retry = Retry(
+        total=HTTPSessionConfig.MAX_RETRIES,
+        backoff_factor=HTTPSessionConfig.BACKOFF_FACTOR,
+        status_forcelist=HTTPSessionConfig.RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False
+    )
+    # pool_block keeps extra threads waiting for a pooled connection
+    # rather than opening throwaway ones
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=retry, pool_block=True)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        'User-Agent': 'JFK-Files-Scraper/1.0 (Research Project)',
+        'Accept': '*/*'
+    })
+    return session
+
+
+def get_http_session(pool_size=None):
+    """
+    Get the shared, thread-safe HTTP session, creating it on first use.
+    
+    The session is rebuilt if a larger pool is requested than the current one,
+    so callers can size it to their worker count.
+    
+    Args:
+        pool_size (int, optional): Minimum connection pool size required
+        
+    Returns:
+        requests.Session: Shared session
+    """
+    global _session, _session_pool_size
+    
+    pool_size = max(1, pool_size or HTTPSessionConfig.POOL_SIZE)
+    with _session_lock:
+        if _session is None or pool_size > _session_pool_size:
+            old_session = _session
+            _session = _create_http_session(pool_size)
+            _session_pool_size = pool_size
+            logger.debug(f"Created shared HTTP session with pool size {pool_size}")
+            if old_session is not None:
+                # Requests already in flight keep their own connection
+                old_session.close()
+        return _session
+
+
+# Bytes written so far for downloads in progress, keyed by final save path
+_download_progress = {}
+_download_progress_lock = threading.Lock()
+
+
+def get_download_progress():
+    """
+    Get the bytes written so far for downloads in progress.
+    
+    Only downloads running with visible progress are reported.
+    
+    Returns:
+        dict: Mapping of save path to (bytes_written, expected_size)
+    """
+    with _download_progress_lock:
+        return dict(_download_progress)
+
+
+def _report_progress(save_path, bytes_written, expected_size, new_bytes):
+    """Publish download progress to the progress table and performance metrics."""
+    with _download_progress_lock:
+        _download_progress[save_path] = (bytes_written, expected_size)
+    update_performance_metrics(downloaded_bytes=new_bytes)
+
+
+def close_http_session():
+    """Close the shared HTTP session and its pooled connections."""
+    global _session, _session_pool_size
+    
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pool_size = 0
+
+
+def _load_resume_state(url, part_path, resume_path):
+    """
+    Get the offset, validator and recorded state for resuming a partial download.
+    
+    Args:
+        url (str): The URL being downloaded
+        part_path (str): Path of the partial file
+        resume_path (str): Path of the validator sidecar
+        
+    Returns:
+        tuple: (offset, validator, state) or (0, None, None) if the partial file cannot be resumed
+    """
+    if not os.path.exists(part_path) or not os.path.exists(resume_path):
+        return 0, None, None
+    
+    try:
+        with open(resume_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return 0, None, None
+    
+    if state.get("url") != url:
+        return 0, None, None
+    
+    # Weak ETags cannot be used with If-Range
+    validator = state.get("etag")
+    if not validator or validator.startswith("W/"):
+        validator = state.get("last_modified")
+    if not validator:
+        return 0, None, None
+    
+    return os.path.getsize(part_path), validator, state
+
+
+def _save_resume_state(url, response, resume_path):
+    """
+    Record the validators of a fresh download so it can be resumed later.
+    
+    Args:
+        url (str): The URL being downloaded
+        response (requests.Response): Response for the full file
+        resume_path (str): Path of the validator sidecar
+        
+    Returns:
+        dict: The validators sent by the server
+    """
+    state = {
+        "url": url,
+        "etag": response.headers.get('ETag'),
+        "last_modified": response.headers.get('Last-Modified'),
+        "size": int(response.headers.get('Content-Length', 0))
+    }
+    if not state["etag"] and not state["last_modified"]:
+        # Not resumable
+        if os.path.exists(resume_path):
+            os.remove(resume_path)
+        return state
+    
+    with open(resume_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    return state
+
+
+def _discard_partial(part_path, resume_path):
+    """Remove a partial download and its validator sidecar."""
+    for path in (part_path, resume_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _content_range(response):
+    """
+    Parse the Content-Range header of a response.
+    
+    Args:
+        response (requests.Response): Response to a Range request
+        
+    Returns:
+        tuple: (start, total); either may be None if not given
+    """
+    match = re.match(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)', response.headers.get('Content-Range', ''))
+    if not match:
+        return None, None
+    start = int(match.group(1)) if match.group(1) is not None else None
+    total = int(match.group(2)) if match.group(2) != '*' else None
+    return start, total
+
+
 @retry_with_backoff(max_retries=3, initial_delay=1, backoff_factor=2, 
-                  exceptions=(requests.exceptions.RequestException, IOError, OSError))
-def download_file(url, save_path, timeout=(10, 60), headers=None):
+                  exceptions=(requests.exceptions.RequestException, DownloadError, IOError, OSError))
+def download_file(url, save_path, timeout=(10, 60), headers=None, session=None, visible_progress=None,
+                  manifest=None):
     """
     Downloads a file from the given URL with retries and error handling.
     
+    The body is streamed into a temporary .part file, synced to disk once and
+    atomically renamed, so save_path only ever holds a complete download.
+    If the server sends an ETag or Last-Modified validator, an interrupted
+    download keeps its .part file and the next attempt (including retries)
+    continues from the last byte written with a Range request.
+    
+    With a manifest, an existing save_path recorded in it is revalidated with
+    If-None-Match/If-Modified-Since and left untouched on a 304, and every
+    completed download is recorded with its validators and hash.
+    
     Args:
         url (str): The URL to download from
         save_path (str): The path to save the file to
         timeout (tuple): Connection and read timeouts in seconds
         headers (dict): HTTP headers to use
+        session (requests.Session, optional): Session to use (default: shared pooled session)
+        visible_progress (bool, optional): Publish bytes written through get_download_progress()
+                                           and performance metrics (default: DownloadConfig.VISIBLE_PROGRESS)
+        manifest (DownloadManifest, optional): Manifest to revalidate against and record into
         
     Returns:
         tuple: (success, file_size, download_time)
@@ -46,30 +279,113 @@ def download_file(url, save_path, timeout=(10, 60), headers=None):
     
     start_time = time.time()
     
-    logger.info(f"Downloading {url} to {save_path}")
+    session = session or get_http_session()
+    if visible_progress is None:
+        visible_progress = DownloadConfig.VISIBLE_PROGRESS
+    part_path = save_path + DownloadConfig.PART_SUFFIX
+    resume_path = part_path + DownloadConfig.RESUME_SUFFIX
     
-    # Make the request with streaming enabled
-    response = requests.get(url, stream=True, headers=headers, timeout=timeout)
-    response.raise_for_status()
+    # Byte offsets must refer to the file as stored, not a decoded transfer
+    request_headers = dict(headers)
+    request_headers['Accept-Encoding'] = 'identity'
     
-    # Get expected file size if available
-    expected_size = int(response.headers.get('Content-Length', 0))
-    actual_size = 0
+    offset, validator, state = _load_resume_state(url, part_path, resume_path)
+    entry = manifest.get(url) if manifest is not None else None
+    if offset:
+        request_headers['Range'] = f"bytes={offset}-"
+        request_headers['If-Range'] = validator
+        logger.info(f"Resuming {url} at byte {offset}")
+    elif entry and entry["path"] == save_path and os.path.exists(save_path):
+        # Only fetch the body if the server's copy changed
+        if entry["etag"]:
+            request_headers['If-None-Match'] = entry["etag"]
+        if entry["last_modified"]:
+            request_headers['If-Modified-Since'] = entry["last_modified"]
+        logger.info(f"Revalidating {url}")
+    else:
+        logger.info(f"Downloading {url} to {save_path}")
     
-    # Write directly to the final file path with immediate visibility
-    with open(save_path, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:  # Filter out keep-alive chunks
-                f.write(chunk)
-                actual_size += len(chunk)
-                # Force flush to ensure content is visible immediately
-                f.flush()
-                os.fsync(f.fileno())
-    
-    # Verify file size if expected size was provided
-    if expected_size > 0 and actual_size != expected_size:
-        os.remove(save_path)
-        raise DownloadError(f"File size mismatch: expected {expected_size}, got {actual_size}")
+    try:
+        # Wait for a slot in the shared outbound request budget
+        get_http_rate_limiter().acquire()
+        
+        # Make the request with streaming enabled; closing the response returns
+        # the connection to the pool
+        with session.get(url, stream=True, headers=request_headers, timeout=timeout) as response:
+            if response.status_code == 304 and entry:
+                manifest.touch(url)
+                download_time = time.time() - start_time
+                logger.info(f"Not modified, keeping {save_path}")
+                return True, entry["size"], download_time
+            
+            if offset and response.status_code == 416:
+                # Nothing left to fetch if the partial file is already complete
+                _, total = _content_range(response)
+                if total != offset:
+                    _discard_partial(part_path, resume_path)
+                    raise DownloadError(f"Cannot resume {url} at byte {offset}, restarting")
+                expected_size = total
+                actual_size = offset
+            else:
+                response.raise_for_status()
+                
+                if offset and response.status_code == 206:
+                    start, total = _content_range(response)
+                    if start != offset:
+                        _discard_partial(part_path, resume_path)
+                        raise DownloadError(f"Server resumed {url} at byte {start}, expected {offset}")
+                    expected_size = total or offset + int(response.headers.get('Content-Length', 0))
+                    mode = 'ab'
+                else:
+                    # Fresh download, or the file changed since the partial copy was made
+                    if offset:
+                        logger.info(f"{url} changed on the server, restarting download")
+                    offset = 0
+                    expected_size = int(response.headers.get('Content-Length', 0))
+                    state = _save_resume_state(url, response, resume_path)
+                    mode = 'wb'
+                
+                actual_size = offset
+                reported_size = offset
+                
+                with open(part_path, mode, buffering=DownloadConfig.WRITE_BUFFER_SIZE) as f:
+                    for chunk in response.iter_content(chunk_size=DownloadConfig.CHUNK_SIZE):
+                        if chunk:  # Filter out keep-alive chunks
+                            f.write(chunk)
+                            actual_size += len(chunk)
+                            if visible_progress and actual_size - reported_size >= DownloadConfig.PROGRESS_INTERVAL:
+                                _report_progress(save_path, actual_size, expected_size, actual_size - reported_size)
+                                reported_size = actual_size
+                    
+                    # Make the file durable once, not per chunk
+                    f.flush()
+                    os.fsync(f.fileno())
+                
+                if visible_progress and actual_size > reported_size:
+                    _report_progress(save_path, actual_size, expected_size, actual_size - reported_size)
+        
+        # Verify file size if expected size was provided
+        if expected_size > 0 and actual_size != expected_size:
+            if actual_size > expected_size:
+                _discard_partial(part_path, resume_path)
+            raise DownloadError(f"File size mismatch: expected {expected_size}, got {actual_size}")
+        
+        # Publish the complete file atomically
+        os.replace(part_path, save_path)
+        if os.path.exists(resume_path):
+            os.remove(resume_path)
+        
+        if manifest is not None:
+            manifest.record(url, save_path, etag=state.get("etag"), last_modified=state.get("last_modified"))
+    except BaseException:
+        # Keep partial data only when a later attempt can safely resume it
+        if not os.path.exists(resume_path) and os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    finally:
+        if visible_progress:
+            with _download_progress_lock:
+                _download_progress.pop(save_path, None)
     
     download_time = time.time() - start_time
     logger.info(f"Successfully downloaded {save_path} ({actual_size} bytes) in {download_time:.2f} seconds")
@@ -77,16 +393,138 @@ def download_file(url, save_path, timeout=(10, 60), headers=None):
     return True, actual_size, download_time
 
 
-def download_pdf(pdf_url, save_dir="pdfs", retry_count=3, organize_by_collection=True):
+def get_pdf_save_path(pdf_url, save_dir="pdfs", organize_by_collection=True):
+    """
+    Determine where a PDF URL is saved, creating its directory.
+    
+    Args:
+        pdf_url (str): The URL of the PDF file
+        save_dir (str): The base directory to save the PDF to
+        organize_by_collection (bool): Whether to organize files into subdirectories
+        
+    Returns:
+        str: Path to save the PDF to
+    """
+    # Extract filename from URL
+    filename = os.path.basename(pdf_url)
+    if not filename.lower().endswith('.pdf'):
+        filename = f"{filename}.pdf"
+    
+    # Create a safe filename
+    safe_filename = "".join([c for c in filename if c.isalnum() or c in "._- "]).strip()
+    
+    # Determine appropriate subdirectory based on document properties
+    if organize_by_collection:
+        # Extract collection identifier from filename (assumes JFK format like 104-XXXXX-XXXXX)
+        collection_match = re.match(r'^(\d+)-', safe_filename)
+        doc_type = None
+    
+        if collection_match:
+            collection_id = collection_match.group(1)
+    
+            # Categorize by collection ID
+            if collection_id == "104":
+                doc_type = "nara-104"  # National Archives Record Group 104
+            elif collection_id == "124":
+                doc_type = "nara-124"  # National Archives Record Group 124
+            elif collection_id == "179":
+                doc_type = "nara-179"  # National Archives Record Group 179
+            elif collection_id == "157":
+                doc_type = "hsca"      # House Select Committee on Assassinations
+            else:
+                doc_type = f"collection-{collection_id}"
+        else:
+            # Check for other document identifiers
+            if "docid" in safe_filename.lower():
+                doc_type = "misc-docid"
+            elif any(s in safe_filename.lower() for s in ["cia", "fbi", "secret"]):
+                doc_type = "agency-docs"
+            else:
+                doc_type = "uncategorized"
+    
+        # Create collection subdirectory
+        collection_dir = os.path.join(save_dir, doc_type)
+        os.makedirs(collection_dir, exist_ok=True)
+    
+        # Final save path with organized structure
+        save_path = os.path.join(collection_dir, safe_filename)
+    else:
+        # Simple flat directory structure
+        save_path = os.path.join(save_dir, safe_filename)
+        os.makedirs(save_dir, exist_ok=True)
+    
+    return save_path
+
+
+def use_existing_download(pdf_url, save_path, manifest=None):
+    """
+    Decide whether an already downloaded file can be used without a request.
+    
+    Empty files and files that no longer match the size and hash recorded in
+    the manifest are removed. The hash is only checked for files modified since
+    they were recorded, unless DownloadConfig.VERIFY_HASHES is set. Files with a
+    manifest entry are revalidated with the server when DownloadConfig.REVALIDATE is set.
+    
+    Args:
+        pdf_url (str): The URL of the PDF file
+        save_path (str): Where the PDF is saved
+        manifest (DownloadManifest, optional): Download manifest
+        
+    Returns:
+        bool: True if the existing file should be used as-is
+    """
+    if not os.path.exists(save_path):
+        return False
+    
+    file_size = os.path.getsize(save_path)
+    logger.info(f"File already exists: {save_path} (size: {file_size} bytes)")
+    entry = manifest.get(pdf_url) if manifest is not None else None
+    
+    # Verify file integrity if it exists but has zero size
+    if file_size == 0:
+        logger.warning(f"Found empty file {save_path}, will retry download")
+        os.remove(save_path)  # Remove corrupted/empty file
+        return False
+    mismatch = manifest.find_mismatch(entry, save_path, DownloadConfig.VERIFY_HASHES) if entry else None
+    if mismatch:
+        logger.warning(f"{save_path} does not match the manifest entry recorded when it was "
+                       f"downloaded ({mismatch}), will retry download")
+        os.remove(save_path)  # Remove truncated/corrupted file
+        return False
+    # With an entry, download_file sends a conditional request and keeps the file on a 304
+    return not (entry and DownloadConfig.REVALIDATE)
+
+
+def get_manifest_for(save_dir):
+    """
+    Get the download manifest for a download directory.
+    
+    Args:
+        save_dir (str): The base download directory
+        
+    Returns:
+        DownloadManifest: The manifest, or None if disabled or unavailable
+    """
+    if not DownloadConfig.USE_MANIFEST:
+        return None
+    return get_download_manifest(os.path.join(save_dir, DownloadConfig.MANIFEST_NAME))
+
+
+def download_pdf(pdf_url, save_dir="pdfs", retry_count=3, organize_by_collection=True, session=None):
     """
     Downloads a PDF file from the given URL and saves it locally with enhanced
     directory organization and streaming visibility.
 
+    Existing files recorded in the download manifest are checked against their
+    recorded size and hash, then revalidated with a conditional request so
+    unchanged files are not downloaded again.
+
     Args:
         pdf_url (str): The URL of the PDF file.
         save_dir (str): The base directory to save the PDF to.
         retry_count (int): Number of times to retry on failure.
         organize_by_collection (bool): Whether to organize files into subdirectories.
+        session (requests.Session, optional): Session to use (default: shared pooled session).
 
     Returns:
         str: The path to the saved PDF file or None if download failed.
@@ -94,70 +532,17 @@ def download_pdf(pdf_url, save_dir="pdfs", retry_count=3, organize_by_collection
     start_time = time.time()
     
     try:
-        # Extract filename from URL
-        filename = os.path.basename(pdf_url)
-        if not filename.lower().endswith('.pdf'):
-            filename = f"{filename}.pdf"
-        
-        # Create a safe filename
-        safe_filename = "".join([c for c in filename if c.isalnum() or c in "._- "]).strip()
-        
-        # Determine appropriate subdirectory based on document properties
-        if organize_by_collection:
-            # Extract collection identifier from filename (assumes JFK format like 104-XXXXX-XXXXX)
-            collection_match = re.match(r'^(\d+)-', safe_filename)
-            doc_type = None
-            
-            if collection_match:
-                collection_id = collection_match.group(1)
-                
-                # Categorize by collection ID
-                if collection_id == "104":
-                    doc_type = "nara-104"  # National Archives Record Group 104
-                elif collection_id == "124":
-                    doc_type = "nara-124"  # National Archives Record Group 124
-                elif collection_id == "179":
-                    doc_type = "nara-179"  # National Archives Record Group 179
-                elif collection_id == "157":
-                    doc_type = "hsca"      # House Select Committee on Assassinations
-                else:
-                    doc_type = f"collection-{collection_id}"
-            else:
-                # Check for other document identifiers
-                if "docid" in safe_filename.lower():
-                    doc_type = "misc-docid"
-                elif any(s in safe_filename.lower() for s in ["cia", "fbi", "secret"]):
-                    doc_type = "agency-docs"
-                else:
-                    doc_type = "uncategorized"
-            
-            # Create collection subdirectory
-            collection_dir = os.path.join(save_dir, doc_type)
-            os.makedirs(collection_dir, exist_ok=True)
-            
-            # Final save path with organized structure
-            save_path = os.path.join(collection_dir, safe_filename)
-        else:
-            # Simple flat directory structure
-            save_path = os.path.join(save_dir, safe_filename)
-            os.makedirs(save_dir, exist_ok=True)
-            
-        # Skip if file already exists
-        if os.path.exists(save_path):
-            file_size = os.path.getsize(save_path)
-            logger.info(f"File already exists: {save_path} (size: {file_size} bytes)")
-            
-            # Verify file integrity if it exists but has zero size
-            if file_size == 0:
-                logger.warning(f"Found empty file {save_path}, will retry download")
-                os.remove(save_path)  # Remove corrupted/empty file
-            else:
-                # Update performance metrics for existing file
-                update_performance_metrics(
-                    total_download_size=file_size,
-                    download_times=time.time() - start_time
-                )
-                return save_path
+        save_path = get_pdf_save_path(pdf_url, save_dir, organize_by_collection)
+        manifest = get_manifest_for(save_dir)
+        
+        # Skip if file already exists and is current
+        if use_existing_download(pdf_url, save_path, manifest):
+            # Update performance metrics for existing file
+            update_performance_metrics(
+                total_download_size=os.path.getsize(save_path),
+                download_times=time.time() - start_time
+            )
+            return save_path
         
         # Make sure the parent directory exists
         parent_dir = os.path.dirname(save_path)
@@ -170,7 +555,9 @@ def download_pdf(pdf_url, save_dir="pdfs", retry_count=3, organize_by_collection
             headers={
                 'User-Agent': 'JFK-Files-Scraper/1.0 (Research Project)',
                 'Accept': 'application/pdf'
-            }
+            },
+            session=session,
+            manifest=manifest
         )
         
         if success:
@@ -14,6 +14,8 @@ import time
 from datetime import datetime
 from functools import wraps
 
+from src.utils.rate_limit import get_http_rate_statistics
+
 
 # Custom exceptions for specific error scenarios
 class ScraperError(Exception):
@@ -64,6 +66,7 @@ _performance_metrics = {
     "successful_files": 0,
     "failed_files": 0,
     "total_download_size": 0,
+    "downloaded_bytes": 0,  # Bytes written by downloads, updated while they run
     "download_times": [],
     "conversion_times": []
 }
@@ -202,6 +205,12 @@ def log_metrics():
     total_mb = _performance_metrics["total_download_size"] / (1024 * 1024)
     logger.info(f"Total download size: {total_mb:.2f} MB")
     
+    # Log outbound HTTP rate limiting
+    http_stats = get_http_rate_statistics()
+    if http_stats:
+        logger.info(f"HTTP request rate: {http_stats['tokens_per_sec']:.2f} tokens/second "
+                    f"(limit {http_stats['rate']:.2f})")
+    
     logger.info("-" * 80)
     logger.info("ERROR METRICS:")
     for category, count in _error_counts.items():
@@ -84,6 +84,16 @@ def get_latest_files(directory, extension, count=5):
     # Sort by modification time (newest first) and return the top N
     return [f[0] for f in sorted(files, key=lambda x: x[1], reverse=True)[:count]]
 
+def load_processing_progress(path=os.path.join('.checkpoints', 'large_scale_processing.progress.json')):
+    """Load the progress counters published by a running large-scale processor."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
 def basic_status_check():
     """Perform a basic status check without the monitoring module."""
     # Check for PDF files (recursively)
@@ -128,6 +138,15 @@ def basic_status_check():
     print(f"JSON files created: {json_count}/{total_expected}")
     print(f"Documents in LiteLLM format: {lite_llm_count}/{total_expected}")
     
+    # Show live counters from the large-scale processor, if one has run
+    progress = load_processing_progress()
+    if progress:
+        print(f"\nLARGE-SCALE PROCESSING (as of {progress['timestamp']}):")
+        print(f"Completed: {progress['completed']}/{progress['total']}, failed: {progress['failed']}, "
+              f"in progress: {progress['in_progress']}, pending: {progress['pending']}")
+        if progress.get('eta_seconds') is not None:
+            print(f"Rate: {progress['rate']:.2f} files/s, ETA: {int(progress['eta_seconds'])}s")
+    
     # Show directory structure details
     if pdf_count > 0:
         print(f"\nPDF DIRECTORY STRUCTURE:")
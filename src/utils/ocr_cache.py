@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-addressed OCR cache for JFK Files Scraper.
+
+This module stores the raw OCR text of each rendered page keyed by a hash of
+the page image together with the OCR engine, resolution and tesseract
+configuration. Re-running conversion with the same settings, reprocessing
+after code changes, and duplicate documents across collections all reuse
+earlier OCR results instead of running tesseract again.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.ocr_cache")
+
+
+class OCRCacheConfig:
+    """Configuration settings for the OCR cache."""
+    ENABLED = True
+    DB_PATH = ".cache/ocr_cache.db"
+    MAX_SIZE_MB = 512  # Least recently used pages are evicted beyond this size
+
+
+class OCRCache:
+    """
+    SQLite-backed page text cache with size-bounded LRU eviction.
+
+    Each process opens its own connection; the database runs in WAL mode so
+    OCR worker processes can share it. Hit, miss and eviction counts are
+    kept in the database so they add up across processes.
+    """
+
+    def __init__(self, db_path=None, max_size_mb=None):
+        """
+        Open (or create) the cache.
+
+        Args:
+            db_path (str): Path to the SQLite database
+            max_size_mb (int): Maximum total size of cached text in MB
+        """
+        self.db_path = db_path or OCRCacheConfig.DB_PATH
+        self.max_size_bytes = int((max_size_mb or OCRCacheConfig.MAX_SIZE_MB) * 1024 * 1024)
+        self.lock = threading.Lock()
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_pages_last_used ON pages(last_used);
+            CREATE TABLE IF NOT EXISTS counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0
+            );
+            INSERT OR IGNORE INTO counters (name, value)
+                VALUES ('hits', 0), ('misses', 0), ('evictions', 0), ('size_bytes', 0);
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(image, engine, dpi, ocr_config):
+        """
+        Build the cache key for a rendered page.
+
+        Args:
+            image (PIL.Image): Rendered page
+            engine (str): OCR engine name and version
+            dpi (int): Rendering resolution
+            ocr_config (str): Tesseract configuration
+
+        Returns:
+            str: Hex digest identifying the page content and OCR settings
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{image.mode}:{image.size[0]}x{image.size[1]}:".encode("utf-8"))
+        digest.update(image.tobytes())
+        page_hash = digest.hexdigest()
+        return hashlib.sha256(f"{page_hash}|{engine}|{dpi}|{ocr_config}".encode("utf-8")).hexdigest()
+
+    def _increment(self, name, amount=1):
+        self.conn.execute("UPDATE counters SET value = value + ? WHERE name = ?", (amount, name))
+
+    def get(self, key):
+        """
+        Look up cached text.
+
+        Args:
+            key (str): Key from make_key()
+
+        Returns:
+            str: Cached OCR text, or None on a miss
+        """
+        with self.lock:
+            row = self.conn.execute("SELECT text FROM pages WHERE key = ?", (key,)).fetchone()
+            if row:
+                self.conn.execute("UPDATE pages SET last_used = ? WHERE key = ?", (time.time(), key))
+                self._increment("hits")
+            else:
+                self._increment("misses")
+            self.conn.commit()
+        return row[0] if row else None
+
+    def put(self, key, text):
+        """
+        Store OCR text and evict least recently used pages if over the size limit.
+
+        Args:
+            key (str): Key from make_key()
+            text (str): Raw OCR text for the page
+        """
+        size = len(text.encode("utf-8"))
+        with self.lock:
+            row = self.conn.execute("SELECT size FROM pages WHERE key = ?", (key,)).fetchone()
+            self._increment("size_bytes", size - (row[0] if row else 0))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (key, text, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, text, size, time.time())
+            )
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        """Drop least recently used pages until the cache fits. Must be called with the lock held."""
+        total_size = self.conn.execute("SELECT value FROM counters WHERE name = 'size_bytes'").fetchone()[0]
+        if total_size <= self.max_size_bytes:
+            return
+
+        # Walk from the least recently used end only as far as needed
+        victims = []
+        freed = 0
+        for key, size in self.conn.execute("SELECT key, size FROM pages ORDER BY last_used"):
+            if total_size - freed <= self.max_size_bytes:
+                break
+            victims.append((key,))
+            freed += size
+
+        self.conn.executemany("DELETE FROM pages WHERE key = ?", victims)
+        self._increment("size_bytes", -freed)
+        self._increment("evictions", len(victims))
+        logger.debug(f"Evicted {len(victims)} pages from OCR cache")
+
+    def get_statistics(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Entry count, total size, hits, misses, evictions and hit rate
+        """
+        with self.lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            counters = dict(self.conn.execute("SELECT name, value FROM counters").fetchall())
+
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "entries": entries,
+            "size_bytes": counters["size_bytes"],
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "evictions": counters["evictions"],
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0
+        }
+
+    def clear(self):
+        """Remove all cached pages and reset the counters."""
+        with self.lock:
+            self.conn.execute("DELETE FROM pages")
+            self.conn.execute("UPDATE counters SET value = 0")
+            self.conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
+
+
+# One cache connection per process and database path
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_ocr_cache():
+    """
+    Get this process's OCR cache, or None if caching is disabled.
+
+    Returns:
+        OCRCache: The shared cache instance, or None
+    """
+    if not OCRCacheConfig.ENABLED:
+        return None
+
+    key = (os.getpid(), os.path.abspath(OCRCacheConfig.DB_PATH))
+    with _caches_lock:
+        if key not in _caches:
+            try:
+                _caches[key] = OCRCache(OCRCacheConfig.DB_PATH, OCRCacheConfig.MAX_SIZE_MB)
+            except sqlite3.Error as e:
+                logger.warning(f"OCR cache unavailable, continuing without it: {e}")
+                return None
+        return _caches[key]
+
+
+def log_ocr_cache_statistics():
+    """Log the OCR cache hit/miss counters, if the cache is enabled."""
+    cache = get_ocr_cache()
+    if cache is None:
+        return
+    stats = cache.get_statistics()
+    logger.info(f"OCR cache: {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['hit_rate'] * 100:.1f}% hit rate), {stats['entries']} pages, "
+                f"{stats['size_bytes'] / (1024 * 1024):.1f} MB, {stats['evictions']} evictions")
@@ -15,21 +15,246 @@ import traceback
 import time
 import re
 import datetime
+import functools
+import multiprocessing
+import concurrent.futures
 from pathlib import Path
 from PIL import Image
 import io
 
+from src.utils.ocr_cache import OCRCache, get_ocr_cache
+
 # Initialize logger
 logger = logging.getLogger("jfk_scraper.pdf2md")
 
+# Rendering resolution for each OCR quality setting
+OCR_DPI = {"high": 300, "medium": 200, "low": 150}
+
+# Tesseract settings (LSTM engine, single uniform block of text)
+OCR_CONFIG = "--oem 1 --psm 6"
+
+
+class OCRConfig:
+    """Default OCR execution settings for PDF2MarkdownWrapper."""
+    # Render and OCR a window of pages at a time instead of the whole document
+    STREAMING = True
+    PAGE_WINDOW = 1
+
+    # Page-level OCR fan-out within one document (1 = OCR pages in-process)
+    PAGE_WORKERS = 1
+    # Pages handed to a worker process per task
+    PAGE_CHUNK_SIZE = 4
+
+    # OCR only the pages of a mixed digital/scanned document that need it
+    PER_PAGE_ROUTING = True
+
+
+def get_page_count(pdf_path):
+    """
+    Get the number of pages in a PDF without rendering it.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        
+    Returns:
+        int: Number of pages
+    """
+    try:
+        import fitz
+        with fitz.open(pdf_path) as doc:
+            return len(doc)
+    except ImportError:
+        from pdf2image import pdfinfo_from_path
+        return int(pdfinfo_from_path(pdf_path)["Pages"])
+
+
+def iter_page_images(pdf_path, dpi, window=1, pages=None):
+    """
+    Render PDF pages to images a few at a time.
+    
+    At most ``window`` page images are alive at once, so peak memory does
+    not grow with the page count. PyMuPDF renders in-process when it is
+    available; otherwise pdf2image renders one window per call.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        dpi (int): Rendering resolution
+        window (int): Number of pages rendered per step
+        pages (list, optional): Zero-based page indexes to render, in ascending order.
+                                Defaults to every page.
+        
+    Yields:
+        tuple: (page_index, PIL.Image) in page order
+    """
+    window = max(1, int(window))
+    
+    try:
+        import fitz
+    except ImportError:
+        fitz = None
+    
+    if fitz is not None:
+        zoom = fitz.Matrix(dpi / 72, dpi / 72)
+        with fitz.open(pdf_path) as doc:
+            for page_index in (range(len(doc)) if pages is None else pages):
+                pixmap = doc[page_index].get_pixmap(matrix=zoom, alpha=False)
+                image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+                del pixmap
+                yield page_index, image
+        return
+    
+    from pdf2image import convert_from_path
+    if pages is None:
+        pages = range(get_page_count(pdf_path))
+    
+    # pdf2image renders page ranges, so split the pages into runs of
+    # consecutive pages (at most a window long) and never render the gaps
+    runs = []
+    for page_index in pages:
+        if runs and page_index == runs[-1][-1] + 1 and len(runs[-1]) < window:
+            runs[-1].append(page_index)
+        else:
+            runs.append([page_index])
+    
+    for run in runs:
+        images = convert_from_path(
+            pdf_path,
+            dpi=dpi,
+            first_page=run[0] + 1,
+            last_page=run[-1] + 1,
+            fmt="ppm"  # Format with good OCR results
+        )
+        for page_index, image in zip(run, images):
+            yield page_index, image
+        del images
+
+
+def format_ocr_text(text):
+    """
+    Turn raw OCR output for one page into Markdown.
+    
+    Args:
+        text (str): Text returned by tesseract
+        
+    Returns:
+        str: Markdown for the page body
+    """
+    if not text or len(text.strip()) <= 20:
+        return "*No text detected on this page*\n"
+    
+    # Simple processing to detect potential headers
+    processed_lines = []
+    for line in text.split('\n'):
+        if line.strip():
+            if line.isupper() and len(line) < 100:
+                processed_lines.append(f"### {line}")
+            else:
+                processed_lines.append(line)
+    
+    # Join lines with proper spacing
+    return '\n'.join(processed_lines)
+
+
+@functools.lru_cache(maxsize=1)
+def _ocr_engine_name():
+    """Identify the OCR engine and version for cache keys."""
+    import pytesseract
+    try:
+        return f"tesseract-{pytesseract.get_tesseract_version()}"
+    except Exception:
+        return "tesseract"
+
+
+def ocr_page_image(image, ocr_config=OCR_CONFIG, dpi=None):
+    """
+    OCR one rendered page into its Markdown body.
+    
+    The raw OCR text is looked up in and stored to the OCR cache, keyed by
+    the page image hash, engine, resolution and configuration.
+    
+    Args:
+        image (PIL.Image): Rendered page
+        ocr_config (str): Tesseract configuration
+        dpi (int, optional): Resolution the page was rendered at
+        
+    Returns:
+        str: Markdown for the page body, or a failure note
+    """
+    import pytesseract
+    
+    cache = get_ocr_cache()
+    cache_key = None
+    if cache is not None:
+        try:
+            cache_key = OCRCache.make_key(image, _ocr_engine_name(), dpi, ocr_config)
+            text = cache.get(cache_key)
+            if text is not None:
+                return format_ocr_text(text)
+        except Exception as e:
+            logger.warning(f"OCR cache lookup failed, running OCR: {str(e)}")
+            cache = None
+    
+    try:
+        text = pytesseract.image_to_string(image, config=ocr_config)
+    except Exception as e:
+        logger.warning(f"OCR failed: {str(e)}")
+        return f"*OCR processing failed for this page: {str(e)}*\n"
+    
+    if cache is not None:
+        try:
+            cache.put(cache_key, text)
+        except Exception as e:
+            logger.warning(f"Could not store OCR result in cache: {str(e)}")
+    
+    return format_ocr_text(text)
+
+
+def _ocr_pages_task(pdf_path, page_indexes, dpi, ocr_config):
+    """
+    Render and OCR a chunk of pages inside a worker process.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        page_indexes (list): Zero-based page indexes in ascending order
+        dpi (int): Rendering resolution
+        ocr_config (str): Tesseract configuration
+        
+    Returns:
+        list: (page_index, markdown_body) tuples
+    """
+    results = []
+    for page_index, image in iter_page_images(pdf_path, dpi, pages=page_indexes):
+        try:
+            results.append((page_index, ocr_page_image(image, ocr_config, dpi)))
+        finally:
+            image.close()
+    return results
+
+
 class PDF2MarkdownWrapper:
     """
     A comprehensive wrapper for PDF to Markdown conversion with multiple
     approaches and enhanced OCR capabilities.
     """
     
-    def __init__(self):
-        """Initialize the wrapper with all available conversion methods."""
+    def __init__(self, streaming_ocr=None, ocr_page_window=None, ocr_workers=None, ocr_chunk_size=None):
+        """
+        Initialize the wrapper with all available conversion methods.
+        
+        Args:
+            streaming_ocr (bool): Render and OCR pages a window at a time instead of
+                                  rasterizing the whole document up front
+            ocr_page_window (int): Number of pages rendered at once in streaming mode
+            ocr_workers (int): Worker processes for page-level OCR within a document
+            ocr_chunk_size (int): Pages per worker task for page-level OCR
+            
+        Unset options default to the OCRConfig class attributes.
+        """
+        self.streaming_ocr = OCRConfig.STREAMING if streaming_ocr is None else streaming_ocr
+        self.ocr_page_window = max(1, int(ocr_page_window or OCRConfig.PAGE_WINDOW))
+        self.ocr_workers = max(1, int(ocr_workers or OCRConfig.PAGE_WORKERS))
+        self.ocr_chunk_size = max(1, int(ocr_chunk_size or OCRConfig.PAGE_CHUNK_SIZE))
+        
         # Initialize flags for available modules
         self.pdf2md_available = False
         self.pymupdf_available = False
@@ -70,7 +295,8 @@ class PDF2MarkdownWrapper:
         except ImportError:
             logger.warning("Local pdf2md implementation not available")
     
-    def markdown(self, pdf_path, force_ocr=False, ocr_quality="high", use_gpt=False):
+    def markdown(self, pdf_path, force_ocr=False, ocr_quality="high", use_gpt=False, analysis=None,
+                 route_pages=None):
         """
         Convert a PDF file to markdown using the best available method.
         
@@ -79,6 +305,9 @@ class PDF2MarkdownWrapper:
             force_ocr (bool): Whether to force OCR processing even for digital PDFs
             ocr_quality (str): OCR quality setting ("low", "medium", "high")
             use_gpt (bool): Whether to use GPT-based conversion (requires API key)
+            analysis (PDFAnalysis, optional): Existing single-pass analysis of the file
+            route_pages (bool, optional): Decide OCR per page instead of per document.
+                                          Defaults to on unless force_ocr is set.
             
         Returns:
             str: Markdown text from the PDF, or a fallback representation if conversion fails
@@ -87,11 +316,38 @@ class PDF2MarkdownWrapper:
             logger.error(f"PDF file not found: {pdf_path}")
             return self._fallback_convert(pdf_path)
         
-        # Determine if PDF needs OCR
+        # Only reuse an analysis of this exact file (repair may have replaced it)
+        if analysis is not None and not analysis.matches(pdf_path):
+            analysis = None
+        
+        # Classify every page so mixed documents only OCR their scanned pages
         needs_ocr = force_ocr
-        if not needs_ocr and not force_ocr:
+        routed = False
+        mixed_ocr_pages = None
+        if route_pages is None:
+            route_pages = not force_ocr
+        if (route_pages and OCRConfig.PER_PAGE_ROUTING and self.pymupdf_available and
+                self.pytesseract_available and self._can_rasterize()):
             try:
-                needs_ocr = self._is_likely_scanned(pdf_path)
+                if analysis is None:
+                    from src.utils.pdf_utils import analyze_pdf
+                    analysis = analyze_pdf(pdf_path, include_text=False)
+                if analysis.pages:
+                    ocr_pages = analysis.pages_needing_ocr()
+                    routed = True
+                    if 0 < len(ocr_pages) < len(analysis.pages):
+                        mixed_ocr_pages = ocr_pages
+                        needs_ocr = True
+                    else:
+                        needs_ocr = bool(ocr_pages)
+                    logger.info(f"Per-page routing: {len(ocr_pages)} of {len(analysis.pages)} pages need OCR")
+            except Exception as e:
+                logger.warning(f"Error classifying pages, using whole-document OCR decision: {e}")
+        
+        # Determine if PDF needs OCR
+        if not routed and not needs_ocr and not force_ocr:
+            try:
+                needs_ocr = self._is_likely_scanned(pdf_path, analysis)
                 logger.info(f"PDF scan detection: {'scanned' if needs_ocr else 'digital'} PDF detected")
             except Exception as e:
                 logger.warning(f"Error detecting if PDF is scanned: {e}")
@@ -103,6 +359,7 @@ class PDF2MarkdownWrapper:
         
         # Track conversion attempts for better error reporting
         conversion_attempts = []
+        markdown_text = None
         
         # If GPT-based conversion requested and available, try that first
         if use_gpt and self.pdf2md_available:
@@ -117,10 +374,22 @@ class PDF2MarkdownWrapper:
                 logger.warning(error_details)
                 conversion_attempts.append(("gpt", error_details))
         
+        # For mixed documents, OCR the scanned pages and use the text layer for the rest
+        if mixed_ocr_pages:
+            try:
+                markdown_text = self._convert_mixed(pdf_path, analysis, mixed_ocr_pages, quality=ocr_quality)
+                if markdown_text and len(markdown_text.strip()) > 100:
+                    return markdown_text
+                logger.warning("Per-page OCR routing produced insufficient content")
+            except Exception as e:
+                error_details = f"Per-page OCR routing failed: {str(e)}\n{traceback.format_exc()}"
+                logger.warning(error_details)
+                conversion_attempts.append(("per_page", error_details))
+        
         # For digital PDFs, try PyMuPDF first (no OCR needed)
         if not needs_ocr and self.pymupdf_available:
             try:
-                markdown_text = self._convert_with_pymupdf(pdf_path)
+                markdown_text = self._convert_with_pymupdf(pdf_path, analysis)
                 if markdown_text and len(markdown_text.strip()) > 100:
                     return markdown_text
                 logger.warning("PyMuPDF extraction produced insufficient content")
@@ -130,7 +399,7 @@ class PDF2MarkdownWrapper:
                 conversion_attempts.append(("pymupdf", error_details))
         
         # For scanned PDFs or if PyMuPDF failed, try pytesseract OCR
-        if (needs_ocr or not markdown_text) and self.pytesseract_available and self.pdf2image_available:
+        if (needs_ocr or not markdown_text) and self.pytesseract_available and self._can_rasterize():
             try:
                 markdown_text = self._convert_with_pytesseract(pdf_path, quality=ocr_quality)
                 if markdown_text and len(markdown_text.strip()) > 100:
@@ -144,7 +413,7 @@ class PDF2MarkdownWrapper:
         # Last attempt with PyMuPDF if we skipped it before
         if needs_ocr and self.pymupdf_available:
             try:
-                markdown_text = self._convert_with_pymupdf(pdf_path)
+                markdown_text = self._convert_with_pymupdf(pdf_path, analysis)
                 if markdown_text and len(markdown_text.strip()) > 100:
                     return markdown_text
                 logger.warning("Fallback PyMuPDF extraction produced insufficient content")
@@ -156,12 +425,13 @@ class PDF2MarkdownWrapper:
         # If all else fails, use the fallback converter with detailed error info
         return self._fallback_convert(pdf_path, conversion_attempts)
     
-    def _is_likely_scanned(self, pdf_path):
+    def _is_likely_scanned(self, pdf_path, analysis=None):
         """
         Detect if a PDF is likely a scanned document that would benefit from OCR.
         
         Args:
             pdf_path (str): Path to the PDF file
+            analysis (PDFAnalysis, optional): Existing single-pass analysis of the file
             
         Returns:
             bool: True if the PDF is likely scanned, False if it's likely digital
@@ -169,33 +439,10 @@ class PDF2MarkdownWrapper:
         # Try PyMuPDF for detection if available
         if self.pymupdf_available:
             try:
-                import fitz
-                doc = fitz.open(pdf_path)
-                
-                # Sample a few pages to determine if the document is scanned
-                text_blocks = 0
-                image_blocks = 0
-                pages_to_check = min(3, len(doc))
-                
-                for page_idx in range(pages_to_check):
-                    page = doc[page_idx]
-                    
-                    # Check text content
-                    text = page.get_text()
-                    if len(text.strip()) > 100:  # More than 100 chars of text
-                        text_blocks += 1
-                    
-                    # Check image content
-                    images = page.get_images()
-                    if len(images) > 0:
-                        image_blocks += 1
-                
-                doc.close()
-                
-                # If there are more images than text blocks, or very little text, likely scanned
-                is_scanned = (image_blocks >= text_blocks) or (text_blocks == 0)
-                logger.debug(f"Scanned PDF detection: text_blocks={text_blocks}, image_blocks={image_blocks}")
-                return is_scanned
+                from src.utils.pdf_utils import analyze_pdf, is_scanned_pdf
+                if analysis is None:
+                    analysis = analyze_pdf(pdf_path, include_text=False)
+                return is_scanned_pdf(pdf_path, analysis=analysis)
                 
             except Exception as e:
                 logger.debug(f"Error in PyMuPDF scan detection: {e}")
@@ -223,12 +470,14 @@ class PDF2MarkdownWrapper:
             # Default to assuming it's scanned to be safe
             return True
     
-    def _convert_with_pymupdf(self, pdf_path):
+    def _convert_with_pymupdf(self, pdf_path, analysis=None):
         """
         Extract text from PDF using PyMuPDF with enhanced formatting.
         
         Args:
             pdf_path (str): Path to the PDF file
+            analysis (PDFAnalysis, optional): Existing single-pass analysis whose page text
+                                              is used instead of re-reading the file, if it has any
             
         Returns:
             str: Markdown text or None if extraction failed
@@ -236,70 +485,21 @@ class PDF2MarkdownWrapper:
         logger.info(f"Attempting PyMuPDF extraction for {pdf_path}")
         
         try:
-            # Only import fitz when needed
-            import fitz
-            
-            # Open the PDF document
-            doc = fitz.open(pdf_path)
-            
-            # Get document metadata
-            metadata = {}
-            try:
-                metadata = doc.metadata
-            except:
-                pass
-            
-            # Format document title
-            title = os.path.splitext(os.path.basename(pdf_path))[0]
-            if metadata.get("title"):
-                title = f"{title} - {metadata['title']}"
+            if analysis is None or not analysis.includes_text:
+                from src.utils.pdf_utils import analyze_pdf
+                analysis = analyze_pdf(pdf_path)
+                if analysis is None:
+                    raise ImportError("PyMuPDF (fitz) not available")
             
-            # Extract text from each page with formatting
-            full_text = [f"# {title}\n"]
-            
-            # Add metadata if available
-            if metadata and any(metadata.values()):
-                full_text.append("## Document Metadata\n")
-                for key, value in metadata.items():
-                    if value:
-                        full_text.append(f"- **{key.capitalize()}**: {value}")
-                full_text.append("")  # Empty line after metadata
+            full_text = self._pymupdf_header(pdf_path, analysis.metadata)
             
             # Process each page
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                
-                # Get basic text
-                text = page.get_text()
-                
-                # Check if the page has meaningful content
-                if text and len(text.strip()) > 20:
+            for page_num, page in enumerate(analysis.pages):
+                body = self._pymupdf_page_body(page)
+                if body is not None:
                     # Add page header
                     full_text.append(f"## Page {page_num+1}\n")
-                    
-                    # Try to get structured content with blocks
-                    try:
-                        blocks = page.get_text("blocks")
-                        if blocks:
-                            # Process blocks to better preserve layout
-                            processed_text = []
-                            for block in blocks:
-                                block_text = block[4].strip()
-                                if block_text:
-                                    # Try to detect headers vs paragraphs
-                                    if len(block_text) < 100 and block_text.isupper():
-                                        processed_text.append(f"### {block_text}")
-                                    else:
-                                        processed_text.append(block_text)
-                            
-                            full_text.append("\n\n".join(processed_text))
-                        else:
-                            full_text.append(text)
-                    except:
-                        # Fall back to basic text
-                        full_text.append(text)
-            
-            doc.close()
+                    full_text.append(body)
             
             # Create final markdown
             if len(full_text) > 1:  # If we have more than just the title
@@ -317,10 +517,131 @@ class PDF2MarkdownWrapper:
             logger.warning(f"Error in PyMuPDF extraction: {str(e)}")
             return None
     
+    def _pymupdf_header(self, pdf_path, metadata):
+        """
+        Build the title and metadata section used for text-layer conversions.
+        
+        Args:
+            pdf_path (str): Path to the PDF file
+            metadata (dict): PDF metadata
+            
+        Returns:
+            list: Markdown parts
+        """
+        metadata = metadata or {}
+        
+        # Format document title
+        title = os.path.splitext(os.path.basename(pdf_path))[0]
+        if metadata.get("title"):
+            title = f"{title} - {metadata['title']}"
+        
+        full_text = [f"# {title}\n"]
+        
+        # Add metadata if available
+        if metadata and any(metadata.values()):
+            full_text.append("## Document Metadata\n")
+            for key, value in metadata.items():
+                if value:
+                    full_text.append(f"- **{key.capitalize()}**: {value}")
+            full_text.append("")  # Empty line after metadata
+        
+        return full_text
+    
+    def _pymupdf_page_body(self, page):
+        """
+        Format the text layer of one analyzed page.
+        
+        Args:
+            page (dict): Page entry from PDFAnalysis.pages
+            
+        Returns:
+            str: Markdown for the page body, or None if the page has no meaningful text
+        """
+        text = page["text"]
+        
+        # Check if the page has meaningful content
+        if not text or len(text.strip()) <= 20:
+            return None
+        
+        # Use structured content with blocks to better preserve layout
+        blocks = page["blocks"]
+        if not blocks:
+            # Fall back to basic text
+            return text
+        
+        processed_text = []
+        for block in blocks:
+            block_text = block.strip()
+            if block_text:
+                # Try to detect headers vs paragraphs
+                if len(block_text) < 100 and block_text.isupper():
+                    processed_text.append(f"### {block_text}")
+                else:
+                    processed_text.append(block_text)
+        
+        return "\n\n".join(processed_text)
+    
+    def _convert_mixed(self, pdf_path, analysis, ocr_pages, quality="high"):
+        """
+        Convert a mixed document, OCR'ing only the pages that need it.
+        
+        Args:
+            pdf_path (str): Path to the PDF file
+            analysis (PDFAnalysis): Single-pass analysis of the file
+            ocr_pages (list): Zero-based indexes of the pages to OCR
+            quality (str): OCR quality setting ("low", "medium", "high")
+            
+        Returns:
+            str: Markdown text with all pages in order
+        """
+        logger.info(f"OCR for {len(ocr_pages)} of {len(analysis.pages)} pages of {pdf_path} (Quality: {quality})")
+        
+        dpi = OCR_DPI.get(quality, OCR_DPI["low"])
+        
+        if self._use_parallel_ocr(len(ocr_pages)):
+            ocr_bodies = self._ocr_pages_parallel(pdf_path, ocr_pages, dpi, OCR_CONFIG)
+        else:
+            ocr_bodies = {}
+            for page_index, image in iter_page_images(pdf_path, dpi, window=self.ocr_page_window, pages=ocr_pages):
+                try:
+                    ocr_bodies[page_index] = ocr_page_image(image, OCR_CONFIG, dpi)
+                finally:
+                    image.close()
+        
+        if not analysis.includes_text:
+            # The routing analysis only has page counters; read the text layer now
+            from src.utils.pdf_utils import analyze_pdf
+            analysis = analyze_pdf(pdf_path)
+        
+        # Merge OCR and text-layer pages in page order
+        markdown_parts = self._pymupdf_header(pdf_path, analysis.metadata)
+        for page_index, page in enumerate(analysis.pages):
+            if page_index in ocr_bodies:
+                body = ocr_bodies[page_index]
+            else:
+                body = self._pymupdf_page_body(page)
+            if body is not None:
+                markdown_parts.append(f"## Page {page_index+1}\n")
+                markdown_parts.append(body)
+        
+        return self._post_process_markdown("\n\n".join(markdown_parts))
+    
+    def _can_rasterize(self):
+        """Whether pages can be rendered to images for OCR."""
+        if self.streaming_ocr:
+            return self.pymupdf_available or self.pdf2image_available
+        return self.pdf2image_available
+    
     def _convert_with_pytesseract(self, pdf_path, quality="high"):
         """
         Convert PDF to markdown using pytesseract OCR.
         
+        In streaming mode pages are rendered and OCR'd a window at a time and
+        each image is released before the next is rendered; otherwise the
+        whole document is rasterized with pdf2image first. With more than one
+        OCR worker, streaming documents longer than one chunk are split into
+        chunks of pages that worker processes render and OCR in parallel.
+        
         Args:
             pdf_path (str): Path to the PDF file
             quality (str): OCR quality setting ("low", "medium", "high")
@@ -330,27 +651,17 @@ class PDF2MarkdownWrapper:
         """
         logger.info(f"Attempting pytesseract OCR for {pdf_path} (Quality: {quality})")
         
-        if not self.pytesseract_available or not self.pdf2image_available:
-            logger.warning("Pytesseract or pdf2image not available")
+        if not self.pytesseract_available or not self._can_rasterize():
+            logger.warning("Pytesseract or a PDF renderer (PyMuPDF/pdf2image) not available")
             return None
         
         try:
             # Import required modules
-            import pytesseract
-            from pdf2image import convert_from_path
+            import pytesseract  # Fail early if OCR is unavailable
             
             # Set up OCR parameters based on quality
-            dpi = 150  # Default DPI
-            ocr_config = ""
-            if quality == "high":
-                dpi = 300
-                ocr_config = "--oem 1 --psm 6"  # High quality, more accurate
-            elif quality == "medium":
-                dpi = 200
-                ocr_config = "--oem 1 --psm 6"  # Default tesseract settings
-            else:  # low
-                dpi = 150
-                ocr_config = "--oem 1 --psm 6"  # Use standard engine for compatibility
+            dpi = OCR_DPI.get(quality, OCR_DPI["low"])
+            ocr_config = OCR_CONFIG
             
             # Get the PDF filename for title
             filename = os.path.basename(pdf_path)
@@ -361,43 +672,43 @@ class PDF2MarkdownWrapper:
             
             # Convert PDF to images
             try:
-                pdf_images = convert_from_path(
-                    pdf_path,
-                    dpi=dpi,
-                    thread_count=4,
-                    fmt="ppm"  # Format with good OCR results
-                )
-                
-                # Process each page with OCR
-                for i, image in enumerate(pdf_images):
-                    logger.info(f"Processing page {i+1} of {len(pdf_images)} with OCR")
-                    
-                    # Add page header
-                    markdown_parts.append(f"## Page {i+1}\n")
+                page_count = get_page_count(pdf_path) if self.streaming_ocr else 0
+                if self._use_parallel_ocr(page_count):
+                    logger.info(f"OCR of {page_count} pages across {self.ocr_workers} processes "
+                                f"({self.ocr_chunk_size} pages per task)")
+                    page_bodies = self._ocr_pages_parallel(pdf_path, list(range(page_count)), dpi, ocr_config)
+                    for i in range(page_count):
+                        markdown_parts.append(f"## Page {i+1}\n")
+                        markdown_parts.append(page_bodies[i])
+                else:
+                    if self.streaming_ocr:
+                        page_images = iter_page_images(pdf_path, dpi, window=self.ocr_page_window)
+                    else:
+                        from pdf2image import convert_from_path
+                        pdf_images = convert_from_path(
+                            pdf_path,
+                            dpi=dpi,
+                            thread_count=4,
+                            fmt="ppm"  # Format with good OCR results
+                        )
+                        page_count = len(pdf_images)
+                        page_images = enumerate(pdf_images)
                     
-                    # Perform OCR
-                    try:
-                        text = pytesseract.image_to_string(image, config=ocr_config)
-                        if text and len(text.strip()) > 20:  # If we got meaningful text
-                            # Process the extracted text
-                            lines = text.split('\n')
-                            processed_lines = []
-                            
-                            # Simple processing to detect potential headers
-                            for line in lines:
-                                if line.strip():
-                                    if line.isupper() and len(line) < 100:
-                                        processed_lines.append(f"### {line}")
-                                    else:
-                                        processed_lines.append(line)
-                            
-                            # Join lines with proper spacing
-                            markdown_parts.append('\n'.join(processed_lines))
-                        else:
-                            markdown_parts.append("*No text detected on this page*\n")
-                    except Exception as e:
-                        logger.warning(f"OCR failed for page {i+1}: {str(e)}")
-                        markdown_parts.append(f"*OCR processing failed for this page: {str(e)}*\n")
+                    # Process each page with OCR
+                    for i, image in page_images:
+                        logger.info(f"Processing page {i+1} of {page_count} with OCR")
+                        
+                        # Add page header
+                        markdown_parts.append(f"## Page {i+1}\n")
+                        
+                        # Perform OCR
+                        try:
+                            markdown_parts.append(ocr_page_image(image, ocr_config, dpi))
+                        finally:
+                            if self.streaming_ocr:
+                                # Release the page bitmap before rendering the next one
+                                image.close()
+                                del image
             except Exception as e:
                 logger.error(f"PDF to image conversion failed: {str(e)}")
                 return None
@@ -414,6 +725,58 @@ class PDF2MarkdownWrapper:
             logger.warning(f"Error in pytesseract OCR: {str(e)}")
             return None
     
+    def _use_parallel_ocr(self, page_count):
+        """Whether a document is large enough to fan its pages out to worker processes."""
+        if self.ocr_workers <= 1 or not self.streaming_ocr or page_count <= self.ocr_chunk_size:
+            return False
+        # Daemonic processes (e.g. multiprocessing.Pool workers) cannot have children
+        if multiprocessing.current_process().daemon:
+            logger.debug("Running in a daemonic process; OCR pages in-process")
+            return False
+        # Conversion pool workers are already one per core
+        from src.utils.conversion_pool import is_conversion_worker
+        if is_conversion_worker():
+            logger.debug("Running in a conversion worker process; OCR pages in-process")
+            return False
+        return True
+    
+    def _ocr_pages_parallel(self, pdf_path, page_indexes, dpi, ocr_config):
+        """
+        OCR pages across a process pool, one chunk of pages per task.
+        
+        Args:
+            pdf_path (str): Path to the PDF file
+            page_indexes (list): Zero-based page indexes to OCR
+            dpi (int): Rendering resolution
+            ocr_config (str): Tesseract configuration
+            
+        Returns:
+            dict: Page index mapped to its Markdown body
+        """
+        chunks = [page_indexes[i:i + self.ocr_chunk_size]
+                  for i in range(0, len(page_indexes), self.ocr_chunk_size)]
+        page_bodies = {}
+        failed_chunks = []
+        
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(self.ocr_workers, len(chunks))) as executor:
+            futures = {
+                executor.submit(_ocr_pages_task, pdf_path, chunk, dpi, ocr_config): chunk
+                for chunk in chunks
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    page_bodies.update(future.result())
+                except Exception as e:
+                    logger.warning(f"OCR worker failed for pages {futures[future][0]+1}-"
+                                   f"{futures[future][-1]+1}: {str(e)}")
+                    failed_chunks.append(futures[future])
+        
+        # Redo chunks lost to a worker failure in this process
+        for chunk in failed_chunks:
+            page_bodies.update(_ocr_pages_task(pdf_path, chunk, dpi, ocr_config))
+        
+        return page_bodies
+    
     def _convert_with_gpt(self, pdf_path, quality="high"):
         """
         Convert PDF to markdown using our local pdf2md implementation with GPT.
@@ -581,7 +944,8 @@ class PDF2MarkdownWrapper:
             logger.error(f"Even fallback conversion failed: {str(e)}")
             return f"# Error Processing {os.path.basename(pdf_path)}\n\nFailed to convert file: {str(e)}"
 
-def convert_pdf_to_markdown(pdf_path, output_path=None, force_ocr=False, ocr_quality="high", use_gpt=False):
+def convert_pdf_to_markdown(pdf_path, output_path=None, force_ocr=False, ocr_quality="high", use_gpt=False,
+                            analysis=None, route_pages=None):
     """
     Convert a PDF file to markdown text using our comprehensive wrapper.
     
@@ -591,6 +955,8 @@ def convert_pdf_to_markdown(pdf_path, output_path=None, force_ocr=False, ocr_qua
         force_ocr (bool): Whether to force OCR processing even for digital PDFs
         ocr_quality (str): OCR quality setting ("low", "medium", "high")
         use_gpt (bool): Whether to use GPT-based conversion (requires API key)
+        analysis (PDFAnalysis, optional): Existing single-pass analysis of the file
+        route_pages (bool, optional): Decide OCR per page (default: unless force_ocr is set)
         
     Returns:
         str: Markdown text from the PDF or a fallback representation
@@ -604,7 +970,8 @@ def convert_pdf_to_markdown(pdf_path, output_path=None, force_ocr=False, ocr_qua
         start_time = time.time()
         
         # Perform the conversion
-        markdown_result = wrapper.markdown(pdf_path, force_ocr=force_ocr, ocr_quality=ocr_quality, use_gpt=use_gpt)
+        markdown_result = wrapper.markdown(pdf_path, force_ocr=force_ocr, ocr_quality=ocr_quality, use_gpt=use_gpt,
+                                           analysis=analysis, route_pages=route_pages)
         
         # Track performance
         end_time = time.time()
@@ -37,12 +37,188 @@ except ImportError:
     logger.warning("pdf2md module not available. PDF to Markdown conversion will use fallbacks.")
 
 
-def is_scanned_pdf(pdf_path):
+class PDFAnalysis:
+    """
+    Results of a single pass over a PDF document.
+    
+    Scan detection, format detection and PyMuPDF text extraction all need the
+    same per-page facts. analyze_pdf() opens the file once and records them
+    here so each consumer can work from this object instead of re-parsing
+    the PDF. Format detection only needs the per-page counters, so the page
+    text and blocks are kept only when the analysis is made for extraction.
+    """
+    
+    def __init__(self, pdf_path):
+        """
+        Initialize an empty analysis.
+        
+        Args:
+            pdf_path (str): Path to the analyzed PDF file
+        """
+        self.pdf_path = pdf_path
+        self.file_size = 0
+        self.page_count = 0
+        self.is_encrypted = False
+        self.decrypted = False
+        self.metadata = {}
+        # Whether the pages carry their text and blocks
+        self.includes_text = True
+        # One dict per readable page: text_length, image_count, image_coverage,
+        # rotation, fonts, plus text and blocks when includes_text is set
+        self.pages = []
+    
+    def sample(self, count):
+        """
+        Get the analysis of the first pages.
+        
+        Args:
+            count (int): Maximum number of pages
+            
+        Returns:
+            list: Page dicts for up to ``count`` leading pages
+        """
+        return self.pages[:count]
+    
+    def pages_needing_ocr(self):
+        """
+        Get the pages whose content is only available as images.
+        
+        Returns:
+            list: Zero-based indexes of pages that should be OCR'd
+        """
+        return [index for index, page in enumerate(self.pages) if page_needs_ocr(page)]
+    
+    def matches(self, pdf_path):
+        """Whether this analysis describes the given file."""
+        return pdf_path is not None and os.path.abspath(pdf_path) == os.path.abspath(self.pdf_path)
+
+
+def analyze_pdf(pdf_path, include_text=True):
+    """
+    Open a PDF once and collect what the detection and extraction steps need.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        include_text (bool): Keep each page's text and blocks for extraction.
+                             Without them the analysis only holds small counters.
+        
+    Returns:
+        PDFAnalysis: Analysis of the document, or None if PyMuPDF is not available
+    """
+    if not HAS_PYMUPDF:
+        return None
+    
+    analysis = PDFAnalysis(pdf_path)
+    analysis.file_size = os.path.getsize(pdf_path)
+    analysis.includes_text = include_text
+    
+    doc = fitz.open(pdf_path)
+    try:
+        analysis.page_count = len(doc)
+        analysis.is_encrypted = doc.is_encrypted
+        
+        if doc.is_encrypted:
+            try:
+                analysis.decrypted = bool(doc.authenticate(""))
+            except Exception:
+                analysis.decrypted = False
+            if not analysis.decrypted:
+                # Page content can't be read without the password
+                return analysis
+        
+        try:
+            analysis.metadata = doc.metadata or {}
+        except Exception:
+            analysis.metadata = {}
+        
+        for page in doc:
+            text = page.get_text()
+            try:
+                fonts = [font[3] if len(font) > 3 else "" for font in page.get_fonts()]
+            except Exception:
+                fonts = []
+            try:
+                image_coverage = _image_coverage(page)
+            except Exception:
+                image_coverage = 0.0
+            
+            page_info = {
+                "text_length": len(text.strip()),
+                "image_count": len(page.get_images()),
+                "image_coverage": image_coverage,
+                "rotation": page.rotation,
+                "fonts": fonts
+            }
+            if include_text:
+                page_info["text"] = text
+                try:
+                    page_info["blocks"] = [block[4] for block in page.get_text("blocks")]
+                except Exception:
+                    page_info["blocks"] = None
+            analysis.pages.append(page_info)
+    finally:
+        doc.close()
+    
+    return analysis
+
+
+def _image_coverage(page):
+    """Fraction of the page area covered by images (overlaps counted once per image)."""
+    page_rect = page.rect
+    page_area = page_rect.width * page_rect.height
+    if page_area <= 0:
+        return 0.0
+    
+    covered = 0.0
+    for info in page.get_image_info():
+        bbox = fitz.Rect(info["bbox"]) & page_rect
+        if not bbox.is_empty:
+            covered += bbox.width * bbox.height
+    return min(1.0, covered / page_area)
+
+
+# Per-page OCR routing thresholds
+PAGE_MIN_TEXT_CHARS = 50        # Less text than this is not a usable text layer
+PAGE_SCANNED_TEXT_CHARS = 200   # Image-covered pages with less text than this are scans
+PAGE_SCANNED_IMAGE_COVERAGE = 0.5
+
+
+def page_needs_ocr(page):
+    """
+    Decide whether one analyzed page needs OCR.
+    
+    A page needs OCR when it has images but next to no text layer, or when
+    most of it is covered by an image and its text layer is only a few
+    stray characters (stamps, Bates numbers) on top of a scan.
+    
+    Args:
+        page (dict): Page entry from PDFAnalysis.pages
+        
+    Returns:
+        bool: True if the page should be OCR'd
+    """
+    if page["image_count"] == 0:
+        return False
+    if page["text_length"] < PAGE_MIN_TEXT_CHARS:
+        return True
+    return (page.get("image_coverage", 0.0) >= PAGE_SCANNED_IMAGE_COVERAGE and
+            page["text_length"] < PAGE_SCANNED_TEXT_CHARS)
+
+
+def _scan_detection_counts(pages):
+    """Count pages with substantial text and pages with images."""
+    text_blocks = sum(1 for page in pages if page["text_length"] > 100)  # More than 100 chars of text
+    image_blocks = sum(1 for page in pages if page["image_count"] > 0)
+    return text_blocks, image_blocks
+
+
+def is_scanned_pdf(pdf_path, analysis=None):
     """
     Determine if a PDF likely contains scanned content that would benefit from OCR.
     
     Args:
         pdf_path (str): Path to the PDF file
+        analysis (PDFAnalysis, optional): Existing analysis of the file
         
     Returns:
         bool: True if the PDF appears to be scanned, False if it's digital
@@ -52,27 +228,11 @@ def is_scanned_pdf(pdf_path):
         return True
         
     try:
-        doc = fitz.open(pdf_path)
+        if analysis is None:
+            analysis = analyze_pdf(pdf_path, include_text=False)
         
         # Sample a few pages to determine if the document is scanned
-        text_blocks = 0
-        image_blocks = 0
-        pages_to_check = min(3, len(doc))
-        
-        for page_idx in range(pages_to_check):
-            page = doc[page_idx]
-            
-            # Check text content
-            text = page.get_text()
-            if len(text.strip()) > 100:  # More than 100 chars of text
-                text_blocks += 1
-            
-            # Check image content
-            images = page.get_images()
-            if len(images) > 0:
-                image_blocks += 1
-        
-        doc.close()
+        text_blocks, image_blocks = _scan_detection_counts(analysis.sample(3))
         
         # If there are more images than text blocks, or very little text, likely scanned
         is_scanned = (image_blocks >= text_blocks) or (text_blocks == 0)
@@ -169,16 +329,19 @@ def extract_text_with_pymupdf(pdf_path):
         return f"Error extracting PDF text: {str(e)}"
 
 
-def detect_document_format(pdf_path, include_details=False):
+def detect_document_format(pdf_path, include_details=False, analysis=None):
     """
     Detect the format of a PDF document to determine optimal processing.
     
     Args:
         pdf_path (str): Path to the PDF file
         include_details (bool): Whether to return detailed format information
+        analysis (PDFAnalysis, optional): Existing analysis of the file
         
     Returns:
-        dict or bool: If include_details is True, returns a dict with format details.
+        dict or bool: If include_details is True, returns a dict with format details
+                     (including the PDFAnalysis under "analysis", without page text
+                     unless one was passed in, and "ocr_page_count").
                      Otherwise, returns True if the document needs OCR, False if not.
     """
     if not HAS_PYMUPDF:
@@ -215,31 +378,30 @@ def detect_document_format(pdf_path, include_details=False):
             result["rare_format_type"] = "potentially_empty"
             result["processing_strategy"] = "cautious"
         
-        # Open the PDF for analysis
-        doc = fitz.open(pdf_path)
+        # Parse the PDF once; later steps reuse the page counters
+        if analysis is None:
+            analysis = analyze_pdf(pdf_path, include_text=False)
+        result["analysis"] = analysis
+        result["ocr_page_count"] = len(analysis.pages_needing_ocr())
         
         # Check for encryption
-        if doc.is_encrypted:
+        if analysis.is_encrypted:
             result["is_rare_format"] = True
             result["rare_format_type"] = "encrypted"
             result["warnings"].append("Document is encrypted")
             result["processing_strategy"] = "decrypt_first"
             
-            # Try to decrypt with empty password
-            try:
-                success = doc.authenticate("")
-                if success:
-                    result["warnings"].append("Document decrypted with empty password")
-                    # If decryption was successful, update the encryption status
-                    result["is_rare_format"] = False
-                    result["processing_strategy"] = "standard"
-                else:
-                    result["needs_ocr"] = True
-            except:
+            # analyze_pdf tries to decrypt with an empty password
+            if analysis.decrypted:
+                result["warnings"].append("Document decrypted with empty password")
+                # If decryption was successful, update the encryption status
+                result["is_rare_format"] = False
+                result["processing_strategy"] = "standard"
+            else:
                 result["needs_ocr"] = True
         
         # Check document characteristics
-        page_count = len(doc)
+        page_count = analysis.page_count
         result["page_count"] = page_count
         
         if page_count == 0:
@@ -251,40 +413,20 @@ def detect_document_format(pdf_path, include_details=False):
         
         # Check for unusual characteristics based on a sample of pages
         pages_to_check = min(5, page_count)
-        text_content = 0
-        image_content = 0
+        sample = analysis.sample(pages_to_check)
+        text_content, image_content = _scan_detection_counts(sample)
         unusual_fonts = 0
         unusual_rotations = 0
         
-        for page_idx in range(pages_to_check):
-            if page_idx >= page_count:
-                break
-                
-            page = doc[page_idx]
-            
-            # Check for text content
-            text = page.get_text()
-            if len(text.strip()) > 100:
-                text_content += 1
-                
-            # Check for images
-            images = page.get_images()
-            if len(images) > 0:
-                image_content += 1
-            
+        for page in sample:
             # Check for unusual page characteristics
-            if page.rotation != 0:
+            if page["rotation"] != 0:
                 unusual_rotations += 1
             
-            # Check for unusual fonts (if possible)
-            try:
-                fonts = page.get_fonts()
-                for font in fonts:
-                    font_name = font[3] if len(font) > 3 else ""
-                    if "symbol" in font_name.lower() or "zapf" in font_name.lower():
-                        unusual_fonts += 1
-            except:
-                pass
+            # Check for unusual fonts
+            for font_name in page["fonts"]:
+                if "symbol" in font_name.lower() or "zapf" in font_name.lower():
+                    unusual_fonts += 1
         
         # Determine if document likely needs OCR
         if text_content == 0 and image_content > 0:
@@ -310,9 +452,6 @@ def detect_document_format(pdf_path, include_details=False):
                 result["rare_format_type"] = "unusual_fonts"
                 result["processing_strategy"] = "careful_extraction"
         
-        # Close the document
-        doc.close()
-        
         # Return appropriate result
         if include_details:
             return result
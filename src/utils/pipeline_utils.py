@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Staged processing pipeline for JFK Files Scraper.
+
+This module provides a pipelined alternative to the download-then-convert
+batch flow. Each stage (download → format detection → PDF→Markdown →
+Markdown→JSON → store) runs its own pool of worker threads and hands work
+items to the next stage through a bounded queue, so conversion of the first
+PDF starts as soon as it has been downloaded.
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+
+# Import custom exceptions and utilities
+from src.utils.logging_utils import track_error, update_performance_metrics
+from src.utils.download_utils import download_pdf, get_http_session
+from src.utils.async_download import AsyncDownloadConfig, AsyncDownloadEngine, HAS_AIOHTTP
+from src.utils.conversion_utils import pdf_to_markdown, markdown_to_json, admit_conversion
+from src.utils.pdf_utils import detect_document_format
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.pipeline")
+
+# Marker placed on a stage queue to tell one worker to exit
+_STOP = object()
+
+
+class PipelineConfig:
+    """Configuration settings for the staged processing pipeline."""
+    # Worker threads per stage
+    DOWNLOAD_WORKERS = 8   # IO-bound, can be generous
+    DETECT_WORKERS = 2     # Cheap PyMuPDF inspection
+    MARKDOWN_WORKERS = max(1, (os.cpu_count() or 2) // 2)  # CPU-bound OCR
+    JSON_WORKERS = 2       # Lightweight text parsing
+    STORE_WORKERS = 1      # Serialized writes to the Lite LLM store
+
+    # Maximum number of items waiting in front of each stage
+    QUEUE_SIZE = 10
+
+    # Output locations
+    PDF_DIR = "pdfs"
+    LITE_LLM_PATH = "lite_llm/jfk_files.json"
+
+
+class PipelineStage:
+    """A single pipeline stage: a bounded input queue and its worker threads."""
+
+    def __init__(self, name, func, workers, queue_size):
+        """
+        Initialize the stage.
+
+        Args:
+            name (str): Stage name used in logs and statistics
+            func (callable): Function taking a work item dict and returning True on success
+            workers (int): Number of worker threads for this stage
+            queue_size (int): Maximum number of items waiting in the input queue
+        """
+        self.name = name
+        self.func = func
+        self.workers = max(1, int(workers))
+        self.input_queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self.threads = []
+        self.finished_workers = 0
+        self.processed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        self.lock = threading.Lock()
+
+
+class ProcessingPipeline:
+    """
+    Runs documents through download, detection, conversion and storage stages
+    concurrently, connected by bounded queues.
+    """
+
+    def __init__(self, config=None, with_ocr=False, ocr_quality="high",
+                 organize_directories=True, batch_metrics=None, conversion_pool=None,
+                 async_downloads=None, on_result=None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            config (PipelineConfig): Stage worker counts and queue sizes
+            with_ocr (bool): Whether to force OCR for PDF to Markdown conversion
+            ocr_quality (str): OCR quality setting ("low", "medium", "high")
+            organize_directories (bool): Whether to organize PDFs into subdirectories by collection
+            batch_metrics (object): BatchMetrics object for per-file tracking (optional)
+            conversion_pool (ConversionProcessPool): Run the Markdown stage in worker processes (optional)
+            async_downloads (bool): Run the download stage on the asyncio engine
+                                    (default: AsyncDownloadConfig.ENABLED)
+            on_result (callable): Called with (url, success) as each item finishes (optional)
+        """
+        self.config = config or PipelineConfig()
+        self.with_ocr = with_ocr
+        self.ocr_quality = ocr_quality
+        self.organize_directories = organize_directories
+        self.batch_metrics = batch_metrics
+        self.conversion_pool = conversion_pool
+        self.on_result = on_result
+
+        if async_downloads is None:
+            async_downloads = AsyncDownloadConfig.ENABLED
+        if async_downloads and not HAS_AIOHTTP:
+            logger.warning("aiohttp not available - using threaded downloads")
+            async_downloads = False
+        self.async_downloads = async_downloads
+
+        self.stages = [
+            # With the async engine a single thread runs all downloads
+            PipelineStage("download", self._download_stage,
+                          1 if async_downloads else self.config.DOWNLOAD_WORKERS, self.config.QUEUE_SIZE),
+            PipelineStage("detect", self._detect_stage,
+                          self.config.DETECT_WORKERS, self.config.QUEUE_SIZE),
+            PipelineStage("markdown", self._markdown_stage,
+                          self.config.MARKDOWN_WORKERS, self.config.QUEUE_SIZE),
+            PipelineStage("json", self._json_stage,
+                          self.config.JSON_WORKERS, self.config.QUEUE_SIZE),
+            PipelineStage("store", self._store_stage,
+                          self.config.STORE_WORKERS, self.config.QUEUE_SIZE),
+        ]
+
+        self.results = {}
+        self.lock = threading.Lock()
+
+        if not async_downloads:
+            # One kept-alive connection per download thread
+            get_http_session(pool_size=self.config.DOWNLOAD_WORKERS)
+
+    # Stage functions
+
+    def _download_stage(self, item):
+        """Download the PDF for a work item."""
+        pdf_path = download_pdf(
+            item["url"],
+            self.config.PDF_DIR,
+            retry_count=3,
+            organize_by_collection=self.organize_directories
+        )
+        if not pdf_path:
+            logger.error(f"Failed to download {item['url']}")
+            return False
+        item["pdf_path"] = pdf_path
+        return True
+
+    def _detect_stage(self, item):
+        """Detect the document format so conversion can skip its own detection pass."""
+        item["doc_format"] = detect_document_format(item["pdf_path"], include_details=True)
+        return True
+
+    def _markdown_stage(self, item):
+        """Convert the downloaded PDF to Markdown."""
+        if self.conversion_pool:
+            # Admit here: the workers cannot see each other's memory reservations
+            with admit_conversion(item["pdf_path"], item["doc_format"], self.with_ocr, self.ocr_quality):
+                markdown_path = self.conversion_pool.convert(
+                    item["pdf_path"],
+                    force_ocr=self.with_ocr,
+                    ocr_quality=self.ocr_quality,
+                    doc_format=item["doc_format"]
+                )
+        else:
+            markdown_path, _ = pdf_to_markdown(
+                item["pdf_path"],
+                force_ocr=self.with_ocr,
+                ocr_quality=self.ocr_quality,
+                doc_format=item.get("doc_format")
+            )
+        if not markdown_path:
+            logger.error(f"Failed to convert PDF to Markdown: {item['pdf_path']}")
+            return False
+        item["markdown_path"] = markdown_path
+        return True
+
+    def _json_stage(self, item):
+        """Convert the Markdown to JSON."""
+        json_path, _ = markdown_to_json(item["markdown_path"])
+        if not json_path:
+            logger.error(f"Failed to convert Markdown to JSON: {item['markdown_path']}")
+            return False
+        item["json_path"] = json_path
+        return True
+
+    def _store_stage(self, item):
+        """Store the JSON in Lite LLM format. Storage failures are not fatal."""
+        try:
+            from src.utils.storage import store_json_data
+            if not store_json_data(item["json_path"], self.config.LITE_LLM_PATH):
+                logger.warning(f"Failed to store JSON data in Lite LLM format: {item['json_path']}")
+        except Exception as e:
+            logger.warning(f"Error storing JSON data in Lite LLM format: {e}")
+        return True
+
+    # Pipeline mechanics
+
+    def _record_result(self, item, success):
+        """Record the final outcome for a work item."""
+        processing_time = time.time() - item["start_time"]
+        with self.lock:
+            self.results[item["url"]] = success
+
+        if success:
+            logger.info(f"Successfully processed {item['url']}")
+
+        # Bookkeeping must not take the worker thread down with it
+        if self.batch_metrics:
+            try:
+                self.batch_metrics.record_file_processed(item["url"], success, processing_time)
+            except Exception as e:
+                logger.error(f"Error recording metrics for {item['url']}: {e}")
+
+        if self.on_result:
+            try:
+                self.on_result(item["url"], success)
+            except Exception as e:
+                logger.error(f"Error in result callback for {item['url']}: {e}")
+
+    def _worker(self, index):
+        """Worker loop for the stage at the given index."""
+        stage = self.stages[index]
+        next_stage = self.stages[index + 1] if index + 1 < len(self.stages) else None
+
+        try:
+            while True:
+                item = stage.input_queue.get()
+                if item is _STOP:
+                    break
+
+                started = time.time()
+                try:
+                    success = stage.func(item)
+                except Exception as e:
+                    logger.error(f"Error in {stage.name} stage for {item['url']}: {e}")
+                    track_error("general", e, item["url"])
+                    success = False
+                elapsed = time.time() - started
+
+                with stage.lock:
+                    stage.busy_time += elapsed
+                    if success:
+                        stage.processed += 1
+                    else:
+                        stage.failed += 1
+
+                self._forward(item, success, next_stage)
+        finally:
+            # Even a worker that died must shut down the next stage, or run() never returns
+            self._finish_worker(index)
+
+    def _forward(self, item, success, next_stage):
+        """Record a failed or finished item, or pass it to the next stage."""
+        if not success:
+            self._record_result(item, False)
+        elif next_stage is None:
+            self._record_result(item, True)
+        else:
+            # Blocks while the next stage is saturated (backpressure)
+            next_stage.input_queue.put(item)
+
+    def _async_download_worker(self):
+        """Run the download stage on the asyncio engine, keeping many downloads in flight."""
+        stage = self.stages[0]
+        next_stage = self.stages[1] if len(self.stages) > 1 else None
+        started = time.time()
+        # Items handed to the engine that have no result yet, and whether the
+        # stop marker has been taken off the queue
+        in_flight = {}
+        stopped = threading.Event()
+
+        def pending_items():
+            while True:
+                item = stage.input_queue.get()
+                if item is _STOP:
+                    stopped.set()
+                    return
+                with stage.lock:
+                    in_flight[id(item)] = item
+                yield item
+
+        def on_result(item, pdf_path):
+            with stage.lock:
+                in_flight.pop(id(item), None)
+                if pdf_path:
+                    stage.processed += 1
+                else:
+                    stage.failed += 1
+            if pdf_path:
+                item["pdf_path"] = pdf_path
+            else:
+                logger.error(f"Failed to download {item['url']}")
+            self._forward(item, bool(pdf_path), next_stage)
+
+        try:
+            engine = AsyncDownloadEngine()
+            engine.run(pending_items(), self.config.PDF_DIR, self.organize_directories,
+                       on_result=on_result, url_of=lambda item: item["url"])
+        except Exception as e:
+            logger.error(f"Error in async download stage: {e}")
+            track_error("download", e)
+            # Fail the downloads the engine abandoned
+            with stage.lock:
+                abandoned = list(in_flight.values())
+                in_flight.clear()
+                stage.failed += len(abandoned)
+            for item in abandoned:
+                self._record_result(item, False)
+            # Fail whatever is still queued so the pipeline can drain; once the
+            # stop marker is consumed nothing more will arrive and get() would block
+            while not stopped.is_set():
+                item = stage.input_queue.get()
+                if item is _STOP:
+                    break
+                self._record_result(item, False)
+        finally:
+            with stage.lock:
+                stage.busy_time += time.time() - started
+            self._finish_worker(0)
+
+    def _finish_worker(self, index):
+        """Count a worker as finished; the last one of a stage shuts down the next stage."""
+        stage = self.stages[index]
+        next_stage = self.stages[index + 1] if index + 1 < len(self.stages) else None
+
+        # The last worker of a stage to exit shuts down the next stage
+        with stage.lock:
+            stage.finished_workers += 1
+            last_worker = stage.finished_workers == stage.workers
+        if last_worker and next_stage is not None:
+            for _ in range(next_stage.workers):
+                next_stage.input_queue.put(_STOP)
+
+    def run(self, urls):
+        """
+        Run URLs through all stages and wait for completion.
+
+        Args:
+            urls (iterable): PDF URLs to process. Consumed lazily, so a generator
+                             can keep feeding the pipeline while it runs.
+
+        Returns:
+            tuple: (successful_count, failed_count)
+        """
+        logger.info("Starting pipeline with stages: " + ", ".join(
+            f"{stage.name}={stage.workers}" for stage in self.stages))
+        pipeline_start = time.time()
+
+        # Start all stage workers
+        for index, stage in enumerate(self.stages):
+            for worker_num in range(stage.workers):
+                if index == 0 and self.async_downloads:
+                    target, args = self._async_download_worker, ()
+                else:
+                    target, args = self._worker, (index,)
+                thread = threading.Thread(
+                    target=target,
+                    args=args,
+                    name=f"pipeline-{stage.name}-{worker_num}",
+                    daemon=True
+                )
+                thread.start()
+                stage.threads.append(thread)
+
+        # Feed the first stage; put() blocks when the download queue is full
+        first_stage = self.stages[0]
+        submitted = 0
+        try:
+            for url in urls:
+                first_stage.input_queue.put({"url": url, "start_time": time.time()})
+                submitted += 1
+        finally:
+            for _ in range(first_stage.workers):
+                first_stage.input_queue.put(_STOP)
+
+        # Wait for every stage to drain
+        for stage in self.stages:
+            for thread in stage.threads:
+                thread.join()
+
+        successful = sum(1 for success in self.results.values() if success)
+        failed = len(self.results) - successful
+        elapsed = time.time() - pipeline_start
+
+        self._log_stage_statistics(elapsed)
+        update_performance_metrics(processed_files=submitted)
+
+        logger.info(f"Pipeline complete in {elapsed:.2f} seconds: {successful} successful, {failed} failed")
+        return successful, failed
+
+    def get_stage_statistics(self):
+        """
+        Get per-stage processing statistics.
+
+        Returns:
+            dict: Stage name mapped to processed/failed counts and busy time
+        """
+        return {
+            stage.name: {
+                "workers": stage.workers,
+                "processed": stage.processed,
+                "failed": stage.failed,
+                "busy_time": stage.busy_time
+            }
+            for stage in self.stages
+        }
+
+    def _log_stage_statistics(self, elapsed):
+        """Log how busy each stage was relative to the wall-clock time."""
+        for name, stats in self.get_stage_statistics().items():
+            utilization = 0.0
+            if elapsed > 0:
+                utilization = stats["busy_time"] / (elapsed * stats["workers"]) * 100
+            logger.info(f"Stage '{name}': {stats['processed']} ok, {stats['failed']} failed, "
+                        f"{stats['busy_time']:.2f}s busy ({utilization:.1f}% utilization)")
+
+
+def run_pipeline(urls, with_ocr=False, ocr_quality="high", organize_directories=True,
+                 batch_metrics=None, config=None):
+    """
+    Convenience function to process URLs with a staged pipeline.
+
+    Args:
+        urls (iterable): PDF URLs to process
+        with_ocr (bool): Whether to force OCR for PDF conversion
+        ocr_quality (str): OCR quality setting ("low", "medium", "high")
+        organize_directories (bool): Whether to organize PDFs into subdirectories
+        batch_metrics (object): BatchMetrics object for tracking (optional)
+        config (PipelineConfig): Stage configuration (optional)
+
+    Returns:
+        tuple: (successful_count, failed_count)
+    """
+    pipeline = ProcessingPipeline(
+        config=config,
+        with_ocr=with_ocr,
+        ocr_quality=ocr_quality,
+        organize_directories=organize_directories,
+        batch_metrics=batch_metrics
+    )
+    result = pipeline.run(urls)
+    
+    from src.utils.storage import export_lite_llm_data
+    export_lite_llm_data(pipeline.config.LITE_LLM_PATH)
+    return result
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Append-only progress journal for JFK Files Scraper.
+
+Checkpointing progress by pickling the whole set of processed URLs costs
+time proportional to the collection on every save. The journal instead
+appends one JSON line per URL state change, so recording progress costs
+O(changes). Lines are flushed to the OS as they are written and fsync'd in
+batches. Every so often the current state is written to a snapshot and the
+journal is truncated, which keeps recovery (load the snapshot, replay the
+journal tail) fast.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.progress_journal")
+
+
+class JournalConfig:
+    """Configuration settings for progress journals."""
+    FSYNC_EVERY = 32  # Records written between fsyncs
+    FSYNC_INTERVAL = 1.0  # Maximum seconds an unsynced record may wait
+    COMPACT_EVERY = 5000  # Journal records replayed before a snapshot is taken
+
+
+class ProgressJournal:
+    """
+    Durable mapping of URL to processing status.
+
+    State lives in two files next to each other: `<base>.snapshot.json`
+    holds the state at the last compaction and `<base>.journal` holds the
+    changes since, one JSON object per line. Small metadata values (counters,
+    the current batch) can be journaled alongside the statuses.
+    """
+
+    def __init__(self, base_path, config=None):
+        """
+        Open a journal, recovering any state already on disk.
+
+        Args:
+            base_path (str): Path prefix for the snapshot and journal files
+            config (JournalConfig, optional): Sync and compaction settings
+        """
+        self.config = config or JournalConfig()
+        self.snapshot_path = f"{base_path}.snapshot.json"
+        self.journal_path = f"{base_path}.journal"
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(base_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.statuses = {}
+        self.meta = {}
+        self.journal_records = 0
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.fsyncs = 0
+        self.compactions = 0
+
+        self._recover()
+        self.file = open(self.journal_path, "a", encoding="utf-8")
+
+    def _recover(self):
+        """Load the snapshot and replay the journal on top of it."""
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            self.statuses = snapshot.get("statuses", {})
+            self.meta = snapshot.get("meta", {})
+
+        if not os.path.exists(self.journal_path):
+            return
+
+        valid_bytes = 0
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final write from a crash; everything before it is intact
+                    logger.warning(f"Ignoring incomplete record at the end of {self.journal_path}")
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                self._apply(record)
+                self.journal_records += 1
+                valid_bytes += len(line)
+
+        # Drop the torn tail so new records start on a clean line
+        if valid_bytes != os.path.getsize(self.journal_path):
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(valid_bytes)
+
+        if self.statuses or self.meta:
+            logger.info(f"Recovered progress for {len(self.statuses)} URLs "
+                        f"({self.journal_records} journal records replayed)")
+
+    def _apply(self, record):
+        """Apply one journal record to the in-memory state."""
+        if "url" in record:
+            self.statuses[record["url"]] = record["status"]
+        if "meta" in record:
+            self.meta.update(record["meta"])
+
+    def _append(self, records):
+        """Write records and apply them. Must be called with the lock held."""
+        for record in records:
+            self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self._apply(record)
+        self.file.flush()
+        self.journal_records += len(records)
+        self.unsynced += len(records)
+
+        if (self.unsynced >= self.config.FSYNC_EVERY or
+                time.monotonic() - self.last_sync >= self.config.FSYNC_INTERVAL):
+            self._sync()
+        if self.journal_records >= self.config.COMPACT_EVERY:
+            self._compact()
+
+    def _sync(self):
+        """fsync the journal. Must be called with the lock held."""
+        if self.unsynced:
+            os.fsync(self.file.fileno())
+            self.fsyncs += 1
+            self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def _compact(self):
+        """Write a snapshot of the state and truncate the journal. Must be called with the lock held."""
+        temp_path = f"{self.snapshot_path}.temp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"statuses": self.statuses, "meta": self.meta}, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+        # Replaying the old journal over the new snapshot would be harmless,
+        # so a crash before the truncation loses nothing
+        self.file.close()
+        self.file = open(self.journal_path, "w", encoding="utf-8")
+        self.journal_records = 0
+        self.unsynced = 0
+        self.compactions += 1
+        logger.debug(f"Compacted progress journal into {self.snapshot_path}")
+
+    def record(self, url, status):
+        """
+        Record a URL's new status.
+
+        Args:
+            url (str): URL
+            status (str): New status
+        """
+        with self.lock:
+            self._append([{"url": url, "status": status}])
+
+    def record_many(self, statuses, **meta):
+        """
+        Record several status changes, and optionally metadata, in one write.
+
+        Args:
+            statuses (dict): Mapping of URL to new status
+            **meta: Metadata values to store with the changes
+        """
+        records = [{"url": url, "status": status} for url, status in statuses.items()]
+        if meta:
+            records.append({"meta": meta})
+        with self.lock:
+            self._append(records)
+
+    def get_statuses(self):
+        """
+        Get the recorded status of every URL.
+
+        Returns:
+            dict: Mapping of URL to status
+        """
+        with self.lock:
+            return dict(self.statuses)
+
+    def get_meta(self):
+        """
+        Get the recorded metadata.
+
+        Returns:
+            dict: Metadata values
+        """
+        with self.lock:
+            return dict(self.meta)
+
+    def flush(self):
+        """Make every record written so far durable."""
+        with self.lock:
+            if not self.file.closed:
+                self._sync()
+
+    def compact(self):
+        """Snapshot the state and truncate the journal now."""
+        with self.lock:
+            self._compact()
+
+    def reset(self):
+        """Forget all recorded progress."""
+        with self.lock:
+            self.statuses = {}
+            self.meta = {}
+            self._compact()
+
+    def get_statistics(self):
+        """
+        Get journal statistics.
+
+        Returns:
+            dict: URLs tracked, records since the last snapshot, fsyncs and compactions
+        """
+        with self.lock:
+            return {
+                "urls": len(self.statuses),
+                "journal_records": self.journal_records,
+                "fsyncs": self.fsyncs,
+                "compactions": self.compactions
+            }
+
+    def close(self):
+        """Sync and close the journal."""
+        with self.lock:
+            if not self.file.closed:
+                self._sync()
+                self.file.close()
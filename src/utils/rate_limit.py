@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rate limiting utilities for JFK Files Scraper.
+
+This module provides a token bucket that can be shared by threads and
+asyncio tasks to cap the rate of outbound requests while still allowing
+short bursts, and the process-wide bucket that paces all scrape and
+download requests.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.rate_limit")
+
+
+class RateLimitConfig:
+    """Configuration settings for the shared outbound HTTP rate limit."""
+    HTTP_RATE = 2.0  # Scrape and download requests started per second; raise with --http-rate
+    HTTP_BURST = 5   # Requests that may start at once after an idle period
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. A caller
+    takes a token and, if the bucket was empty, waits until its token would
+    have been refilled. Waiting callers are served in the order they arrived.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """
+        Initialize the bucket, starting full.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float, optional): Maximum burst size (default: one second of tokens)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, self.rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+        # Usage statistics
+        self.started = self.updated
+        self.acquired = 0.0
+        self.wait_time = 0.0
+
+    def _refill(self, now):
+        """Add the tokens accrued since the last update. Must be called with the lock held."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, tokens=1):
+        """
+        Take tokens, borrowing against future refills if necessary.
+
+        Args:
+            tokens (float): Number of tokens to take
+
+        Returns:
+            float: Seconds the caller must wait before using the tokens
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens -= tokens
+            self.acquired += tokens
+            if self.tokens >= 0:
+                return 0.0
+            wait = -self.tokens / self.rate
+            self.wait_time += wait
+            return wait
+
+    def acquire(self, tokens=1):
+        """
+        Take tokens, sleeping until they are available.
+
+        Args:
+            tokens (float): Number of tokens to take
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens=1):
+        """
+        Take tokens, yielding to the event loop until they are available.
+
+        Args:
+            tokens (float): Number of tokens to take
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def set_rate(self, rate, capacity=None):
+        """
+        Change the refill rate, keeping the tokens accrued so far.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float, optional): New maximum burst size
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            if capacity:
+                self.capacity = float(capacity)
+                self.tokens = min(self.tokens, self.capacity)
+        logger.debug(f"Token bucket rate set to {rate:.2f}/s")
+
+    def get_statistics(self):
+        """
+        Get usage statistics for the bucket.
+
+        Returns:
+            dict: Configured rate, tokens taken, observed tokens/sec and total wait time
+        """
+        with self.lock:
+            elapsed = time.monotonic() - self.started
+            return {
+                "rate": self.rate,
+                "capacity": self.capacity,
+                "acquired": self.acquired,
+                "tokens_per_sec": self.acquired / elapsed if elapsed > 0 else 0.0,
+                "wait_time": self.wait_time
+            }
+
+
+# Process-wide limiter for outbound HTTP, created on first use
+_http_rate_limiter = None
+_http_rate_limiter_lock = threading.Lock()
+
+
+def get_http_rate_limiter():
+    """
+    Get the token bucket shared by all scrape and download requests.
+
+    Returns:
+        TokenBucket: The shared limiter
+    """
+    global _http_rate_limiter
+    if _http_rate_limiter is None:
+        with _http_rate_limiter_lock:
+            if _http_rate_limiter is None:
+                _http_rate_limiter = TokenBucket(RateLimitConfig.HTTP_RATE, RateLimitConfig.HTTP_BURST)
+                logger.info(f"HTTP rate limit set to {RateLimitConfig.HTTP_RATE:.2f} requests/s")
+    return _http_rate_limiter
+
+
+def get_http_rate_statistics():
+    """
+    Get usage statistics for the shared HTTP limiter.
+
+    Returns:
+        dict: Statistics from TokenBucket.get_statistics(), or None if no request has been limited yet
+    """
+    if _http_rate_limiter is None:
+        return None
+    return _http_rate_limiter.get_statistics()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Size-aware scheduling for JFK Files Scraper.
+
+Processing files in scrape order lets a few huge scanned documents start
+last and dominate the total run time. This module estimates each file's
+size from the local copy when it has already been downloaded (optionally
+from a HEAD request's Content-Length otherwise; files of unknown size rank
+as the median known size) and orders work by a selectable policy:
+
+- "largest_first": start the biggest jobs early to shorten the makespan
+- "smallest_first": finish many small jobs early for early throughput
+- "fifo": keep the original order
+"""
+
+import os
+import heapq
+import logging
+import threading
+import statistics
+import concurrent.futures
+
+from src.utils.download_utils import get_http_session, get_pdf_save_path
+from src.utils.rate_limit import get_http_rate_limiter
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.scheduling")
+
+SCHEDULING_POLICIES = ("fifo", "largest_first", "smallest_first")
+
+
+class SchedulingConfig:
+    """Configuration settings for size-aware scheduling."""
+    POLICY = "largest_first"  # One of SCHEDULING_POLICIES
+    PROBE_REMOTE = False  # Send HEAD requests for files not downloaded yet (one rate-limited request each)
+    PROBE_WORKERS = 8  # Concurrent HEAD requests
+    PROBE_TIMEOUT = 10  # Seconds per HEAD request
+
+
+def _head_content_length(url, timeout):
+    """
+    Get a URL's Content-Length with a HEAD request.
+
+    Args:
+        url (str): URL to probe
+        timeout (float): Request timeout in seconds
+
+    Returns:
+        int: Size in bytes, or None if the server does not report it
+    """
+    get_http_rate_limiter().acquire()
+    try:
+        response = get_http_session().head(url, allow_redirects=True, timeout=timeout)
+        if response.status_code == 200 and response.headers.get("Content-Length"):
+            return int(response.headers["Content-Length"])
+    except Exception as e:
+        logger.debug(f"HEAD request failed for {url}: {e}")
+    return None
+
+
+def estimate_job_sizes(urls, save_dir="pdfs", organize_by_collection=True, probe_remote=None, config=None):
+    """
+    Estimate the size in bytes of each file to process.
+
+    Files already on disk are measured locally; the rest are probed with HEAD
+    requests when probe_remote is enabled.
+
+    Args:
+        urls (list): PDF URLs
+        save_dir (str): Directory downloads are saved to
+        organize_by_collection (bool): Whether downloads are organized into subdirectories
+        probe_remote (bool, optional): Override SchedulingConfig.PROBE_REMOTE
+        config (SchedulingConfig, optional): Probe settings
+
+    Returns:
+        dict: Mapping of URL to size in bytes, or None where it is unknown
+    """
+    config = config or SchedulingConfig()
+    if probe_remote is None:
+        probe_remote = config.PROBE_REMOTE
+
+    sizes = {}
+    remote = []
+    for url in urls:
+        path = get_pdf_save_path(url, save_dir, organize_by_collection)
+        if os.path.exists(path):
+            sizes[url] = os.path.getsize(path)
+        elif probe_remote:
+            remote.append(url)
+        else:
+            sizes[url] = None
+
+    if remote:
+        logger.info(f"Probing sizes of {len(remote)} files with HEAD requests")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=config.PROBE_WORKERS) as executor:
+            for url, size in zip(remote, executor.map(lambda u: _head_content_length(u, config.PROBE_TIMEOUT), remote)):
+                sizes[url] = size
+
+    known = sum(1 for size in sizes.values() if size is not None)
+    logger.info(f"Sizes known for {known}/{len(sizes)} files")
+    return sizes
+
+
+class SizeAwareQueue:
+    """
+    Thread-safe work queue ordered by a scheduling policy.
+
+    Offers the put/get/empty/qsize subset of queue.Queue used by the
+    processors. Items of unknown size are ranked as if they were the median
+    known size; ties keep insertion order.
+    """
+
+    def __init__(self, policy="largest_first"):
+        """
+        Initialize an empty queue.
+
+        Args:
+            policy (str): One of SCHEDULING_POLICIES
+        """
+        if policy not in SCHEDULING_POLICIES:
+            raise ValueError(f"Unknown scheduling policy '{policy}', expected one of {SCHEDULING_POLICIES}")
+        self.policy = policy
+        self.heap = []
+        self.counter = 0
+        self.lock = threading.Lock()
+
+    def _priority(self, size):
+        """Heap key for an item of the given size."""
+        if self.policy == "largest_first":
+            return -size
+        if self.policy == "smallest_first":
+            return size
+        return 0
+
+    def put(self, item, size=None):
+        """
+        Add an item.
+
+        Args:
+            item: Work item
+            size (int, optional): Size used for ordering
+        """
+        with self.lock:
+            heapq.heappush(self.heap, (self._priority(size or 0), self.counter, item))
+            self.counter += 1
+
+    def put_many(self, items, sizes):
+        """
+        Add items with their estimated sizes.
+
+        Args:
+            items (list): Work items
+            sizes (dict): Mapping of item to size (None where unknown)
+        """
+        known = [size for size in (sizes.get(item) for item in items) if size is not None]
+        default = statistics.median(known) if known else 0
+        for item in items:
+            size = sizes.get(item)
+            self.put(item, default if size is None else size)
+
+    def get(self):
+        """
+        Remove and return the next item.
+
+        Returns:
+            The highest-priority item
+
+        Raises:
+            IndexError: If the queue is empty
+        """
+        with self.lock:
+            return heapq.heappop(self.heap)[2]
+
+    def empty(self):
+        """Whether the queue has no items."""
+        with self.lock:
+            return not self.heap
+
+    def qsize(self):
+        """Number of queued items."""
+        with self.lock:
+            return len(self.heap)
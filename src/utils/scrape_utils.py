@@ -4,19 +4,31 @@
 Web scraping utilities for JFK Files Scraper.
 
 This module provides functionality for scraping JFK files from web sources,
-with pagination handling and error recovery.
+with pagination handling and error recovery. Listing pages are fetched over
+the pooled HTTP session and scanned for PDF links directly; the Crawl4AI
+headless browser is only started for pages that fail that fast path.
+URLs can also be streamed as each page is scraped, so processing starts
+while discovery is still running, and re-scrapes can be diffed against a
+persistent URL manifest to find what changed since the previous run.
 """
 
 import os
+import re
+import html
 import time
+import queue
 import asyncio
 import logging
+import threading
 from pathlib import Path
 from bs4 import BeautifulSoup
 
 # Import custom exceptions and utilities
 from src.utils.logging_utils import track_error
 from src.utils.checkpoint_utils import save_checkpoint
+from src.utils.rate_limit import get_http_rate_limiter
+from src.utils.download_utils import get_http_session
+from src.utils.url_manifest import get_url_manifest
 
 # Initialize logger
 logger = logging.getLogger("jfk_scraper.scrape")
@@ -32,6 +44,159 @@ except ImportError:
     logger.warning("Crawl4AI not available - web scraping functionality will be limited")
 
 
+class ScrapeConfig:
+    """Configuration settings for listing page scraping."""
+    CONCURRENT_PAGES = 4  # Listing pages crawled at once
+    PAGE_DELAY = 0.5  # Base delay (seconds) a connection waits between its pages
+    MAX_PAGE_DELAY = 2.0  # Upper bound of the adaptive per-connection delay
+    MODE = "fast"  # "fast": plain HTTP with browser fallback, "browser": always use Crawl4AI
+    FAST_TIMEOUT = 30  # Seconds per listing page request in fast mode
+    TOTAL_PAGES = 113  # Listing pages in the full JFK Archive
+    INCREMENTAL_STOP_AFTER = 2  # Consecutive unchanged listing pages that end an incremental scrape
+
+
+# Marker placed on the URL stream queue when discovery has finished
+_END_OF_STREAM = object()
+
+
+# href values of <a> tags, quoted or not, matched directly on the raw HTML bytes
+_ANCHOR_HREF_PATTERN = re.compile(
+    rb'<a\b[^>]*?\bhref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))',
+    re.IGNORECASE
+)
+
+
+def _absolute_pdf_url(href, page_url):
+    """
+    Make a PDF link from a listing page absolute.
+    
+    Args:
+        href (str): Link target as written in the page
+        page_url (str): URL of the listing page
+        
+    Returns:
+        str: Absolute URL
+    """
+    if href.startswith('http'):
+        return href
+    if href.startswith('/'):
+        return f"https://www.archives.gov{href}"
+    base_url = page_url.split('?')[0]
+    return f"{base_url}/{href}"
+
+
+def extract_pdf_links(page_html, page_url):
+    """
+    Extract PDF links from listing page HTML without building a parse tree.
+    
+    Args:
+        page_html (bytes): Raw HTML of the page
+        page_url (str): URL of the page, for resolving relative links
+        
+    Returns:
+        list: Absolute PDF URLs in document order
+    """
+    pdf_files = []
+    for match in _ANCHOR_HREF_PATTERN.finditer(page_html):
+        raw_href = match.group(1) or match.group(2) or match.group(3) or b''
+        href = html.unescape(raw_href.decode('utf-8', errors='replace')).strip()
+        if href.lower().endswith('.pdf'):
+            pdf_files.append(_absolute_pdf_url(href, page_url))
+    return pdf_files
+
+
+def _fetch_listing_page(page_url):
+    """Fetch a listing page's raw HTML over the pooled HTTP session."""
+    response = get_http_session().get(page_url, timeout=ScrapeConfig.FAST_TIMEOUT)
+    response.raise_for_status()
+    return response.content
+
+
+async def _fast_scrape_page(page_url):
+    """
+    Scrape a single page without a browser.
+    
+    Args:
+        page_url (str): URL of the page to scrape
+        
+    Returns:
+        tuple: (success, pdf_files, error_message)
+    """
+    try:
+        await get_http_rate_limiter().acquire_async()
+        loop = asyncio.get_running_loop()
+        page_html = await loop.run_in_executor(None, _fetch_listing_page, page_url)
+    except Exception as e:
+        return False, [], f"Fast fetch failed: {e}"
+    return True, extract_pdf_links(page_html, page_url), None
+
+
+class _BrowserFallback:
+    """Provides a Crawl4AI crawler, starting the browser only when a page first needs it."""
+    
+    def __init__(self, crawler=None):
+        """
+        Args:
+            crawler: Existing crawler to use (it is not closed by this object)
+        """
+        self.crawler = crawler
+        self.owned = False
+        self.lock = asyncio.Lock()
+    
+    async def get(self):
+        """Get the crawler, or None if Crawl4AI is not available."""
+        async with self.lock:
+            if self.crawler is None and HAS_CRAWL4AI:
+                logger.info("Starting headless browser for listing pages")
+                # Create proper configurations for Crawl4AI
+                browser_config = BrowserConfig(
+                    verbose=True
+                    # Note: Update this configuration based on the actual Crawl4AI API
+                )
+                self.crawler = AsyncWebCrawler(config=browser_config)
+                await self.crawler.__aenter__()
+                self.owned = True
+        return self.crawler
+    
+    async def close(self):
+        """Close the browser if this object started it."""
+        if self.owned:
+            await self.crawler.__aexit__(None, None, None)
+            self.crawler = None
+            self.owned = False
+
+
+async def _scrape_listing_page(browser, page_url, run_config, fast=True):
+    """
+    Scrape a listing page, over plain HTTP first when `fast` is set.
+    
+    Args:
+        browser (_BrowserFallback): Source of the Crawl4AI crawler
+        page_url (str): URL of the page to scrape
+        run_config: CrawlerRunConfig object
+        fast (bool): Try the browserless fast path first
+        
+    Returns:
+        tuple: (success, pdf_files, error_message)
+    """
+    if fast:
+        success, pdf_files, error_msg = await _fast_scrape_page(page_url)
+        # A listing page without any PDF links was probably rendered by JavaScript
+        if success and pdf_files:
+            return success, pdf_files, error_msg
+        reason = error_msg or "no PDF links in the static HTML"
+        crawler = await browser.get()
+        if crawler is None:
+            return success, pdf_files, error_msg
+        logger.info(f"Falling back to the browser for {page_url}: {reason}")
+    else:
+        crawler = await browser.get()
+        if crawler is None:
+            return False, [], "Crawl4AI not available for browser scraping"
+    
+    return await _scrape_page(crawler, page_url, run_config)
+
+
 async def _scrape_page(crawler, page_url, run_config, retry_count=5):
     """
     Scrape a single page with retries.
@@ -47,6 +212,9 @@ async def _scrape_page(crawler, page_url, run_config, retry_count=5):
     """
     for attempt in range(1, retry_count + 1):
         try:
+            # Wait for a slot in the shared outbound request budget
+            await get_http_rate_limiter().acquire_async()
+            
             # Use arun with proper configuration
             result = await crawler.arun(
                 url=page_url,
@@ -75,14 +243,7 @@ async def _scrape_page(crawler, page_url, run_config, retry_count=5):
                 href = link['href']
                 # Check if it's a PDF link
                 if href.lower().endswith('.pdf'):
-                    # Make relative URLs absolute
-                    if not href.startswith('http'):
-                        if href.startswith('/'):
-                            href = f"https://www.archives.gov{href}"
-                        else:
-                            base_url = page_url.split('?')[0]
-                            href = f"{base_url}/{href}"
-                    pdf_files.append(href)
+                    pdf_files.append(_absolute_pdf_url(href, page_url))
             
             return True, pdf_files, None
             
@@ -95,97 +256,132 @@ async def _scrape_page(crawler, page_url, run_config, retry_count=5):
                 return False, [], error_msg
 
 
-async def _async_scrape_jfk_files(base_url, start_page, end_page, total_pages):
+async def _async_scrape_jfk_files(base_url, start_page, end_page, total_pages, crawler=None,
+                                  concurrency=None):
     """
     Internal async function to scrape JFK files.
     
+    Up to `concurrency` listing pages are crawled at once. Each connection
+    slot waits a polite, adaptive delay after its page before taking the next
+    one, so the per-connection request pattern is unchanged while discovery
+    runs several times faster.
+    
     Args:
         base_url (str): Base URL for scraping
         start_page (int): Starting page number
         end_page (int): Ending page number
         total_pages (int): Total number of pages
+        crawler: Crawler to use instead of a new AsyncWebCrawler (must provide arun)
+        concurrency (int, optional): Pages crawled at once (default: ScrapeConfig.CONCURRENT_PAGES)
         
     Returns:
-        list: List of PDF file URLs
+        list: List of PDF file URLs, in page order
+    """
+    browser = _BrowserFallback(crawler)
+    try:
+        return await _crawl_listing_pages(browser, base_url, start_page, end_page, total_pages, concurrency)
+    finally:
+        await browser.close()
+
+
+async def _crawl_listing_pages(browser, base_url, start_page, end_page, total_pages, concurrency,
+                               page_queue=None, stop_event=None):
     """
-    # Create proper configurations for Crawl4AI
-    browser_config = BrowserConfig(
-        verbose=True
-        # Note: Update this configuration based on the actual Crawl4AI API
-    )
+    Crawl listing pages concurrently; see _async_scrape_jfk_files.
+    
+    Each page is also put on `page_queue`, when given, as a (page, pdf_files)
+    tuple in completion order, with pdf_files None if the page failed. Pages
+    not started yet are skipped once `stop_event` is set.
+    """
+    fast = ScrapeConfig.MODE == "fast"
     run_config = CrawlerRunConfig(
         word_count_threshold=10,
         process_iframes=True,
         remove_overlay_elements=True
-    )
+    ) if HAS_CRAWL4AI else None
     
-    # Initialize the crawler with proper configuration
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        pdf_files = []
-        page = start_page
-        
-        # Track processed pages for checkpointing
-        processed_pages = 0
-        
-        # Process each page
-        while page <= end_page:
+    concurrency = max(1, concurrency or ScrapeConfig.CONCURRENT_PAGES)
+    semaphore = asyncio.Semaphore(concurrency)
+    pages = list(range(start_page, end_page + 1))
+    page_results = {}  # Page number -> PDF URLs for successfully scraped pages
+    state = {"processed_pages": 0}
+    
+    def ordered_pdf_files():
+        """PDF URLs of the pages scraped so far, in page order."""
+        return [url for page in sorted(page_results) for url in page_results[page]]
+    
+    async def crawl(page):
+        async with semaphore:
+            if stop_event is not None and stop_event.is_set():
+                return
             page_url = f"{base_url}?page={page}"
             logger.info(f"Scraping page {page} of {total_pages}: {page_url}")
             
-            success, page_pdf_files, error_msg = await _scrape_page(crawler, page_url, run_config)
+            success, page_pdf_files, error_msg = await _scrape_listing_page(browser, page_url, run_config, fast)
             
-            if success:
-                # Log the results and add to our collection
-                logger.info(f"Found {len(page_pdf_files)} PDF files on page {page}")
-                pdf_files.extend(page_pdf_files)
-                
-                # Save page checkpoint for resumable scraping
-                checkpoint_data = {
-                    "last_processed_page": page,
-                    "total_pdf_files": len(pdf_files),
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                }
-                save_checkpoint(checkpoint_data, f"scrape_page_{page}")
-                
-                processed_pages += 1
-                
-                # Add delay to avoid overloading server
-                # Adaptive delay - slower for large batches
-                delay = min(2.0, 0.5 + (processed_pages / 20))
-                logger.debug(f"Waiting {delay:.2f}s before next page")
-                await asyncio.sleep(delay)
-            else:
+            if not success:
                 logger.error(error_msg)
                 track_error("scraping", Exception(error_msg), page_url)
+                if page_queue is not None:
+                    page_queue.put_nowait((page, None))
+                return
+            
+            # Log the results and add to our collection
+            logger.info(f"Found {len(page_pdf_files)} PDF files on page {page}")
+            page_results[page] = page_pdf_files
+            if page_queue is not None:
+                page_queue.put_nowait((page, page_pdf_files))
+            state["processed_pages"] += 1
+            processed_pages = state["processed_pages"]
             
-            page += 1
+            # Save page checkpoint for resumable scraping
+            checkpoint_data = {
+                "last_processed_page": page,
+                "total_pdf_files": sum(len(urls) for urls in page_results.values()),
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            save_checkpoint(checkpoint_data, f"scrape_page_{page}")
             
             # Every 10 pages, save a comprehensive checkpoint
-            if page % 10 == 0:
+            if processed_pages % 10 == 0:
+                # The last page before the first gap, so resuming after it misses nothing
+                last_page = start_page - 1
+                while last_page + 1 in page_results:
+                    last_page += 1
+                pdf_files = ordered_pdf_files()
                 logger.info(f"Progress checkpoint: {processed_pages}/{total_pages} pages, {len(pdf_files)} PDF files")
                 comprehensive_checkpoint = {
                     "pdf_urls": pdf_files,
                     "processed_pages": processed_pages,
                     "total_pages": total_pages,
-                    "last_page": page - 1,
+                    "last_page": last_page,
                     "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
                 }
                 save_checkpoint(comprehensive_checkpoint, "scrape_progress")
+            
+            # Polite delay before this connection takes another page
+            # Adaptive delay - slower for large batches
+            delay = min(ScrapeConfig.MAX_PAGE_DELAY,
+                        ScrapeConfig.PAGE_DELAY + (processed_pages / concurrency) / 20)
+            logger.debug(f"Waiting {delay:.2f}s before next page on this connection")
+            await asyncio.sleep(delay)
     
-        # Save final checkpoint
-        final_checkpoint = {
-            "pdf_urls": pdf_files,
-            "processed_pages": processed_pages,
-            "total_pages": total_pages,
-            "complete": True,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
-        save_checkpoint(final_checkpoint, "scrape_complete")
-        
-        # Close the crawler
-        await crawler.close()
-        logger.info(f"Total PDF files found: {len(pdf_files)}")
-        return pdf_files
+    await asyncio.gather(*(crawl(page) for page in pages))
+    
+    # Save final checkpoint
+    pdf_files = ordered_pdf_files()
+    final_checkpoint = {
+        "pdf_urls": pdf_files,
+        "processed_pages": state["processed_pages"],
+        "total_pages": total_pages,
+        "complete": True,
+        "stopped_early": stop_event is not None and stop_event.is_set(),
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+    }
+    save_checkpoint(final_checkpoint, "scrape_complete")
+    
+    logger.info(f"Total PDF files found: {len(pdf_files)}")
+    return pdf_files
 
 
 def scrape_jfk_files(base_url, start_page=1, end_page=None):
@@ -203,12 +399,14 @@ def scrape_jfk_files(base_url, start_page=1, end_page=None):
     logger.info("Initializing web crawler with proper configuration")
     
     if not HAS_CRAWL4AI:
-        logger.error("Crawl4AI not available - cannot perform web scraping")
-        return []
+        if ScrapeConfig.MODE != "fast":
+            logger.error("Crawl4AI not available - cannot perform web scraping")
+            return []
+        logger.info("Crawl4AI not available - scraping over plain HTTP without browser fallback")
     
     # Set total pages - default to all 113 pages from Archive
     if end_page is None:
-        total_pages = 113  # Full JFK Archive has 113 pages
+        total_pages = ScrapeConfig.TOTAL_PAGES
         logger.info(f"Using default total pages: {total_pages}")
         end_page = total_pages
     else:
@@ -222,4 +420,265 @@ def scrape_jfk_files(base_url, start_page=1, end_page=None):
         error_msg = f"Failed to scrape JFK files: {e}"
         logger.error(error_msg)
         track_error("scraping", e, base_url, fatal=True)
-        return []
\ No newline at end of file
+        return []
+
+async def iter_jfk_file_urls(base_url, start_page, end_page, total_pages=None, crawler=None,
+                             concurrency=None):
+    """
+    Async generator yielding PDF URLs as soon as their listing page is scraped.
+    
+    Pages are crawled exactly as in _async_scrape_jfk_files. URLs are yielded
+    once each, in the order their pages finish, and the "urls" checkpoint is
+    updated after every page that adds new ones.
+    
+    Args:
+        base_url (str): Base URL for scraping
+        start_page (int): Starting page number
+        end_page (int): Ending page number
+        total_pages (int, optional): Total number of pages (default: end_page)
+        crawler: Crawler to use instead of a new AsyncWebCrawler (must provide arun)
+        concurrency (int, optional): Pages crawled at once (default: ScrapeConfig.CONCURRENT_PAGES)
+        
+    Yields:
+        str: PDF file URL
+    """
+    browser = _BrowserFallback(crawler)
+    page_queue = asyncio.Queue()
+    crawl_task = asyncio.ensure_future(_crawl_listing_pages(
+        browser, base_url, start_page, end_page, total_pages or end_page, concurrency, page_queue
+    ))
+    # Wake the consumer once crawling ends, whether it finished or failed
+    crawl_task.add_done_callback(lambda task: page_queue.put_nowait(None))
+    
+    seen = set()
+    discovered = []
+    try:
+        while True:
+            item = await page_queue.get()
+            if item is None:
+                break
+            page, page_pdf_files = item
+            new_urls = []
+            for url in page_pdf_files or []:
+                if url not in seen:
+                    seen.add(url)
+                    new_urls.append(url)
+            if not new_urls:
+                continue
+            
+            discovered.extend(new_urls)
+            save_checkpoint({
+                "pdf_urls": discovered,
+                "complete": False,
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+            }, "urls")
+            for url in new_urls:
+                yield url
+        
+        # Surface any error that ended the crawl
+        await crawl_task
+        save_checkpoint({
+            "pdf_urls": discovered,
+            "complete": True,
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+        }, "urls")
+        logger.info(f"URL discovery complete: {len(discovered)} unique PDF files")
+    finally:
+        if not crawl_task.done():
+            # The consumer stopped early
+            crawl_task.cancel()
+            try:
+                await crawl_task
+            except BaseException:
+                pass
+        await browser.close()
+
+
+async def iter_changed_jfk_file_urls(base_url, start_page, end_page, manifest, total_pages=None,
+                                     crawler=None, concurrency=None, changes=None):
+    """
+    Async generator yielding only the PDF URLs that still need processing.
+    
+    Pages are checked against the URL manifest in page order. Once
+    ScrapeConfig.INCREMENTAL_STOP_AFTER consecutive pages list exactly the
+    links they did last time, the rest of the listing is assumed unchanged
+    and no further pages are started. URLs that vanished from the scraped
+    pages are marked removed in the manifest. New URLs are yielded as their
+    page is checked; URLs listed by an earlier scrape but never marked
+    processed follow once the scrape is done. The "urls" checkpoint is
+    rewritten with every listed URL and "url_changes" with the diff.
+    
+    Args:
+        base_url (str): Base URL for scraping
+        start_page (int): Starting page number
+        end_page (int): Ending page number
+        manifest (UrlManifest): Manifest of previously discovered URLs
+        total_pages (int, optional): Total number of pages (default: end_page)
+        crawler: Crawler to use instead of a new AsyncWebCrawler (must provide arun)
+        concurrency (int, optional): Pages crawled at once (default: ScrapeConfig.CONCURRENT_PAGES)
+        changes (dict, optional): Filled in at the end with the new, pending and removed
+                                  URLs, pages scraped and whether the scrape stopped early
+        
+    Yields:
+        str: New or still unprocessed PDF file URL
+    """
+    started_at = time.time()
+    browser = _BrowserFallback(crawler)
+    page_queue = asyncio.Queue()
+    stop_event = asyncio.Event()
+    crawl_task = asyncio.ensure_future(_crawl_listing_pages(
+        browser, base_url, start_page, end_page, total_pages or end_page, concurrency,
+        page_queue, stop_event
+    ))
+    # Wake the consumer once crawling ends, whether it finished or failed
+    crawl_task.add_done_callback(lambda task: page_queue.put_nowait(None))
+    
+    results = {}  # Pages finished out of order, waiting for their turn
+    next_page = start_page
+    unchanged_streak = 0
+    scraped_pages = []
+    new_urls = []
+    try:
+        while True:
+            item = await page_queue.get()
+            if item is None:
+                break
+            page, page_pdf_files = item
+            results[page] = page_pdf_files
+            
+            # Pages are compared in order so the streak means consecutive pages
+            while next_page in results and not stop_event.is_set():
+                page_pdf_files = results.pop(next_page)
+                if page_pdf_files is None:
+                    unchanged_streak = 0
+                else:
+                    unchanged, page_new_urls = manifest.record_page(next_page, page_pdf_files)
+                    scraped_pages.append(next_page)
+                    unchanged_streak = unchanged_streak + 1 if unchanged else 0
+                    new_urls.extend(page_new_urls)
+                    for url in page_new_urls:
+                        yield url
+                    if unchanged_streak >= ScrapeConfig.INCREMENTAL_STOP_AFTER:
+                        logger.info(f"Listing unchanged through page {next_page}, stopping the scrape")
+                        stop_event.set()
+                next_page += 1
+        
+        # Surface any error that ended the crawl
+        await crawl_task
+        removed_urls = manifest.finish_scrape(started_at, scraped_pages)
+        # Listed earlier but not processed yet, e.g. the previous run was interrupted
+        yielded = set(new_urls)
+        pending_urls = [url for url in manifest.get_pending_urls() if url not in yielded]
+        summary = {
+            "new": new_urls,
+            "pending": pending_urls,
+            "removed": removed_urls,
+            "pages_scraped": len(scraped_pages),
+            "stopped_early": stop_event.is_set()
+        }
+        if changes is not None:
+            changes.update(summary)
+        
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        save_checkpoint({"pdf_urls": manifest.get_urls(), "complete": True, "timestamp": timestamp}, "urls")
+        save_checkpoint(dict(summary, timestamp=timestamp), "url_changes")
+        logger.info(f"Incremental scrape of {len(scraped_pages)} pages: {len(new_urls)} new, "
+                    f"{len(pending_urls)} pending and {len(removed_urls)} removed URLs")
+        for url in pending_urls:
+            yield url
+    finally:
+        if not crawl_task.done():
+            # The consumer stopped early
+            crawl_task.cancel()
+            try:
+                await crawl_task
+            except BaseException:
+                pass
+        await browser.close()
+
+
+def stream_jfk_file_urls(base_url, start_page=1, end_page=None, crawler=None, concurrency=None,
+                         manifest=None, changes=None):
+    """
+    Stream JFK file URLs to synchronous code while the listing pages are scraped.
+    
+    Discovery runs iter_jfk_file_urls, or iter_changed_jfk_file_urls when a
+    manifest is given, on its own event loop thread; URLs are handed over
+    through a queue as they are found. Closing the generator early stops
+    discovery after the page in progress.
+    
+    Args:
+        base_url (str): The base URL of the JFK records page.
+        start_page (int): The page to start scraping from.
+        end_page (int): The page to end scraping at. If None, scrapes all pages.
+        crawler: Crawler to use instead of a new AsyncWebCrawler (must provide arun)
+        concurrency (int, optional): Pages crawled at once (default: ScrapeConfig.CONCURRENT_PAGES)
+        manifest (UrlManifest, optional): Yield only URLs that are new or not yet processed
+        changes (dict, optional): With a manifest, filled in with the scrape's changes
+        
+    Yields:
+        str: PDF file URL
+    """
+    if not HAS_CRAWL4AI and ScrapeConfig.MODE != "fast":
+        logger.error("Crawl4AI not available - cannot perform web scraping")
+        return
+    
+    if end_page is None:
+        end_page = ScrapeConfig.TOTAL_PAGES
+    url_queue = queue.Queue()
+    stop_requested = threading.Event()
+    
+    async def discover():
+        if manifest is not None:
+            urls = iter_changed_jfk_file_urls(base_url, start_page, end_page, manifest, crawler=crawler,
+                                              concurrency=concurrency, changes=changes)
+        else:
+            urls = iter_jfk_file_urls(base_url, start_page, end_page, crawler=crawler, concurrency=concurrency)
+        try:
+            async for url in urls:
+                url_queue.put(url)
+                if stop_requested.is_set():
+                    break
+        finally:
+            await urls.aclose()
+    
+    def run():
+        try:
+            asyncio.run(discover())
+        except Exception as e:
+            logger.error(f"Failed to scrape JFK files: {e}")
+            track_error("scraping", e, base_url, fatal=True)
+        finally:
+            url_queue.put(_END_OF_STREAM)
+    
+    thread = threading.Thread(target=run, name="url-discovery", daemon=True)
+    thread.start()
+    try:
+        while True:
+            url = url_queue.get()
+            if url is _END_OF_STREAM:
+                break
+            yield url
+    finally:
+        stop_requested.set()
+
+
+def scrape_jfk_file_changes(base_url, start_page=1, end_page=None, manifest=None):
+    """
+    Re-scrape the listing and report what changed since the previous scrape.
+    
+    Args:
+        base_url (str): The base URL of the JFK records page.
+        start_page (int): The page to start scraping from.
+        end_page (int): The page to end scraping at. If None, scrapes all pages.
+        manifest (UrlManifest, optional): URL manifest (default: get_url_manifest())
+        
+    Returns:
+        dict: "new", "pending" and "removed" URL lists, "pages_scraped" and "stopped_early",
+              or an empty dict if the scrape failed
+    """
+    changes = {}
+    for _ in stream_jfk_file_urls(base_url, start_page, end_page, manifest=manifest or get_url_manifest(),
+                                  changes=changes):
+        pass
+    return changes
@@ -17,6 +17,8 @@ import time
 from datetime import datetime
 from pathlib import Path
 import threading
+import sqlite3
+from contextlib import contextmanager
 
 # Initialize logger
 logger = logging.getLogger("jfk_scraper.storage")
@@ -24,6 +26,249 @@ logger = logging.getLogger("jfk_scraper.storage")
 # Thread lock for file operations
 file_lock = threading.Lock()
 
+# File types that make a document complete
+DOCUMENT_FILE_TYPES = ('pdf', 'markdown', 'json')
+
+
+class SQLiteMetadataIndex:
+    """
+    SQLite-backed metadata index for StorageManager.
+    
+    Behaves like the dict previously held in ``StorageManager._metadata_index``
+    (doc_id -> {file_type: {path, size, last_modified, file_type}}), but each
+    update is a single row write instead of a rewrite of ``index.json``.
+    The database runs in WAL mode so readers are not blocked by writers, and
+    document status and file sizes are columns that statistics and listings
+    can query directly.
+    """
+    
+    def __init__(self, db_path, legacy_index_path=None):
+        """
+        Open (or create) the index database.
+        
+        Args:
+            db_path (str): Path to the SQLite database
+            legacy_index_path (str, optional): index.json to import on first use
+        """
+        self.db_path = str(db_path)
+        self.lock = threading.RLock()
+        self._batch_depth = 0
+        
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                total_size INTEGER NOT NULL DEFAULT 0,
+                last_modified TEXT
+            );
+            CREATE TABLE IF NOT EXISTS files (
+                doc_id TEXT NOT NULL,
+                file_type TEXT NOT NULL,
+                path TEXT NOT NULL,
+                size INTEGER NOT NULL DEFAULT 0,
+                last_modified TEXT,
+                PRIMARY KEY (doc_id, file_type)
+            );
+            CREATE INDEX IF NOT EXISTS idx_documents_status ON documents(status);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        self.conn.commit()
+        
+        if legacy_index_path:
+            self._import_legacy_index(Path(legacy_index_path))
+    
+    def _import_legacy_index(self, index_path):
+        """Import an existing index.json once."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'legacy_index_imported'").fetchone()
+        if row or not index_path.exists():
+            return
+        
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                legacy_index = json.load(f)
+        except Exception as e:
+            logger.error(f"Error importing metadata index {index_path}: {e}")
+            return
+        
+        with self.batch():
+            for doc_id, file_types in legacy_index.items():
+                for file_type, info in file_types.items():
+                    self.set_file(doc_id, file_type, info)
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('legacy_index_imported', ?)",
+                              (datetime.now().isoformat(),))
+        
+        logger.info(f"Imported {len(legacy_index)} documents from {index_path} into {self.db_path}")
+    
+    def _commit(self):
+        """Commit unless a batch is open."""
+        if self._batch_depth == 0:
+            self.conn.commit()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group updates into a single transaction, committed when the outermost batch exits.
+        
+        The lock is held for the whole batch, so other threads' writes wait
+        instead of being committed or rolled back with it.
+        """
+        with self.lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            except Exception:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.conn.rollback()
+                raise
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.commit()
+    
+    def _refresh_document(self, doc_id):
+        """Recompute the status and total size row for a document."""
+        placeholders = ",".join("?" for _ in DOCUMENT_FILE_TYPES)
+        present, total_size, last_modified = self.conn.execute(
+            f"SELECT COUNT(CASE WHEN file_type IN ({placeholders}) THEN 1 END), "
+            f"COALESCE(SUM(size), 0), MAX(last_modified) FROM files WHERE doc_id = ?",
+            (*DOCUMENT_FILE_TYPES, doc_id)
+        ).fetchone()
+        
+        status = 'complete' if present == len(DOCUMENT_FILE_TYPES) else 'partial'
+        self.conn.execute(
+            "INSERT INTO documents (doc_id, status, total_size, last_modified) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(doc_id) DO UPDATE SET status = excluded.status, "
+            "total_size = excluded.total_size, last_modified = excluded.last_modified",
+            (doc_id, status, total_size, last_modified)
+        )
+    
+    def set_file(self, doc_id, file_type, info):
+        """
+        Record metadata for one file of a document.
+        
+        Args:
+            doc_id (str): Document ID
+            file_type (str): File type ('pdf', 'markdown', 'json')
+            info (dict): Metadata with 'path', 'size' and 'last_modified' keys
+        """
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO files (doc_id, file_type, path, size, last_modified) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (doc_id, file_type, str(info.get('path', '')), int(info.get('size', 0) or 0),
+                 info.get('last_modified'))
+            )
+            self._refresh_document(doc_id)
+            self._commit()
+    
+    def get(self, doc_id, default=None):
+        """Get the metadata for a document, in the same shape as the JSON index."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT file_type, path, size, last_modified FROM files WHERE doc_id = ?", (doc_id,)
+            ).fetchall()
+        if not rows:
+            return default
+        return {
+            file_type: {'path': path, 'size': size, 'last_modified': last_modified, 'file_type': file_type}
+            for file_type, path, size, last_modified in rows
+        }
+    
+    def __getitem__(self, doc_id):
+        metadata = self.get(doc_id)
+        if metadata is None:
+            raise KeyError(doc_id)
+        return metadata
+    
+    def __contains__(self, doc_id):
+        with self.lock:
+            return self.conn.execute(
+                "SELECT 1 FROM documents WHERE doc_id = ?", (doc_id,)).fetchone() is not None
+    
+    def __delitem__(self, doc_id):
+        with self.lock:
+            self.conn.execute("DELETE FROM files WHERE doc_id = ?", (doc_id,))
+            self.conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,))
+            self._commit()
+    
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def keys(self):
+        """List all document IDs."""
+        return self.list_documents()
+    
+    def items(self):
+        """Yield (doc_id, metadata) pairs."""
+        for doc_id in self.keys():
+            yield doc_id, self.get(doc_id, {})
+    
+    def get_status(self, doc_id):
+        """
+        Get the processing status of a document.
+        
+        Returns:
+            str: 'complete', 'partial' or 'not_found'
+        """
+        with self.lock:
+            row = self.conn.execute("SELECT status FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+        return row[0] if row else 'not_found'
+    
+    def list_documents(self, status=None):
+        """
+        List document IDs, optionally filtered by status.
+        
+        Args:
+            status (str, optional): 'complete' or 'partial'
+            
+        Returns:
+            list: Document IDs
+        """
+        with self.lock:
+            if status:
+                rows = self.conn.execute(
+                    "SELECT doc_id FROM documents WHERE status = ? ORDER BY rowid", (status,)).fetchall()
+            else:
+                rows = self.conn.execute("SELECT doc_id FROM documents ORDER BY rowid").fetchall()
+        return [row[0] for row in rows]
+    
+    def get_statistics(self):
+        """
+        Compute document counts by status and total sizes by file type.
+        
+        Returns:
+            dict: Statistics in the StorageManager.get_statistics() format
+        """
+        with self.lock:
+            status_counts = dict(self.conn.execute(
+                "SELECT status, COUNT(*) FROM documents GROUP BY status").fetchall())
+            sizes = dict(self.conn.execute(
+                "SELECT file_type, SUM(size) FROM files GROUP BY file_type").fetchall())
+        
+        return {
+            'total_documents': sum(status_counts.values()),
+            'complete_documents': status_counts.get('complete', 0),
+            'partial_documents': status_counts.get('partial', 0),
+            'total_size': {file_type: sizes.get(file_type, 0) or 0 for file_type in DOCUMENT_FILE_TYPES}
+        }
+    
+    def close(self):
+        """Commit pending changes and close the database."""
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
+
+
 class StorageManager:
     """
     Manages the storage structure for processed JFK files.
@@ -32,7 +277,7 @@ class StorageManager:
     based on configurable parameters like document ID, date, or batches.
     """
     
-    def __init__(self, base_dir=None, structure_type="hierarchical", batch_size=100):
+    def __init__(self, base_dir=None, structure_type="hierarchical", batch_size=100, index_backend="sqlite"):
         """
         Initialize the storage manager with the specified parameters.
         
@@ -40,6 +285,7 @@ class StorageManager:
             base_dir (str): Base directory for storage. If None, uses default directory structure
             structure_type (str): Type of storage structure ('hierarchical', 'flat', or 'batched')
             batch_size (int): Number of files per batch for 'batched' structure type
+            index_backend (str): Metadata index backend ('sqlite' or 'json')
         """
         # Set base directory
         if base_dir:
@@ -51,6 +297,11 @@ class StorageManager:
         self.structure_type = structure_type
         self.batch_size = batch_size
         
+        if index_backend not in ('sqlite', 'json'):
+            raise ValueError(f"Unsupported index backend: {index_backend}")
+        self.index_backend = index_backend
+        self._batch_depth = 0
+        
         # Create structure for different file types
         self.pdf_dir = self.base_dir / "pdfs"
         self.markdown_dir = self.base_dir / "markdown"
@@ -63,8 +314,25 @@ class StorageManager:
         self.create_directories()
         
         # Initialize metadata index
-        self._metadata_index = {}
-        self._load_metadata_index()
+        if self.index_backend == 'sqlite':
+            self._metadata_index = SQLiteMetadataIndex(
+                self.metadata_dir / "index.db",
+                legacy_index_path=self.metadata_dir / "index.json"
+            )
+        else:
+            self._metadata_index = {}
+            self._load_metadata_index()
+    
+    def close(self):
+        """Close the metadata index database."""
+        if self.index_backend == 'sqlite':
+            self._metadata_index.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def create_directories(self):
         """Create all necessary directories for the storage structure."""
@@ -221,6 +489,15 @@ class StorageManager:
         now = datetime.now().isoformat()
         file_path = Path(file_path)
         
+        if self.index_backend == 'sqlite':
+            # One row write; no per-document or global JSON rewrite
+            self._metadata_index.set_file(doc_id, file_type, {
+                'path': str(file_path),
+                'size': file_path.stat().st_size,
+                'last_modified': now
+            })
+            return
+        
         # Initialize metadata entry if it doesn't exist
         if doc_id not in self._metadata_index:
             self._metadata_index[doc_id] = {}
@@ -238,8 +515,29 @@ class StorageManager:
         with open(metadata_path, 'w', encoding='utf-8') as f:
             json.dump(self._metadata_index[doc_id], f, indent=2)
         
-        # Update global metadata index
-        self._save_metadata_index()
+        # Update global metadata index (deferred to the end of a batch)
+        if self._batch_depth == 0:
+            self._save_metadata_index()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group several store_file calls into one index update.
+        
+        With the SQLite backend the updates share a transaction; with the
+        JSON backend index.json is written once when the batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            if self.index_backend == 'sqlite':
+                with self._metadata_index.batch():
+                    yield self
+            else:
+                yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self.index_backend == 'json':
+                self._save_metadata_index()
     
     def _load_metadata_index(self):
         """Load the metadata index from disk."""
@@ -255,6 +553,9 @@ class StorageManager:
     
     def _save_metadata_index(self):
         """Save the metadata index to disk."""
+        if self.index_backend == 'sqlite':
+            # Rows are committed as they are written
+            return
         index_path = self.metadata_dir / "index.json"
         with open(index_path, 'w', encoding='utf-8') as f:
             json.dump(self._metadata_index, f, indent=2)
@@ -269,6 +570,11 @@ class StorageManager:
         Returns:
             list: List of document IDs
         """
+        if self.index_backend == 'sqlite':
+            return self._metadata_index.list_documents(status)
+        if status:
+            return [doc_id for doc_id in self._metadata_index
+                    if self.check_processing_status(doc_id) == status]
         return list(self._metadata_index.keys())
     
     def get_document_metadata(self, doc_id):
@@ -293,6 +599,9 @@ class StorageManager:
         Returns:
             str: Processing status ('complete', 'partial', 'not_found')
         """
+        if self.index_backend == 'sqlite':
+            return self._metadata_index.get_status(doc_id)
+        
         if doc_id not in self._metadata_index:
             return 'not_found'
         
@@ -310,6 +619,9 @@ class StorageManager:
         Returns:
             dict: Statistics
         """
+        if self.index_backend == 'sqlite':
+            return self._metadata_index.get_statistics()
+        
         stats = {
             'total_documents': len(self._metadata_index),
             'complete_documents': 0,
@@ -428,16 +740,15 @@ def get_document_path(doc_id, file_type='all'):
     Returns:
         str or dict: Path to the file or dict of paths if file_type is 'all'
     """
-    storage = StorageManager()
-    
-    if file_type == 'all':
-        return {
-            'pdf': storage.get_file_path(doc_id, 'pdf'),
-            'markdown': storage.get_file_path(doc_id, 'markdown'),
-            'json': storage.get_file_path(doc_id, 'json')
-        }
-    else:
-        return storage.get_file_path(doc_id, file_type)
+    with StorageManager() as storage:
+        if file_type == 'all':
+            return {
+                'pdf': storage.get_file_path(doc_id, 'pdf'),
+                'markdown': storage.get_file_path(doc_id, 'markdown'),
+                'json': storage.get_file_path(doc_id, 'json')
+            }
+        else:
+            return storage.get_file_path(doc_id, file_type)
 
 
 def store_document(doc_id, pdf_path=None, markdown_path=None, json_path=None):
@@ -453,28 +764,255 @@ def store_document(doc_id, pdf_path=None, markdown_path=None, json_path=None):
     Returns:
         dict: Paths to stored files
     """
-    storage = StorageManager()
     result = {}
     
-    if pdf_path:
-        result['pdf'] = storage.store_file(pdf_path, doc_id, 'pdf')
+    with StorageManager() as storage, storage.batch():
+        if pdf_path:
+            result['pdf'] = storage.store_file(pdf_path, doc_id, 'pdf')
+        
+        if markdown_path:
+            result['markdown'] = storage.store_file(markdown_path, doc_id, 'markdown')
+        
+        if json_path:
+            result['json'] = storage.store_file(json_path, doc_id, 'json')
     
-    if markdown_path:
-        result['markdown'] = storage.store_file(markdown_path, doc_id, 'markdown')
+    return result
+
+
+class LiteLLMStore:
+    """
+    Append-only store for Lite LLM entries.
     
-    if json_path:
-        result['json'] = storage.store_file(json_path, doc_id, 'json')
+    Entries are appended as JSON lines to a log file next to the Lite LLM
+    array file (e.g. ``lite_llm/jfk_files.jsonl`` for ``lite_llm/jfk_files.json``).
+    An in-memory index maps each document ID to the offset of its latest
+    record, so an upsert is a single append. Superseded records are dropped by
+    periodic compaction, and export() writes the array format on demand.
+    """
     
-    return result
+    # Compact once this many superseded records have accumulated...
+    COMPACT_MIN_STALE = 100
+    # ...and they make up at least this fraction of the live records
+    COMPACT_STALE_RATIO = 0.5
+    
+    def __init__(self, output_path):
+        """
+        Initialize the store for a Lite LLM output file.
+        
+        Args:
+            output_path (str): Path of the Lite LLM array file the store exports to
+        """
+        self.output_path = Path(output_path)
+        self.log_path = self.output_path.with_suffix(".jsonl")
+        self.lock = threading.Lock()
+        
+        # document ID -> (offset, length) of the latest record, in first-seen order
+        self._index = {}
+        self._record_count = 0
+        
+        os.makedirs(self.log_path.parent, exist_ok=True)
+        self._load()
+    
+    @staticmethod
+    def _document_id(entry):
+        """Get the key used to identify an entry's document."""
+        content = entry.get("content")
+        if isinstance(content, dict):
+            doc_id = content.get("document_id") or content.get("docId")
+            if doc_id:
+                return str(doc_id)
+        return entry.get("source", "")
+    
+    def _load(self):
+        """Build the index from the log, importing a legacy array file if there is no log yet."""
+        if not self.log_path.exists():
+            self._import_legacy_array()
+            return
+        
+        offset = 0
+        with open(self.log_path, 'rb') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    # A torn final write from a crash; everything before it is intact
+                    logger.warning(f"Ignoring incomplete record at offset {offset} in {self.log_path}")
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                self._index[self._document_id(entry)] = (offset, len(line))
+                self._record_count += 1
+                offset += len(line)
+        
+        # Drop the torn tail so the next append starts on a clean line
+        if offset != self.log_path.stat().st_size:
+            with open(self.log_path, 'r+b') as f:
+                f.truncate(offset)
+        
+        logger.info(f"Loaded Lite LLM store {self.log_path} with {len(self._index)} documents "
+                    f"({self._record_count} records)")
+    
+    def _import_legacy_array(self):
+        """Seed the log from an existing array-format Lite LLM file."""
+        if not self.output_path.exists() or self.output_path.stat().st_size <= 10:
+            return
+        
+        try:
+            with open(self.output_path, 'r', encoding='utf-8') as f:
+                existing_data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Error reading existing Lite LLM file, starting empty store: {e}")
+            return
+        
+        if not isinstance(existing_data, list):
+            existing_data = [existing_data]
+        
+        with open(self.log_path, 'ab') as f:
+            for entry in existing_data:
+                self._append(f, entry)
+        
+        logger.info(f"Imported {len(existing_data)} entries from {self.output_path} into {self.log_path}")
+    
+    def _append(self, f, entry):
+        """Append one record to an open log file and index it."""
+        line = json.dumps(entry, ensure_ascii=False).encode('utf-8') + b"\n"
+        offset = f.tell()
+        f.write(line)
+        self._index[self._document_id(entry)] = (offset, len(line))
+        self._record_count += 1
+    
+    def upsert(self, entry):
+        """
+        Insert or replace the entry for a document.
+        
+        Args:
+            entry (dict): Lite LLM entry with "source", "timestamp" and "content" keys
+        """
+        with self.lock:
+            with open(self.log_path, 'ab') as f:
+                self._append(f, entry)
+            
+            stale = self._record_count - len(self._index)
+            if stale >= self.COMPACT_MIN_STALE and stale >= len(self._index) * self.COMPACT_STALE_RATIO:
+                self._compact()
+    
+    def _iter_entries(self):
+        """Yield the latest entry for every document in first-seen order."""
+        with open(self.log_path, 'rb') as f:
+            for offset, length in list(self._index.values()):
+                f.seek(offset)
+                yield json.loads(f.read(length))
+    
+    def compact(self):
+        """Rewrite the log keeping only the latest record for each document."""
+        with self.lock:
+            self._compact()
+    
+    def _compact(self):
+        """Compact the log. Must be called with the lock held."""
+        if not self.log_path.exists():
+            return
+        
+        stale = self._record_count - len(self._index)
+        temp_path = self.log_path.with_suffix(".jsonl.temp")
+        new_index = {}
+        offset = 0
+        
+        with open(temp_path, 'wb') as out:
+            with open(self.log_path, 'rb') as f:
+                for doc_id, (old_offset, length) in self._index.items():
+                    f.seek(old_offset)
+                    out.write(f.read(length))
+                    new_index[doc_id] = (offset, length)
+                    offset += length
+        
+        os.replace(temp_path, self.log_path)
+        self._index = new_index
+        self._record_count = len(new_index)
+        logger.info(f"Compacted Lite LLM store {self.log_path}: dropped {stale} superseded records")
+    
+    def export(self, output_path=None):
+        """
+        Write the current entries in the Lite LLM array format.
+        
+        Args:
+            output_path (str, optional): Destination file. Defaults to the store's output path.
+            
+        Returns:
+            str: Path of the exported file
+        """
+        output_path = Path(output_path) if output_path else self.output_path
+        temp_path = output_path.with_suffix(output_path.suffix + ".temp")
+        
+        with self.lock:
+            entries = list(self._iter_entries()) if self.log_path.exists() else []
+        
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, output_path)
+        
+        logger.info(f"Exported {len(entries)} Lite LLM entries to {output_path}")
+        return str(output_path)
+    
+    def __len__(self):
+        """Number of documents in the store."""
+        return len(self._index)
+    
+    def __contains__(self, doc_id):
+        """Whether a document is in the store."""
+        return doc_id in self._index
+
+
+# Lite LLM stores shared across threads, keyed by absolute output path
+_lite_llm_stores = {}
+_lite_llm_stores_lock = threading.Lock()
+
+
+def get_lite_llm_store(output_path):
+    """
+    Get the shared LiteLLMStore for an output path.
+    
+    Args:
+        output_path (str): Path of the Lite LLM array file
+        
+    Returns:
+        LiteLLMStore: The store instance
+    """
+    key = os.path.abspath(output_path)
+    with _lite_llm_stores_lock:
+        if key not in _lite_llm_stores:
+            _lite_llm_stores[key] = LiteLLMStore(output_path)
+        return _lite_llm_stores[key]
+
+
+def export_lite_llm_data(output_path):
+    """
+    Export the Lite LLM store to its array-format file.
+    
+    Args:
+        output_path (str): Path of the Lite LLM array file
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        get_lite_llm_store(output_path).export()
+        return True
+    except Exception as e:
+        logger.error(f"Error exporting Lite LLM data to {output_path}: {e}")
+        return False
 
 
 def store_json_data(source_json_path, output_path):
     """
     Store JSON data in the LiteLLM compatible format for API integration.
     
+    The entry is appended to the append-only store behind ``output_path``;
+    call export_lite_llm_data() to refresh the array-format file.
+    
     Args:
         source_json_path (str): Path to the source JSON file
-        output_path (str): Path to save the Lite LLM format JSON
+        output_path (str): Path of the Lite LLM format JSON
         
     Returns:
         bool: True if successful, False otherwise
@@ -491,41 +1029,8 @@ def store_json_data(source_json_path, output_path):
             "content": source_data
         }
         
-        # Check if output file exists and has content
-        if os.path.exists(output_path) and os.path.getsize(output_path) > 10:
-            try:
-                # Read existing data
-                with open(output_path, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-                
-                # Append or update entry
-                if isinstance(existing_data, list):
-                    # Find and replace if this doc_id already exists
-                    doc_id = source_data.get("document_id", "")
-                    updated = False
-                    
-                    for i, entry in enumerate(existing_data):
-                        if "content" in entry and "document_id" in entry["content"]:
-                            if entry["content"]["document_id"] == doc_id:
-                                existing_data[i] = lite_llm_entry
-                                updated = True
-                                break
-                    
-                    if not updated:
-                        existing_data.append(lite_llm_entry)
-                else:
-                    # Convert to list format
-                    existing_data = [existing_data, lite_llm_entry]
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Error reading existing Lite LLM file, creating new: {e}")
-                existing_data = [lite_llm_entry]
-        else:
-            # Create new data structure
-            existing_data = [lite_llm_entry]
-        
-        # Write data back to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, indent=2, ensure_ascii=False)
+        # Append to the store; the index turns a repeat into an update
+        get_lite_llm_store(output_path).upsert(lite_llm_entry)
         
         logger.info(f"Successfully stored JSON data in Lite LLM format at {output_path}")
         return True
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+URL manifest for JFK Files Scraper.
+
+This module remembers every PDF URL found on the listing pages, with the
+time it was first and last seen, and a hash of each listing page's links.
+A re-scrape compares pages against their stored hash, so it can stop once
+the listing is unchanged, and reports only the URLs that are new or have
+disappeared since the previous run. URLs stay pending until processing
+marks them done, so an interrupted run does not lose them.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.url_manifest")
+
+
+class UrlManifestConfig:
+    """Configuration settings for the URL manifest."""
+    PATH = os.path.join(".checkpoints", "url_manifest.db")  # SQLite database location
+
+
+def listing_hash(pdf_files):
+    """
+    Hash the PDF links of a listing page.
+
+    Only the links are hashed, so markup that changes on every request
+    (timestamps, tokens) does not make an unchanged listing look new.
+
+    Args:
+        pdf_files (list): PDF URLs on the page, in page order
+
+    Returns:
+        str: Hex digest
+    """
+    return hashlib.sha256("\n".join(pdf_files).encode("utf-8")).hexdigest()
+
+
+class UrlManifest:
+    """
+    SQLite-backed record of discovered URLs and listing page hashes.
+
+    The connection is shared by callers under a lock, like DownloadManifest.
+    """
+
+    def __init__(self, db_path):
+        """
+        Open (or create) the manifest.
+
+        Args:
+            db_path (str): Path to the SQLite database
+        """
+        self.db_path = db_path
+        self.lock = threading.Lock()
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                page INTEGER NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                removed_at REAL,
+                processed_at REAL
+            )
+        """)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(urls)")}
+        if "processed_at" not in columns:
+            # Manifests written before processing was tracked
+            self.conn.execute("ALTER TABLE urls ADD COLUMN processed_at REAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                page INTEGER PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                url_count INTEGER NOT NULL,
+                checked_at REAL NOT NULL,
+                changed_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def record_page(self, page, pdf_files, seen_at=None):
+        """
+        Record the PDF links found on a listing page.
+
+        Args:
+            page (int): Page number
+            pdf_files (list): PDF URLs on the page, in page order
+            seen_at (float, optional): Scrape time (default: now)
+
+        Returns:
+            tuple: (unchanged, new_urls) - whether the page matches its stored
+                   hash, and the URLs not currently in the manifest
+        """
+        seen_at = seen_at or time.time()
+        content_hash = listing_hash(pdf_files)
+        new_urls = []
+
+        with self.lock:
+            row = self.conn.execute("SELECT content_hash FROM pages WHERE page = ?", (page,)).fetchone()
+            unchanged = row is not None and row["content_hash"] == content_hash
+
+            for url in pdf_files:
+                existing = self.conn.execute("SELECT removed_at FROM urls WHERE url = ?", (url,)).fetchone()
+                if existing is None:
+                    self.conn.execute("""
+                        INSERT INTO urls (url, page, first_seen, last_seen) VALUES (?, ?, ?, ?)
+                    """, (url, page, seen_at, seen_at))
+                    new_urls.append(url)
+                else:
+                    if existing["removed_at"] is not None:
+                        # Listed again after being removed
+                        new_urls.append(url)
+                    self.conn.execute("""
+                        UPDATE urls SET page = ?, last_seen = ?, removed_at = NULL WHERE url = ?
+                    """, (page, seen_at, url))
+
+            self.conn.execute("""
+                INSERT INTO pages (page, content_hash, url_count, checked_at, changed_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(page) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    url_count = excluded.url_count,
+                    checked_at = excluded.checked_at,
+                    changed_at = CASE WHEN pages.content_hash = excluded.content_hash
+                                      THEN pages.changed_at ELSE excluded.changed_at END
+            """, (page, content_hash, len(pdf_files), seen_at, seen_at))
+            self.conn.commit()
+
+        return unchanged, new_urls
+
+    def finish_scrape(self, started_at, pages):
+        """
+        Mark URLs that have disappeared from the re-scraped pages as removed.
+
+        Only URLs last recorded on one of `pages` are considered, so pages an
+        early-stopped scrape never reached keep their URLs.
+
+        Args:
+            started_at (float): Time the scrape started
+            pages (iterable): Pages scraped successfully in this run
+
+        Returns:
+            list: URLs marked as removed
+        """
+        pages = list(pages)
+        if not pages:
+            return []
+        placeholders = ",".join("?" * len(pages))
+        with self.lock:
+            removed = [row["url"] for row in self.conn.execute(f"""
+                SELECT url FROM urls
+                WHERE removed_at IS NULL AND last_seen < ? AND page IN ({placeholders})
+                ORDER BY page, rowid
+            """, (started_at, *pages))]
+            self.conn.executemany(
+                "UPDATE urls SET removed_at = ? WHERE url = ?",
+                [(time.time(), url) for url in removed]
+            )
+            self.conn.commit()
+        return removed
+
+    def mark_processed(self, url):
+        """
+        Record that a URL has been processed, so it is no longer pending.
+
+        Args:
+            url (str): PDF URL
+        """
+        with self.lock:
+            self.conn.execute("UPDATE urls SET processed_at = ? WHERE url = ?", (time.time(), url))
+            self.conn.commit()
+
+    def get_pending_urls(self):
+        """
+        Get listed URLs that have not been processed yet.
+
+        Returns:
+            list: URLs in listing order
+        """
+        with self.lock:
+            return [row["url"] for row in self.conn.execute("""
+                SELECT url FROM urls WHERE removed_at IS NULL AND processed_at IS NULL ORDER BY page, rowid
+            """)]
+
+    def get_urls(self, include_removed=False):
+        """
+        Get the manifest's URLs in listing order.
+
+        Args:
+            include_removed (bool): Also return URLs no longer listed
+
+        Returns:
+            list: URLs
+        """
+        where = "" if include_removed else "WHERE removed_at IS NULL"
+        with self.lock:
+            return [row["url"] for row in self.conn.execute(f"SELECT url FROM urls {where} ORDER BY page, rowid")]
+
+    def get(self, url):
+        """
+        Get the manifest entry for a URL.
+
+        Args:
+            url (str): PDF URL
+
+        Returns:
+            dict: Entry with page, first_seen, last_seen, removed_at and processed_at, or None
+        """
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM urls WHERE url = ?", (url,)).fetchone()
+        return dict(row) if row else None
+
+    def get_statistics(self):
+        """
+        Get manifest statistics.
+
+        Returns:
+            dict: Listed, pending and removed URL counts and known pages
+        """
+        with self.lock:
+            listed, removed, pending = self.conn.execute("""
+                SELECT COUNT(*) - COUNT(removed_at), COUNT(removed_at),
+                       SUM(CASE WHEN removed_at IS NULL AND processed_at IS NULL THEN 1 ELSE 0 END)
+                FROM urls
+            """).fetchone()
+            pages = self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        return {"urls": listed, "pending": pending or 0, "removed": removed, "pages": pages}
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
+
+
+# One manifest connection per process and database path
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+
+def get_url_manifest(db_path=None):
+    """
+    Get this process's URL manifest for a database path.
+
+    Args:
+        db_path (str, optional): Path to the SQLite database (default: UrlManifestConfig.PATH)
+
+    Returns:
+        UrlManifest: The shared manifest instance
+    """
+    key = (os.getpid(), os.path.abspath(db_path or UrlManifestConfig.PATH))
+    with _manifests_lock:
+        if key not in _manifests:
+            _manifests[key] = UrlManifest(db_path or UrlManifestConfig.PATH)
+        return _manifests[key]
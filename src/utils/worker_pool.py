@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Elastic worker pool for JFK Files Scraper.
+
+ThreadPoolExecutor fixes its worker count when it is created. This module
+provides an executor with the same submit/shutdown interface whose worker
+threads can be added and retired while it runs, so a resource monitor can
+grow or shrink it with the load.
+"""
+
+import queue
+import logging
+import threading
+import concurrent.futures
+
+# Initialize logger
+logger = logging.getLogger("jfk_scraper.worker_pool")
+
+
+class ElasticThreadPool:
+    """
+    Thread pool whose size can be changed at any time.
+
+    Growing starts new worker threads immediately. Shrinking lets surplus
+    workers finish their current task and exit before taking another one, so
+    running tasks are never interrupted.
+    """
+
+    IDLE_POLL = 0.1  # Seconds an idle worker waits before re-checking the target size
+
+    def __init__(self, max_workers, thread_name_prefix="ElasticWorker"):
+        """
+        Initialize the pool and start its workers.
+
+        Args:
+            max_workers (int): Initial number of worker threads
+            thread_name_prefix (str): Prefix for worker thread names
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.thread_name_prefix = thread_name_prefix
+        self.target_workers = 0
+        self.workers = set()
+        self.work_queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.shutdown_requested = False
+        self._next_id = 0
+        self.resize(max_workers)
+
+    @property
+    def worker_count(self):
+        """int: Number of live worker threads."""
+        with self.lock:
+            return len(self.workers)
+
+    def resize(self, workers):
+        """
+        Change the number of worker threads.
+
+        Args:
+            workers (int): New number of workers (at least 1)
+
+        Returns:
+            int: The previous target size
+        """
+        workers = max(1, int(workers))
+        with self.lock:
+            if self.shutdown_requested:
+                raise RuntimeError("cannot resize a pool after shutdown")
+            previous = self.target_workers
+            self.target_workers = workers
+            # Retiring workers exit on their own; only growth needs new threads
+            for _ in range(workers - len(self.workers)):
+                self._start_worker()
+        return previous
+
+    def _start_worker(self):
+        """Start one worker thread. Must be called with the lock held."""
+        self._next_id += 1
+        thread = threading.Thread(
+            target=self._worker,
+            name=f"{self.thread_name_prefix}-{self._next_id}",
+            daemon=True
+        )
+        self.workers.add(thread)
+        thread.start()
+
+    def _should_retire(self):
+        """Decide whether the calling worker is surplus, and if so deregister it."""
+        with self.lock:
+            if len(self.workers) > self.target_workers:
+                self.workers.discard(threading.current_thread())
+                return True
+            return False
+
+    def _worker(self):
+        """Run queued tasks until the pool shrinks or shuts down."""
+        while not self._should_retire():
+            try:
+                item = self.work_queue.get(timeout=self.IDLE_POLL)
+            except queue.Empty:
+                continue
+            if item is None:
+                # Shutdown sentinel
+                with self.lock:
+                    self.workers.discard(threading.current_thread())
+                return
+
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Queue a task.
+
+        Args:
+            fn (callable): Function to run
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            concurrent.futures.Future: Future for the task's result
+        """
+        with self.lock:
+            if self.shutdown_requested:
+                raise RuntimeError("cannot submit to a pool after shutdown")
+            future = concurrent.futures.Future()
+            self.work_queue.put((future, fn, args, kwargs))
+        return future
+
+    def shutdown(self, wait=True):
+        """
+        Stop the pool once the queued tasks have run.
+
+        Args:
+            wait (bool): Block until every worker has exited
+        """
+        with self.lock:
+            self.shutdown_requested = True
+            workers = list(self.workers)
+        # Sentinels queue behind the outstanding tasks, one per worker
+        for _ in workers:
+            self.work_queue.put(None)
+        if wait:
+            for thread in workers:
+                thread.join()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for memory admission control.
+"""
+
+import os
+import sys
+import time
+import threading
+import unittest
+import concurrent.futures
+from unittest import mock
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.admission import MemoryAdmissionController, estimate_job_memory
+from src.utils.conversion_pool import WORKER_ENV
+from src.utils.conversion_utils import _convert_pdf_to_markdown
+from src.utils.batch_utils import _submit_admitted
+from src.utils.pipeline_utils import ProcessingPipeline
+
+
+class EstimateJobMemoryTest(unittest.TestCase):
+    """Test suite for estimate_job_memory."""
+
+    def test_ocr_costs_more_than_text(self):
+        """Rasterizing pages dominates the estimate and scales with DPI."""
+        text = estimate_job_memory(2, 20)
+        ocr_low = estimate_job_memory(2, 20, dpi=150, raster_pages=20)
+        ocr_high = estimate_job_memory(2, 20, dpi=300, raster_pages=20)
+        self.assertLess(text, ocr_low)
+        self.assertAlmostEqual(ocr_high - text, (ocr_low - text) * 4)
+
+    def test_streaming_window_bounds_raster_cost(self):
+        """Only the pages held at once count towards the raster cost."""
+        streamed = estimate_job_memory(10, 200, dpi=300, raster_pages=200, pages_in_memory=1)
+        whole = estimate_job_memory(10, 200, dpi=300, raster_pages=200, pages_in_memory=200)
+        self.assertGreater(whole, streamed * 50)
+
+
+class MemoryAdmissionControllerTest(unittest.TestCase):
+    """Test suite for MemoryAdmissionController."""
+
+    def _run_jobs(self, controller, costs, duration=0.05):
+        """Run one thread per job cost and return the peak number running at once."""
+        state = {"running": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def job(cost):
+            with controller.admit(cost):
+                with lock:
+                    state["running"] += 1
+                    state["peak"] = max(state["peak"], state["running"])
+                time.sleep(duration)
+                with lock:
+                    state["running"] -= 1
+
+        threads = [threading.Thread(target=job, args=(cost,)) for cost in costs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        return state["peak"]
+
+    def test_small_jobs_share_the_budget(self):
+        """Jobs run side by side while their total fits."""
+        controller = MemoryAdmissionController(1000)
+        self.assertEqual(self._run_jobs(controller, [100] * 10), 10)
+        self.assertEqual(controller.get_statistics()["in_use_mb"], 0)
+
+    def test_giant_jobs_never_co_scheduled(self):
+        """Jobs that each take most of the budget run one at a time."""
+        controller = MemoryAdmissionController(1000)
+        self.assertEqual(self._run_jobs(controller, [700] * 4), 1)
+        self.assertEqual(controller.get_statistics()["peak_mb"], 700)
+
+    def test_oversized_job_runs_alone(self):
+        """A job above the whole budget still runs once nothing else is."""
+        controller = MemoryAdmissionController(100)
+        self.assertTrue(controller.acquire(500, timeout=1))
+        self.assertFalse(controller.acquire(10, timeout=0.05))
+        controller.release(500)
+        self.assertTrue(controller.acquire(10, timeout=1))
+
+    def test_large_job_not_starved(self):
+        """A waiting large job is admitted before small jobs that arrive after it."""
+        controller = MemoryAdmissionController(100)
+        controller.acquire(60)
+        order = []
+
+        def job(name, cost):
+            controller.acquire(cost)
+            order.append(name)
+            controller.release(cost)
+
+        large = threading.Thread(target=job, args=("large", 90))
+        large.start()
+        time.sleep(0.05)
+        small = threading.Thread(target=job, args=("small", 10))
+        small.start()
+        time.sleep(0.05)
+        self.assertEqual(order, [])
+
+        controller.release(60)
+        large.join(timeout=5)
+        small.join(timeout=5)
+        self.assertEqual(order, ["large", "small"])
+
+
+class FakeConversionPool:
+    """Stand-in for ConversionProcessPool that records how many conversions overlap."""
+
+    max_workers = 4
+
+    def __init__(self, duration=0.05):
+        self.duration = duration
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _work(self):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.duration)
+        with self.lock:
+            self.running -= 1
+        return "converted.md"
+
+    def submit(self, pdf_path, **kwargs):
+        future = concurrent.futures.Future()
+        threading.Thread(target=lambda: future.set_result(self._work())).start()
+        return future
+
+    def convert(self, pdf_path, **kwargs):
+        return self._work()
+
+
+class ParentAdmissionTest(unittest.TestCase):
+    """Conversions sent to a process pool share the parent's budget."""
+
+    DOC_FORMAT = {"needs_ocr": True, "is_rare_format": False, "page_count": 100, "file_size_mb": 20}
+
+    def setUp(self):
+        self.controller = MemoryAdmissionController(1000)
+
+    def test_pool_submissions_share_budget(self):
+        """Giant conversions submitted to the pool never run side by side."""
+        pool = FakeConversionPool()
+        with mock.patch("src.utils.batch_utils.get_admission_controller", return_value=self.controller), \
+                mock.patch("src.utils.batch_utils.estimate_conversion_memory", return_value=700):
+            futures = [_submit_admitted(pool, f"{i}.pdf", self.DOC_FORMAT, False, "high") for i in range(4)]
+            concurrent.futures.wait(futures, timeout=10)
+        self.assertEqual(pool.peak, 1)
+        self.assertEqual(self.controller.get_statistics()["admitted"], 4)
+
+    def test_pipeline_pool_stage_shares_budget(self):
+        """The pipeline admits pooled conversions before handing them to a worker."""
+        pool = FakeConversionPool()
+        pipeline = ProcessingPipeline(conversion_pool=pool)
+        items = [{"pdf_path": f"{i}.pdf", "doc_format": self.DOC_FORMAT} for i in range(4)]
+        with mock.patch("src.utils.conversion_utils.get_admission_controller", return_value=self.controller), \
+                mock.patch("src.utils.conversion_utils.estimate_conversion_memory", return_value=700):
+            threads = [threading.Thread(target=pipeline._markdown_stage, args=(item,)) for item in items]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=10)
+        self.assertEqual(pool.peak, 1)
+        self.assertTrue(all(item["markdown_path"] == "converted.md" for item in items))
+
+    def test_workers_skip_their_own_controller(self):
+        """Inside a pool worker the conversion does not admit against a per-process budget."""
+        doc_format = {"needs_ocr": False, "is_rare_format": False, "page_count": 1, "file_size_mb": 0.1}
+        controller = mock.MagicMock()
+        with mock.patch("src.utils.conversion_utils.get_admission_controller", return_value=controller), \
+                mock.patch("src.utils.pdf2md_wrapper.convert_pdf_to_markdown",
+                           return_value="# Doc\n\nConverted text of the document."):
+            with mock.patch.dict(os.environ, {WORKER_ENV: "1"}):
+                _convert_pdf_to_markdown("doc.pdf", doc_format=doc_format)
+            controller.admit.assert_not_called()
+
+            with mock.patch.dict(os.environ, {WORKER_ENV: ""}):
+                _convert_pdf_to_markdown("doc.pdf", doc_format=doc_format)
+            controller.admit.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the asyncio download engine.
+
+Downloads run against a local HTTP stand-in server that holds each response
+briefly and records how many requests it is serving at once.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import async_download
+from src.utils.async_download import AsyncDownloadEngine, AsyncDownloadConfig, HAS_AIOHTTP
+from src.utils.download_utils import DownloadConfig
+from src.utils.pipeline_utils import ProcessingPipeline, PipelineConfig
+
+PAYLOAD = b"%PDF-1.4\n" + os.urandom(64 * 1024) + b"\n%%EOF\n"
+
+
+class SlowServer:
+    """Serves PAYLOAD after a short delay, tracking concurrent requests."""
+
+    def __init__(self, delay=0.05):
+        self.active = 0
+        self.peak = 0
+        self.requests = 0
+        lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with lock:
+                    server.active += 1
+                    server.requests += 1
+                    server.peak = max(server.peak, server.active)
+                time.sleep(delay)
+                with lock:
+                    server.active -= 1
+                if self.path.startswith("/missing"):
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(PAYLOAD)))
+                self.end_headers()
+                self.wfile.write(PAYLOAD)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def _config(**settings):
+    config = AsyncDownloadConfig()
+    config.SHARED_RATE_LIMIT = False
+    config.RETRY_DELAY = 0
+    for name, value in settings.items():
+        setattr(config, name, value)
+    return config
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp not available")
+class AsyncDownloadEngineTest(unittest.TestCase):
+    """Test suite for AsyncDownloadEngine."""
+
+    def setUp(self):
+        self.server = SlowServer()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def _urls(self, count):
+        return [f"{self.server.base_url}/docid-{i:04d}.pdf" for i in range(count)]
+
+    def test_downloads_bounded_per_host(self):
+        """Many downloads run concurrently, but never more than the per-host limit."""
+        engine = AsyncDownloadEngine(_config(PER_HOST_LIMIT=8))
+        threads_before = threading.active_count()
+        results = engine.download_urls(self._urls(40), self.temp_dir, organize_by_collection=False)
+
+        self.assertEqual(len(results), 40)
+        for url, path in results.items():
+            self.assertEqual(os.path.basename(path), os.path.basename(url))
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), PAYLOAD)
+        self.assertEqual(self.server.peak, 8)
+        self.assertLessEqual(threading.active_count(), threads_before + 1)
+
+    def test_rate_limit_paces_requests(self):
+        """The token bucket caps how fast requests start."""
+        engine = AsyncDownloadEngine(_config(RATE_LIMIT=50.0, BURST=1))
+        started = time.time()
+        engine.download_urls(self._urls(11), self.temp_dir, organize_by_collection=False)
+
+        # One token up front, then ten more at 50 per second
+        self.assertGreaterEqual(time.time() - started, 0.19)
+
+    def test_permanent_errors_not_retried(self):
+        """A 404 fails the item once without retries."""
+        engine = AsyncDownloadEngine(_config())
+        urls = self._urls(2) + [f"{self.server.base_url}/missing.pdf"]
+        results = engine.download_urls(urls, self.temp_dir, organize_by_collection=False)
+
+        self.assertIsNone(results[urls[-1]])
+        self.assertTrue(all(results[url] for url in urls[:2]))
+        self.assertEqual(self.server.requests, 3)
+
+    def test_file_writes_off_event_loop(self):
+        """The .part file is opened and written by executor threads, never on the event loop."""
+        io_threads = []
+
+        class RecordingFile:
+            def __init__(self, f):
+                self.f = f
+
+            def write(self, data):
+                io_threads.append(threading.current_thread())
+                return self.f.write(data)
+
+            def __getattr__(self, name):
+                return getattr(self.f, name)
+
+        def recording_open(*args, **kwargs):
+            io_threads.append(threading.current_thread())
+            return RecordingFile(open(*args, **kwargs))
+
+        engine = AsyncDownloadEngine(_config())
+        url = self._urls(1)[0]
+        # Small blocks so the body takes more than one write
+        with mock.patch.object(async_download, "open", recording_open, create=True), \
+                mock.patch.object(DownloadConfig, "WRITE_BUFFER_SIZE", 16 * 1024):
+            results = engine.download_urls([url], self.temp_dir, organize_by_collection=False)
+
+        with open(results[url], "rb") as f:
+            self.assertEqual(f.read(), PAYLOAD)
+        self.assertGreaterEqual(len(io_threads), 3)  # open plus at least two block writes
+        self.assertNotIn(threading.current_thread(), io_threads)
+
+    def test_pipeline_download_stage(self):
+        """The pipeline can run its download stage on the engine."""
+        config = PipelineConfig()
+        config.PDF_DIR = self.temp_dir
+        pipeline = ProcessingPipeline(config=config, organize_directories=False, async_downloads=True)
+        # Stop after the download stage
+        pipeline.stages = pipeline.stages[:1]
+
+        successful, failed = pipeline.run(iter(self._urls(5) + [f"{self.server.base_url}/missing.pdf"]))
+
+        self.assertEqual((successful, failed), (5, 1))
+        self.assertEqual(pipeline.get_stage_statistics()["download"]["processed"], 5)
+        self.assertEqual(len([name for name in os.listdir(self.temp_dir) if name.endswith(".pdf")]), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for concurrent listing page scraping.
+
+Pages are served by a local paginated HTML fixture server that delays each
+response and records how many requests it is serving at once. A small
+stand-in for Crawl4AI's crawler fetches them with urllib, marking its
+requests as rendered so the server can serve pages that need a browser.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import tempfile
+import threading
+import unittest
+import urllib.request
+from unittest import mock
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.utils.scrape_utils as scrape_utils
+from src.utils.scrape_utils import (
+    _async_scrape_jfk_files, iter_jfk_file_urls, stream_jfk_file_urls, scrape_jfk_file_changes,
+    extract_pdf_links, ScrapeConfig
+)
+from src.utils.url_manifest import UrlManifest
+from src.utils.batch_utils import process_url_stream
+from src.utils.rate_limit import get_http_rate_limiter
+
+LINKS_PER_PAGE = 3
+
+
+def setUpModule():
+    # The local test server does not need the archive's polite request rate
+    limiter = get_http_rate_limiter()
+    setUpModule.previous_rate = (limiter.rate, limiter.capacity)
+    limiter.set_rate(1000.0, 1000.0)
+
+
+def tearDownModule():
+    get_http_rate_limiter().set_rate(*setUpModule.previous_rate)
+
+
+class ListingServer:
+    """
+    Serves /release?page=N listing pages with LINKS_PER_PAGE PDF links each.
+
+    Pages in `script_pages` only contain their links when rendered, and pages
+    in `error_pages` fail unless rendered. With `shared_link` every page also
+    links to the same common.pdf. Entries in `listings` replace a page's
+    links with the given file names.
+    """
+
+    def __init__(self, delay=0.05, script_pages=(), error_pages=(), shared_link=False):
+        self.active = 0
+        self.peak = 0
+        self.rendered_requests = []
+        self.requested_pages = []
+        self.listings = {}
+        lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with lock:
+                    server.active += 1
+                    server.peak = max(server.peak, server.active)
+                page = int(parse_qs(urlparse(self.path).query)["page"][0])
+                rendered = self.headers.get("X-Rendered") == "1"
+                with lock:
+                    server.requested_pages.append(page)
+                if rendered:
+                    with lock:
+                        server.rendered_requests.append(page)
+                # Later pages answer faster, so completion order differs from page order
+                time.sleep(delay / page)
+                links = "".join(
+                    f'<a href="/files/releases/p{page:03d}-{i}.pdf">Doc</a>' for i in range(LINKS_PER_PAGE)
+                )
+                if page in server.listings:
+                    links = "".join(f'<a href="/files/releases/{name}">Doc</a>' for name in server.listings[page])
+                if shared_link:
+                    links += '<a href="/files/releases/common.pdf">Common</a>'
+                if page in script_pages and not rendered:
+                    links = "<script>loadDocuments()</script>"
+                body = f"<html><body><a href='/about'>About</a>{links}</body></html>".encode()
+                with lock:
+                    server.active -= 1
+                if page in error_pages and not rendered:
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/release"
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FetchResult:
+    """The parts of a Crawl4AI CrawlResult that _scrape_page reads."""
+
+    def __init__(self, html):
+        self.success = True
+        self.html = html
+        self.error_message = None
+
+
+class UrllibCrawler:
+    """Minimal async crawler that fetches pages with urllib on a worker thread."""
+
+    async def arun(self, url, config=None):
+        loop = asyncio.get_running_loop()
+        request = urllib.request.Request(url, headers={"X-Rendered": "1"})
+        html = await loop.run_in_executor(None, lambda: urllib.request.urlopen(request).read().decode())
+        return FetchResult(html)
+
+
+class ConcurrentScrapeTest(unittest.TestCase):
+    """Test suite for _async_scrape_jfk_files."""
+
+    def setUp(self):
+        self.server = ListingServer()
+        self.checkpoints = {}
+        patcher = mock.patch.object(
+            scrape_utils, "save_checkpoint",
+            lambda data, name: self.checkpoints.__setitem__(name, data)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name, value in (("PAGE_DELAY", 0.01), ("MODE", "browser")):
+            patcher = mock.patch.object(ScrapeConfig, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _scrape(self, pages, concurrency):
+        return asyncio.run(_async_scrape_jfk_files(
+            self.server.base_url, 1, pages, pages, crawler=UrllibCrawler(), concurrency=concurrency
+        ))
+
+    def test_pages_crawled_concurrently_in_order(self):
+        """Up to `concurrency` pages are in flight and results keep page order."""
+        pdf_files = self._scrape(12, concurrency=4)
+
+        expected = [
+            f"https://www.archives.gov/files/releases/p{page:03d}-{i}.pdf"
+            for page in range(1, 13) for i in range(LINKS_PER_PAGE)
+        ]
+        self.assertEqual(pdf_files, expected)
+        self.assertGreater(self.server.peak, 1)
+        self.assertLessEqual(self.server.peak, 4)
+
+    def test_checkpoints(self):
+        """Each page gets its checkpoint and the progress checkpoint keeps page order."""
+        pdf_files = self._scrape(12, concurrency=4)
+
+        for page in range(1, 13):
+            self.assertEqual(self.checkpoints[f"scrape_page_{page}"]["last_processed_page"], page)
+        progress = self.checkpoints["scrape_progress"]
+        self.assertEqual(progress["processed_pages"], 10)
+        self.assertEqual(progress["pdf_urls"], sorted(progress["pdf_urls"]))
+        self.assertLessEqual(progress["last_page"], 10)
+        self.assertEqual(self.checkpoints["scrape_complete"]["pdf_urls"], pdf_files)
+
+    def test_single_connection(self):
+        """With one connection, pages are crawled one at a time."""
+        self._scrape(4, concurrency=1)
+        self.assertEqual(self.server.peak, 1)
+
+
+class FastScrapeTest(unittest.TestCase):
+    """Test suite for the browserless listing page fast path."""
+
+    def setUp(self):
+        patcher = mock.patch.object(scrape_utils, "save_checkpoint", lambda data, name: None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name, value in (("PAGE_DELAY", 0.01), ("MODE", "fast")):
+            patcher = mock.patch.object(ScrapeConfig, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _scrape(self, server, pages):
+        self.addCleanup(server.stop)
+        return asyncio.run(_async_scrape_jfk_files(
+            server.base_url, 1, pages, pages, crawler=UrllibCrawler(), concurrency=4
+        ))
+
+    def _expected(self, pages):
+        return [
+            f"https://www.archives.gov/files/releases/p{page:03d}-{i}.pdf"
+            for page in range(1, pages + 1) for i in range(LINKS_PER_PAGE)
+        ]
+
+    def test_static_pages_skip_browser(self):
+        """Static listing pages are scraped over plain HTTP without the browser."""
+        server = ListingServer(delay=0.01)
+        self.assertEqual(self._scrape(server, 6), self._expected(6))
+        self.assertEqual(server.rendered_requests, [])
+
+    def test_browser_fallback(self):
+        """Pages that fail or have no links over plain HTTP are rendered in the browser."""
+        server = ListingServer(delay=0.01, script_pages=(2,), error_pages=(5,))
+        self.assertEqual(self._scrape(server, 6), self._expected(6))
+        self.assertEqual(sorted(server.rendered_requests), [2, 5])
+
+    def test_extract_pdf_links(self):
+        """Links are found whatever their quoting, case or entity encoding."""
+        page = (
+            b'<html><body>'
+            b'<A HREF="/files/one.PDF">One</A>'
+            b"<a class='doc' href='two.pdf'>Two</a>"
+            b'<a href=https://example.org/three.pdf>Three</a>'
+            b'<a href="/files/four.pdf?x=1&amp;y=2">Not a PDF path</a>'
+            b'<a href="/files/five%20a&amp;b.pdf">Five</a>'
+            b'<a name="top">No link</a><link href="/style.pdf">'
+            b'</body></html>'
+        )
+        self.assertEqual(extract_pdf_links(page, "https://www.archives.gov/research/release?page=2"), [
+            "https://www.archives.gov/files/one.PDF",
+            "https://www.archives.gov/research/release/two.pdf",
+            "https://example.org/three.pdf",
+            "https://www.archives.gov/files/five%20a&b.pdf",
+        ])
+
+
+
+class StreamingDiscoveryTest(unittest.TestCase):
+    """Test suite for streaming URL discovery."""
+
+    def setUp(self):
+        self.server = ListingServer(delay=0.2, shared_link=True)
+        self.addCleanup(self.server.stop)
+        self.checkpoints = {}
+        patcher = mock.patch.object(scrape_utils, "save_checkpoint", self._save_checkpoint)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name, value in (("PAGE_DELAY", 0.01), ("MODE", "fast")):
+            patcher = mock.patch.object(ScrapeConfig, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _save_checkpoint(self, data, name):
+        # Copy the URL list, which discovery keeps extending
+        self.checkpoints[name] = dict(data, pdf_urls=list(data.get("pdf_urls", [])))
+
+    def test_urls_yielded_per_page(self):
+        """URLs arrive before discovery finishes, once each, with the urls checkpoint kept current."""
+        async def collect():
+            urls = []
+            checkpoint_at_first_url = None
+            async for url in iter_jfk_file_urls(self.server.base_url, 1, 6, concurrency=2):
+                if checkpoint_at_first_url is None:
+                    checkpoint_at_first_url = self.checkpoints["urls"]
+                urls.append(url)
+            return urls, checkpoint_at_first_url
+
+        urls, first_checkpoint = asyncio.run(collect())
+
+        self.assertFalse(first_checkpoint["complete"])
+        self.assertEqual(len(first_checkpoint["pdf_urls"]), LINKS_PER_PAGE + 1)
+        self.assertEqual(len(urls), len(set(urls)))
+        self.assertEqual(len(urls), 6 * LINKS_PER_PAGE + 1)
+        self.assertEqual(urls.count("https://www.archives.gov/files/releases/common.pdf"), 1)
+        self.assertTrue(self.checkpoints["urls"]["complete"])
+        self.assertEqual(self.checkpoints["urls"]["pdf_urls"], urls)
+
+    def test_sync_stream(self):
+        """The synchronous stream hands over the first URL long before the last page is scraped."""
+        started = time.monotonic()
+        stream = stream_jfk_file_urls(self.server.base_url, 1, 6, concurrency=1)
+        urls = [next(stream)]
+        first_url_time = time.monotonic() - started
+        urls.extend(stream)
+        total_time = time.monotonic() - started
+
+        self.assertEqual(len(urls), 6 * LINKS_PER_PAGE + 1)
+        self.assertLess(first_url_time, total_time / 2)
+
+
+
+class IncrementalScrapeTest(unittest.TestCase):
+    """Test suite for incremental scrapes against the URL manifest."""
+
+    def setUp(self):
+        self.server = ListingServer(delay=0.01)
+        self.addCleanup(self.server.stop)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.manifest = UrlManifest(os.path.join(self.temp_dir.name, "urls.db"))
+        self.addCleanup(self.manifest.close)
+        self.checkpoints = {}
+        patcher = mock.patch.object(scrape_utils, "save_checkpoint",
+                                    lambda data, name: self.checkpoints.__setitem__(name, data))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name, value in (("PAGE_DELAY", 0.01), ("MODE", "fast"), ("INCREMENTAL_STOP_AFTER", 2)):
+            patcher = mock.patch.object(ScrapeConfig, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _scrape(self):
+        self.server.requested_pages.clear()
+        return scrape_jfk_file_changes(self.server.base_url, 1, 10, manifest=self.manifest)
+
+    def test_unchanged_listing_stops_early(self):
+        """The first scrape reads every page; a repeat stops after the unchanged streak."""
+        first = self._scrape()
+        self.assertEqual(len(first["new"]), 10 * LINKS_PER_PAGE)
+        self.assertFalse(first["stopped_early"])
+        self.assertEqual(len(self.checkpoints["urls"]["pdf_urls"]), 10 * LINKS_PER_PAGE)
+
+        second = self._scrape()
+        self.assertEqual((second["new"], second["removed"]), ([], []))
+        self.assertTrue(second["stopped_early"])
+        self.assertEqual(second["pages_scraped"], 2)
+        # Pages already in flight when the streak ended may finish, but not the whole listing
+        self.assertLess(len(self.server.requested_pages), 10)
+        self.assertEqual(len(self.checkpoints["urls"]["pdf_urls"]), 10 * LINKS_PER_PAGE)
+
+    def test_new_and_removed_urls(self):
+        """Only URLs added to or dropped from the listing are reported."""
+        self._scrape()
+        self.server.listings[1] = ["new-release.pdf", "p001-0.pdf", "p001-1.pdf"]
+
+        changes = self._scrape()
+        self.assertEqual(changes["new"], ["https://www.archives.gov/files/releases/new-release.pdf"])
+        self.assertEqual(changes["removed"], ["https://www.archives.gov/files/releases/p001-2.pdf"])
+        self.assertEqual(changes["pages_scraped"], 3)
+        self.assertEqual(self.checkpoints["url_changes"]["new"], changes["new"])
+        self.assertNotIn("https://www.archives.gov/files/releases/p001-2.pdf", self.checkpoints["urls"]["pdf_urls"])
+
+    def test_unprocessed_urls_yielded_again(self):
+        """URLs a previous run discovered but never processed are yielded after the scrape."""
+        first = list(stream_jfk_file_urls(self.server.base_url, 1, 10, manifest=self.manifest))
+        for url in first[:-2]:
+            self.manifest.mark_processed(url)
+
+        second = list(stream_jfk_file_urls(self.server.base_url, 1, 10, manifest=self.manifest))
+        self.assertEqual(second, first[-2:])
+        self.assertEqual(self.checkpoints["url_changes"]["pending"], first[-2:])
+
+    def test_failed_urls_stay_pending(self):
+        """A URL that fails processing is not marked processed and is yielded by the next scrape."""
+        failing_url = "https://www.archives.gov/files/releases/p002-1.pdf"
+
+        class FakePipeline:
+            def __init__(self, on_result=None, **kwargs):
+                self.on_result = on_result
+
+            def run(self, urls):
+                results = [(url, url != failing_url) for url in urls]
+                for url, success in results:
+                    self.on_result(url, success)
+                successful = sum(success for _, success in results)
+                return successful, len(results) - successful
+
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+        for target, value in (("src.utils.pipeline_utils.ProcessingPipeline", FakePipeline),
+                              ("src.utils.storage.export_lite_llm_data", lambda *args: None),
+                              ("src.utils.ocr_cache.log_ocr_cache_statistics", lambda: None)):
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        stream = stream_jfk_file_urls(self.server.base_url, 1, 10, manifest=self.manifest)
+        self.assertEqual(process_url_stream(stream, on_processed=self.manifest.mark_processed),
+                         (10 * LINKS_PER_PAGE - 1, 1, 10 * LINKS_PER_PAGE))
+        self.assertEqual(self.manifest.get_pending_urls(), [failing_url])
+        self.assertIsNone(self.manifest.get(failing_url)["processed_at"])
+
+        again = list(stream_jfk_file_urls(self.server.base_url, 1, 10, manifest=self.manifest))
+        self.assertEqual(again, [failing_url])
+
+
+if __name__ == "__main__":
+    unittest.main()
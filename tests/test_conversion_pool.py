@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the process-pool conversion engine.
+
+Converts the bundled digital test PDF in worker processes and checks worker
+recycling and crash isolation.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.conversion_pool import ConversionProcessPool, HAS_MAX_TASKS_PER_CHILD
+from src.utils.pdf_utils import HAS_PYMUPDF, detect_document_format
+
+TEST_PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "test_data", "test_document.pdf")
+
+
+@unittest.skipUnless(HAS_PYMUPDF, "PyMuPDF is required for conversion")
+class ConversionPoolTest(unittest.TestCase):
+    """Test suite for ConversionProcessPool."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="conversion_pool_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _copy_pdf(self, name):
+        path = os.path.join(self.temp_dir, name)
+        shutil.copy(TEST_PDF, path)
+        return path
+
+    def test_convert_in_worker_process(self):
+        """A PDF is converted to Markdown by a worker process."""
+        pool = ConversionProcessPool(max_workers=2, memory_limit_mb=2048)
+        try:
+            markdown_path = pool.convert(self._copy_pdf("doc-a.pdf"), output_dir=self.temp_dir)
+        finally:
+            pool.shutdown()
+
+        self.assertTrue(markdown_path and os.path.exists(markdown_path))
+        self.assertEqual(pool.get_statistics()["completed"], 1)
+
+    def test_analysis_stays_in_parent(self):
+        """The detection analysis is not sent to the worker process."""
+        pdf_path = self._copy_pdf("doc-analysis.pdf")
+        doc_format = detect_document_format(pdf_path, include_details=True)
+        doc_format["analysis"].unpicklable = lambda: None
+        pool = ConversionProcessPool(max_workers=1)
+        try:
+            markdown_path = pool.convert(pdf_path, output_dir=self.temp_dir, doc_format=doc_format)
+        finally:
+            pool.shutdown()
+
+        self.assertTrue(markdown_path and os.path.exists(markdown_path))
+        self.assertIn("analysis", doc_format)
+
+    @unittest.skipIf(HAS_MAX_TASKS_PER_CHILD, "Native max_tasks_per_child recycling is used")
+    def test_workers_are_recycled(self):
+        """Workers are replaced after the configured number of documents."""
+        pool = ConversionProcessPool(max_workers=1, max_tasks_per_worker=1)
+        try:
+            for i in range(3):
+                self.assertIsNotNone(pool.convert(self._copy_pdf(f"doc-{i}.pdf"), output_dir=self.temp_dir))
+        finally:
+            pool.shutdown()
+
+        self.assertEqual(pool.get_statistics()["recycled"], 2)
+
+    def test_worker_crash_is_isolated(self):
+        """A crashed worker fails its task and the pool keeps working."""
+        pool = ConversionProcessPool(max_workers=1)
+        try:
+            crashed = pool.executor.submit(os._exit, 1)
+            self.assertIsNone(pool.result(crashed, "crash.pdf"))
+            markdown_path = pool.convert(self._copy_pdf("after-crash.pdf"), output_dir=self.temp_dir)
+        finally:
+            pool.shutdown()
+
+        self.assertTrue(markdown_path and os.path.exists(markdown_path))
+        stats = pool.get_statistics()
+        self.assertEqual(stats["crashed"], 1)
+        self.assertEqual(stats["completed"], 1)
+
+    def test_crash_does_not_fail_queued_documents(self):
+        """A document queued next to a crashing task is retried and still converted."""
+        pool = ConversionProcessPool(max_workers=1)
+        try:
+            crashed = pool.executor.submit(os._exit, 1)
+            healthy = pool.submit(self._copy_pdf("queued.pdf"), output_dir=self.temp_dir)
+            self.assertIsNone(pool.result(crashed, "crash.pdf"))
+            markdown_path = pool.result(healthy, "queued.pdf")
+        finally:
+            pool.shutdown()
+
+        self.assertTrue(markdown_path and os.path.exists(markdown_path))
+        stats = pool.get_statistics()
+        self.assertEqual(stats["crashed"], 1)
+        self.assertEqual(stats["completed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
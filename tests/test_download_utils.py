@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the download write path, resumable downloads and the download manifest.
+
+Downloads run against the local HTTP stand-in server from
+scripts/benchmark_http_session.py, or a range-capable server defined here.
+"""
+
+import os
+import re
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import download_utils
+from src.utils.download_utils import (
+    download_file, download_pdf, close_http_session, get_download_progress, DownloadConfig
+)
+from src.utils.download_manifest import DownloadManifest, file_sha256
+from src.utils.logging_utils import _performance_metrics
+from scripts.benchmark_http_session import start_server
+
+PAYLOAD = os.urandom(256 * 1024)
+
+
+class DownloadWriteTest(unittest.TestCase):
+    """Test suite for durable-at-end downloads."""
+
+    def setUp(self):
+        close_http_session()
+        self.server, self.base_url, self.stats = start_server(PAYLOAD)
+        self.temp_dir = tempfile.mkdtemp()
+        self.save_path = os.path.join(self.temp_dir, "doc.pdf")
+
+    def tearDown(self):
+        close_http_session()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_single_fsync_and_atomic_rename(self):
+        """The file is synced once and appears only when complete."""
+        real_fsync = os.fsync
+        with mock.patch.object(DownloadConfig, "CHUNK_SIZE", 8192), \
+             mock.patch.object(download_utils.os, "fsync", side_effect=real_fsync) as fsync:
+            success, size, _ = download_file(f"{self.base_url}/doc.pdf", self.save_path)
+
+        self.assertTrue(success)
+        self.assertEqual(size, len(PAYLOAD))
+        self.assertEqual(fsync.call_count, 1)
+        with open(self.save_path, "rb") as f:
+            self.assertEqual(f.read(), PAYLOAD)
+        self.assertEqual(os.listdir(self.temp_dir), ["doc.pdf"])
+
+    def test_failed_download_leaves_no_file(self):
+        """Without validators a failed download leaves neither the file nor its .part."""
+        def broken_write(*args):
+            raise OSError("disk full")
+
+        with mock.patch("src.utils.logging_utils.time.sleep"), \
+             mock.patch.object(download_utils.os, "fsync", side_effect=broken_write):
+            with self.assertRaises(OSError):
+                download_file(f"{self.base_url}/doc.pdf", self.save_path)
+
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_visible_progress(self):
+        """Visible progress publishes bytes written through the metrics."""
+        observed = []
+        report = download_utils._report_progress
+
+        def record(save_path, bytes_written, expected_size, new_bytes):
+            report(save_path, bytes_written, expected_size, new_bytes)
+            observed.append(get_download_progress()[save_path])
+
+        before = _performance_metrics["downloaded_bytes"]
+        with mock.patch.object(DownloadConfig, "CHUNK_SIZE", 32 * 1024), \
+             mock.patch.object(DownloadConfig, "PROGRESS_INTERVAL", 64 * 1024), \
+             mock.patch.object(download_utils, "_report_progress", side_effect=record):
+            download_file(f"{self.base_url}/doc.pdf", self.save_path, visible_progress=True)
+
+        self.assertEqual([written for written, _ in observed], [65536, 131072, 196608, 262144])
+        self.assertTrue(all(expected == len(PAYLOAD) for _, expected in observed))
+        self.assertEqual(_performance_metrics["downloaded_bytes"] - before, len(PAYLOAD))
+        self.assertEqual(get_download_progress(), {})
+
+
+class RangeServer:
+    """Local server with ETag, conditional GET, Range and If-Range support that can cut responses short."""
+
+    def __init__(self, payload, etag='"v1"'):
+        self.payload = payload
+        self.etag = etag
+        self.cuts = []  # Bytes to send before dropping the connection, per request
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                range_header = self.headers.get("Range")
+                server.requests.append((range_header, self.headers.get("If-Range")))
+                data = server.payload
+                if self.headers.get("If-None-Match") == server.etag:
+                    self.send_response(304)
+                    self.send_header("ETag", server.etag)
+                    self.end_headers()
+                    return
+                start = 0
+                match = re.match(r"bytes=(\d+)-$", range_header or "")
+                if match and self.headers.get("If-Range") in (None, server.etag):
+                    start = int(match.group(1))
+                    if start >= len(data):
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{len(data)}")
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+                else:
+                    self.send_response(200)
+                body = data[start:]
+                self.send_header("ETag", server.etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                cut = server.cuts.pop(0) if server.cuts else None
+                if cut is None:
+                    self.wfile.write(body)
+                else:
+                    self.wfile.write(body[:cut])
+                    self.wfile.flush()
+                    self.close_connection = True
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/doc.pdf"
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class ResumableDownloadTest(unittest.TestCase):
+    """Test suite for Range-based resume of interrupted downloads."""
+
+    def setUp(self):
+        close_http_session()
+        self.server = RangeServer(PAYLOAD)
+        self.temp_dir = tempfile.mkdtemp()
+        self.save_path = os.path.join(self.temp_dir, "doc.pdf")
+        for patcher in (mock.patch("src.utils.logging_utils.time.sleep"),
+                        mock.patch.object(DownloadConfig, "CHUNK_SIZE", 8192)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        close_http_session()
+        self.server.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def _read(self):
+        with open(self.save_path, "rb") as f:
+            return f.read()
+
+    def test_retry_continues_from_last_byte(self):
+        """An interrupted transfer is finished with a Range request, not refetched."""
+        self.server.cuts = [98304, 49152]
+        success, size, _ = download_file(self.server.url, self.save_path)
+
+        self.assertTrue(success)
+        self.assertEqual(size, len(PAYLOAD))
+        self.assertEqual(self._read(), PAYLOAD)
+        self.assertEqual(self.server.requests, [
+            (None, None),
+            ("bytes=98304-", '"v1"'),
+            ("bytes=147456-", '"v1"'),
+        ])
+        self.assertEqual(os.listdir(self.temp_dir), ["doc.pdf"])
+
+    def test_changed_file_restarts(self):
+        """If the validator no longer matches, the download starts over."""
+        self.server.cuts = [98304]
+        with self.assertRaises(Exception):
+            download_file.__wrapped__(self.server.url, self.save_path)
+        self.assertTrue(os.path.exists(self.save_path + DownloadConfig.PART_SUFFIX))
+
+        self.server.payload = PAYLOAD[::-1]
+        self.server.etag = '"v2"'
+        download_file(self.server.url, self.save_path)
+
+        self.assertEqual(self._read(), PAYLOAD[::-1])
+        self.assertEqual(self.server.requests[-1], ("bytes=98304-", '"v1"'))
+
+    def test_complete_partial_file(self):
+        """A .part file that already holds every byte is published without refetching."""
+        self.server.cuts = [len(PAYLOAD) - 8192]
+        with self.assertRaises(Exception):
+            download_file.__wrapped__(self.server.url, self.save_path)
+
+        with open(self.save_path + DownloadConfig.PART_SUFFIX, "ab") as f:
+            f.write(PAYLOAD[-8192:])
+        download_file(self.server.url, self.save_path)
+
+        self.assertEqual(self._read(), PAYLOAD)
+        self.assertEqual(self.server.requests[-1], (f"bytes={len(PAYLOAD)}-", '"v1"'))
+
+
+class DownloadManifestTest(unittest.TestCase):
+    """Test suite for manifest-based revalidation of existing downloads."""
+
+    def setUp(self):
+        close_http_session()
+        self.server = RangeServer(PAYLOAD)
+        self.temp_dir = tempfile.mkdtemp()
+        self.save_path = os.path.join(self.temp_dir, "doc.pdf")
+        self.manifest_path = os.path.join(self.temp_dir, DownloadConfig.MANIFEST_NAME)
+
+    def tearDown(self):
+        close_http_session()
+        self.server.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def _download(self):
+        return download_pdf(self.server.url, save_dir=self.temp_dir, organize_by_collection=False)
+
+    def test_manifest_records_download(self):
+        """A completed download is recorded with its validator, size and hash."""
+        self.assertEqual(self._download(), self.save_path)
+
+        entry = DownloadManifest(self.manifest_path).get(self.server.url)
+        self.assertEqual(entry["path"], self.save_path)
+        self.assertEqual(entry["etag"], '"v1"')
+        self.assertEqual(entry["size"], len(PAYLOAD))
+        self.assertEqual(entry["sha256"], file_sha256(self.save_path))
+
+    def test_unchanged_file_is_not_refetched(self):
+        """A re-run sends If-None-Match and keeps the file on a 304."""
+        self._download()
+        mtime = os.path.getmtime(self.save_path)
+        self._download()
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(os.path.getmtime(self.save_path), mtime)
+
+    def test_changed_file_is_refetched(self):
+        """A new ETag on the server replaces the local copy."""
+        self._download()
+        self.server.payload = PAYLOAD[::-1]
+        self.server.etag = '"v2"'
+        self._download()
+
+        with open(self.save_path, "rb") as f:
+            self.assertEqual(f.read(), PAYLOAD[::-1])
+        entry = DownloadManifest(self.manifest_path).get(self.server.url)
+        self.assertEqual(entry["etag"], '"v2"')
+
+    def test_truncated_file_is_refetched(self):
+        """A local file that no longer matches its recorded size or hash is downloaded again."""
+        self._download()
+        with open(self.save_path, "r+b") as f:
+            f.truncate(len(PAYLOAD) // 2)
+        self._download()
+
+        with open(self.save_path, "rb") as f:
+            self.assertEqual(f.read(), PAYLOAD)
+        self.assertEqual(len(self.server.requests), 2)
+
+        # Same size but different content is caught by the hash once the file was modified
+        with open(self.save_path, "r+b") as f:
+            f.write(b"X" * 16)
+        os.utime(self.save_path, ns=(0, os.stat(self.save_path).st_mtime_ns + 10 ** 9))
+        self._download()
+
+        with open(self.save_path, "rb") as f:
+            self.assertEqual(f.read(), PAYLOAD)
+
+    def test_hash_skipped_while_mtime_unchanged(self):
+        """Files untouched since they were recorded are not hashed unless VERIFY_HASHES is set."""
+        self._download()
+        stat = os.stat(self.save_path)
+        with open(self.save_path, "r+b") as f:
+            f.write(b"X" * 16)
+        os.utime(self.save_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        with mock.patch("src.utils.download_manifest.file_sha256") as sha256:
+            self._download()
+            sha256.assert_not_called()
+
+        with mock.patch.object(DownloadConfig, "VERIFY_HASHES", True):
+            self._download()
+        with open(self.save_path, "rb") as f:
+            self.assertEqual(f.read(), PAYLOAD)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the shared pooled HTTP session used for downloads.
+
+Downloads run against a local keep-alive HTTP stand-in server that counts
+the connections it accepts.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import concurrent.futures
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.download_utils import download_pdf, get_http_session, close_http_session
+from src.utils.rate_limit import get_http_rate_limiter
+from scripts.benchmark_http_session import start_server
+
+PAYLOAD = b"%PDF-1.4\n" + b"0" * 4096 + b"\n%%EOF\n"
+
+
+def setUpModule():
+    # The local test server does not need the archive's polite request rate
+    limiter = get_http_rate_limiter()
+    setUpModule.previous_rate = (limiter.rate, limiter.capacity)
+    limiter.set_rate(1000.0, 1000.0)
+
+
+def tearDownModule():
+    get_http_rate_limiter().set_rate(*setUpModule.previous_rate)
+
+
+class HTTPSessionTest(unittest.TestCase):
+    """Test suite for the pooled download session."""
+
+    def setUp(self):
+        close_http_session()
+        self.server, self.base_url, self.stats = start_server(PAYLOAD)
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        close_http_session()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def _download(self, i):
+        return download_pdf(f"{self.base_url}/docid-{i:04d}.pdf", save_dir=self.temp_dir,
+                            organize_by_collection=False)
+
+    def test_sequential_downloads_reuse_one_connection(self):
+        """Consecutive downloads share a single kept-alive connection."""
+        paths = [self._download(i) for i in range(5)]
+
+        self.assertTrue(all(os.path.getsize(path) == len(PAYLOAD) for path in paths))
+        self.assertEqual(self.stats["requests"], 5)
+        self.assertEqual(self.stats["connections"], 1)
+
+    def test_concurrent_downloads_bounded_by_pool(self):
+        """Concurrent downloads open no more connections than the pool size."""
+        get_http_session(pool_size=3)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            paths = list(executor.map(self._download, range(30)))
+
+        self.assertEqual(len(set(paths)), 30)
+        self.assertEqual(self.stats["requests"], 30)
+        self.assertLessEqual(self.stats["connections"], 3)
+
+    def test_session_grows_with_requested_pool(self):
+        """The shared session is reused unless a larger pool is requested."""
+        session = get_http_session(pool_size=4)
+        self.assertIs(get_http_session(pool_size=2), session)
+        larger = get_http_session(pool_size=16)
+        self.assertIsNot(larger, session)
+        self.assertIs(get_http_session(pool_size=8), larger)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the append-only Lite LLM store.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.storage import LiteLLMStore, store_json_data, export_lite_llm_data
+
+
+def _entry(doc_id, text="content"):
+    return {
+        "source": f"JFK Files - {doc_id}.json",
+        "timestamp": "2025-01-01 00:00:00",
+        "content": {"document_id": doc_id, "full_text": text}
+    }
+
+
+class LiteLLMStoreTest(unittest.TestCase):
+    """Test suite for LiteLLMStore."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.temp_dir, "lite_llm", "jfk_files.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _read_export(self):
+        with open(self.output_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_upsert_replaces_existing_document(self):
+        """A repeated document ID updates the entry in place."""
+        store = LiteLLMStore(self.output_path)
+        store.upsert(_entry("doc-1", "first"))
+        store.upsert(_entry("doc-2"))
+        store.upsert(_entry("doc-1", "second"))
+        store.export()
+
+        data = self._read_export()
+        self.assertEqual([e["content"]["document_id"] for e in data], ["doc-1", "doc-2"])
+        self.assertEqual(data[0]["content"]["full_text"], "second")
+
+    def test_index_is_rebuilt_from_log(self):
+        """A new store instance sees the entries written by a previous one."""
+        store = LiteLLMStore(self.output_path)
+        store.upsert(_entry("doc-1"))
+        store.upsert(_entry("doc-1", "updated"))
+
+        reopened = LiteLLMStore(self.output_path)
+        self.assertEqual(len(reopened), 1)
+        reopened.export()
+        self.assertEqual(self._read_export()[0]["content"]["full_text"], "updated")
+
+    def test_torn_tail_is_truncated(self):
+        """A record cut short by a crash is dropped before new records are appended."""
+        store = LiteLLMStore(self.output_path)
+        store.upsert(_entry("doc-1"))
+        with open(store.log_path, 'ab') as f:
+            f.write(json.dumps(_entry("doc-2")).encode('utf-8'))  # Complete JSON, no newline
+
+        reopened = LiteLLMStore(self.output_path)
+        self.assertEqual(len(reopened), 1)
+        reopened.upsert(_entry("doc-3"))
+
+        reopened = LiteLLMStore(self.output_path)
+        self.assertEqual(len(reopened), 2)
+        reopened.export()
+        self.assertEqual([e["content"]["document_id"] for e in self._read_export()], ["doc-1", "doc-3"])
+
+    def test_legacy_array_is_imported(self):
+        """An existing array-format file seeds the store."""
+        os.makedirs(os.path.dirname(self.output_path))
+        with open(self.output_path, 'w', encoding='utf-8') as f:
+            json.dump([_entry("doc-1"), _entry("doc-2")], f)
+
+        store = LiteLLMStore(self.output_path)
+        self.assertEqual(len(store), 2)
+        self.assertIn("doc-2", store)
+
+    def test_compaction_drops_superseded_records(self):
+        """Compaction keeps only the latest record per document."""
+        store = LiteLLMStore(self.output_path)
+        store.COMPACT_MIN_STALE = 5
+        for i in range(10):
+            store.upsert(_entry("doc-1", f"version {i}"))
+
+        with open(store.log_path, 'rb') as f:
+            self.assertLess(len(f.readlines()), 10)
+
+        store.export()
+        self.assertEqual(self._read_export()[0]["content"]["full_text"], "version 9")
+
+    def test_store_json_data_and_export(self):
+        """store_json_data appends to the store and export writes the array file."""
+        source_path = os.path.join(self.temp_dir, "doc-3.json")
+        with open(source_path, 'w', encoding='utf-8') as f:
+            json.dump({"document_id": "doc-3", "full_text": "text"}, f)
+
+        self.assertTrue(store_json_data(source_path, self.output_path))
+        self.assertTrue(store_json_data(source_path, self.output_path))
+        self.assertTrue(export_lite_llm_data(self.output_path))
+
+        data = self._read_export()
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["source"], "JFK Files - doc-3.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
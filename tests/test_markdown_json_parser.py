@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests that the single-pass Markdown to JSON parser matches the previous one.
+
+The previous line-by-line implementation is kept in the benchmark script as
+the reference. Both are run over the sample documents in data/markdown and
+over small documents aimed at the parser's edge cases.
+"""
+
+import os
+import sys
+import glob
+import tempfile
+import unittest
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.conversion_utils import _convert_markdown_to_json, _extract_markdown_metadata
+from scripts.benchmark_markdown_to_json import (
+    legacy_convert_markdown_to_json, comparable, build_large_document, DEFAULT_MARKDOWN_DIR
+)
+
+EDGE_CASES = {
+    "104-10001-10001 text-before-headers": (
+        "Memo received 22 November 1963.\n\nClassification: top secret\n\n"
+        "# Report\n\n\n\n\nFrom: Dallas field office\n## Page 2\nSECRETARY of State\n"
+    ),
+    "docid-32204484 code-blocks": (
+        "# Title\n```\n# not a header\n\n```\nafter code\n\n## Page 1\n\n  ```python\n"
+        "## Page 9\n```\ntext\n"
+    ),
+    "empty-and-odd-headers": (
+        "#   \nlost text\n####### seven hashes\n# page 12 of 40\ncontent\n#\tTabbed\n\n\nmore\n"
+        "#NoSpace\n## Section ##\nCIA and FBI\n"
+    ),
+    "header-only": "# One\n# Two\n\n",
+    "blank-lines-only": "\n\n   \n\t\n",
+    "fence-only": "```\n",
+    "metadata-precedence": (
+        "# Cable\n12/5/63 UNCLASSIFIED copy\nDated: 11/22/1963\n5 December 1963\n"
+        "Originator: \n\nDOD\nclassified: secret noforn\n"
+    ),
+    "crlf-lines": "# Cable\r\nDate: 1/2/64\r\n\r\n## Page 1\r\nFBI\r\n",
+    "unicode": "# Résumé\nDÉCLASSIFIÉ\nFrom: Département d'État\n## Page ٣\n",
+}
+
+
+class MarkdownJsonParserTest(unittest.TestCase):
+    """Test suite comparing _convert_markdown_to_json with the reference implementation."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _assert_same(self, path, title=None):
+        self.assertEqual(
+            comparable(_convert_markdown_to_json(path, title)),
+            comparable(legacy_convert_markdown_to_json(path, title)),
+            f"Output differs for {path}"
+        )
+
+    def test_sample_documents(self):
+        """Every sample document converts to the same JSON."""
+        paths = sorted(glob.glob(os.path.join(DEFAULT_MARKDOWN_DIR, "*.md")))
+        self.assertTrue(paths)
+        for path in paths:
+            self._assert_same(path)
+
+    def test_large_document(self):
+        """A long OCR-style document of many page sections converts to the same JSON."""
+        paths = sorted(glob.glob(os.path.join(DEFAULT_MARKDOWN_DIR, "*.md")))
+        self._assert_same(build_large_document(paths, 40, self.temp_dir.name))
+
+    def test_edge_cases(self):
+        """Code blocks, odd headers, implicit sections and metadata precedence match."""
+        for name, content in EDGE_CASES.items():
+            path = os.path.join(self.temp_dir.name, f"{name}.md")
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(content)
+            with self.subTest(name=name):
+                self._assert_same(path)
+                self._assert_same(path, title=name.split(" ")[0])
+
+    def test_empty_file(self):
+        """An empty file gives the same placeholder document."""
+        path = os.path.join(self.temp_dir.name, "empty.md")
+        open(path, "w").close()
+        self._assert_same(path)
+
+    def test_metadata_precedence(self):
+        """The first pattern in a field's list wins, wherever its match is."""
+        metadata = _extract_markdown_metadata("CIA 3/4/63 SECRET\nDate: 1-2-63\nAgency: FBI\nTOP SECRET")
+        self.assertEqual(metadata, {"date": "1-2-63", "classification": "SECRET", "agency": "FBI\nTOP SECRET"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the SQLite metadata index used by StorageManager.
+"""
+
+import os
+import sys
+import json
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.storage import StorageManager
+
+
+class SQLiteMetadataIndexTest(unittest.TestCase):
+    """Test suite for StorageManager with the SQLite index backend."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.base_dir = os.path.join(self.temp_dir, "storage")
+        self.files = {}
+        for file_type, ext in (("pdf", "pdf"), ("markdown", "md"), ("json", "json")):
+            path = os.path.join(self.temp_dir, f"source.{ext}")
+            with open(path, 'w') as f:
+                f.write(f"{file_type} content")
+            self.files[file_type] = path
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _store_all(self, storage, doc_id, file_types=("pdf", "markdown", "json")):
+        with storage.batch():
+            for file_type in file_types:
+                storage.store_file(self.files[file_type], doc_id, file_type)
+
+    def test_status_and_listing(self):
+        """list_documents filters by status and statistics come from the index."""
+        storage = StorageManager(base_dir=self.base_dir)
+        self._store_all(storage, "doc-complete")
+        self._store_all(storage, "doc-partial", file_types=("pdf",))
+
+        self.assertEqual(storage.check_processing_status("doc-complete"), "complete")
+        self.assertEqual(storage.check_processing_status("doc-partial"), "partial")
+        self.assertEqual(storage.check_processing_status("missing"), "not_found")
+        self.assertEqual(storage.list_documents(status="complete"), ["doc-complete"])
+        self.assertEqual(storage.list_documents(status="partial"), ["doc-partial"])
+        self.assertEqual(storage.list_documents(), ["doc-complete", "doc-partial"])
+
+        stats = storage.get_statistics()
+        self.assertEqual(stats["total_documents"], 2)
+        self.assertEqual(stats["complete_documents"], 1)
+        self.assertEqual(stats["partial_documents"], 1)
+        self.assertEqual(stats["total_size"]["pdf"], 2 * len("pdf content"))
+
+    def test_mapping_access_and_persistence(self):
+        """The index keeps the dict-style access and survives a restart."""
+        storage = StorageManager(base_dir=self.base_dir)
+        self._store_all(storage, "doc-1")
+
+        self.assertIn("doc-1", storage._metadata_index)
+        self.assertTrue(storage._metadata_index["doc-1"]["pdf"]["path"].endswith("doc-1.pdf"))
+        self.assertFalse(os.path.exists(os.path.join(self.base_dir, "metadata", "index.json")))
+
+        reopened = StorageManager(base_dir=self.base_dir)
+        self.assertEqual(reopened.check_processing_status("doc-1"), "complete")
+
+        del storage._metadata_index["doc-1"]
+        self.assertNotIn("doc-1", reopened._metadata_index)
+
+    def test_wal_mode(self):
+        """The database is opened in WAL mode."""
+        StorageManager(base_dir=self.base_dir)
+        conn = sqlite3.connect(os.path.join(self.base_dir, "metadata", "index.db"))
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        conn.close()
+
+    def test_batch_isolated_from_other_threads(self):
+        """Another thread's write waits for a batch and survives its rollback."""
+        storage = StorageManager(base_dir=self.base_dir)
+        self.addCleanup(storage.close)
+        index = storage._metadata_index
+        info = {"path": "/tmp/doc.pdf", "size": 1, "last_modified": "2025-01-01T00:00:00"}
+        written = threading.Event()
+
+        def write_other():
+            index.set_file("doc-other", "pdf", info)
+            written.set()
+
+        writer = threading.Thread(target=write_other)
+        with self.assertRaises(RuntimeError):
+            with index.batch():
+                index.set_file("doc-batch", "pdf", info)
+                writer.start()
+                self.assertFalse(written.wait(0.2))
+                raise RuntimeError("abort batch")
+        writer.join(timeout=5)
+
+        self.assertNotIn("doc-batch", index)
+        self.assertIn("doc-other", index)
+
+    def test_context_manager_closes_index(self):
+        """Leaving the with block closes the index connection."""
+        with StorageManager(base_dir=self.base_dir) as storage:
+            self._store_all(storage, "doc-1")
+        with self.assertRaises(sqlite3.ProgrammingError):
+            storage._metadata_index.conn.execute("SELECT 1")
+
+    def test_legacy_index_import(self):
+        """An existing index.json is imported once."""
+        metadata_dir = os.path.join(self.base_dir, "metadata")
+        os.makedirs(metadata_dir)
+        legacy = {
+            "old-doc": {
+                file_type: {"path": f"/old/old-doc.{file_type}", "size": 10,
+                            "last_modified": "2025-01-01T00:00:00", "file_type": file_type}
+                for file_type in ("pdf", "markdown", "json")
+            }
+        }
+        with open(os.path.join(metadata_dir, "index.json"), 'w') as f:
+            json.dump(legacy, f)
+
+        storage = StorageManager(base_dir=self.base_dir)
+        self.assertEqual(storage.check_processing_status("old-doc"), "complete")
+        self.assertEqual(storage.get_document_metadata("old-doc")["pdf"]["size"], 10)
+
+        # A second start does not import again over newer data
+        del storage._metadata_index["old-doc"]
+        reopened = StorageManager(base_dir=self.base_dir)
+        self.assertEqual(reopened.check_processing_status("old-doc"), "not_found")
+
+    def test_json_backend_filters_status(self):
+        """The JSON backend also honours the status filter."""
+        storage = StorageManager(base_dir=self.base_dir, index_backend="json")
+        self._store_all(storage, "doc-complete")
+        self._store_all(storage, "doc-partial", file_types=("pdf",))
+
+        self.assertEqual(storage.list_documents(status="partial"), ["doc-partial"])
+        self.assertTrue(os.path.exists(os.path.join(self.base_dir, "metadata", "index.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
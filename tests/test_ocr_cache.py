@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the content-addressed OCR cache.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import ocr_cache
+from src.utils.ocr_cache import OCRCache, OCRCacheConfig
+from src.utils import pdf2md_wrapper
+
+try:
+    import pytesseract
+    HAS_PYTESSERACT = True
+except ImportError:
+    HAS_PYTESSERACT = False
+
+
+class OCRCacheTest(unittest.TestCase):
+    """Test suite for OCRCache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "ocr_cache.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_key_depends_on_content_and_settings(self):
+        """Identical pages share a key; different pixels or settings do not."""
+        white = Image.new("L", (20, 20), 255)
+        same = Image.new("L", (20, 20), 255)
+        black = Image.new("L", (20, 20), 0)
+
+        key = OCRCache.make_key(white, "tesseract-5", 300, "--psm 6")
+        self.assertEqual(key, OCRCache.make_key(same, "tesseract-5", 300, "--psm 6"))
+        self.assertNotEqual(key, OCRCache.make_key(black, "tesseract-5", 300, "--psm 6"))
+        self.assertNotEqual(key, OCRCache.make_key(white, "tesseract-5", 200, "--psm 6"))
+        self.assertNotEqual(key, OCRCache.make_key(white, "tesseract-5", 300, "--psm 3"))
+        self.assertNotEqual(key, OCRCache.make_key(white, "tesseract-4", 300, "--psm 6"))
+
+    def test_hits_misses_and_persistence(self):
+        """Counters track lookups and entries survive reopening."""
+        cache = OCRCache(self.db_path)
+        self.assertIsNone(cache.get("page"))
+        cache.put("page", "some text")
+        self.assertEqual(cache.get("page"), "some text")
+        cache.close()
+
+        reopened = OCRCache(self.db_path)
+        self.assertEqual(reopened.get("page"), "some text")
+        stats = reopened.get_statistics()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (2, 1, 1))
+        self.assertEqual(stats["size_bytes"], len("some text"))
+
+    def test_lru_eviction(self):
+        """The least recently used pages are evicted past the size limit."""
+        cache = OCRCache(self.db_path, max_size_mb=1)
+        cache.max_size_bytes = 25
+        cache.put("a", "x" * 10)
+        cache.put("b", "x" * 10)
+        cache.get("a")  # "b" is now the least recently used
+        cache.put("c", "x" * 10)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        stats = cache.get_statistics()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["size_bytes"], 20)
+
+    @unittest.skipUnless(HAS_PYTESSERACT, "pytesseract not available")
+    def test_repeated_page_skips_ocr(self):
+        """A page seen before is served from the cache without running OCR."""
+        image = Image.new("RGB", (40, 40), (255, 255, 255))
+        fake_ocr = mock.Mock(return_value="A CACHED LINE OF TEXT LONG ENOUGH TO KEEP")
+
+        with mock.patch.object(OCRCacheConfig, "DB_PATH", self.db_path), \
+             mock.patch.object(ocr_cache, "_caches", {}), \
+             mock.patch.object(pytesseract, "image_to_string", fake_ocr):
+            first = pdf2md_wrapper.ocr_page_image(image, dpi=150)
+            second = pdf2md_wrapper.ocr_page_image(image.copy(), dpi=150)
+            third = pdf2md_wrapper.ocr_page_image(image, dpi=300)
+
+        self.assertEqual(first, second)
+        self.assertEqual(fake_ocr.call_count, 2)  # Second call hit, third differs in DPI
+        self.assertEqual(third, first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for per-page OCR routing of mixed digital/scanned documents.
+
+Tesseract is replaced with a stand-in that reports the rendered page width;
+the image pages have distinct widths, so the output shows which pages were
+OCR'd.
+"""
+
+import os
+import re
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.pdf_utils import HAS_PYMUPDF, analyze_pdf, page_needs_ocr
+from src.utils.ocr_cache import OCRCacheConfig
+from src.utils.pdf2md_wrapper import PDF2MarkdownWrapper
+
+try:
+    import pytesseract
+    HAS_PYTESSERACT = True
+except ImportError:
+    HAS_PYTESSERACT = False
+
+PARAGRAPH = "This memorandum records the digital text layer of a typed page. " * 6
+
+# Page widths in points; None marks a digital text page
+LAYOUT = [None, 300, None, 340, None]
+
+
+def _fake_ocr(image, config=""):
+    return f"SCANNED PAGE RENDERED {image.size[0]} PIXELS WIDE"
+
+
+@unittest.skipUnless(HAS_PYMUPDF and HAS_PYTESSERACT, "PyMuPDF or pytesseract not available")
+class PageRoutingTest(unittest.TestCase):
+    """Test suite for per-page OCR routing."""
+
+    def setUp(self):
+        import fitz
+        cache_patcher = mock.patch.object(OCRCacheConfig, "ENABLED", False)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        self.temp_dir = tempfile.mkdtemp()
+        self.pdf_path = os.path.join(self.temp_dir, "mixed.pdf")
+
+        doc = fitz.open()
+        for width in LAYOUT:
+            if width is None:
+                page = doc.new_page(width=400, height=500)
+                page.insert_textbox(fitz.Rect(20, 20, 380, 480), PARAGRAPH, fontsize=10)
+            else:
+                page = doc.new_page(width=width, height=400)
+                pixmap = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 60, 80), False)
+                pixmap.clear_with(200)
+                page.insert_image(page.rect, pixmap=pixmap)
+        doc.save(self.pdf_path)
+        doc.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_pages_are_classified(self):
+        """Only the image-only pages are marked for OCR."""
+        analysis = analyze_pdf(self.pdf_path)
+
+        self.assertEqual(analysis.pages_needing_ocr(), [1, 3])
+        self.assertGreater(analysis.pages[1]["image_coverage"], 0.9)
+        self.assertEqual(analysis.pages[0]["image_coverage"], 0.0)
+        self.assertFalse(page_needs_ocr({"text_length": 0, "image_count": 0}))
+
+    def test_mixed_document_ocrs_only_scanned_pages(self):
+        """Scanned pages are OCR'd, text pages keep their text layer, in page order."""
+        fake_ocr = mock.Mock(side_effect=_fake_ocr)
+        wrapper = PDF2MarkdownWrapper(ocr_workers=1)
+        with mock.patch.object(pytesseract, "image_to_string", fake_ocr):
+            markdown = wrapper.markdown(self.pdf_path, ocr_quality="low")
+
+        self.assertEqual(fake_ocr.call_count, 2)
+        self.assertEqual(markdown.count("digital text layer"), 3 * PARAGRAPH.count("digital text layer"))
+
+        headers = [int(number) for number in re.findall(r"## Page (\d+)", markdown)]
+        self.assertEqual(headers, [1, 2, 3, 4, 5])
+        widths = [int(width) for width in re.findall(r"RENDERED (\d+) PIXELS", markdown)]
+        self.assertEqual(len(widths), 2)
+        self.assertLess(widths[0], widths[1])
+        self.assertLess(markdown.index("## Page 2"), markdown.index(f"RENDERED {widths[0]}"))
+        self.assertLess(markdown.index(f"RENDERED {widths[1]}"), markdown.index("## Page 5"))
+
+    def test_force_ocr_disables_routing(self):
+        """Forcing OCR still OCRs every page."""
+        fake_ocr = mock.Mock(side_effect=_fake_ocr)
+        wrapper = PDF2MarkdownWrapper(ocr_workers=1)
+        with mock.patch.object(pytesseract, "image_to_string", fake_ocr):
+            wrapper.markdown(self.pdf_path, force_ocr=True, ocr_quality="low")
+
+        self.assertEqual(fake_ocr.call_count, len(LAYOUT))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for page-level parallel OCR in PDF2MarkdownWrapper.
+
+Tesseract is replaced with a stand-in that reports the rendered page width;
+each test page has a different width, so the output shows which page was
+OCR'd where. Worker processes inherit the stand-in through fork.
+"""
+
+import os
+import re
+import sys
+import shutil
+import tempfile
+import unittest
+import multiprocessing
+from unittest import mock
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.pdf_utils import HAS_PYMUPDF
+from src.utils.ocr_cache import OCRCacheConfig
+from src.utils.pdf2md_wrapper import PDF2MarkdownWrapper
+from src.utils.conversion_pool import ConversionProcessPool, is_conversion_worker
+
+try:
+    import pytesseract
+    HAS_PYTESSERACT = True
+except ImportError:
+    HAS_PYTESSERACT = False
+
+PAGE_COUNT = 7
+
+
+def _fake_ocr(image, config=""):
+    return f"SCANNED PAGE RENDERED {image.size[0]} PIXELS WIDE"
+
+
+def _parallel_ocr_in_worker():
+    wrapper = PDF2MarkdownWrapper(ocr_workers=3, ocr_chunk_size=2, streaming_ocr=True)
+    return is_conversion_worker(), wrapper._use_parallel_ocr(PAGE_COUNT)
+
+
+@unittest.skipUnless(HAS_PYMUPDF and HAS_PYTESSERACT, "PyMuPDF or pytesseract not available")
+@unittest.skipUnless(multiprocessing.get_start_method() == "fork", "Stand-in OCR needs fork start method")
+class ParallelOCRTest(unittest.TestCase):
+    """Test suite for page-level OCR fan-out."""
+
+    def setUp(self):
+        import fitz
+        cache_patcher = mock.patch.object(OCRCacheConfig, "ENABLED", False)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        self.temp_dir = tempfile.mkdtemp()
+        self.pdf_path = os.path.join(self.temp_dir, "pages.pdf")
+        doc = fitz.open()
+        for i in range(PAGE_COUNT):
+            doc.new_page(width=200 + 20 * i, height=300)
+        doc.save(self.pdf_path)
+        doc.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _convert(self, **options):
+        wrapper = PDF2MarkdownWrapper(streaming_ocr=True, **options)
+        with mock.patch.object(pytesseract, "image_to_string", _fake_ocr):
+            return wrapper, wrapper._convert_with_pytesseract(self.pdf_path, quality="low")
+
+    def test_parallel_matches_sequential(self):
+        """Pages OCR'd in worker processes are reassembled in page order."""
+        _, sequential = self._convert(ocr_workers=1)
+        wrapper, parallel = self._convert(ocr_workers=3, ocr_chunk_size=2)
+
+        self.assertTrue(wrapper._use_parallel_ocr(PAGE_COUNT))
+        self.assertEqual(parallel, sequential)
+
+        # Page widths grow with the page number, so in-order output is increasing
+        widths = [int(width) for width in re.findall(r"RENDERED (\d+) PIXELS", parallel)]
+        self.assertEqual(len(widths), PAGE_COUNT)
+        self.assertEqual(widths, sorted(widths))
+
+    def test_small_documents_stay_in_process(self):
+        """Documents that fit in one chunk are not fanned out."""
+        wrapper = PDF2MarkdownWrapper(ocr_workers=4, ocr_chunk_size=PAGE_COUNT)
+        self.assertFalse(wrapper._use_parallel_ocr(PAGE_COUNT))
+
+    def test_conversion_workers_stay_in_process(self):
+        """Conversion pool workers OCR their pages in-process instead of starting another pool."""
+        pool = ConversionProcessPool(max_workers=1)
+        try:
+            in_worker, parallel = pool.executor.submit(_parallel_ocr_in_worker).result(timeout=60)
+        finally:
+            pool.shutdown()
+
+        self.assertEqual((in_worker, parallel), (True, False))
+        self.assertFalse(is_conversion_worker())
+
+
+if __name__ == "__main__":
+    unittest.main()
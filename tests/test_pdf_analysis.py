@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the single-pass PDF analysis shared by detection and extraction.
+"""
+
+import os
+import sys
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import pdf_utils
+from src.utils.pdf_utils import analyze_pdf, detect_document_format, is_scanned_pdf, HAS_PYMUPDF
+from src.utils.pdf2md_wrapper import PDF2MarkdownWrapper
+from src.utils.conversion_utils import _convert_pdf_to_markdown
+
+TEST_PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "test_data", "test_document.pdf")
+
+
+@unittest.skipUnless(HAS_PYMUPDF and os.path.exists(TEST_PDF), "PyMuPDF or test PDF not available")
+class PDFAnalysisTest(unittest.TestCase):
+    """Test suite for analyze_pdf and its consumers."""
+
+    def test_analysis_contents(self):
+        """The analysis records per-page facts for every page."""
+        analysis = analyze_pdf(TEST_PDF)
+
+        self.assertEqual(analysis.page_count, 2)
+        self.assertEqual(len(analysis.pages), 2)
+        self.assertFalse(analysis.is_encrypted)
+        self.assertGreater(analysis.pages[0]["text_length"], 0)
+        self.assertEqual(analysis.pages[0]["rotation"], 0)
+        self.assertTrue(analysis.matches(TEST_PDF))
+
+        # Plain data, so it can be handed to conversion worker processes
+        restored = pickle.loads(pickle.dumps(analysis))
+        self.assertEqual(restored.pages, analysis.pages)
+
+    def test_consumers_do_not_reopen_file(self):
+        """Detection and extraction work from an existing analysis without opening the PDF."""
+        analysis = analyze_pdf(TEST_PDF)
+        wrapper = PDF2MarkdownWrapper()
+
+        with mock.patch.object(pdf_utils.fitz, "open", side_effect=AssertionError("PDF reopened")):
+            doc_format = detect_document_format(TEST_PDF, include_details=True, analysis=analysis)
+            scanned = is_scanned_pdf(TEST_PDF, analysis=analysis)
+            likely_scanned = wrapper._is_likely_scanned(TEST_PDF, analysis)
+            markdown = wrapper._convert_with_pymupdf(TEST_PDF, analysis)
+
+        self.assertIs(doc_format["analysis"], analysis)
+        self.assertEqual(doc_format["page_count"], 2)
+        self.assertEqual(scanned, likely_scanned)
+        self.assertIn("## Page 1", markdown)
+
+    def test_detection_keeps_counters_only(self):
+        """Format detection keeps no page text; extraction re-reads it."""
+        doc_format = detect_document_format(TEST_PDF, include_details=True)
+        analysis = doc_format["analysis"]
+        wrapper = PDF2MarkdownWrapper()
+
+        self.assertFalse(analysis.includes_text)
+        self.assertNotIn("text", analysis.pages[0])
+        self.assertGreater(analysis.pages[0]["text_length"], 0)
+        self.assertEqual(doc_format["ocr_page_count"], len(analysis.pages_needing_ocr()))
+        self.assertEqual(wrapper._convert_with_pymupdf(TEST_PDF, analysis),
+                         wrapper._convert_with_pymupdf(TEST_PDF))
+
+    def test_results_match_fresh_parse(self):
+        """Results from a shared analysis match those from a fresh parse."""
+        analysis = analyze_pdf(TEST_PDF)
+        wrapper = PDF2MarkdownWrapper()
+
+        fresh = detect_document_format(TEST_PDF, include_details=True)
+        shared = detect_document_format(TEST_PDF, include_details=True, analysis=analysis)
+        fresh.pop("analysis")
+        shared.pop("analysis")
+
+        self.assertEqual(fresh, shared)
+        self.assertEqual(wrapper._convert_with_pymupdf(TEST_PDF),
+                         wrapper._convert_with_pymupdf(TEST_PDF, analysis))
+
+
+@unittest.skipUnless(HAS_PYMUPDF, "PyMuPDF not available")
+class SingleParseConversionTest(unittest.TestCase):
+    """A conversion without a pre-computed doc_format parses the PDF once."""
+
+    PAGE_COUNT = 30
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.pdf_path = os.path.join(self.temp_dir, "digital.pdf")
+        doc = pdf_utils.fitz.open()
+        for page_number in range(self.PAGE_COUNT):
+            page = doc.new_page()
+            for line in range(40):
+                page.insert_text((72, 72 + line * 16),
+                                 f"Page {page_number + 1} line {line}: memorandum for the record", fontsize=9)
+        doc.save(self.pdf_path)
+        doc.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_digital_pdf_parsed_once(self):
+        """Detection and extraction share one open and one text pass per page."""
+        fitz = pdf_utils.fitz
+        counts = {"open": 0, "get_text": 0}
+        real_open, real_get_text = fitz.open, fitz.Page.get_text
+
+        def counting_open(*args, **kwargs):
+            counts["open"] += 1
+            return real_open(*args, **kwargs)
+
+        def counting_get_text(page, *args, **kwargs):
+            counts["get_text"] += 1
+            return real_get_text(page, *args, **kwargs)
+
+        with mock.patch.object(fitz, "open", counting_open), \
+                mock.patch.object(fitz.Page, "get_text", counting_get_text):
+            markdown = _convert_pdf_to_markdown(self.pdf_path)
+
+        self.assertIn(f"## Page {self.PAGE_COUNT}", markdown)
+        self.assertEqual(counts["open"], 1)
+        # Plain text and blocks, once per page
+        self.assertEqual(counts["get_text"], 2 * self.PAGE_COUNT)
+
+
+if __name__ == "__main__":
+    unittest.main()
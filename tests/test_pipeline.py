@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the staged processing pipeline.
+
+These tests replace the download and conversion functions with fast stand-ins
+so the queueing behaviour can be checked without network access or OCR.
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import pipeline_utils
+from src.utils.pipeline_utils import ProcessingPipeline, PipelineConfig
+from src.utils.batch_utils import process_url_stream
+from src.utils.progress_journal import ProgressJournal
+
+
+class SmallPipelineConfig(PipelineConfig):
+    """Small worker counts so tests stay fast and deterministic."""
+    DOWNLOAD_WORKERS = 2
+    DETECT_WORKERS = 1
+    MARKDOWN_WORKERS = 1
+    JSON_WORKERS = 1
+    STORE_WORKERS = 1
+    QUEUE_SIZE = 2
+
+
+class PipelineTest(unittest.TestCase):
+    """Test suite for ProcessingPipeline."""
+
+    def setUp(self):
+        self.events = []
+        self.events_lock = threading.Lock()
+        self.server_recovered = False
+
+    def _log(self, event):
+        with self.events_lock:
+            self.events.append((event, time.time()))
+
+    def _fake_download(self, url, save_dir="pdfs", retry_count=3, organize_by_collection=True):
+        time.sleep(0.05)
+        self._log(f"download:{url}")
+        if "missing" in url and not self.server_recovered:
+            return None
+        return f"/tmp/{os.path.basename(url)}"
+
+    def _fake_markdown(self, pdf_path, force_ocr=False, ocr_quality="high", doc_format=None):
+        self._log(f"markdown:{pdf_path}")
+        return pdf_path.replace(".pdf", ".md"), "# content"
+
+    def _patch_stages(self):
+        for target, value in (
+            ("download_pdf", self._fake_download),
+            ("detect_document_format", lambda path, include_details=False: {"needs_ocr": False}),
+            ("pdf_to_markdown", self._fake_markdown),
+            ("markdown_to_json", lambda path: (path.replace(".md", ".json"), {})),
+        ):
+            patcher = mock.patch.object(pipeline_utils, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch("src.utils.storage.store_json_data", lambda src, dst: True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, urls):
+        self._patch_stages()
+        pipeline = ProcessingPipeline(config=SmallPipelineConfig())
+        result = pipeline.run(urls)
+        return pipeline, result
+
+    def test_all_documents_complete(self):
+        """Every URL reaches the final stage."""
+        urls = [f"https://example.org/doc-{i}.pdf" for i in range(6)]
+        pipeline, (successful, failed) = self._run(urls)
+
+        self.assertEqual(successful, 6)
+        self.assertEqual(failed, 0)
+        self.assertEqual(set(pipeline.results), set(urls))
+        self.assertEqual(pipeline.get_stage_statistics()["store"]["processed"], 6)
+
+    def test_conversion_starts_before_downloads_finish(self):
+        """The first conversion happens while later downloads are still running."""
+        urls = [f"https://example.org/doc-{i}.pdf" for i in range(8)]
+        self._run(urls)
+
+        first_markdown = min(t for event, t in self.events if event.startswith("markdown:"))
+        last_download = max(t for event, t in self.events if event.startswith("download:"))
+        self.assertLess(first_markdown, last_download)
+
+    def test_failed_download_is_counted(self):
+        """A failed stage records the document as failed and skips later stages."""
+        urls = ["https://example.org/doc-1.pdf", "https://example.org/missing.pdf"]
+        pipeline, (successful, failed) = self._run(urls)
+
+        self.assertEqual(successful, 1)
+        self.assertEqual(failed, 1)
+        self.assertFalse(pipeline.results["https://example.org/missing.pdf"])
+        self.assertEqual(pipeline.get_stage_statistics()["download"]["failed"], 1)
+
+    def test_generator_input(self):
+        """URLs can be supplied lazily by a generator."""
+        def url_source():
+            for i in range(3):
+                yield f"https://example.org/gen-{i}.pdf"
+
+        _, (successful, failed) = self._run(url_source())
+        self.assertEqual((successful, failed), (3, 0))
+
+    def test_raising_result_callback(self):
+        """A result callback that raises is logged and does not stall the pipeline."""
+        self._patch_stages()
+
+        def on_result(url, success):
+            raise RuntimeError("journal unavailable")
+
+        pipeline = ProcessingPipeline(config=SmallPipelineConfig(), on_result=on_result)
+        urls = [f"https://example.org/doc-{i}.pdf" for i in range(4)]
+        worker = threading.Thread(target=lambda: self.events.append(("result", pipeline.run(urls))), daemon=True)
+        worker.start()
+        worker.join(timeout=10)
+        self.assertFalse(worker.is_alive())
+        self.assertIn(("result", (4, 0)), self.events)
+
+    def test_async_engine_failure_after_stop(self):
+        """If the download engine dies after taking the stop marker, in-flight items fail and run() returns."""
+        self._patch_stages()
+
+        class FailingEngine:
+            def run(self, items, save_dir, organize_by_collection, on_result, url_of):
+                items = list(items)  # Consumes the stop marker too
+                on_result(items[0], "/tmp/doc-0.pdf")
+                raise RuntimeError("event loop crashed")
+
+        pipeline = ProcessingPipeline(config=SmallPipelineConfig(), async_downloads=True)
+        urls = [f"https://example.org/doc-{i}.pdf" for i in range(3)]
+        with mock.patch.object(pipeline_utils, "AsyncDownloadEngine", FailingEngine):
+            worker = threading.Thread(target=lambda: self.events.append(("result", pipeline.run(urls))), daemon=True)
+            worker.start()
+            worker.join(timeout=10)
+        self.assertFalse(worker.is_alive())
+        self.assertIn(("result", (1, 2)), self.events)
+        self.assertEqual(pipeline.get_stage_statistics()["download"]["failed"], 2)
+        self.assertEqual(pipeline.results, {urls[0]: True, urls[1]: False, urls[2]: False})
+
+    def _prepare_stream(self):
+        self._patch_stages()
+        for target in ("src.utils.storage.export_lite_llm_data", "src.utils.ocr_cache.log_ocr_cache_statistics"):
+            patcher = mock.patch(target, lambda *args: None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        cwd = os.getcwd()
+        temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(temp_dir.name)
+        self.addCleanup(temp_dir.cleanup)
+        self.addCleanup(os.chdir, cwd)
+
+    def test_process_url_stream(self):
+        """Streamed URLs are de-duplicated, already processed ones skipped and results journaled."""
+        self._prepare_stream()
+
+        journal = ProgressJournal(os.path.join(".checkpoints", "progress"))
+        journal.record("https://example.org/done.pdf", "processed")
+        journal.close()
+
+        def discovered_urls():
+            yield "https://example.org/a.pdf"
+            yield "https://example.org/done.pdf"
+            yield "https://example.org/a.pdf"
+            yield "https://example.org/missing.pdf"
+
+        processed = []
+        self.assertEqual(process_url_stream(discovered_urls(), on_processed=processed.append), (1, 1, 3))
+        self.assertEqual(sorted(processed), ["https://example.org/a.pdf", "https://example.org/done.pdf"])
+        downloads = sorted(event for event, _ in self.events if event.startswith("download:"))
+        self.assertEqual(downloads, ["download:https://example.org/a.pdf",
+                                     "download:https://example.org/missing.pdf"])
+
+        journal = ProgressJournal(os.path.join(".checkpoints", "progress"))
+        self.addCleanup(journal.close)
+        self.assertEqual(journal.get_statuses(), {
+            "https://example.org/a.pdf": "processed",
+            "https://example.org/done.pdf": "processed",
+            "https://example.org/missing.pdf": "failed"
+        })
+
+    def test_failed_url_retried_next_run(self):
+        """A URL whose download failed is not skipped on resume and succeeds once the server recovers."""
+        self._prepare_stream()
+        urls = ["https://example.org/a.pdf", "https://example.org/missing.pdf"]
+
+        processed = []
+        self.assertEqual(process_url_stream(iter(urls), on_processed=processed.append), (1, 1, 2))
+        self.assertEqual(processed, ["https://example.org/a.pdf"])
+
+        self.server_recovered = True
+        self.events.clear()
+        processed.clear()
+        self.assertEqual(process_url_stream(iter(urls), on_processed=processed.append), (1, 0, 2))
+        downloads = [event for event, _ in self.events if event.startswith("download:")]
+        self.assertEqual(downloads, ["download:https://example.org/missing.pdf"])
+        self.assertEqual(sorted(processed), urls)
+
+
+if __name__ == "__main__":
+    unittest.main()
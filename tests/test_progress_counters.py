@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for LargeScaleProcessor's live status counters and progress API.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.optimization as optimization
+from src.optimization import LargeScaleProcessor
+from src.utils.scheduling import SchedulingConfig
+
+
+class ProgressCountersTest(unittest.TestCase):
+    """Test suite for LargeScaleProcessor progress tracking."""
+
+    def setUp(self):
+        # The processor keeps its checkpoints and journal under the working directory
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+        self.processor = LargeScaleProcessor()
+
+    def tearDown(self):
+        self.processor.shutdown()
+        os.chdir(self.cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def test_counters_follow_transitions(self):
+        """Counts are updated on each transition without rescanning the statuses."""
+        processor = self.processor
+        processor._load_statuses({f"url-{i}": "pending" for i in range(5)})
+        with processor.lock:
+            processor._set_status("url-0", "in_progress")
+            processor._set_status("url-1", "in_progress")
+            processor._set_status("url-0", "completed")
+            processor._set_status("url-1", "error")
+            processor._set_status("url-new", "pending")
+
+        progress = processor.get_progress()
+        self.assertEqual(
+            (progress["completed"], progress["failed"], progress["in_progress"], progress["pending"]),
+            (1, 1, 0, 4)
+        )
+        self.assertEqual(progress["processed"], 2)
+
+    def test_process_urls_publishes_progress(self):
+        """A run leaves final counts in the checkpoint progress file."""
+        def fake_process_file(url, **kwargs):
+            return not url.endswith("doc-3.pdf")
+
+        urls = [f"https://example.com/doc-{i}.pdf" for i in range(6)]
+        with mock.patch.object(optimization, "process_file", fake_process_file), \
+                mock.patch.object(optimization, "export_lite_llm_data"), \
+                mock.patch.object(SchedulingConfig, "POLICY", "fifo"):
+            self.assertEqual(self.processor.process_urls(urls, resume=False), (5, 1))
+
+        with open(self.processor.progress_path) as f:
+            progress = json.load(f)
+        self.assertEqual((progress["total"], progress["completed"], progress["failed"]), (6, 5, 1))
+        self.assertEqual(progress["pending"] + progress["in_progress"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the append-only progress journal.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.progress_journal import ProgressJournal, JournalConfig
+
+
+def _config(**settings):
+    config = JournalConfig()
+    for name, value in settings.items():
+        setattr(config, name, value)
+    return config
+
+
+class ProgressJournalTest(unittest.TestCase):
+    """Test suite for ProgressJournal."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.base = os.path.join(self.temp_dir, "progress")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_recover_after_reopen(self):
+        """Statuses and metadata survive reopening; later records win."""
+        journal = ProgressJournal(self.base)
+        journal.record("a", "failed")
+        journal.record_many({"b": "completed", "a": "completed"}, current_batch=3)
+        journal.close()
+
+        journal = ProgressJournal(self.base)
+        self.assertEqual(journal.get_statuses(), {"a": "completed", "b": "completed"})
+        self.assertEqual(journal.get_meta(), {"current_batch": 3})
+        journal.close()
+
+    def test_recording_cost_is_per_change(self):
+        """Each record appends one line; nothing rewrites earlier progress."""
+        journal = ProgressJournal(self.base, _config(COMPACT_EVERY=10 ** 6))
+        journal.record_many({f"url-{i}": "completed" for i in range(1000)})
+        size_before = os.path.getsize(journal.journal_path)
+        journal.record("url-new", "completed")
+        journal.flush()
+
+        added = os.path.getsize(journal.journal_path) - size_before
+        self.assertLess(added, 100)
+        self.assertFalse(os.path.exists(journal.snapshot_path))
+        journal.close()
+
+    def test_fsync_batching(self):
+        """fsync runs once per batch of records, not once per record."""
+        journal = ProgressJournal(self.base, _config(FSYNC_EVERY=10, FSYNC_INTERVAL=3600))
+        for i in range(25):
+            journal.record(f"url-{i}", "completed")
+        self.assertEqual(journal.get_statistics()["fsyncs"], 2)
+        journal.close()
+        self.assertEqual(journal.get_statistics()["fsyncs"], 3)
+
+    def test_compaction(self):
+        """After COMPACT_EVERY records the state moves to a snapshot and the journal restarts."""
+        journal = ProgressJournal(self.base, _config(COMPACT_EVERY=10))
+        for i in range(13):
+            journal.record(f"url-{i}", "completed")
+        stats = journal.get_statistics()
+        self.assertEqual(stats["compactions"], 1)
+        self.assertEqual(stats["journal_records"], 3)
+        journal.close()
+
+        journal = ProgressJournal(self.base)
+        self.assertEqual(len(journal.get_statuses()), 13)
+        self.assertEqual(journal.get_statistics()["journal_records"], 3)
+        journal.close()
+
+    def test_torn_tail_ignored(self):
+        """A partial last line from a crash is dropped and the journal stays usable."""
+        journal = ProgressJournal(self.base)
+        journal.record("a", "completed")
+        journal.close()
+        with open(journal.journal_path, "a") as f:
+            f.write('{"url":"b","sta')
+
+        journal = ProgressJournal(self.base)
+        self.assertEqual(journal.get_statuses(), {"a": "completed"})
+        journal.record("c", "failed")
+        journal.close()
+
+        journal = ProgressJournal(self.base)
+        self.assertEqual(journal.get_statuses(), {"a": "completed", "c": "failed"})
+        journal.close()
+
+    def test_reset(self):
+        """Reset forgets progress on disk as well as in memory."""
+        journal = ProgressJournal(self.base)
+        journal.record("a", "completed")
+        journal.reset()
+        journal.close()
+
+        journal = ProgressJournal(self.base)
+        self.assertEqual(journal.get_statuses(), {})
+        journal.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the token bucket rate limiter and the shared HTTP limiter.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.rate_limit import TokenBucket, get_http_rate_limiter
+from src.optimization import AdaptiveThreadPool, OptimizationConfig
+
+
+class TokenBucketTest(unittest.TestCase):
+    """Test suite for TokenBucket."""
+
+    def test_burst_then_paced(self):
+        """A full bucket allows a burst, after which callers wait their turn."""
+        bucket = TokenBucket(rate=10, capacity=3)
+
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        waits = [bucket.reserve() for _ in range(3)]
+        for expected, wait in zip([0.1, 0.2, 0.3], waits):
+            self.assertAlmostEqual(wait, expected, delta=0.02)
+
+    def test_refill_is_capped(self):
+        """Idle time never accumulates more than the capacity."""
+        bucket = TokenBucket(rate=1000, capacity=2)
+        time.sleep(0.02)
+        bucket.reserve(2)
+        self.assertGreater(bucket.reserve(), 0)
+
+    def test_set_rate(self):
+        """Changing the rate changes how long later callers wait."""
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.reserve()
+        bucket.set_rate(100)
+        self.assertLess(bucket.reserve(), 0.05)
+        with self.assertRaises(ValueError):
+            bucket.set_rate(0)
+
+    def test_async_acquire(self):
+        """Async callers are paced without blocking the event loop."""
+        bucket = TokenBucket(rate=50, capacity=1)
+
+        async def run():
+            started = time.monotonic()
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(6)))
+            return time.monotonic() - started
+
+        self.assertGreaterEqual(asyncio.run(run()), 0.09)
+
+    def test_statistics(self):
+        """Statistics report tokens taken, the observed rate and time spent waiting."""
+        bucket = TokenBucket(rate=100, capacity=2)
+        for _ in range(4):
+            bucket.acquire()
+
+        stats = bucket.get_statistics()
+        self.assertEqual(stats["rate"], 100)
+        self.assertEqual(stats["acquired"], 4)
+        self.assertAlmostEqual(stats["wait_time"], 0.03, delta=0.015)
+        self.assertGreater(stats["tokens_per_sec"], 0)
+
+
+class SharedHTTPLimiterTest(unittest.TestCase):
+    """Test suite for the shared HTTP limiter and AdaptiveThreadPool."""
+
+    def setUp(self):
+        self.config = OptimizationConfig()
+        self.config.MONITOR_INTERVAL = 60
+        self.pool = AdaptiveThreadPool(self.config)
+
+    def tearDown(self):
+        self.pool.shutdown()
+        get_http_rate_limiter().set_rate(self.config.BASE_HTTP_RATE)
+
+    def test_limiter_is_shared(self):
+        """Every caller gets the same limiter."""
+        self.assertIs(get_http_rate_limiter(), get_http_rate_limiter())
+        self.assertIs(self.pool.rate_limiter, get_http_rate_limiter())
+
+    def test_submit_does_not_wait(self):
+        """CPU-bound tasks are submitted without any delay."""
+        started = time.monotonic()
+        futures = [self.pool.submit(sum, range(1000)) for _ in range(20)]
+        self.assertLess(time.monotonic() - started, 0.2)
+        self.assertEqual([f.result() for f in futures], [499500] * 20)
+
+    def test_monitor_adjusts_http_rate(self):
+        """Throttling and accelerating change the shared limiter's rate within bounds."""
+        limiter = get_http_rate_limiter()
+        self.pool._throttle_processing()
+        self.assertAlmostEqual(limiter.rate, self.config.BASE_HTTP_RATE / 1.5)
+
+        for _ in range(10):
+            self.pool._throttle_processing()
+        self.assertEqual(limiter.rate, self.config.MIN_HTTP_RATE)
+
+        for _ in range(20):
+            self.pool._accelerate_processing()
+        self.assertEqual(limiter.rate, self.config.MAX_HTTP_RATE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for size-aware scheduling.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.scheduling import SizeAwareQueue, estimate_job_sizes
+
+
+class SizeAwareQueueTest(unittest.TestCase):
+    """Test suite for SizeAwareQueue."""
+
+    SIZES = {"a": 300, "b": 100, "c": None, "d": 500}
+
+    def _drain(self, policy):
+        work = SizeAwareQueue(policy)
+        work.put_many(list(self.SIZES), self.SIZES)
+        self.assertEqual(work.qsize(), 4)
+        order = []
+        while not work.empty():
+            order.append(work.get())
+        return order
+
+    def test_policies(self):
+        """Each policy orders work as documented; unknown sizes rank as the median."""
+        self.assertEqual(self._drain("fifo"), ["a", "b", "c", "d"])
+        self.assertEqual(self._drain("largest_first"), ["d", "a", "c", "b"])
+        self.assertEqual(self._drain("smallest_first"), ["b", "a", "c", "d"])
+
+    def test_unknown_policy(self):
+        """An unknown policy is rejected."""
+        with self.assertRaises(ValueError):
+            SizeAwareQueue("random")
+
+
+class EstimateJobSizesTest(unittest.TestCase):
+    """Test suite for estimate_job_sizes."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.head_requests = []
+        test = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_HEAD(self):
+                test.head_requests.append(self.path)
+                self.send_response(200)
+                if self.path != "/unknown.pdf":
+                    self.send_header("Content-Length", "4096")
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_local_and_remote_sizes(self):
+        """Downloaded files are measured locally; the rest come from HEAD requests."""
+        with open(os.path.join(self.temp_dir, "local.pdf"), "wb") as f:
+            f.write(b"x" * 1234)
+        urls = [f"{self.base_url}/local.pdf", f"{self.base_url}/remote.pdf", f"{self.base_url}/unknown.pdf"]
+
+        sizes = estimate_job_sizes(urls, self.temp_dir, organize_by_collection=False, probe_remote=True)
+
+        self.assertEqual(sizes, {urls[0]: 1234, urls[1]: 4096, urls[2]: None})
+        self.assertEqual(sorted(self.head_requests), ["/remote.pdf", "/unknown.pdf"])
+
+    def test_no_remote_probe_by_default(self):
+        """By default files not on disk have unknown size and nothing is probed."""
+        url = f"{self.base_url}/remote.pdf"
+        sizes = estimate_job_sizes([url], self.temp_dir, organize_by_collection=False)
+        self.assertEqual(sizes, {url: None})
+        self.assertEqual(self.head_requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for streaming per-page OCR in PDF2MarkdownWrapper.
+
+Tesseract itself is replaced with a stand-in so the tests only exercise the
+rendering and page bookkeeping.
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.pdf_utils import HAS_PYMUPDF
+from src.utils.ocr_cache import OCRCacheConfig
+from src.utils.pdf2md_wrapper import PDF2MarkdownWrapper, iter_page_images, get_page_count
+
+try:
+    import pytesseract
+    HAS_PYTESSERACT = True
+except ImportError:
+    HAS_PYTESSERACT = False
+
+TEST_PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "test_data", "test_document.pdf")
+
+
+@unittest.skipUnless(HAS_PYMUPDF and HAS_PYTESSERACT and os.path.exists(TEST_PDF),
+                     "PyMuPDF, pytesseract or test PDF not available")
+class StreamingOCRTest(unittest.TestCase):
+    """Test suite for streaming OCR."""
+
+    def setUp(self):
+        cache_patcher = mock.patch.object(OCRCacheConfig, "ENABLED", False)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+    def test_iter_page_images(self):
+        """Pages are rendered one at a time, in order, at the requested resolution."""
+        low = [(index, image.size) for index, image in iter_page_images(TEST_PDF, dpi=72)]
+        high = [(index, image.size) for index, image in iter_page_images(TEST_PDF, dpi=144)]
+
+        self.assertEqual([index for index, _ in low], list(range(get_page_count(TEST_PDF))))
+        self.assertAlmostEqual(high[0][1][0], low[0][1][0] * 2, delta=2)
+
+    def test_images_are_released_per_page(self):
+        """Only one page image is alive while a page is OCR'd."""
+        alive = []
+        peak = []
+
+        def is_open(image):
+            try:
+                image.getpixel((0, 0))
+                return True
+            except ValueError:
+                return False
+
+        def fake_ocr(image, config=""):
+            alive.append(image)
+            peak.append(sum(1 for img in alive if is_open(img)))
+            return f"TEXT FOR A PAGE OF {image.size[0]} PIXELS WIDE, LONG ENOUGH TO KEEP"
+
+        wrapper = PDF2MarkdownWrapper(streaming_ocr=True, ocr_page_window=1)
+        with mock.patch.object(pytesseract, "image_to_string", fake_ocr):
+            markdown = wrapper._convert_with_pytesseract(TEST_PDF, quality="low")
+
+        self.assertEqual(peak, [1, 1])
+        self.assertNotIn("OCR processing failed", markdown)
+        self.assertLess(markdown.index("## Page 1"), markdown.index("## Page 2"))
+        self.assertIn("### TEXT FOR A PAGE", markdown)
+
+
+class PDF2ImageFallbackTest(unittest.TestCase):
+    """Test suite for rendering with pdf2image when PyMuPDF is missing."""
+
+    def test_only_requested_pages_are_rendered(self):
+        """Sparse pages are rendered as consecutive runs, split by the window."""
+        calls = []
+
+        def convert_from_path(pdf_path, dpi, first_page, last_page, fmt):
+            calls.append((first_page, last_page))
+            return [f"page {number}" for number in range(first_page, last_page + 1)]
+
+        fake_pdf2image = mock.Mock(convert_from_path=convert_from_path)
+        with mock.patch.dict(sys.modules, {"fitz": None, "pdf2image": fake_pdf2image}):
+            rendered = list(iter_page_images("doc.pdf", dpi=72, window=2, pages=[0, 1, 2, 5, 9, 10]))
+
+        self.assertEqual(calls, [(1, 2), (3, 3), (6, 6), (10, 11)])
+        self.assertEqual(rendered, [(0, "page 1"), (1, "page 2"), (2, "page 3"),
+                                    (5, "page 6"), (9, "page 10"), (10, "page 11")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the URL manifest used by incremental scrapes.
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+import unittest
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.url_manifest import UrlManifest, listing_hash
+
+
+class UrlManifestTest(unittest.TestCase):
+    """Test suite for UrlManifest."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "manifest", "urls.db")
+        self.manifest = UrlManifest(self.path)
+        self.addCleanup(self.manifest.close)
+
+    def test_new_and_unchanged_pages(self):
+        """A page is new the first time, unchanged when re-listed and changed when its links change."""
+        self.assertEqual(self.manifest.record_page(1, ["a.pdf", "b.pdf"]), (False, ["a.pdf", "b.pdf"]))
+        self.assertEqual(self.manifest.record_page(1, ["a.pdf", "b.pdf"]), (True, []))
+        self.assertEqual(self.manifest.record_page(1, ["c.pdf", "a.pdf", "b.pdf"]), (False, ["c.pdf"]))
+        self.assertEqual(self.manifest.get_urls(), ["a.pdf", "b.pdf", "c.pdf"])
+
+    def test_seen_timestamps(self):
+        """First-seen is kept while last-seen moves forward."""
+        self.manifest.record_page(1, ["a.pdf"], seen_at=100.0)
+        self.manifest.record_page(1, ["a.pdf"], seen_at=200.0)
+        entry = self.manifest.get("a.pdf")
+        self.assertEqual((entry["first_seen"], entry["last_seen"]), (100.0, 200.0))
+        self.assertIsNone(entry["removed_at"])
+
+    def test_removed_only_on_scraped_pages(self):
+        """URLs missing from re-scraped pages are removed; pages not reached keep theirs."""
+        self.manifest.record_page(1, ["a.pdf", "b.pdf"], seen_at=100.0)
+        self.manifest.record_page(2, ["c.pdf"], seen_at=100.0)
+
+        started = time.time()
+        self.manifest.record_page(1, ["a.pdf"])
+        self.assertEqual(self.manifest.finish_scrape(started, [1]), ["b.pdf"])
+        self.assertEqual(self.manifest.get_urls(), ["a.pdf", "c.pdf"])
+        self.assertEqual(self.manifest.get_urls(include_removed=True), ["a.pdf", "b.pdf", "c.pdf"])
+
+        # A removed URL that is listed again counts as new
+        self.assertEqual(self.manifest.record_page(1, ["a.pdf", "b.pdf"]), (False, ["b.pdf"]))
+        self.assertEqual(self.manifest.get_statistics(), {"urls": 3, "pending": 3, "removed": 0, "pages": 2})
+
+    def test_pending_until_processed(self):
+        """Listed URLs stay pending until marked processed; removed URLs are not pending."""
+        self.manifest.record_page(1, ["a.pdf", "b.pdf", "c.pdf"], seen_at=100.0)
+        self.manifest.mark_processed("a.pdf")
+        self.assertEqual(self.manifest.get_pending_urls(), ["b.pdf", "c.pdf"])
+        self.assertIsNotNone(self.manifest.get("a.pdf")["processed_at"])
+
+        started = time.time()
+        self.manifest.record_page(1, ["a.pdf", "b.pdf"])
+        self.manifest.finish_scrape(started, [1])
+        self.assertEqual(self.manifest.get_pending_urls(), ["b.pdf"])
+        self.assertEqual(self.manifest.get_statistics()["pending"], 1)
+
+    def test_adds_processed_column(self):
+        """Manifests created before processing was tracked are migrated with every URL pending."""
+        old_path = os.path.join(self.temp_dir.name, "old.db")
+        conn = sqlite3.connect(old_path)
+        conn.execute("""
+            CREATE TABLE urls (url TEXT PRIMARY KEY, page INTEGER NOT NULL, first_seen REAL NOT NULL,
+                               last_seen REAL NOT NULL, removed_at REAL)
+        """)
+        conn.execute("INSERT INTO urls VALUES ('a.pdf', 1, 100.0, 100.0, NULL)")
+        conn.commit()
+        conn.close()
+
+        manifest = UrlManifest(old_path)
+        self.addCleanup(manifest.close)
+        self.assertEqual(manifest.get_pending_urls(), ["a.pdf"])
+        manifest.mark_processed("a.pdf")
+        self.assertEqual(manifest.get_pending_urls(), [])
+
+    def test_persistence(self):
+        """The manifest is read back by a new connection."""
+        self.manifest.record_page(3, ["a.pdf"])
+        self.manifest.close()
+        manifest = UrlManifest(self.path)
+        self.addCleanup(manifest.close)
+        self.assertEqual(manifest.record_page(3, ["a.pdf"]), (True, []))
+
+    def test_listing_hash(self):
+        """The hash depends on the links and their order."""
+        self.assertEqual(listing_hash(["a.pdf", "b.pdf"]), listing_hash(["a.pdf", "b.pdf"]))
+        self.assertNotEqual(listing_hash(["a.pdf", "b.pdf"]), listing_hash(["b.pdf", "a.pdf"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
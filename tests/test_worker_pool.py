@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the elastic worker pool and AdaptiveThreadPool scaling.
+"""
+
+import os
+import sys
+import time
+import threading
+import unittest
+
+# Add parent directory to python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.worker_pool import ElasticThreadPool
+from src.utils.rate_limit import get_http_rate_limiter
+from src.optimization import AdaptiveThreadPool, OptimizationConfig
+
+
+class ConcurrencyProbe:
+    """Task that records how many copies of itself run at once."""
+
+    def __init__(self, duration=0.05):
+        self.duration = duration
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.duration)
+        with self.lock:
+            self.active -= 1
+
+    def reset(self):
+        with self.lock:
+            self.peak = self.active
+
+
+class ElasticThreadPoolTest(unittest.TestCase):
+    """Test suite for ElasticThreadPool."""
+
+    def setUp(self):
+        self.pool = ElasticThreadPool(2)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_results_and_exceptions(self):
+        """Futures carry results and exceptions like ThreadPoolExecutor's."""
+        self.assertEqual(self.pool.submit(pow, 2, 10).result(timeout=5), 1024)
+        with self.assertRaises(ZeroDivisionError):
+            self.pool.submit(lambda: 1 / 0).result(timeout=5)
+
+    def test_grow_and_shrink(self):
+        """Resizing changes how many tasks run concurrently."""
+        probe = ConcurrencyProbe()
+        for f in [self.pool.submit(probe) for _ in range(8)]:
+            f.result(timeout=5)
+        self.assertEqual(probe.peak, 2)
+
+        self.pool.resize(6)
+        probe.reset()
+        for f in [self.pool.submit(probe) for _ in range(24)]:
+            f.result(timeout=5)
+        self.assertEqual(probe.peak, 6)
+        self.assertEqual(self.pool.worker_count, 6)
+
+        self.pool.resize(1)
+        time.sleep(ElasticThreadPool.IDLE_POLL * 3)
+        self.assertEqual(self.pool.worker_count, 1)
+        probe.reset()
+        for f in [self.pool.submit(probe) for _ in range(4)]:
+            f.result(timeout=5)
+        self.assertEqual(probe.peak, 1)
+
+    def test_shutdown_runs_queued_tasks(self):
+        """Shutdown waits for queued work and then refuses new tasks."""
+        probe = ConcurrencyProbe(duration=0.01)
+        futures = [self.pool.submit(probe) for _ in range(10)]
+        self.pool.shutdown()
+        self.assertTrue(all(f.done() for f in futures))
+        self.assertEqual(self.pool.worker_count, 0)
+        with self.assertRaises(RuntimeError):
+            self.pool.submit(probe)
+
+
+class AdaptiveScalingTest(unittest.TestCase):
+    """Test suite for AdaptiveThreadPool scaling decisions."""
+
+    def setUp(self):
+        self.config = OptimizationConfig()
+        self.config.MONITOR_INTERVAL = 60
+        self.pool = AdaptiveThreadPool(self.config)
+
+    def tearDown(self):
+        self.pool.shutdown()
+        get_http_rate_limiter().set_rate(self.config.BASE_HTTP_RATE)
+
+    def test_accelerate_beyond_initial_workers(self):
+        """Acceleration really adds worker threads, up to MAX_WORKERS."""
+        for _ in range(self.config.MAX_WORKERS):
+            self.pool._accelerate_processing("test")
+        self.assertEqual(self.pool.executor.worker_count, self.config.MAX_WORKERS)
+
+        probe = ConcurrencyProbe()
+        for f in [self.pool.submit(probe) for _ in range(self.config.MAX_WORKERS * 3)]:
+            f.result(timeout=5)
+        self.assertEqual(probe.peak, self.config.MAX_WORKERS)
+
+    def test_scaling_log(self):
+        """Each decision is recorded with its before/after sizes and reason."""
+        self.pool._throttle_processing("CPU 95%")
+        self.pool._accelerate_processing("CPU 10%")
+
+        first, second = self.pool.scaling_log
+        self.assertEqual(first["action"], "throttling")
+        initial = self.config.INITIAL_WORKERS
+        self.assertEqual(first["workers"], [initial, initial - 1])
+        self.assertEqual(first["reason"], "CPU 95%")
+        self.assertEqual(second["workers"], [initial - 1, initial])
+
+
+if __name__ == "__main__":
+    unittest.main()